@@ -10,6 +10,8 @@ import numpy as np
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from market_data.panel import Panel, build_panel
+
 
 @dataclass
 class Position:
@@ -95,6 +97,7 @@ class PortfolioBacktest:
 
         # 데이터
         self.data: Dict[str, pd.DataFrame] = {}
+        self.panel: Optional[Panel] = None  # 날짜 정렬된 전체 종목 패널 (run 에서 재사용)
 
     def load_data(self, symbol: str, data: pd.DataFrame):
         """
@@ -109,10 +112,45 @@ class PortfolioBacktest:
             raise ValueError(f"Data must contain columns: {required_columns}")
 
         self.data[symbol] = data.copy()
+        self.panel = None
 
         if symbol not in self.symbols:
             self.symbols.append(symbol)
 
+    def load_panel(self, panel: Panel):
+        """
+        날짜 정렬된 패널 로드 (data_loader.load_panel 결과를 종목별로 다시 맞추지 않고 그대로 사용)
+
+        Args:
+            panel: Open, High, Low, Close, Volume 필드를 가진 Panel
+        """
+        required_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
+        if not all(col in panel.fields for col in required_columns):
+            raise ValueError(f"Data must contain columns: {required_columns}")
+
+        for symbol in panel.symbols:
+            self.data[symbol] = panel.symbol(symbol)
+            if symbol not in self.symbols:
+                self.symbols.append(symbol)
+        self.panel = panel
+
+    def _get_panel(self) -> Panel:
+        """종목별 데이터를 날짜 합집합 패널로 (로드된 데이터가 바뀌지 않으면 재사용)"""
+        if self.panel is None or set(self.panel.symbols) != set(self.data):
+            self.panel = build_panel(self.data)
+        return self.panel
+
+    def _row_positions(self, panel: Panel) -> Dict[str, np.ndarray]:
+        """종목별로 패널 날짜 위치 -> 원본 데이터 행 위치 (봉이 없으면 -1)"""
+        dates = panel.dates.values
+        positions = {}
+        for symbol in panel.symbols:
+            index = pd.DatetimeIndex(self.data[symbol].index).values
+            pos = np.full(len(dates), -1, dtype=np.intp)
+            pos[np.searchsorted(dates, index)] = np.arange(len(index))
+            positions[symbol] = pos
+        return positions
+
     def buy(self, symbol: str, quantity: float, price: float, date: datetime) -> bool:
         """
         매수 실행
@@ -257,21 +295,21 @@ class PortfolioBacktest:
         if not self.data:
             raise ValueError("No data loaded. Use load_data() first.")
 
-        # 모든 데이터의 날짜 인덱스 통합
-        all_dates = set()
-        for df in self.data.values():
-            all_dates.update(df.index)
-        dates = sorted(all_dates)
+        # 날짜 정렬된 패널 (날짜 합집합 + 종목별 봉 존재 mask)
+        panel = self._get_panel()
+        closes = panel.field('Close')
+        # 전략에는 원본 행을 그대로 넘김 (종목별 추가/지표 컬럼과 dtype 유지)
+        positions = self._row_positions(panel)
 
         # 각 날짜마다 전략 실행
-        for date in dates:
-            # 현재 날짜의 데이터 수집
+        for t, date in enumerate(panel.dates):
+            # 현재 날짜의 데이터 수집 (봉이 있는 종목만)
             current_data = {}
             current_prices = {}
-            for symbol, df in self.data.items():
-                if date in df.index:
-                    current_data[symbol] = df.loc[date]
-                    current_prices[symbol] = df.loc[date, 'Close']
+            for j in np.flatnonzero(panel.mask[t]):
+                symbol = panel.symbols[j]
+                current_data[symbol] = self.data[symbol].iloc[positions[symbol][t]]
+                current_prices[symbol] = closes[t, j]
 
             # 전략 함수 호출
             strategy_func(self, date, current_data)
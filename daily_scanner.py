@@ -17,7 +17,8 @@ sys.path.extend(['.'])
 import kis_auth as ka
 from examples_llm_stock.volume_rank.volume_rank import volume_rank
 from examples_llm_stock.market_cap.market_cap import market_cap
-from data_loader import load_stock_data
+from data_loader import load_stock_data, sync_calendar
+from domestic_stock.domestic_stock_functions import get_quotes
 import pandas as pd
 from datetime import datetime, timedelta
 
@@ -154,6 +155,11 @@ def main():
     ka.auth(svr="prod")
     print("✓ 인증 완료")
 
+    # 거래일 달력 갱신 (저장된 구간은 다시 조회하지 않으므로 하루 1회 휴장일 조회)
+    calendar = sync_calendar()
+    if not calendar.is_trading_day(calendar.now().date()):
+        print(f"  오늘은 휴장일입니다 (직전 거래일 {calendar.previous_session():%Y-%m-%d} 기준 스캔)")
+
     # 2. 거래량 상위 종목 리스트 가져오기 (여러 기준으로 조회해서 합치기)
     print("\n[2/4] 거래량 상위 종목 조회 중 (여러 기준 병합)...")
 
@@ -252,26 +258,30 @@ def main():
 
     print(f"✓ 총 {len(all_stocks)}개 종목 로드 완료 (중복 제거 후)")
 
+    # 현재가 일괄 조회 (30종목당 1회 호출)로 가격/거래량 조건(2, 6) 미달 종목은 일봉 조회 전에 제외
+    # 시세 조회에 실패한 종목은 그대로 스캔
+    quotes = get_quotes(all_stocks['mksc_shrn_iscd'].tolist())
+    if not quotes.empty:
+        codes = all_stocks['mksc_shrn_iscd']
+        passed = quotes.index[(quotes['inter2_prpr'] >= 1000) & (quotes['acml_vol'] >= 500000)]
+        all_stocks = all_stocks[~codes.isin(quotes.index) | codes.isin(passed)]
+        print(f"✓ 현재가/거래량 조건 통과: {len(all_stocks)}개")
+
     # 3. 각 종목 스캔
     print(f"\n[3/4] {len(all_stocks)}개 종목 스캔 중...")
     print("  (EMA60 위 + 거래량 500% 증가 + 양봉)")
     print()
 
-    candidates = []
-
-    for i, (idx, row) in enumerate(all_stocks.iterrows(), start=1):
-        code = row['mksc_shrn_iscd']
-        name = row['hts_kor_isnm']
-
-        print(f"  [{i}/{len(all_stocks)}] {name} ({code})... ", end="", flush=True)
+    # 종목별 일봉 조회를 호출 한도 안에서 동시에 실행 (완료 순서대로 출력, 결과는 입력 순서)
+    stocks = dict(zip(all_stocks['mksc_shrn_iscd'], all_stocks['hts_kor_isnm']))
 
-        result = scan_stock(code, name)
+    def on_progress(done, total, code, result, error):
+        status = "✓ 매수 후보!" if result else f"✗ {error}" if error else "✗"
+        print(f"  [{done}/{total}] {stocks[code]} ({code})... {status}", flush=True)
 
-        if result:
-            print("✓ 매수 후보!")
-            candidates.append(result)
-        else:
-            print("✗")
+    scanned = ka.fan_out(scan_stock, {code: (code, name) for code, name in stocks.items()},
+                         on_progress=on_progress)
+    candidates = [result for result in scanned.results.values() if result]
 
     # 4. 결과 출력
     print("\n" + "=" * 80)
@@ -1,16 +1,586 @@
 """
 백테스팅을 위한 과거 데이터 로더
 """
+import logging
+import os
 import sys
-from datetime import datetime, timedelta
+import threading
+from datetime import date, datetime, timedelta
 from typing import Optional
-import time
 
+import numpy as np
 import pandas as pd
 
 sys.path.extend(['.'])
 import kis_auth as ka
-from examples_llm_stock.inquire_daily_itemchartprice.inquire_daily_itemchartprice import inquire_daily_itemchartprice
+import kis_schema
+from market_data import (
+    Panel, TradingCalendar, Universe, build_panel, get_calendar, get_universe, ohlcv_store, resample
+)
+from market_data.adjustments import ActionStore, adjust, events_from_ksdinfo
+from market_data.checkpoint import BackfillCheckpoint
+from market_data.snapshot import ResultCache, SnapshotStore
+from settings import settings
+
+# 국내주식기간별시세(일/주/월/년)[v1_국내주식-016], 한 번에 최대 100건
+CHART_API_URL = "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice"
+CHART_TR_ID = "FHKST03010100"
+
+# 로컬 저장소에 보관하는 봉 주기 (분봉은 1분봉만 저장하고 나머지 분봉은 1분봉에서 계산)
+STORE_PERIODS = ("D", "W", "M", "Y")
+
+# 주식일별분봉조회[국내주식-213], 한 번에 최대 120건 (1분봉, 당일 포함 최대 1년 보관)
+MINUTE_API_URL = "/uapi/domestic-stock/v1/quotations/inquire-time-dailychartprice"
+MINUTE_TR_ID = "FHKST03010230"
+MINUTE_MAX_ROWS = 120
+
+# 주식당일분봉조회[v1_국내주식-022], 당일 1분봉 30건씩
+TODAY_MINUTE_API_URL = "/uapi/domestic-stock/v1/quotations/inquire-time-itemchartprice"
+TODAY_MINUTE_TR_ID = "FHKST03010200"
+TODAY_MINUTE_MAX_ROWS = 30
+
+# 1분봉 저장소 주기 (period "3", "5", "60" 등은 1분봉을 리샘플링)
+MINUTE_PERIOD = "1"
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# 예탁원 기업 행사 조회 기준일 여유 (액면분할 변경상장일 등은 기준일 몇 주 뒤)
+KSDINFO_LOOKBACK = timedelta(days=90)
+
+# 예탁원정보 조회 API (종류: api_url, tr_id, 조회일자 외 파라미터), 전 종목 조회
+KSDINFO_APIS = {
+    "split": ("/uapi/domestic-stock/v1/ksdinfo/rev-split", "HHKDB669105C0",  # 액면교체
+              {"SHT_CD": "", "CTS": "", "MARKET_GB": "0"}),
+    "bonus": ("/uapi/domestic-stock/v1/ksdinfo/bonus-issue", "HHKDB669101C0",  # 무상증자
+              {"CTS": "", "SHT_CD": ""}),
+    "rights": ("/uapi/domestic-stock/v1/ksdinfo/paidin-capin", "HHKDB669100C0",  # 유상증자, GB1 2: 기준일별
+               {"CTS": "", "GB1": "2", "SHT_CD": ""}),
+    "merger": ("/uapi/domestic-stock/v1/ksdinfo/merger-split", "HHKDB669104C0",  # 합병/분할
+               {"CTS": "", "SHT_CD": ""}),
+    "dividend": ("/uapi/domestic-stock/v1/ksdinfo/dividend", "HHKDB669102C0",  # 배당일정
+                 {"CTS": "", "GB1": "0", "SHT_CD": "", "HIGH_GB": ""}),
+}
+
+_action_lock = threading.Lock()
+
+
+class NoDataError(ValueError):
+    """요청 구간에 봉이 하나도 없는 종목 (거래정지, 종료일 이후 상장 등)"""
+
+# 기간별시세 1회 응답 최대 건수
+CHART_MAX_ROWS = 100
+
+# 주/월/년봉 봉 1개 기간, 1회 조회 구간은 100개 봉
+_PERIOD_STEPS = {
+    "W": pd.DateOffset(weeks=1),
+    "M": pd.DateOffset(months=1),
+    "Y": pd.DateOffset(years=1),
+}
+_PERIOD_WINDOWS = {period: step * CHART_MAX_ROWS for period, step in _PERIOD_STEPS.items()}
+
+
+def _fetch_chart_window(
+    stock_code: str,
+    start: datetime,
+    end: datetime,
+    period: str,
+    adjusted: bool
+) -> pd.DataFrame:
+    """
+    한 구간의 기간별시세 조회
+
+    응답이 최대 건수(100건)로 잘렸으면 응답의 가장 이른 일자 전날을 다음 요청의 종료일로 넘겨
+    구간 시작일까지 이어서 조회합니다 (겹치거나 빠지는 날짜 없음).
+    API 호출이 (재시도 후에도) 실패하면 빈 구간으로 취급하지 않고 예외를 발생시켜
+    데이터가 조용히 누락되지 않도록 합니다.
+
+    Raises:
+        ka.KISAPIError: API 호출 실패
+    """
+    params = {
+        "FID_COND_MRKT_DIV_CODE": "J",  # J: KRX
+        "FID_INPUT_ISCD": stock_code,
+        "FID_INPUT_DATE_1": start.strftime("%Y%m%d"),
+        "FID_INPUT_DATE_2": end.strftime("%Y%m%d"),
+        "FID_PERIOD_DIV_CODE": period,
+        "FID_ORG_ADJ_PRC": "0" if adjusted else "1"  # 0: 수정주가, 1: 원주가
+    }
+
+    records = []
+    while True:
+        res = ka._url_fetch(CHART_API_URL, CHART_TR_ID, "", params)
+        if not res.isOK():
+            raise ka.KISAPIError(res, CHART_API_URL)
+
+        # 데이터가 없는 구간은 빈 레코드가 올 수 있음
+        page = [r for r in (res.getBody().output2 or []) if r.get('stck_bsop_date')]
+        records.extend(page)
+        if len(page) < CHART_MAX_ROWS:
+            break
+
+        # 잘렸을 수 있는 응답: 가장 이른 일자 앞에 봉이 더 있을 수 있으면 그 전날까지 다시 조회
+        earliest = datetime.strptime(min(r['stck_bsop_date'] for r in page), "%Y%m%d")
+        if not _may_have_bars(start, earliest, period):
+            break
+        params = {**params, "FID_INPUT_DATE_2": (earliest - timedelta(days=1)).strftime("%Y%m%d")}
+
+    return kis_schema.decode(pd.DataFrame(records), CHART_TR_ID, "output2")
+
+
+def _trading_days(start_dt: datetime, end_dt: datetime) -> pd.DatetimeIndex:
+    """start_dt ~ end_dt 의 거래일 (거래일 달력, 달력을 채우지 않은 구간은 주말만 제외)"""
+    return get_calendar().trading_days(start_dt, end_dt)
+
+
+def _may_have_bars(start: datetime, earliest: datetime, period: str) -> bool:
+    """start 부터 earliest 전날 사이에 봉이 더 있을 수 있는지 (100건 응답이 잘린 것인지 판단)"""
+    if period == "D":
+        return len(_trading_days(start, earliest - timedelta(days=1))) > 0
+    return earliest - _PERIOD_STEPS.get(period, timedelta(days=1)) >= start
+
+
+def _plan_windows(start_dt: datetime, end_dt: datetime, period: str) -> list:
+    """
+    start_dt ~ end_dt 를 API 1회 조회 구간으로 분할 (최근 구간부터, 빈틈 없이 이어지는 구간)
+
+    - 일봉: 거래일 100일씩 (응답 최대 건수만큼, 겹침 없음)
+    - 주/월/년봉: 100주 / 100개월 / 100년씩
+    - 분봉/시간봉: 약 10일씩
+
+    Returns:
+        [(구간 시작, 구간 종료), ...]
+    """
+    if start_dt > end_dt:
+        return []
+
+    if period == "D":
+        days = _trading_days(start_dt, end_dt)
+        # 최근부터 100 거래일씩 묶은 구간의 시작일, 가장 오래된 구간은 start_dt 부터
+        starts = [days[max(0, i - CHART_MAX_ROWS)].to_pydatetime() for i in range(len(days), 0, -CHART_MAX_ROWS)]
+        starts = starts[:-1] + [start_dt] if starts else [start_dt]
+        ends = [end_dt] + [s - timedelta(days=1) for s in starts[:-1]]
+        return list(zip(starts, ends))
+
+    windows = []
+    current_end = end_dt
+
+    while current_end >= start_dt:
+        if period in _PERIOD_WINDOWS:
+            current_start = max(current_end - _PERIOD_WINDOWS[period] + timedelta(days=1), start_dt)
+        else:
+            # 분봉/시간봉: 더 짧은 기간 (약 10일)
+            current_start = max(current_end - timedelta(days=10), start_dt)
+
+        windows.append((current_start, current_end))
+
+        # 다음 구간으로 이동 (하루 전으로)
+        current_end = current_start - timedelta(days=1)
+
+    return windows
+
+
+def _fetch_range(
+    stock_code: str,
+    start_dt: datetime,
+    end_dt: datetime,
+    period: str,
+    adjusted: bool
+) -> pd.DataFrame:
+    """
+    start_dt ~ end_dt 구간 전체를 여러 번 나눠 조회해서 backtesting.py 형식으로 변환
+
+    KIS API는 한 번에 최대 100개 봉만 반환하므로, 조회 구간을 미리 나눠 두고
+    ka.fan_out 으로 동시에 조회한 뒤 한 번에 합침 (호출 속도는 ka._url_fetch 의 속도 제한을 따름)
+    데이터가 없는 구간이면 빈 DataFrame 반환
+
+    Raises:
+        ka.KISAPIError: 구간 조회 API 호출 실패
+    """
+    windows = _plan_windows(start_dt, end_dt, period)
+    fetched = ka.fan_out(
+        lambda start, end: _fetch_chart_window(stock_code, start, end, period, adjusted),
+        {window: window for window in windows}
+    )
+
+    # 한 구간이라도 실패하면 데이터가 빠지지 않도록 예외
+    if fetched.errors:
+        raise next(iter(fetched.errors.values()))
+
+    all_data = [df for df in fetched.results.values() if not df.empty]
+
+    if not all_data:
+        return pd.DataFrame(columns=OHLCV_COLUMNS, index=pd.DatetimeIndex([], name='Date'))
+
+    # 모든 데이터 합치기
+    combined_df = pd.concat(all_data, ignore_index=True)
+
+    # 중복 제거 (날짜 기준, 구간이 겹치지 않으므로 방어용)
+    combined_df = combined_df.drop_duplicates(subset=['stck_bsop_date'], keep='first')
+
+    # backtesting.py 형식으로 변환 (숫자/날짜 타입은 kis_schema 에서 변환됨)
+    result_df = combined_df[['stck_oprc', 'stck_hgpr', 'stck_lwpr', 'stck_clpr', 'acml_vol']]
+    result_df.columns = OHLCV_COLUMNS
+
+    # 날짜를 인덱스로 설정
+    result_df.index = pd.DatetimeIndex(combined_df['stck_bsop_date'], name='Date')
+
+    # 날짜 순으로 정렬 (오래된 날짜 -> 최근 날짜)
+    return result_df.sort_index()
+
+
+def _minute_cursors(day: date) -> list:
+    """
+    하루치 1분봉을 빠짐없이 받는 조회 시각 목록 (마감 시각부터 1회 최대 건수 분씩 앞으로)
+
+    응답은 입력 시각부터 과거 방향으로 최대 건수만큼이므로 각 조회는 적어도 입력 시각 전 (최대 건수)분을 덮고,
+    거래가 없는 분이 있으면 더 앞까지 받아서 겹칠 뿐 빠지는 분은 없습니다.
+    조회 시각을 미리 정해 두므로 한 날짜의 조회도 서로 기다리지 않고 동시에 호출할 수 있습니다.
+    """
+    calendar = get_calendar()
+    now = TradingCalendar.now()
+    step = TODAY_MINUTE_MAX_ROWS if day == now.date() else MINUTE_MAX_ROWS
+    t = datetime.combine(day, calendar.close_time)
+    if day == now.date():
+        t = min(t, now.replace(tzinfo=None, second=0, microsecond=0))
+    session_open = datetime.combine(day, calendar.open_time)
+
+    cursors = []
+    while t >= session_open:
+        cursors.append(t.strftime("%H%M%S"))
+        t -= timedelta(minutes=step)
+    return cursors
+
+
+def _fetch_minute_page(stock_code: str, day: date, hour: str) -> list:
+    """
+    입력 시각 hour 부터 과거 방향 1분봉 한 페이지 (day 의 봉만)
+
+    당일은 주식당일분봉조회(30건), 지난 날짜는 주식일별분봉조회(120건)
+
+    Raises:
+        ka.KISAPIError: API 호출 실패
+    """
+    ymd = day.strftime("%Y%m%d")
+    if day == TradingCalendar.now().date():
+        api_url, tr_id = TODAY_MINUTE_API_URL, TODAY_MINUTE_TR_ID
+        params = {
+            "FID_COND_MRKT_DIV_CODE": "J",
+            "FID_INPUT_ISCD": stock_code,
+            "FID_INPUT_HOUR_1": hour,
+            "FID_PW_DATA_INCU_YN": "N",
+            "FID_ETC_CLS_CODE": "",
+        }
+    else:
+        api_url, tr_id = MINUTE_API_URL, MINUTE_TR_ID
+        params = {
+            "FID_COND_MRKT_DIV_CODE": "J",
+            "FID_INPUT_ISCD": stock_code,
+            "FID_INPUT_HOUR_1": hour,
+            "FID_INPUT_DATE_1": ymd,
+            "FID_PW_DATA_INCU_YN": "N",
+            "FID_FAKE_TICK_INCU_YN": "",
+        }
+
+    res = ka._url_fetch(api_url, tr_id, "", params)
+    if not res.isOK():
+        raise ka.KISAPIError(res, api_url)
+    return [r for r in (res.getBody().output2 or []) if r.get('stck_bsop_date') == ymd and r.get('stck_cntg_hour')]
+
+
+def _minute_bars(day: date, pages: list) -> np.ndarray:
+    """하루치 조회 페이지들 → 1분봉 배열 (겹친 분은 한 번만)"""
+    records = [r for page in pages for r in page]
+    if not records:
+        return np.empty(0, dtype=ohlcv_store.MINUTE_BAR_DTYPE)
+
+    ymd = day.strftime("%Y%m%d")
+    df = pd.DataFrame(records).drop_duplicates(subset=['stck_cntg_hour'])
+    index = pd.DatetimeIndex(pd.to_datetime(ymd + df['stck_cntg_hour'], format="%Y%m%d%H%M%S"), name='Date')
+    df = kis_schema.decode(df, MINUTE_TR_ID, "output2")
+    result_df = df[['stck_oprc', 'stck_hgpr', 'stck_lwpr', 'stck_prpr', 'cntg_vol']]
+    result_df.columns = OHLCV_COLUMNS
+    result_df.index = index
+    return ohlcv_store.to_bars(result_df, ohlcv_store.MINUTE_BAR_DTYPE)
+
+
+def _fetch_minute_bars(stock_code: str, start: date, end: date) -> np.ndarray:
+    """start ~ end 거래일의 1분봉 (날짜 x 조회 시각 동시 조회)"""
+    pages = {
+        (day, hour): (stock_code, day, hour)
+        for day in (d.date() for d in _trading_days(start, end))
+        for hour in _minute_cursors(day)
+    }
+    fetched = ka.fan_out(_fetch_minute_page, pages)
+    if fetched.errors:
+        raise next(iter(fetched.errors.values()))
+
+    by_day = {}
+    for (day, _), page in fetched.results.items():
+        by_day.setdefault(day, []).append(page)
+    bars = [_minute_bars(day, day_pages) for day, day_pages in by_day.items()]
+    return _concat_minute_bars(bars)
+
+
+def _concat_minute_bars(bars: list) -> np.ndarray:
+    if not bars:
+        return np.empty(0, dtype=ohlcv_store.MINUTE_BAR_DTYPE)
+    return np.sort(np.concatenate(bars), order="Date", kind="stable")
+
+
+def _minute_ranges(coverage, start: date, end: date) -> list:
+    """저장된 구간과 이어지도록 start ~ end 중 받아야 할 구간 (저장된 구간이 없으면 전체)"""
+    if coverage is None:
+        return [(start, end)] if start <= end else []
+    lo, hi = coverage
+    ranges = []
+    if start < lo:
+        ranges.append((start, lo - timedelta(days=1)))
+    if end > hi:
+        ranges.append((hi + timedelta(days=1), end))
+    return ranges
+
+
+def _store_minutes(store: ohlcv_store.OHLCVStore, stock_code: str, fetched: list, bars=None, coverage=None) -> np.ndarray:
+    """
+    받은 구간별 1분봉 [(시작일, 종료일, 봉 배열), ...] 을 저장소에 합쳐서 저장 (store.lock 안에서 호출)
+
+    오늘 봉은 장중에 늘어나므로 받은 구간은 어제까지만 기록 (오늘은 매번 다시 조회)
+    """
+    bars = np.empty(0, dtype=ohlcv_store.MINUTE_BAR_DTYPE) if bars is None else np.array(bars)
+    lo, hi = coverage or (None, None)
+    for since, until, new in fetched:
+        bars = ohlcv_store.merge_bars(bars, new, since, until)
+        lo = since if lo is None else min(lo, since)
+        hi = until if hi is None else max(hi, until)
+
+    if lo is not None:
+        hi = min(hi, TradingCalendar.now().date() - timedelta(days=1))
+        if hi >= lo:
+            store.write(stock_code, MINUTE_PERIOD, False, bars, (lo, hi))
+    return bars
+
+
+def _sync_minutes(store: ohlcv_store.OHLCVStore, stock_code: str, start: date, end: date) -> np.ndarray:
+    """
+    1분봉 저장소에 없는 날짜만 조회해서 추가하고 전체 1분봉 배열 반환 (분봉은 원주가로만 저장)
+    """
+    with store.lock(stock_code, MINUTE_PERIOD, False):
+        bars, coverage = store.read(stock_code, MINUTE_PERIOD, False)
+        ranges = _minute_ranges(coverage, start, end)
+        if not ranges:
+            return bars
+        fetched = [(lo, hi, _fetch_minute_bars(stock_code, lo, hi)) for lo, hi in ranges]
+        return _store_minutes(store, stock_code, fetched, bars, coverage)
+
+
+def load_minute_data(
+    stock_code: str,
+    start_date: str,
+    end_date: str,
+    minutes: int = 1,
+    use_store: bool = True
+) -> pd.DataFrame:
+    """
+    1분봉 저장소에서 분봉 로드 (N분봉은 1분봉을 장 시작 시각 기준으로 리샘플링)
+
+    1분봉을 한 번 받아 두면 3/5/10/30/60분봉은 API 호출 없이 계산합니다.
+    KIS 는 분봉을 최대 1년까지 보관하므로 그 이전 날짜는 빈 구간입니다.
+
+    Args:
+        stock_code: 종목 코드
+        start_date: 시작일 (YYYYMMDD)
+        end_date: 종료일 (YYYYMMDD)
+        minutes: 봉 주기 (분)
+        use_store: False면 로컬 저장소를 쓰지 않고 전체 구간을 API로 조회
+
+    Returns:
+        pd.DataFrame: backtesting.py 형식 분봉 (원주가)
+    """
+    start = datetime.strptime(start_date, "%Y%m%d").date()
+    end = datetime.strptime(end_date, "%Y%m%d").date()
+
+    store = ohlcv_store.get_store() if use_store else None
+    if store is not None:
+        bars = ohlcv_store.slice_bars(_sync_minutes(store, stock_code, start, end), start, end)
+    else:
+        bars = _fetch_minute_bars(stock_code, start, end)
+
+    df = ohlcv_store.to_frame(bars)
+    if minutes == 1:
+        return df
+    calendar = get_calendar()
+    return resample(df, minutes, calendar.open_time, calendar.close_time)
+
+
+def backfill_minutes(
+    codes,
+    start_date: str,
+    end_date: str,
+    max_workers: Optional[int] = None,
+    on_progress=None
+) -> ka.FanOutResult:
+    """
+    여러 종목 1분봉을 저장소에 백필 (중단돼도 다시 실행하면 받은 날짜부터 이어서 진행)
+
+    1. 종목별로 저장소에 없는 거래일을 찾고, 날짜마다 조회 시각(_minute_cursors)을 미리 정함
+    2. (종목, 날짜, 조회 시각) 전체를 ka.fan_out 으로 호출 한도 안에서 동시에 조회
+    3. 한 날짜의 조회가 모두 끝나면 그 날짜의 1분봉을 체크포인트({저장소}/checkpoints/1/{종목}/{날짜}.npy)에 기록
+    4. 종목의 모든 날짜가 끝나면 저장소에 합치고 체크포인트 삭제
+    실패한 날짜가 있는 종목은 저장소에 합치지 않고 체크포인트를 남겨 두므로, 다시 실행하면 남은 날짜만 조회합니다.
+    오늘은 장중에 봉이 늘어나므로 백필하지 않습니다 (어제까지).
+
+    Args:
+        codes: 종목 코드 목록
+        start_date: 시작일 (YYYYMMDD, KIS 분봉 보관 기간은 최대 1년)
+        end_date: 종료일 (YYYYMMDD)
+        max_workers: 동시 호출 수 (기본: 초당 호출 한도)
+        on_progress: 조회 1건마다 on_progress(완료 수, 전체 수, (종목, 날짜, 시각), 레코드, 예외)
+
+    Returns:
+        ka.FanOutResult: results {종목: 저장소의 1분봉 수}, errors {종목: 첫 예외}
+
+    Example:
+        >>> r = backfill_minutes(["069500", "122630", "114800", "252670"], "20240101", "20241231")
+        >>> r.errors  # 실패한 종목은 다시 실행하면 이어서 진행
+    """
+    store = ohlcv_store.get_store()
+    if store is None:
+        raise ValueError("1분봉 백필에는 로컬 저장소가 필요합니다 (OHLCV_STORE=true)")
+    checkpoint = BackfillCheckpoint(os.path.join(store.root, "checkpoints", MINUTE_PERIOD))
+
+    start = datetime.strptime(start_date, "%Y%m%d").date()
+    end = min(datetime.strptime(end_date, "%Y%m%d").date(), TradingCalendar.now().date() - timedelta(days=1))
+
+    # 1. 계획: 종목별 받을 구간 / 날짜, 체크포인트에 없는 날짜의 조회 시각
+    plans = {}
+    pages = {}
+    remaining = {}
+    for code in dict.fromkeys(codes):
+        _, coverage = store.read(code, MINUTE_PERIOD, False)
+        ranges = _minute_ranges(coverage, start, end)
+        plans[code] = ranges
+        for lo, hi in ranges:
+            for day in (d.date() for d in _trading_days(lo, hi)):
+                if checkpoint.done(code, day):
+                    continue
+                cursors = _minute_cursors(day)
+                remaining[(code, day)] = len(cursors)
+                for hour in cursors:
+                    pages[(code, day, hour)] = (code, day, hour)
+
+    # 2~3. 동시 조회, 날짜가 끝날 때마다 체크포인트 기록 (on_progress 는 호출한 스레드에서 실행)
+    collected = {}
+
+    def progress(done, total, key, page, error):
+        code, day, _ = key
+        if error is None:
+            collected.setdefault((code, day), []).append(page)
+            remaining[(code, day)] -= 1
+            if remaining[(code, day)] == 0:
+                checkpoint.save(code, day, _minute_bars(day, collected.pop((code, day))))
+        if on_progress is not None:
+            on_progress(done, total, key, page, error)
+
+    fetched = ka.fan_out(_fetch_minute_page, pages, max_workers=max_workers, on_progress=progress)
+
+    # 4. 모든 날짜를 받은 종목만 저장소에 합침
+    failed = {}
+    for (code, _, _), error in fetched.errors.items():
+        failed.setdefault(code, error)
+
+    results = {}
+    for code, ranges in plans.items():
+        if code in failed:
+            continue
+        with store.lock(code, MINUTE_PERIOD, False):
+            bars, coverage = store.read(code, MINUTE_PERIOD, False)
+            staged = [
+                (lo, hi, _concat_minute_bars([checkpoint.load(code, d.date()) for d in _trading_days(lo, hi)]))
+                for lo, hi in ranges
+            ]
+            bars = _store_minutes(store, code, staged, bars, coverage) if staged else bars
+        checkpoint.clear(code)
+        results[code] = 0 if bars is None else len(bars)
+
+    return ka.FanOutResult(results, failed)
+
+
+def _fetch_bars(stock_code: str, start: date, end: date, period: str, adjusted: bool) -> np.ndarray:
+    df = _fetch_range(
+        stock_code,
+        datetime.combine(start, datetime.min.time()),
+        datetime.combine(end, datetime.min.time()),
+        period,
+        adjusted
+    )
+    return ohlcv_store.to_bars(df)
+
+
+def _same_bar(bars: np.ndarray, new: np.ndarray, day) -> bool:
+    """저장된 봉과 새로 받은 봉의 같은 날짜 종가 비교 (수정주가 기준이 바뀌었는지 확인용)"""
+    old = bars[bars["Date"] == day]
+    got = new[new["Date"] == day]
+    if len(old) == 0 or len(got) == 0:
+        return True
+    return bool(np.isclose(old["Close"][0], got["Close"][0]))
+
+
+def _sync_store(
+    store: ohlcv_store.OHLCVStore,
+    stock_code: str,
+    start: date,
+    end: date,
+    period: str,
+    adjusted: bool
+) -> np.ndarray:
+    """
+    저장소에 없는 구간만 API 로 조회해서 추가하고 전체 봉 배열 반환
+
+    - 앞/뒤로 모자란 구간만 조회하고, 저장된 첫/마지막 봉을 한 개 겹쳐 받아서 비교
+    - 수정주가 데이터에서 겹친 봉의 종가가 다르면 (권리락, 액면분할 등으로 기준 변경) 전체 구간을 다시 조회
+    - 오늘 봉은 장중에 바뀌므로 받은 구간은 어제까지만 기록 (주/월/년봉은 마지막 봉 전날까지)
+    """
+    with store.lock(stock_code, period, adjusted):
+        bars, coverage = store.read(stock_code, period, adjusted)
+
+        if bars is None:
+            lo, hi = start, end
+            bars = _fetch_bars(stock_code, lo, hi, period, adjusted)
+        else:
+            lo, hi = coverage
+            if start >= lo and end <= hi:
+                return bars
+
+            dates = bars["Date"]
+            fetched = []
+            rebuild = False
+            if start < lo:
+                until = dates[0].astype(date) if len(bars) else lo - timedelta(days=1)
+                fetched.append((start, until, _fetch_bars(stock_code, start, until, period, adjusted)))
+            if end > hi:
+                since = min(hi + timedelta(days=1), dates[-1].astype(date)) if len(bars) else hi + timedelta(days=1)
+                fetched.append((since, end, _fetch_bars(stock_code, since, end, period, adjusted)))
+
+            if adjusted and len(bars):
+                rebuild = not all(
+                    _same_bar(bars, new, edge)
+                    for _, _, new in fetched
+                    for edge in (dates[0], dates[-1])
+                )
+
+            lo, hi = min(start, lo), max(end, hi)
+            if rebuild:
+                bars = _fetch_bars(stock_code, lo, hi, period, adjusted)
+            else:
+                bars = np.array(bars)
+                for since, until, new in fetched:
+                    bars = ohlcv_store.merge_bars(bars, new, since, until)
+
+        hi = min(hi, date.today() - timedelta(days=1))
+        if period != "D" and len(bars):
+            hi = min(hi, bars["Date"][-1].astype(date) - timedelta(days=1))
+        store.write(stock_code, period, adjusted, bars, (lo, hi))
+        return bars
 
 
 def load_stock_data(
@@ -18,13 +588,17 @@ def load_stock_data(
     start_date: str,
     end_date: str,
     adjusted: bool = True,
-    period: str = "D"
+    period: str = "D",
+    use_store: bool = True
 ) -> pd.DataFrame:
     """
     KIS API에서 주식 데이터를 가져와 backtesting.py 형식으로 변환
 
     KIS API는 한 번에 최대 100개 봉만 반환하므로,
     여러 번 요청해서 데이터를 이어붙임
+    일/주/월/년봉은 로컬 저장소(market_data.OHLCVStore)에 보관해서, 이미 받은 구간은 API 호출 없이 읽고
+    모자란 구간만 조회해서 추가함
+    분봉은 1분봉만 저장소에 보관하고 요청한 주기로 리샘플링함 (load_minute_data)
 
     Args:
         stock_code: 종목 코드 (예: "005930" - 삼성전자)
@@ -41,87 +615,406 @@ def load_stock_data(
             - "10": 10분봉
             - "30": 30분봉
             - "60": 60분봉 (1시간봉)
+        use_store: False면 로컬 저장소를 쓰지 않고 전체 구간을 API로 조회
+
+    LOCAL_ADJUSTMENT=true 면 수정주가 일봉은 KIS 수정주가를 받지 않고 원주가에 기업 행사
+    (load_corporate_actions) 계수를 곱해서 만듭니다.
 
     Returns:
         pd.DataFrame: backtesting.py 형식의 DataFrame
             - Index: 날짜/시간 (datetime)
             - Columns: Open, High, Low, Close, Volume
 
+    Raises:
+        ka.KISAPIError: 구간 조회 API 호출 실패 (일부 구간이 빠진 데이터를 반환하지 않음)
+        NoDataError: 구간에 봉이 없음
+
     Example:
         >>> ka.auth(svr="prod")  # 먼저 인증 필요
         >>> df = load_stock_data("005930", "20220101", "20231231")  # 일봉
         >>> df_hourly = load_stock_data("005930", "20220101", "20231231", period="60")  # 1시간봉
         >>> print(df.head())
     """
+    start_dt = datetime.strptime(start_date, "%Y%m%d")
+    end_dt = datetime.strptime(end_date, "%Y%m%d")
+
     # KIS API 인증 (아직 인증 안 되어 있으면)
     try:
         ka.getTREnv().my_token
     except AttributeError:
         ka.auth(svr="prod")
 
-    # 실전투자 환경
-    env_dv = "real"
+    # 수정주가를 원주가 + 기업 행사 계수로 직접 계산 (수정 기준일 = 조회 종료일)
+    if adjusted and settings.local_adjustment and period == "D":
+        raw_df = load_stock_data(stock_code, start_date, end_date, adjusted=False, period=period, use_store=use_store)
+        events = load_corporate_actions(start_date, end_date)
+        return adjust(raw_df, events[events["code"] == stock_code])
 
-    # 날짜 범위를 100일씩 나눠서 여러 번 요청
-    all_data = []
+    # 분봉은 1분봉 저장소에서 리샘플링 (분봉 API 는 원주가만 제공, 수정주가는 로컬 수정 설정 시 계산)
+    if period.isdigit() and use_store and ohlcv_store.get_store() is not None:
+        result_df = load_minute_data(stock_code, start_date, end_date, minutes=int(period))
+        if adjusted and settings.local_adjustment and not result_df.empty:
+            events = load_corporate_actions(start_date, end_date)
+            result_df = adjust(result_df, events[events["code"] == stock_code])
+        if result_df.empty:
+            raise NoDataError(f"데이터를 가져올 수 없습니다: {stock_code}")
+        return result_df
 
-    start_dt = datetime.strptime(start_date, "%Y%m%d")
-    end_dt = datetime.strptime(end_date, "%Y%m%d")
+    store = ohlcv_store.get_store() if use_store and period in STORE_PERIODS else None
+    if store is not None:
+        bars = _sync_store(store, stock_code, start_dt.date(), end_dt.date(), period, adjusted)
+        result_df = ohlcv_store.to_frame(ohlcv_store.slice_bars(bars, start_dt.date(), end_dt.date()))
+    else:
+        result_df = _fetch_range(stock_code, start_dt, end_dt, period, adjusted)
 
-    current_end = end_dt
+    if result_df.empty:
+        raise NoDataError(f"데이터를 가져올 수 없습니다: {stock_code}")
 
-    while current_end >= start_dt:
-        # 기간 계산 (분봉/시간봉은 더 짧은 기간으로)
-        if period in ["1", "5", "10", "30", "60"]:
-            # 분봉/시간봉: 더 짧은 기간 (약 10일)
-            current_start = max(current_end - timedelta(days=10), start_dt)
-        else:
-            # 일봉/주봉/월봉: 100일 전 날짜 계산 (주말 포함해서 약 140일 = 100 거래일)
-            current_start = max(current_end - timedelta(days=140), start_dt)
-
-        # API 호출
-        _, df = inquire_daily_itemchartprice(
-            env_dv=env_dv,
-            fid_cond_mrkt_div_code="J",  # J: KRX
-            fid_input_iscd=stock_code,
-            fid_input_date_1=current_start.strftime("%Y%m%d"),
-            fid_input_date_2=current_end.strftime("%Y%m%d"),
-            fid_period_div_code=period,  # 동적으로 period 설정
-            fid_org_adj_prc="0" if adjusted else "1"  # 0: 수정주가, 1: 원주가
-        )
-
-        if not df.empty:
-            all_data.append(df)
+    return result_df
 
-        # 다음 구간으로 이동 (하루 전으로)
-        current_end = current_start - timedelta(days=1)
 
-        # API rate limit 방지 (초당 20회 제한)
-        time.sleep(0.1)
+def load_panel(
+    codes,
+    start_date: str,
+    end_date: str,
+    period: str = "D",
+    adjusted: bool = True,
+    how: str = "outer",
+    skip_missing: bool = False
+) -> Panel:
+    """
+    여러 종목 데이터를 날짜 정렬된 패널(필드 × 날짜 × 종목)로 로드
 
-    if not all_data:
-        raise ValueError(f"데이터를 가져올 수 없습니다: {stock_code}")
+    종목별 load_stock_data 를 ka.fan_out 으로 동시에 실행한 뒤 공통 날짜 인덱스 하나에 맞춥니다.
 
-    # 모든 데이터 합치기
-    combined_df = pd.concat(all_data, ignore_index=True)
+    Args:
+        codes: 종목 코드 목록
+        start_date: 시작일 (YYYYMMDD)
+        end_date: 종료일 (YYYYMMDD)
+        period: 봉 주기 (load_stock_data 와 동일)
+        adjusted: True면 수정주가, False면 원주가
+        how: "outer" 면 날짜 합집합 (봉이 없는 자리는 NaN, mask False), "inner" 면 모든 종목에 봉이 있는 날짜만
+        skip_missing: True 면 구간에 봉이 없는 종목(NoDataError)은 패널에서 빼고 진행 (panel.symbols 로 확인)
 
-    # 중복 제거 (날짜 기준)
-    combined_df = combined_df.drop_duplicates(subset=['stck_bsop_date'], keep='first')
+    Returns:
+        Panel: values (필드, 날짜, 종목), mask (날짜, 종목), dates, symbols
+
+    Raises:
+        ka.KISAPIError, ValueError: 종목 데이터 로드 실패 (일부 종목이 빠진 패널을 반환하지 않음)
+
+    Example:
+        >>> panel = load_panel(["233740", "251340"], "20200101", "20241231", how="inner")
+        >>> panel.frame("Close").pct_change()
+    """
+    codes = list(dict.fromkeys(codes))
+    loaded = ka.fan_out(
+        lambda code: load_stock_data(code, start_date, end_date, adjusted=adjusted, period=period),
+        codes
+    )
+    for error in loaded.errors.values():
+        if not (skip_missing and isinstance(error, NoDataError)):
+            raise error
+
+    return build_panel(loaded.results, how=how)
+
+
+def snapshot_store() -> Optional[SnapshotStore]:
+    """로컬 저장소의 데이터셋 스냅샷 ({저장소}/snapshots, 저장소를 쓰지 않으면 None)"""
+    store = ohlcv_store.get_store()
+    return SnapshotStore(os.path.join(store.root, "snapshots")) if store is not None else None
+
+
+def result_cache() -> Optional[ResultCache]:
+    """스냅샷별 백테스트 결과 캐시 (저장소를 쓰지 않으면 None)"""
+    store = ohlcv_store.get_store()
+    return ResultCache(os.path.join(store.root, "snapshots")) if store is not None else None
+
+
+def load_snapshot(
+    codes,
+    start_date: str,
+    end_date: str,
+    period: str = "D",
+    adjusted: bool = True,
+    snapshot_id: Optional[str] = None,
+    refresh: bool = False
+) -> tuple:
+    """
+    여러 종목 패널을 데이터셋 스냅샷으로 로드 (백테스트 재현용)
+
+    - snapshot_id 를 주면 그 스냅샷을 그대로 사용 (API 조회 없음)
+    - 없으면 같은 조건(종목, 구간, 봉 주기, 수정주가 여부)으로 마지막에 만든 스냅샷을 사용
+      (종료일이 오늘 이후면 아직 봉이 추가될 수 있으므로 재사용하지 않음)
+    - refresh=True 거나 스냅샷이 없으면 load_panel 로 로드해서 새 스냅샷 저장 (내용이 같으면 ID 도 같음)
+    로컬 저장소를 쓰지 않으면(OHLCV_STORE=false) 스냅샷 없이 load_panel 결과를 반환합니다.
+
+    Returns:
+        (스냅샷 ID, Panel), 저장소를 쓰지 않으면 (None, Panel)
+
+    Raises:
+        KeyError: 없는 snapshot_id
+        ValueError: 저장소 없이 snapshot_id 를 지정, snapshot_id 형식이 아님
+
+    Example:
+        >>> sid, panel = load_snapshot(["233740", "251340"], "20200101", "20241231")
+        >>> sid, panel = load_snapshot([], "", "", snapshot_id=sid)  # 같은 데이터로 다시 실행
+    """
+    snapshots = snapshot_store()
+    if snapshots is None:
+        if snapshot_id is not None:
+            raise ValueError("스냅샷을 사용하려면 로컬 저장소가 필요합니다 (OHLCV_STORE=true)")
+        return None, load_panel(codes, start_date, end_date, period=period, adjusted=adjusted)
+
+    if snapshot_id is not None:
+        return snapshot_id, snapshots.load(snapshot_id)
 
-    # backtesting.py 형식으로 변환
-    result_df = pd.DataFrame({
-        'Open': pd.to_numeric(combined_df['stck_oprc']),
-        'High': pd.to_numeric(combined_df['stck_hgpr']),
-        'Low': pd.to_numeric(combined_df['stck_lwpr']),
-        'Close': pd.to_numeric(combined_df['stck_clpr']),
-        'Volume': pd.to_numeric(combined_df['acml_vol'])
+    codes = list(dict.fromkeys(codes))
+    spec = {"symbols": codes, "start": start_date, "end": end_date, "period": period, "adjusted": adjusted}
+    still_open = end_date >= date.today().strftime("%Y%m%d")
+    latest = None if refresh or still_open else snapshots.latest(spec)
+    if latest is not None:
+        return latest, snapshots.load(latest)
+
+    panel = load_panel(codes, start_date, end_date, period=period, adjusted=adjusted)
+    return snapshots.save(panel, spec), panel
+
+
+def build_universe(
+    codes,
+    start_date: str,
+    end_date: str,
+    universe: Optional[Universe] = None
+) -> int:
+    """
+    전 종목 유니버스에 과거 일봉(원주가) 적재
+
+    유니버스의 마지막 날짜 이후 구간만 load_panel 로 받아 날짜 순서대로 추가합니다.
+    유니버스는 날짜를 뒤에 이어붙이기만 하므로 수정주가가 아닌 원주가를 저장합니다.
+    구간에 봉이 없는 종목(거래정지, 종료일 이후 상장 등)은 건너뛰고 경고 로그로 남깁니다.
+
+    Args:
+        codes: 종목 코드 목록 (KOSPI + KOSDAQ 전체 등)
+        start_date: 시작일 (YYYYMMDD)
+        end_date: 종료일 (YYYYMMDD)
+        universe: 대상 유니버스 (기본: market_data.get_universe())
+
+    Returns:
+        int: 추가한 날짜 수
+    """
+    if universe is None:
+        universe = get_universe()
+    last = universe.last_date
+    if last is not None:
+        start_date = max(start_date, (last + timedelta(days=1)).strftime("%Y%m%d"))
+    if start_date > end_date:
+        return 0
+
+    codes = list(dict.fromkeys(codes))
+    panel = load_panel(codes, start_date, end_date, adjusted=False, skip_missing=True)
+    loaded = set(panel.symbols)
+    skipped = [code for code in codes if code not in loaded]
+    if skipped:
+        logging.warning("[Universe] %d codes have no bars in %s ~ %s, skipped: %s",
+                        len(skipped), start_date, end_date, ", ".join(skipped))
+    return universe.append_panel(panel)
+
+
+def sync_universe(
+    codes=None,
+    universe: Optional[Universe] = None
+) -> bool:
+    """
+    장 마감 후 당일 일봉을 유니버스에 하루치 추가
+
+    멀티종목 시세(get_quotes, 30종목당 1회 호출)로 전 종목 당일 시가/고가/저가/종가/거래량을 받으므로
+    2,500종목이면 약 84회 호출로 끝납니다. 시세는 호출 시점 값이라 과거 날짜는 기록할 수 없고,
+    장중에 추가한 봉은 나중에 고칠 수 없으므로 거래일 정규장 마감 후(한국 시간)에만 추가합니다.
+
+    Args:
+        codes: 종목 코드 목록 (기본: 유니버스에 있는 전체 종목)
+        universe: 대상 유니버스 (기본: market_data.get_universe())
+
+    Returns:
+        bool: 추가했으면 True (휴장일, 장 마감 전, 이미 있는 날짜, 조회 결과 없음이면 False)
+    """
+    from domestic_stock.domestic_stock_functions import get_quotes
+
+    if universe is None:
+        universe = get_universe()
+    calendar = get_calendar()
+    now = calendar.now()
+    if not calendar.is_closed(now):
+        return False
+    day = now.date()
+
+    quotes = get_quotes(universe.codes if codes is None else codes)
+    if quotes.empty:
+        return False
+
+    bars = pd.DataFrame({
+        'Open': quotes['inter2_oprc'],
+        'High': quotes['inter2_hgpr'],
+        'Low': quotes['inter2_lwpr'],
+        'Close': quotes['inter2_prpr'],
+        'Volume': quotes['acml_vol'],
     })
+    # 거래정지 등으로 거래가 없는 종목은 봉 없음
+    bars = bars[bars['Volume'] > 0]
+    return universe.append(day, bars)
 
-    # 날짜를 인덱스로 설정 (YYYYMMDD -> datetime)
-    result_df.index = pd.to_datetime(combined_df['stck_bsop_date'], format='%Y%m%d')
-    result_df.index.name = 'Date'
 
-    # 날짜 순으로 정렬 (오래된 날짜 -> 최근 날짜)
-    result_df = result_df.sort_index()
+# 휴장일 조회 기본 구간: 처음엔 작년 1월 1일부터, 앞으로는 한 달 뒤까지 (발표된 휴장일)
+CALENDAR_LOOKAHEAD = timedelta(days=31)
+
+
+def _fetch_holidays(start: date, end: date) -> tuple:
+    """
+    chk_holiday 를 기준일을 옮겨가며 조회해서 start ~ end 의 개장일 여부 수집
+
+    Returns:
+        ({날짜: 개장일 여부}, 실제로 조회된 마지막 날짜), 조회된 날짜가 없으면 ({}, None)
+    """
+    from domestic_stock.domestic_stock_functions import chk_holiday
+
+    days = {}
+    last = None
+    bass = start
+    while bass <= end:
+        df = chk_holiday(bass.strftime("%Y%m%d"))
+        if df.empty:
+            break
+        dates = df["bass_dt"]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates.astype(str), format="%Y%m%d")
+        for d, opnd_yn in zip(dates.dt.date, df["opnd_yn"].astype(str)):
+            if start <= d <= end:
+                days[d] = opnd_yn == "Y"
+        got = dates.max().date()
+        if got < bass:
+            break
+        last = min(got, end)
+        bass = got + timedelta(days=1)
+    return days, last
+
+
+def sync_calendar(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    calendar: Optional[TradingCalendar] = None
+) -> TradingCalendar:
+    """
+    거래일 달력에 없는 구간의 휴장일을 조회해서 저장 (조회해 둔 구간은 다시 호출하지 않음)
+
+    국내휴장일조회(chk_holiday)는 가급적 1일 1회 호출하도록 안내된 API 이므로 하루 한 번
+    (장 시작 전 등) 호출하면 충분하고, 데이터 로더나 스케줄러는 저장된 달력만 읽습니다.
+    휴장일을 새로 받으면 market_time 의 장 시작/마감 시간도 함께 반영합니다.
+
+    Args:
+        start_date: 시작일 (YYYYMMDD, 기본: 작년 1월 1일 또는 저장된 구간 시작일)
+        end_date: 종료일 (YYYYMMDD, 기본: 한 달 뒤)
+        calendar: 대상 달력 (기본: market_data.get_calendar())
+
+    Returns:
+        TradingCalendar: 갱신된 달력
+    """
+    from domestic_stock.domestic_stock_functions import market_time
+
+    if calendar is None:
+        calendar = get_calendar()
+    today = TradingCalendar.now().date()
+    if start_date:
+        start = datetime.strptime(start_date, "%Y%m%d").date()
+    else:
+        start = calendar.coverage[0] if calendar.coverage else date(today.year - 1, 1, 1)
+    end = datetime.strptime(end_date, "%Y%m%d").date() if end_date else today + CALENDAR_LOOKAHEAD
+
+    updated = False
+    for lo, hi in calendar.missing(start, end):
+        days, last = _fetch_holidays(lo, hi)
+        # 저장된 구간 앞쪽은 끝까지 받아야 구간이 이어짐
+        if last is None or (calendar.coverage and hi < calendar.coverage[0] and last < hi):
+            continue
+        calendar.update(days, lo, last)
+        updated = True
+
+    if updated:
+        session = market_time()
+        if not session.empty and {"s_time", "e_time"} <= set(session.columns):
+            calendar.set_session(session["s_time"].iloc[0], session["e_time"].iloc[0])
+    return calendar
+
+
+def _fetch_ksdinfo(kind: str, start: date, end: date) -> pd.DataFrame:
+    """
+    예탁원정보 한 종류 조회 (기준일 start ~ end, 연속 조회 포함)
+
+    조회 실패를 "기업 행사 없음" 으로 취급하면 그 구간이 조회된 것으로 저장되어
+    분할/배당이 영구히 빠지므로 예외를 발생시킵니다.
+
+    Raises:
+        ka.KISAPIError: API 호출 실패
+    """
+    api_url, tr_id, params = KSDINFO_APIS[kind]
+    params = {**params, "F_DT": start.strftime("%Y%m%d"), "T_DT": end.strftime("%Y%m%d")}
+    res, pages = ka._paginate(api_url, tr_id, "", params, ("output1",))
+    if not res.isOK():
+        raise ka.KISAPIError(res, api_url)
+    return events_from_ksdinfo(kind, ka._toFrame(pages["output1"], tr_id, "output1"))
+
+
+def _fetch_corporate_actions(start: date, end: date) -> pd.DataFrame:
+    """
+    전 종목 기업 행사를 예탁원 정보 5종으로 조회 (기준일 start ~ end, 종류별 동시 조회)
+
+    Raises:
+        ka.KISAPIError: 한 종류라도 조회 실패 (일부 종류가 빠진 결과를 반환하지 않음)
+    """
+    fetched = ka.fan_out(lambda kind: _fetch_ksdinfo(kind, start, end), list(KSDINFO_APIS))
+    if fetched.errors:
+        raise next(iter(fetched.errors.values()))
+    return pd.concat(list(fetched.results.values()), ignore_index=True)
+
+
+def _action_store() -> Optional[ActionStore]:
+    store = ohlcv_store.get_store()
+    return ActionStore(os.path.join(store.root, "actions")) if store is not None else None
+
+
+def load_corporate_actions(start_date: str, end_date: str) -> pd.DataFrame:
+    """
+    전 종목 기업 행사 이벤트 (권리락/배당락/변경상장일이 start_date ~ end_date 인 이벤트)
+
+    예탁원 정보는 종목 구분 없이 전 종목을 한 번에 조회해서 로컬 저장소(OHLCV 저장소의 actions 폴더)에
+    보관하고, 저장된 기준일 구간 밖만 추가로 조회합니다.
+
+    Returns:
+        pd.DataFrame: market_data.adjustments 이벤트 (code, ex_date, kind, ratio, price)
+
+    Raises:
+        ka.KISAPIError: 예탁원정보 조회 실패 (조회 구간을 저장하지 않음)
+    """
+    start = datetime.strptime(start_date, "%Y%m%d").date() - KSDINFO_LOOKBACK
+    end = datetime.strptime(end_date, "%Y%m%d").date()
+
+    store = _action_store()
+    if store is None:
+        events = _fetch_corporate_actions(start, end)
+    else:
+        with _action_lock:
+            events, coverage = store.read()
+            lo, hi = coverage or (start, start - timedelta(days=1))
+            missing = []
+            if start < lo:
+                missing.append((start, lo - timedelta(days=1)))
+            if end > hi:
+                missing.append((max(start, hi + timedelta(days=1)), end))
+            if missing:
+                fetched = [_fetch_corporate_actions(a, b) for a, b in missing]
+                events = pd.concat([events, *fetched], ignore_index=True)
+                events = events.drop_duplicates(subset=["code", "ex_date", "kind"], keep="last")
+                # 오늘 이후 공시는 바뀔 수 있으므로 어제까지만 조회한 구간으로 기록
+                hi = min(max(end, hi), date.today() - timedelta(days=1))
+                store.write(events, (min(start, lo), hi))
 
-    return result_df
\ No newline at end of file
+    ex_date = events["ex_date"]
+    return events[(ex_date >= pd.Timestamp(start_date)) & (ex_date <= pd.Timestamp(end_date))].reset_index(drop=True)
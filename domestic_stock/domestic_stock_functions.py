@@ -1,12 +1,14 @@
 import logging
 import time
 import sys
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional, Tuple
 
 import pandas as pd
 
 sys.path.extend(['..', '.'])
 import kis_auth as ka
+import kis_schema
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
@@ -29,9 +31,6 @@ def after_hour_balance(
         fid_vol_cnt: str,  # 거래량 수
         fid_input_price_2: str,  # 입력 가격2
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 순위분석 
@@ -50,9 +49,6 @@ def after_hour_balance(
         fid_vol_cnt (str): 입력값 없을때 전체 (거래량 ~)
         fid_input_price_2 (str): 입력값 없을때 전체 (~ 가격)
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 시간외잔량 순위 데이터
@@ -93,11 +89,6 @@ def after_hour_balance(
         logger.error("fid_input_iscd is required. (e.g. '0000')")
         raise ValueError("fid_input_iscd is required. (e.g. '0000')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API 호출 URL 및 거래 ID 설정
 
     tr_id = "FHPST01760000"
@@ -117,44 +108,11 @@ def after_hour_balance(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
-    # API 호출 성공 시 데이터 처리
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        # 기존 데이터프레임과 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        # 다음 페이지 호출
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return after_hour_balance(
-                fid_input_price_1,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_rank_sort_cls_code,
-                fid_div_cls_code,
-                fid_input_iscd,
-                fid_trgt_exls_cls_code,
-                fid_trgt_cls_code,
-                fid_vol_cnt,
-                fid_input_price_2,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         # API 호출 실패 시 에러 로그 출력
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
@@ -180,9 +138,6 @@ def bulk_trans_num(
         fid_trgt_cls_code: str,  # 대상 구분 코드
         fid_vol_cnt: str,  # 거래량 수
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 순위분석 
@@ -203,9 +158,6 @@ def bulk_trans_num(
         fid_trgt_cls_code (str): 0:전체
         fid_vol_cnt (str): 거래량 ~
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 대량체결건수 상위 데이터
@@ -260,11 +212,6 @@ def bulk_trans_num(
         logger.error("fid_trgt_cls_code is required. (e.g. '0')")
         raise ValueError("fid_trgt_cls_code is required. (e.g. '0')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHKST190900C0"
 
     params = {
@@ -283,45 +230,11 @@ def bulk_trans_num(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 다음 페이지 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return bulk_trans_num(
-                fid_aply_rang_prc_2,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_rank_sort_cls_code,
-                fid_div_cls_code,
-                fid_input_price_1,
-                fid_aply_rang_prc_1,
-                fid_input_iscd_2,
-                fid_trgt_exls_cls_code,
-                fid_trgt_cls_code,
-                fid_vol_cnt,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         # API 호출 실패 시 에러 로그
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
@@ -405,7 +318,7 @@ def capture_uplowprice(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        return pd.DataFrame(res.getBody().output)
+        return ka._toFrame(res.getBody().output, tr_id, "output")
     else:
         res.printError(url=api_url)
         return pd.DataFrame()
@@ -420,9 +333,6 @@ def chk_holiday(
         NK100: str = "",  # 연속조회키
         FK100: str = "",  # 연속조회검색조건
         tr_cont: str = "",  # 연속거래여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 내부 재귀깊이 (자동관리)
-        max_depth: int = 10  # 최대 재귀 횟수 제한
 ) -> pd.DataFrame:
     """
     (★중요) 국내휴장일조회(TCA0903R) 서비스는 당사 원장서비스와 연관되어 있어 
@@ -437,9 +347,6 @@ def chk_holiday(
         NK100 (str): 연속조회키
         FK100 (str): 연속조회검색조건
         tr_cont (str): 연속거래여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 내부 재귀깊이 (자동관리)
-        max_depth (int): 최대 재귀 횟수 제한
 
     Returns:
         pd.DataFrame: 국내휴장일조회 데이터
@@ -453,13 +360,6 @@ def chk_holiday(
     if bass_dt == "":
         raise ValueError("bass_dt is required (e.g. 'YYYYMMDD')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe is None:
-            return pd.DataFrame()
-        else:
-            return dataframe
-
     tr_id = "CTCA0903R"  # 국내휴장일조회
 
     params = {
@@ -468,35 +368,14 @@ def chk_holiday(
         "CTX_AREA_NK": NK100
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(
+        api_url, tr_id, tr_cont, params, ("output",),
+        cursor={"CTX_AREA_FK": "ctx_area_fk", "CTX_AREA_NK": "ctx_area_nk"},
+    )
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk
-        NK100 = res.getBody().ctx_area_nk
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return chk_holiday(
-                bass_dt, NK100, FK100, "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe
+        logging.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         res.printError(url=api_url)
         return pd.DataFrame()
@@ -511,11 +390,7 @@ def comp_interest(
         fid_cond_scr_div_code: str,  # 조건화면분류코드
         fid_div_cls_code: str,  # 분류구분코드
         fid_div_cls_code1: str,  # 분류구분코드
-        dataframe1: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output1)
-        dataframe2: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output2)
         tr_cont: str = "",
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     [국내주식] 업종/기타 
@@ -527,11 +402,7 @@ def comp_interest(
         fid_cond_scr_div_code (str): 조건화면분류코드 (필수)
         fid_div_cls_code (str): 분류구분코드 (필수)
         fid_div_cls_code1 (str): 분류구분코드 (공백 허용)
-        dataframe1 (Optional[pd.DataFrame]): 누적 데이터프레임 (output1)
-        dataframe2 (Optional[pd.DataFrame]): 누적 데이터프레임 (output2)
         tr_cont (str): 연속 거래 여부
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 금리 종합(국내채권_금리) 데이터
@@ -558,11 +429,6 @@ def comp_interest(
         logger.error("fid_div_cls_code is required. (e.g. '1')")
         raise ValueError("fid_div_cls_code is required. (e.g. '1')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "FHPST07020000"
 
     params = {
@@ -573,44 +439,11 @@ def comp_interest(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                current_data1 = pd.DataFrame(output_data if isinstance(output_data, list) else [output_data])
-                dataframe1 = pd.concat([dataframe1, current_data1],
-                                       ignore_index=True) if dataframe1 is not None else current_data1
-            else:
-                dataframe1 = dataframe1 if dataframe1 is not None else pd.DataFrame()
-
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                current_data2 = pd.DataFrame(output_data if isinstance(output_data, list) else [output_data])
-                dataframe2 = pd.concat([dataframe2, current_data2],
-                                       ignore_index=True) if dataframe2 is not None else current_data2
-            else:
-                dataframe2 = dataframe2 if dataframe2 is not None else pd.DataFrame()
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return comp_interest(
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_div_cls_code,
-                fid_div_cls_code1,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1", "output2"))
+
+    if res.isOK():
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1"), ka._toFrame(pages["output2"], tr_id, "output2")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -664,7 +497,7 @@ def comp_program_trade_daily(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        return pd.DataFrame(res.getBody().output)
+        return ka._toFrame(res.getBody().output, tr_id, "output")
     else:
         res.printError(url=api_url)
         return pd.DataFrame()
@@ -728,7 +561,7 @@ def comp_program_trade_today(
 
     if res.isOK():
         # array 타입이므로 DataFrame으로 반환
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -746,11 +579,7 @@ def credit_balance(
         fid_option: str,  # 증가율기간
         fid_cond_mrkt_div_code: str,  # 조건 시장 분류 코드
         fid_rank_sort_cls_code: str,  # 순위 정렬 구분 코드
-        dataframe1: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output1)
-        dataframe2: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output2)
         tr_cont: str = "",
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     [국내주식] 순위분석 
@@ -763,11 +592,7 @@ def credit_balance(
         fid_option (str): 2~999
         fid_cond_mrkt_div_code (str): 시장구분코드 (주식 J)
         fid_rank_sort_cls_code (str): '(융자)0:잔고비율 상위, 1: 잔고수량 상위, 2: 잔고금액 상위, 3: 잔고비율 증가상위, 4: 잔고비율 감소상위  (대주)5:잔고비율 상위, 6: 잔고수량 상위, 7: 잔고금액 상위, 8: 잔고비율 증가상위, 9: 잔고비율 감소상위 '
-        dataframe1 (Optional[pd.DataFrame]): 누적 데이터프레임 (output1)
-        dataframe2 (Optional[pd.DataFrame]): 누적 데이터프레임 (output2)
         tr_cont (str): 연속 거래 여부
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 국내주식 신용잔고 상위 데이터
@@ -799,11 +624,6 @@ def credit_balance(
         logger.error("fid_rank_sort_cls_code is required. (e.g. '0')")
         raise ValueError("fid_rank_sort_cls_code is required. (e.g. '0')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "FHKST17010000"
 
     params = {
@@ -814,67 +634,11 @@ def credit_balance(
         "FID_RANK_SORT_CLS_CODE": fid_rank_sort_cls_code,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1", "output2"))
 
     if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                # output1은 단일 객체, output2는 배열일 수 있음
-                if isinstance(output_data, list):
-                    current_data1 = pd.DataFrame(output_data)
-                else:
-                    # 단일 객체인 경우 리스트로 감싸서 DataFrame 생성
-                    current_data1 = pd.DataFrame([output_data])
-
-                if dataframe1 is not None:
-                    dataframe1 = pd.concat([dataframe1, current_data1], ignore_index=True)
-                else:
-                    dataframe1 = current_data1
-            else:
-                if dataframe1 is None:
-                    dataframe1 = pd.DataFrame()
-        else:
-            if dataframe1 is None:
-                dataframe1 = pd.DataFrame()
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                # output1은 단일 객체, output2는 배열일 수 있음
-                if isinstance(output_data, list):
-                    current_data2 = pd.DataFrame(output_data)
-                else:
-                    # 단일 객체인 경우 리스트로 감싸서 DataFrame 생성
-                    current_data2 = pd.DataFrame([output_data])
-
-                if dataframe2 is not None:
-                    dataframe2 = pd.concat([dataframe2, current_data2], ignore_index=True)
-                else:
-                    dataframe2 = current_data2
-            else:
-                if dataframe2 is None:
-                    dataframe2 = pd.DataFrame()
-        else:
-            if dataframe2 is None:
-                dataframe2 = pd.DataFrame()
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return credit_balance(
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_option,
-                fid_cond_mrkt_div_code,
-                fid_rank_sort_cls_code,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1"), ka._toFrame(pages["output2"], tr_id, "output2")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -892,9 +656,6 @@ def credit_by_company(
         fid_cond_scr_div_code: str,  # 조건 화면 분류 코드
         fid_cond_mrkt_div_code: str,  # 조건 시장 분류 코드
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -908,9 +669,6 @@ def credit_by_company(
         fid_cond_scr_div_code (str): Unique key(20477)
         fid_cond_mrkt_div_code (str): 시장구분코드 (주식 J)
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 당사 신용가능종목 데이터
@@ -950,11 +708,6 @@ def credit_by_company(
         logger.error("fid_cond_mrkt_div_code is required. (e.g. 'J')")
         raise ValueError("fid_cond_mrkt_div_code is required. (e.g. 'J')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API 호출 URL 및 ID 설정
 
     tr_id = "FHPST04770000"
@@ -969,42 +722,11 @@ def credit_by_company(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
-    # API 호출 성공 시 데이터 처리
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 기존 데이터프레임과 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        # 다음 페이지 호출
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return credit_by_company(
-                fid_rank_sort_cls_code,
-                fid_slct_yn,
-                fid_input_iscd,
-                fid_cond_scr_div_code,
-                fid_cond_mrkt_div_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         # API 호출 실패 시 에러 로그 출력
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
@@ -1022,9 +744,6 @@ def daily_credit_balance(
         fid_input_iscd: str,  # [필수] 종목코드
         fid_input_date_1: str,  # [필수] 결제일자
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 내부 재귀깊이 (자동관리)
-        max_depth: int = 10  # 최대 재귀 횟수 제한
 ) -> pd.DataFrame:
     """
     국내주식 신용잔고 일별추이 API입니다.
@@ -1039,9 +758,6 @@ def daily_credit_balance(
         fid_input_iscd (str): [필수] 종목코드 (ex. 005930)
         fid_input_date_1 (str): [필수] 결제일자 (ex. 20240313)
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 내부 재귀깊이 (자동관리)
-        max_depth (int): 최대 재귀 횟수 제한
 
     Returns:
         pd.DataFrame: 국내주식 신용잔고 일별추이 데이터
@@ -1064,13 +780,6 @@ def daily_credit_balance(
     if fid_input_date_1 == "":
         raise ValueError("fid_input_date_1 is required (e.g. '20240313')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe is None:
-            return pd.DataFrame()
-        else:
-            return dataframe
-
     tr_id = "FHPST04760000"  # 국내주식 신용잔고 일별추이
 
     params = {
@@ -1080,28 +789,11 @@ def daily_credit_balance(
         "FID_INPUT_DATE_1": fid_input_date_1  # 결제일자
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return daily_credit_balance(
-                fid_cond_mrkt_div_code, fid_cond_scr_div_code, fid_input_iscd, fid_input_date_1, "N", dataframe,
-                depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe
+        logging.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         res.printError(url=api_url)
         return pd.DataFrame()
@@ -1158,7 +850,7 @@ def daily_loan_trans(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        result_data = pd.DataFrame(res.getBody().output1)
+        result_data = ka._toFrame(res.getBody().output1, tr_id, "output1")
         return result_data
     else:
         res.printError(url=api_url)
@@ -1194,6 +886,29 @@ def daily_short_sale(
     """
     api_url = "/uapi/domestic-stock/v1/quotations/daily-short-sale"
 
+    tr_id, params = _daily_short_sale_request(
+        fid_cond_mrkt_div_code, fid_input_iscd, fid_input_date_1, fid_input_date_2
+    )
+
+    res = ka._url_fetch(api_url, tr_id, "", params)
+
+    if res.isOK():
+        # output1 처리 (object 타입 -> DataFrame)
+        output1_data = ka._toFrame(res.getBody().output1, tr_id, "output1")
+
+        # output2 처리 (array 타입 -> DataFrame)
+        output2_data = ka._toFrame(res.getBody().output2, tr_id, "output2")
+
+        return output1_data, output2_data
+    else:
+        res.printError(url=api_url)
+        return pd.DataFrame(), pd.DataFrame()
+
+
+def _daily_short_sale_request(
+        fid_cond_mrkt_div_code, fid_input_iscd, fid_input_date_1, fid_input_date_2
+) -> Tuple[str, dict]:
+    """daily_short_sale / iter_daily_short_sale 공통: 파라미터 검증 후 (tr_id, params) 반환"""
     # 필수 파라미터 검증
     if fid_cond_mrkt_div_code == "":
         raise ValueError("fid_cond_mrkt_div_code is required (e.g. 'J:주식')")
@@ -1210,19 +925,63 @@ def daily_short_sale(
         "FID_INPUT_DATE_2": fid_input_date_2
     }
 
-    res = ka._url_fetch(api_url, tr_id, "", params)
+    return tr_id, params
 
-    if res.isOK():
-        # output1 처리 (object 타입 -> DataFrame)
-        output1_data = pd.DataFrame(res.getBody().output1, index=[0])
 
-        # output2 처리 (array 타입 -> DataFrame)
-        output2_data = pd.DataFrame(res.getBody().output2)
+def iter_daily_short_sale(
+        fid_cond_mrkt_div_code: str,  # [필수] 시장분류코드 (ex. J:주식)
+        fid_input_iscd: str,  # [필수] 종목코드 (ex. 123456)
+        fid_input_date_1: str = "",  # 시작일자
+        fid_input_date_2: str = "",  # 종료일자
+        records: bool = False,  # True: output2 레코드(dict) 단위로 반환
+) -> Iterator:
+    """
+    국내주식 공매도 일별추이 (구간 단위 generator)
+    이 API 는 연속조회(tr_cont)가 없어 한 번에 최근 일부 기간만 응답하므로,
+    응답의 가장 이른 일자 전날을 다음 요청의 종료일자로 넘기며 시작일자까지 거슬러 조회합니다.
 
-        return output1_data, output2_data
-    else:
-        res.printError(url=api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    Args:
+        daily_short_sale 와 동일
+        records (bool): True 면 output2 레코드(dict)를 한 건씩 반환
+
+    Yields:
+        Tuple[pd.DataFrame, pd.DataFrame]: 구간별 (output1, output2), records=True 면 output2 레코드(dict)
+
+    Raises:
+        ka.KISAPIError: API 오류 응답
+
+    Example:
+        >>> for df1, df2 in iter_daily_short_sale("J", "005930", "20200101", "20241231"):
+        ...     print(len(df2))
+    """
+    api_url = "/uapi/domestic-stock/v1/quotations/daily-short-sale"
+
+    tr_id, params = _daily_short_sale_request(
+        fid_cond_mrkt_div_code, fid_input_iscd, fid_input_date_1, fid_input_date_2
+    )
+
+    while True:
+        res = ka._url_fetch(api_url, tr_id, "", params)
+        if not res.isOK():
+            raise ka.KISAPIError(res, api_url)
+
+        dated = [r for r in (res.getBody().output2 or []) if r.get("stck_bsop_date")]
+        rows = [r for r in dated if not fid_input_date_1 or r["stck_bsop_date"] >= fid_input_date_1]
+        if not rows:
+            break
+
+        if records:
+            for row in rows:
+                yield row
+        else:
+            yield ka._toFrame(res.getBody().output1, tr_id, "output1"), ka._toFrame(rows, tr_id, "output2")
+
+        # 응답의 가장 이른 일자 전날부터 다시 조회
+        earliest = min(r["stck_bsop_date"] for r in dated)
+        next_end = (pd.Timestamp(earliest) - pd.Timedelta(days=1)).strftime("%Y%m%d")
+        if not fid_input_date_1 or next_end < fid_input_date_1 or next_end >= (params["FID_INPUT_DATE_2"] or "99999999"):
+            break
+        params = {**params, "FID_INPUT_DATE_2": next_end}
 
 
 ##############################################################################################
@@ -1242,9 +1001,6 @@ def disparity(
         fid_input_price_1: str,  # 입력 가격1
         fid_vol_cnt: str,  # 거래량 수
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 순위분석 
@@ -1264,9 +1020,6 @@ def disparity(
         fid_input_price_1 (str): 입력값 없을때 전체 (가격 ~)
         fid_vol_cnt (str): 입력값 없을때 전체 (거래량 ~)
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 이격도 순위 데이터
@@ -1313,11 +1066,6 @@ def disparity(
         logger.error("fid_input_iscd is required. (e.g. '0000')")
         raise ValueError("fid_input_iscd is required. (e.g. '0000')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPST01780000"
 
     params = {
@@ -1334,41 +1082,11 @@ def disparity(
         "fid_vol_cnt": fid_vol_cnt,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return disparity(
-                fid_input_price_2,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_div_cls_code,
-                fid_rank_sort_cls_code,
-                fid_hour_cls_code,
-                fid_input_iscd,
-                fid_trgt_cls_code,
-                fid_trgt_exls_cls_code,
-                fid_input_price_1,
-                fid_vol_cnt,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -1389,9 +1107,6 @@ def dividend_rate(
         t_dt: str,  # 기준일To
         gb4: str,  # 결산/중간배당
         tr_cont: str = "",
-        dataframe: Optional[pd.DataFrame] = None,
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 순위분석 
@@ -1408,9 +1123,6 @@ def dividend_rate(
         t_dt (str): 기준일 종료
         gb4 (str): 0:전체, 1:결산배당, 2:중간배당
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 배당률 상위 데이터
@@ -1458,11 +1170,6 @@ def dividend_rate(
         logger.error("gb4 is required. (e.g. '0')")
         raise ValueError("gb4 is required. (e.g. '0')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB13470100"
 
     params = {
@@ -1476,38 +1183,11 @@ def dividend_rate(
         "GB4": gb4,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return dividend_rate(
-                cts_area,
-                gb1,
-                upjong,
-                gb2,
-                gb3,
-                f_dt,
-                t_dt,
-                gb4,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -1520,13 +1200,7 @@ def dividend_rate(
 
 def estimate_perform(
         sht_cd: str,  # 종목코드
-        dataframe1: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output1)
-        dataframe2: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output2)
-        dataframe3: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output3)
-        dataframe4: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output4)
         tr_cont: str = "",
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -1535,13 +1209,7 @@ def estimate_perform(
     
     Args:
         sht_cd (str): 종목코드 (예: 265520)
-        dataframe1 (Optional[pd.DataFrame]): 누적 데이터프레임 (output1)
-        dataframe2 (Optional[pd.DataFrame]): 누적 데이터프레임 (output2)
-        dataframe3 (Optional[pd.DataFrame]): 누적 데이터프레임 (output3)
-        dataframe4 (Optional[pd.DataFrame]): 누적 데이터프레임 (output4)
         tr_cont (str): 연속 거래 여부
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]: 국내주식 종목추정실적 데이터
@@ -1557,76 +1225,17 @@ def estimate_perform(
         logger.error("sht_cd is required. (e.g. '265520')")
         raise ValueError("sht_cd is required. (e.g. '265520')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return (
-            dataframe1 if dataframe1 is not None else pd.DataFrame(),
-            dataframe2 if dataframe2 is not None else pd.DataFrame(),
-            dataframe3 if dataframe3 is not None else pd.DataFrame(),
-            dataframe4 if dataframe4 is not None else pd.DataFrame()
-        )
-
     tr_id = "HHKST668300C0"
 
     params = {
         "SHT_CD": sht_cd,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                current_data1 = pd.DataFrame(output_data if isinstance(output_data, list) else [output_data])
-                dataframe1 = pd.concat([dataframe1, current_data1],
-                                       ignore_index=True) if dataframe1 is not None else current_data1
-            else:
-                dataframe1 = pd.DataFrame() if dataframe1 is None else dataframe1
-
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                current_data2 = pd.DataFrame(output_data if isinstance(output_data, list) else [output_data])
-                dataframe2 = pd.concat([dataframe2, current_data2],
-                                       ignore_index=True) if dataframe2 is not None else current_data2
-            else:
-                dataframe2 = pd.DataFrame() if dataframe2 is None else dataframe2
-
-        # output3 처리
-        if hasattr(res.getBody(), 'output3'):
-            output_data = res.getBody().output3
-            if output_data:
-                current_data3 = pd.DataFrame(output_data if isinstance(output_data, list) else [output_data])
-                dataframe3 = pd.concat([dataframe3, current_data3],
-                                       ignore_index=True) if dataframe3 is not None else current_data3
-            else:
-                dataframe3 = pd.DataFrame() if dataframe3 is None else dataframe3
-
-        # output4 처리
-        if hasattr(res.getBody(), 'output4'):
-            output_data = res.getBody().output4
-            if output_data:
-                current_data4 = pd.DataFrame(output_data if isinstance(output_data, list) else [output_data])
-                dataframe4 = pd.concat([dataframe4, current_data4],
-                                       ignore_index=True) if dataframe4 is not None else current_data4
-            else:
-                dataframe4 = pd.DataFrame() if dataframe4 is None else dataframe4
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return estimate_perform(
-                sht_cd, dataframe1, dataframe2, dataframe3, dataframe4, "N", depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2, dataframe3, dataframe4
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1", "output2", "output3", "output4"))
+
+    if res.isOK():
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1"), ka._toFrame(pages["output2"], tr_id, "output2"), ka._toFrame(pages["output3"], tr_id, "output3"), ka._toFrame(pages["output4"], tr_id, "output4")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -1693,7 +1302,7 @@ def exp_closing_price(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        return pd.DataFrame(res.getBody().output)
+        return ka._toFrame(res.getBody().output, tr_id, "output")
     else:
         res.printError(url=api_url)
         return pd.DataFrame()
@@ -1709,9 +1318,6 @@ def exp_index_trend(
         fid_input_iscd: str,  # 입력 종목코드
         fid_cond_mrkt_div_code: str,  # 조건 시장 분류 코드
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 업종/기타 
@@ -1724,9 +1330,6 @@ def exp_index_trend(
         fid_input_iscd (str): 0000:전체, 0001:코스피, 1001:코스닥, 2001:코스피200, 4001: KRX100
         fid_cond_mrkt_div_code (str): 시장구분코드 (주식 U)
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 예상체결지수 추이 데이터
@@ -1749,11 +1352,6 @@ def exp_index_trend(
         logger.error("fid_cond_mrkt_div_code is required. (e.g. 'U')")
         raise ValueError("fid_cond_mrkt_div_code is required. (e.g. 'U')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPST01840000"
 
     params = {
@@ -1764,37 +1362,11 @@ def exp_index_trend(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return exp_index_trend(
-                fid_mkop_cls_code,
-                fid_input_hour_1,
-                fid_input_iscd,
-                fid_cond_mrkt_div_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -1850,8 +1422,8 @@ def exp_price_trend(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        output1_data = pd.DataFrame([res.getBody().output1])
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output1_data = ka._toFrame(res.getBody().output1, tr_id, "output1")
+        output2_data = ka._toFrame(res.getBody().output2, tr_id, "output2")
 
         logging.info("Data fetch complete.")
         return output1_data, output2_data
@@ -1870,11 +1442,7 @@ def exp_total_index(
         fid_cond_scr_div_code: str,  # 조건 화면 분류 코드
         fid_input_iscd: str,  # 입력 종목코드
         fid_mkop_cls_code: str,  # 장운영 구분 코드
-        dataframe1: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output1)
-        dataframe2: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output2)
         tr_cont: str = "",
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     [국내주식] 업종/기타 
@@ -1887,11 +1455,7 @@ def exp_total_index(
         fid_cond_scr_div_code (str): Unique key(11175)
         fid_input_iscd (str): 0000:전체, 0001:거래소, 1001:코스닥, 2001:코스피200, 4001: KRX100
         fid_mkop_cls_code (str): 1:장시작전, 2:장마감
-        dataframe1 (Optional[pd.DataFrame]): 누적 데이터프레임 (output1)
-        dataframe2 (Optional[pd.DataFrame]): 누적 데이터프레임 (output2)
         tr_cont (str): 연속 거래 여부
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 국내주식 예상체결 전체지수 데이터
@@ -1932,11 +1496,6 @@ def exp_total_index(
         logger.error("fid_mkop_cls_code is required. (e.g. '1')")
         raise ValueError("fid_mkop_cls_code is required. (e.g. '1')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "FHKUP11750000"
 
     params = {
@@ -1948,49 +1507,11 @@ def exp_total_index(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                current_data1 = pd.DataFrame(output_data if isinstance(output_data, list) else [output_data])
-                dataframe1 = pd.concat([dataframe1, current_data1],
-                                       ignore_index=True) if dataframe1 is not None else current_data1
-            else:
-                dataframe1 = pd.DataFrame() if dataframe1 is None else dataframe1
-        else:
-            dataframe1 = pd.DataFrame() if dataframe1 is None else dataframe1
-
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                current_data2 = pd.DataFrame(output_data if isinstance(output_data, list) else [output_data])
-                dataframe2 = pd.concat([dataframe2, current_data2],
-                                       ignore_index=True) if dataframe2 is not None else current_data2
-            else:
-                dataframe2 = pd.DataFrame() if dataframe2 is None else dataframe2
-        else:
-            dataframe2 = pd.DataFrame() if dataframe2 is None else dataframe2
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return exp_total_index(
-                fid_mrkt_cls_code,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_mkop_cls_code,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1", "output2"))
+
+    if res.isOK():
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1"), ka._toFrame(pages["output2"], tr_id, "output2")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -2013,9 +1534,6 @@ def exp_trans_updown(
         fid_blng_cls_code: str,  # 소속 구분 코드
         fid_mkop_cls_code: str,  # 장운영 구분 코드
         tr_cont: str = "",
-        dataframe: Optional[pd.DataFrame] = None,
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 순위분석 
@@ -2034,9 +1552,6 @@ def exp_trans_updown(
         fid_blng_cls_code (str): 0: 전체
         fid_mkop_cls_code (str): 0:장전예상1:장마감예상
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 예상체결 상승_하락상위 데이터
@@ -2089,11 +1604,6 @@ def exp_trans_updown(
         logger.error("fid_mkop_cls_code is required. (e.g. '0')")
         raise ValueError("fid_mkop_cls_code is required. (e.g. '0')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPST01820000"
 
     params = {
@@ -2110,43 +1620,11 @@ def exp_trans_updown(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return exp_trans_updown(
-                fid_rank_sort_cls_code,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_aply_rang_prc_1,
-                fid_vol_cnt,
-                fid_pbmn,
-                fid_blng_cls_code,
-                fid_mkop_cls_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -2162,9 +1640,6 @@ def finance_balance_sheet(
         fid_cond_mrkt_div_code: str,  # 조건 시장 분류 코드
         fid_input_iscd: str,  # 입력 종목코드
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -2176,9 +1651,6 @@ def finance_balance_sheet(
         fid_cond_mrkt_div_code (str): J
         fid_input_iscd (str): 000660 : 종목코드
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 대차대조표 데이터
@@ -2204,11 +1676,6 @@ def finance_balance_sheet(
         logger.error("fid_input_iscd is required. (e.g. '000660')")
         raise ValueError("fid_input_iscd is required. (e.g. '000660')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHKST66430100"
 
     params = {
@@ -2218,36 +1685,11 @@ def finance_balance_sheet(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return finance_balance_sheet(
-                fid_div_cls_code,
-                fid_cond_mrkt_div_code,
-                fid_input_iscd,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         # API 에러 처리
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
@@ -2264,9 +1706,6 @@ def finance_financial_ratio(
         fid_cond_mrkt_div_code: str,  # 조건 시장 분류 코드
         fid_input_iscd: str,  # 입력 종목코드
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -2278,9 +1717,6 @@ def finance_financial_ratio(
         fid_cond_mrkt_div_code (str): J
         fid_input_iscd (str): 000660 : 종목코드
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 재무비율 데이터
@@ -2306,11 +1742,6 @@ def finance_financial_ratio(
         logger.error("fid_input_iscd is required. (e.g. '000660')")
         raise ValueError("fid_input_iscd is required. (e.g. '000660')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHKST66430300"
 
     params = {
@@ -2320,36 +1751,11 @@ def finance_financial_ratio(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return finance_financial_ratio(
-                fid_div_cls_code,
-                fid_cond_mrkt_div_code,
-                fid_input_iscd,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -2365,9 +1771,6 @@ def finance_growth_ratio(
         fid_div_cls_code: str,  # 분류 구분 코드
         fid_cond_mrkt_div_code: str,  # 조건 시장 분류 코드
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -2379,9 +1782,6 @@ def finance_growth_ratio(
         fid_div_cls_code (str): 분류 구분 코드 (0: 년, 1: 분기)
         fid_cond_mrkt_div_code (str): 조건 시장 분류 코드 (예: 'J')
         tr_cont (str): 연속 거래 여부 (기본값: "")
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 성장성비율 데이터
@@ -2407,11 +1807,6 @@ def finance_growth_ratio(
         logger.error("fid_cond_mrkt_div_code is required. (e.g. 'J')")
         raise ValueError("fid_cond_mrkt_div_code is required. (e.g. 'J')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API URL 및 거래 ID 설정
     tr_id = "FHKST66430800"
 
@@ -2423,36 +1818,11 @@ def finance_growth_ratio(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
-    # API 응답 처리
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return finance_growth_ratio(
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_cond_mrkt_div_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -2468,9 +1838,6 @@ def finance_income_statement(
         fid_cond_mrkt_div_code: str,  # 조건 시장 분류 코드
         fid_input_iscd: str,  # 입력 종목코드
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     국내주식 손익계산서 API를 호출하여 DataFrame으로 반환합니다.
@@ -2480,9 +1847,6 @@ def finance_income_statement(
         fid_cond_mrkt_div_code (str): 조건 시장 분류 코드 (예: 'J')
         fid_input_iscd (str): 입력 종목코드 (예: '000660')
         tr_cont (str): 연속 거래 여부 (기본값: "")
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
 
     Returns:
         Optional[pd.DataFrame]: 국내주식 손익계산서 데이터
@@ -2505,11 +1869,6 @@ def finance_income_statement(
         logger.error("fid_input_iscd is required. (e.g. '000660')")
         raise ValueError("fid_input_iscd is required. (e.g. '000660')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHKST66430200"
 
     params = {
@@ -2519,38 +1878,11 @@ def finance_income_statement(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return finance_income_statement(
-                fid_div_cls_code,
-                fid_cond_mrkt_div_code,
-                fid_input_iscd,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -2566,9 +1898,6 @@ def finance_other_major_ratios(
         fid_div_cls_code: str,  # 분류 구분 코드
         fid_cond_mrkt_div_code: str,  # 조건 시장 분류 코드
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -2580,9 +1909,6 @@ def finance_other_major_ratios(
         fid_div_cls_code (str): 분류 구분 코드 (예: '0' - 년, '1' - 분기)
         fid_cond_mrkt_div_code (str): 조건 시장 분류 코드 (예: 'J')
         tr_cont (str): 연속 거래 여부 (기본값: 공백)
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임 (기본값: None)
-        depth (int): 현재 재귀 깊이 (기본값: 0)
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 기타주요비율 데이터
@@ -2605,11 +1931,6 @@ def finance_other_major_ratios(
         logger.error("fid_cond_mrkt_div_code is required. (e.g. 'J')")
         raise ValueError("fid_cond_mrkt_div_code is required. (e.g. 'J')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHKST66430500"
 
     params = {
@@ -2619,33 +1940,11 @@ def finance_other_major_ratios(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return finance_other_major_ratios(
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_cond_mrkt_div_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -2661,9 +1960,6 @@ def finance_profit_ratio(
         fid_div_cls_code: str,  # 분류 구분 코드
         fid_cond_mrkt_div_code: str,  # 조건 시장 분류 코드
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -2675,9 +1971,6 @@ def finance_profit_ratio(
         fid_div_cls_code (str): 분류 구분 코드 (0: 년, 1: 분기)
         fid_cond_mrkt_div_code (str): 조건 시장 분류 코드 (예: 'J')
         tr_cont (str): 연속 거래 여부 (기본값: 공백)
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 수익성비율 데이터
@@ -2703,11 +1996,6 @@ def finance_profit_ratio(
         logger.error("fid_cond_mrkt_div_code is required. (e.g. 'J')")
         raise ValueError("fid_cond_mrkt_div_code is required. (e.g. 'J')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHKST66430400"
 
     params = {
@@ -2717,39 +2005,11 @@ def finance_profit_ratio(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return finance_profit_ratio(
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_cond_mrkt_div_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         # API 호출 실패 시 에러 로그
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
@@ -2776,7 +2036,6 @@ def finance_ratio(
         fid_blng_cls_code: str,  # 소속 구분 코드
         fid_trgt_exls_cls_code: str,  # 대상 제외 구분 코드
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None  # 누적 데이터프레임
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 순위분석 
@@ -2798,7 +2057,6 @@ def finance_ratio(
         fid_blng_cls_code (str): 소속 구분 코드 (0)
         fid_trgt_exls_cls_code (str): 대상 제외 구분 코드 (0 : 전체)
         tr_cont (str): 연속 거래 여부 (공백 : 초기 조회, N : 다음 데이터 조회)
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 재무비율 순위 데이터
@@ -2861,46 +2119,11 @@ def finance_ratio(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            print("Call Next")
-            ka.smart_sleep()
-            return finance_ratio(
-                fid_trgt_cls_code,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_input_price_1,
-                fid_input_price_2,
-                fid_vol_cnt,
-                fid_input_option_1,
-                fid_input_option_2,
-                fid_rank_sort_cls_code,
-                fid_blng_cls_code,
-                fid_trgt_exls_cls_code,
-                "N", dataframe
-            )
-        else:
-            print("The End")
-            return dataframe
+        print("The End")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         # 오류 처리
         res.printError(api_url)
@@ -2916,9 +2139,6 @@ def finance_stability_ratio(
         fid_div_cls_code: str,  # 분류 구분 코드
         fid_cond_mrkt_div_code: str,  # 조건 시장 분류 코드
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -2930,9 +2150,6 @@ def finance_stability_ratio(
         fid_div_cls_code (str): 분류 구분 코드 (예: '0' - 년, '1' - 분기)
         fid_cond_mrkt_div_code (str): 조건 시장 분류 코드 (예: 'J')
         tr_cont (str): 연속 거래 여부 (기본값: "")
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임 (기본값: None)
-        depth (int): 현재 재귀 깊이 (기본값: 0)
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 안정성비율 데이터
@@ -2955,11 +2172,6 @@ def finance_stability_ratio(
         logger.error("fid_cond_mrkt_div_code is required. (e.g. 'J')")
         raise ValueError("fid_cond_mrkt_div_code is required. (e.g. 'J')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHKST66430600"
 
     params = {
@@ -2969,36 +2181,11 @@ def finance_stability_ratio(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return finance_stability_ratio(
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_cond_mrkt_div_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -3025,7 +2212,6 @@ def fluctuation(
         fid_rsfl_rate1: str,  # 필수, 등락 비율1
         fid_rsfl_rate2: str,  # 필수, 등락 비율2
         tr_cont: str = "",  # 선택, 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None  # 선택, 누적 데이터프레임
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 순위분석
@@ -3048,7 +2234,6 @@ def fluctuation(
         fid_rsfl_rate1 (str): 등락 비율1 (하락률 하한)
         fid_rsfl_rate2 (str): 등락 비율2 (상승률 상한)
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
         
     Returns:
         Optional[pd.DataFrame]: API 응답 데이터
@@ -3083,34 +2268,11 @@ def fluctuation(
         "fid_rsfl_rate1": fid_rsfl_rate1
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":  # 다음 페이지 존재
-            print("Call Next")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return fluctuation(
-                fid_rsfl_rate2, fid_cond_mrkt_div_code, fid_cond_scr_div_code,
-                fid_input_iscd, fid_rank_sort_cls_code, fid_input_cnt_1,
-                fid_prc_cls_code, fid_input_price_1, fid_input_price_2,
-                fid_vol_cnt, fid_trgt_cls_code, fid_trgt_exls_cls_code,
-                fid_div_cls_code, fid_rsfl_rate1, "N", dataframe
-            )
-        else:
-            print("The End")
-            return dataframe
+        print("The End")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         res.printError(api_url)
         return pd.DataFrame()
@@ -3187,7 +2349,7 @@ def foreign_institution_total(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
 
         logging.info("Data fetch complete.")
         return current_data
@@ -3243,7 +2405,7 @@ def frgnmem_pchs_trend(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        output_data = pd.DataFrame(res.getBody().output)
+        output_data = ka._toFrame(res.getBody().output, tr_id, "output")
 
         logging.info("Data fetch complete.")
         return output_data
@@ -3311,7 +2473,7 @@ def frgnmem_trade_estimate(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -3329,11 +2491,7 @@ def frgnmem_trade_trend(
         fid_input_iscd_2: str,  # 회원사코드
         fid_mrkt_cls_code: str,  # 시장구분코드
         fid_vol_cnt: str,  # 거래량
-        dataframe1: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output1)
-        dataframe2: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output2)
         tr_cont: str = "",
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     [국내주식] 시세분석 
@@ -3347,11 +2505,7 @@ def frgnmem_trade_trend(
         fid_input_iscd_2 (str): ex. 99999(전체)  ※ 회원사코드 (kis developers 포탈 사이트 포럼-> FAQ -> 종목정보 다운로드(국내) 참조)
         fid_mrkt_cls_code (str): A(전체),K(코스피), Q(코스닥), K2(코스피200), W(ELW)  ※ FID_INPUT_ISCD(종목코드) 혹은 FID_MRKT_CLS_CODE(시장구분코드) 둘 중 하나만 입력
         fid_vol_cnt (str): 거래량 ~
-        dataframe1 (Optional[pd.DataFrame]): 누적 데이터프레임 (output1)
-        dataframe2 (Optional[pd.DataFrame]): 누적 데이터프레임 (output2)
         tr_cont (str): 연속 거래 여부
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 회원사 실 시간 매매동향(틱) 데이터
@@ -3386,11 +2540,6 @@ def frgnmem_trade_trend(
         logger.error("fid_mrkt_cls_code is required. (e.g. 'A')")
         raise ValueError("fid_mrkt_cls_code is required. (e.g. 'A')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "FHPST04320000"
 
     params = {
@@ -3402,67 +2551,11 @@ def frgnmem_trade_trend(
         "FID_VOL_CNT": fid_vol_cnt,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1", "output2"))
 
     if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                # output1은 단일 객체, output2는 배열일 수 있음
-                if isinstance(output_data, list):
-                    current_data1 = pd.DataFrame(output_data)
-                else:
-                    # 단일 객체인 경우 리스트로 감싸서 DataFrame 생성
-                    current_data1 = pd.DataFrame([output_data])
-
-                if dataframe1 is not None:
-                    dataframe1 = pd.concat([dataframe1, current_data1], ignore_index=True)
-                else:
-                    dataframe1 = current_data1
-            else:
-                if dataframe1 is None:
-                    dataframe1 = pd.DataFrame()
-        else:
-            if dataframe1 is None:
-                dataframe1 = pd.DataFrame()
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                # output1은 단일 객체, output2는 배열일 수 있음
-                if isinstance(output_data, list):
-                    current_data2 = pd.DataFrame(output_data)
-                else:
-                    # 단일 객체인 경우 리스트로 감싸서 DataFrame 생성
-                    current_data2 = pd.DataFrame([output_data])
-
-                if dataframe2 is not None:
-                    dataframe2 = pd.concat([dataframe2, current_data2], ignore_index=True)
-                else:
-                    dataframe2 = current_data2
-            else:
-                if dataframe2 is None:
-                    dataframe2 = pd.DataFrame()
-        else:
-            if dataframe2 is None:
-                dataframe2 = pd.DataFrame()
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return frgnmem_trade_trend(
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_input_iscd_2,
-                fid_mrkt_cls_code,
-                fid_vol_cnt,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1"), ka._toFrame(pages["output2"], tr_id, "output2")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -3475,9 +2568,6 @@ def frgnmem_trade_trend(
 
 def hts_top_view(
         tr_cont: str = "",
-        dataframe: Optional[pd.DataFrame] = None,
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 순위분석 
@@ -3486,58 +2576,29 @@ def hts_top_view(
     
     Args:
         tr_cont (str): 연속 거래 여부 ("공백": 초기 조회, "N": 다음 데이터 조회)
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: HTS조회상위20종목 데이터
         
     Example:
-        >>> df = hts_top_view(tr_cont="", dataframe=None, depth=0, max_depth=10)
+        >>> df = hts_top_view(tr_cont="")
         >>> print(df)
     """
     api_url = "/uapi/domestic-stock/v1/ranking/hts-top-view"
     # 로깅 설정
     logger = logging.getLogger(__name__)
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHMCM000100C0"
 
     # Request Query Parameter가 없으므로 빈 딕셔너리로 유지
     params = {}
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1",))
 
     if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output1'):
-            current_data = pd.DataFrame(res.getBody().output1)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 다음 페이지 호출 여부 결정
-        tr_cont = res.getHeader().tr_cont
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return hts_top_view(
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1")
     else:
         # API 호출 실패 시 에러 로그 출력
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
@@ -3595,10 +2656,10 @@ def inquire_account_balance(
 
     if res.isOK():
         # output1 - array 타입
-        df1 = pd.DataFrame(res.getBody().output1)
+        df1 = ka._toFrame(res.getBody().output1, tr_id, "output1")
 
         # output2 - object 타입 (단일 객체를 DataFrame으로 변환)
-        df2 = pd.DataFrame([res.getBody().output2])
+        df2 = ka._toFrame(res.getBody().output2, tr_id, "output2")
 
         logging.info("Data fetch complete.")
         return df1, df2
@@ -3661,10 +2722,10 @@ def inquire_asking_price_exp_ccn(
 
     if res.isOK():
         # output1 (object) -> 호가정보
-        output1_data = pd.DataFrame([res.getBody().output1])
+        output1_data = ka._toFrame(res.getBody().output1, tr_id, "output1")
 
         # output2 (array) -> 예상체결정보
-        output2_data = pd.DataFrame([res.getBody().output2])
+        output2_data = ka._toFrame(res.getBody().output2, tr_id, "output2")
 
         return output1_data, output2_data
     else:
@@ -3689,10 +2750,6 @@ def inquire_balance(
         FK100: str = "",  # 연속조회검색조건100
         NK100: str = "",  # 연속조회키100
         tr_cont: str = "",  # 연속거래여부
-        dataframe1: Optional[pd.DataFrame] = None,  # 누적 데이터프레임1
-        dataframe2: Optional[pd.DataFrame] = None,  # 누적 데이터프레임2
-        depth: int = 0,  # 내부 재귀깊이 (자동관리)
-        max_depth: int = 10  # 최대 재귀 횟수 제한
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     주식 잔고조회 API입니다. 
@@ -3714,10 +2771,6 @@ def inquire_balance(
         FK100 (str): 연속조회검색조건100
         NK100 (str): 연속조회키100
         tr_cont (str): 연속거래여부
-        dataframe1 (Optional[pd.DataFrame]): 누적 데이터프레임1
-        dataframe2 (Optional[pd.DataFrame]): 누적 데이터프레임2
-        depth (int): 내부 재귀깊이 (자동관리)
-        max_depth (int): 최대 재귀 횟수 제한
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 주식잔고조회 데이터 (output1, output2)
@@ -3757,14 +2810,6 @@ def inquire_balance(
     if prcs_dvsn == "":
         raise ValueError("prcs_dvsn is required (e.g. '00: 전일매매포함, 01:전일매매미포함')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe1 is None:
-            dataframe1 = pd.DataFrame()
-        if dataframe2 is None:
-            dataframe2 = pd.DataFrame()
-        return dataframe1, dataframe2
-
     # tr_id 설정
     if env_dv == "real":
         tr_id = "TTTC8434R"
@@ -3787,38 +2832,14 @@ def inquire_balance(
         "CTX_AREA_NK100": NK100
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(
+        api_url, tr_id, tr_cont, params, ("output1", "output2"),
+        cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"},
+    )
 
     if res.isOK():
-        # output1 처리
-        current_data1 = pd.DataFrame(res.getBody().output1)
-        if dataframe1 is not None:
-            dataframe1 = pd.concat([dataframe1, current_data1], ignore_index=True)
-        else:
-            dataframe1 = current_data1
-
-        # output2 처리
-        current_data2 = pd.DataFrame(res.getBody().output2)
-        if dataframe2 is not None:
-            dataframe2 = pd.concat([dataframe2, current_data2], ignore_index=True)
-        else:
-            dataframe2 = current_data2
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return inquire_balance(
-                env_dv, cano, acnt_prdt_cd, afhr_flpr_yn, inqr_dvsn, unpr_dvsn,
-                fund_sttl_icld_yn, fncg_amt_auto_rdpt_yn, prcs_dvsn, FK100, NK100,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe1, dataframe2
+        logging.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1"), ka._toFrame(pages["output2"], tr_id, "output2")
     else:
         res.printError(url=api_url)
         return pd.DataFrame(), pd.DataFrame()
@@ -3842,10 +2863,6 @@ def inquire_balance_rlz_pl(
         FK100: str = "",  # 연속조회검색조건100
         NK100: str = "",  # 연속조회키100
         tr_cont: str = "",  # 연속거래여부
-        dataframe1: Optional[pd.DataFrame] = None,  # 누적 데이터프레임1
-        dataframe2: Optional[pd.DataFrame] = None,  # 누적 데이터프레임2
-        depth: int = 0,  # 내부 재귀깊이 (자동관리)
-        max_depth: int = 10  # 최대 재귀 횟수 제한
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     주식잔고조회_실현손익 API입니다.
@@ -3866,10 +2883,6 @@ def inquire_balance_rlz_pl(
         FK100 (str): 연속조회검색조건100
         NK100 (str): 연속조회키100
         tr_cont (str): 연속거래여부
-        dataframe1 (Optional[pd.DataFrame]): 누적 데이터프레임1
-        dataframe2 (Optional[pd.DataFrame]): 누적 데이터프레임2
-        depth (int): 내부 재귀깊이 (자동관리)
-        max_depth (int): 최대 재귀 횟수 제한
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 주식잔고조회_실현손익 데이터 (output1, output2)
@@ -3906,14 +2919,6 @@ def inquire_balance_rlz_pl(
     if prcs_dvsn == "":
         raise ValueError("prcs_dvsn is required (e.g. '00:전일매매포함, 01:전일매매미포함')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe1 is None:
-            dataframe1 = pd.DataFrame()
-        if dataframe2 is None:
-            dataframe2 = pd.DataFrame()
-        return dataframe1, dataframe2
-
     tr_id = "TTTC8494R"  # 주식잔고조회_실현손익
 
     params = {
@@ -3931,39 +2936,14 @@ def inquire_balance_rlz_pl(
         "CTX_AREA_NK100": NK100
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(
+        api_url, tr_id, tr_cont, params, ("output1", "output2"),
+        cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"},
+    )
 
     if res.isOK():
-        # output1 처리
-        current_data1 = pd.DataFrame(res.getBody().output1)
-        if dataframe1 is not None:
-            dataframe1 = pd.concat([dataframe1, current_data1], ignore_index=True)
-        else:
-            dataframe1 = current_data1
-
-        # output2 처리  
-        current_data2 = pd.DataFrame(res.getBody().output2)
-        if dataframe2 is not None:
-            dataframe2 = pd.concat([dataframe2, current_data2], ignore_index=True)
-        else:
-            dataframe2 = current_data2
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return inquire_balance_rlz_pl(
-                cano, acnt_prdt_cd, afhr_flpr_yn, inqr_dvsn, unpr_dvsn,
-                fund_sttl_icld_yn, fncg_amt_auto_rdpt_yn, prcs_dvsn,
-                ofl_yn, cost_icld_yn, FK100, NK100, "N",
-                dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe1, dataframe2
+        logging.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1"), ka._toFrame(pages["output2"], tr_id, "output2")
     else:
         res.printError(url=api_url)
         return pd.DataFrame(), pd.DataFrame()
@@ -4021,7 +3001,7 @@ def inquire_ccnl(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -4105,7 +3085,7 @@ def inquire_credit_psamount(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output, index=[0])
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -4136,10 +3116,6 @@ def inquire_daily_ccld(
         NK100: str = "",  # 연속조회키100 (공란: 최초 조회 / 이전 조회 Output 사용)
         tr_cont: str = "",  # 연속거래여부
         excg_id_dvsn_cd: Optional[str] = "KRX",  # 거래소ID구분코드 (KRX / NXT / SOR / ALL)
-        dataframe1: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output1)
-        dataframe2: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output2)
-        depth: int = 0,  # 내부 재귀깊이 (자동관리)
-        max_depth: int = 10  # 최대 재귀 횟수 제한
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     주식일별주문체결조회 API입니다. 
@@ -4171,10 +3147,6 @@ def inquire_daily_ccld(
         NK100 (str): 연속조회키100 (ex. 공란: 최초 조회 / 이전 조회 Output 사용)
         tr_cont (str): 연속거래여부
         excg_id_dvsn_cd (Optional[str]): 거래소ID구분코드 (ex. KRX / NXT / SOR / ALL)
-        dataframe1 (Optional[pd.DataFrame]): 누적 데이터프레임 (output1)
-        dataframe2 (Optional[pd.DataFrame]): 누적 데이터프레임 (output2)
-        depth (int): 내부 재귀깊이 (자동관리)
-        max_depth (int): 최대 재귀 횟수 제한
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: (output1 데이터프레임, output2 데이터프레임)
@@ -4191,6 +3163,29 @@ def inquire_daily_ccld(
     """
     api_url = "/uapi/domestic-stock/v1/trading/inquire-daily-ccld"
 
+    tr_id, params = _inquire_daily_ccld_request(
+        env_dv, pd_dv, cano, acnt_prdt_cd, inqr_strt_dt, inqr_end_dt, sll_buy_dvsn_cd, ccld_dvsn,
+        inqr_dvsn, inqr_dvsn_3, pdno, ord_gno_brno, odno, inqr_dvsn_1, FK100, NK100, excg_id_dvsn_cd
+    )
+
+    res, pages = ka._paginate(
+        api_url, tr_id, tr_cont, params, ("output1", "output2"),
+        cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"},
+    )
+
+    if res.isOK():
+        logging.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1"), ka._toFrame(pages["output2"], tr_id, "output2")
+    else:
+        res.printError(url=api_url)
+        return pd.DataFrame(), pd.DataFrame()
+
+
+def _inquire_daily_ccld_request(
+        env_dv, pd_dv, cano, acnt_prdt_cd, inqr_strt_dt, inqr_end_dt, sll_buy_dvsn_cd, ccld_dvsn,
+        inqr_dvsn, inqr_dvsn_3, pdno, ord_gno_brno, odno, inqr_dvsn_1, FK100, NK100, excg_id_dvsn_cd
+) -> Tuple[str, dict]:
+    """inquire_daily_ccld / iter_inquire_daily_ccld 공통: 파라미터 검증 후 (tr_id, params) 반환"""
     # 필수 파라미터 검증
     if env_dv == "":
         raise ValueError("env_dv is required (e.g. 'real:실전', 'demo:모의')")
@@ -4223,14 +3218,6 @@ def inquire_daily_ccld(
         raise ValueError(
             "inqr_dvsn_3 is required (e.g. '00 전체 / 01 현금 / 02 신용 / 03 담보 / 04 대주 / 05 대여 / 06 자기융자신규/상환 / 07 유통융자신규/상환')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe1 is None:
-            dataframe1 = pd.DataFrame()
-        if dataframe2 is None:
-            dataframe2 = pd.DataFrame()
-        return dataframe1, dataframe2
-
     # tr_id 설정
     if env_dv == "real":
         if pd_dv == "before":
@@ -4269,42 +3256,68 @@ def inquire_daily_ccld(
     if excg_id_dvsn_cd is not None:
         params["EXCG_ID_DVSN_CD"] = excg_id_dvsn_cd
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    return tr_id, params
 
-    if res.isOK():
-        # output1 (array) 처리
-        current_data1 = pd.DataFrame(res.getBody().output1)
-        if dataframe1 is not None:
-            dataframe1 = pd.concat([dataframe1, current_data1], ignore_index=True)
-        else:
-            dataframe1 = current_data1
 
-        # output2 (object) 처리
-        current_data2 = pd.DataFrame([res.getBody().output2])
-        if dataframe2 is not None:
-            dataframe2 = pd.concat([dataframe2, current_data2], ignore_index=True)
-        else:
-            dataframe2 = current_data2
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return inquire_daily_ccld(
-                env_dv, pd_dv, cano, acnt_prdt_cd, inqr_strt_dt, inqr_end_dt,
-                sll_buy_dvsn_cd, pdno, ccld_dvsn, inqr_dvsn, inqr_dvsn_3,
-                ord_gno_brno, odno, inqr_dvsn_1, FK100, NK100, "N",
-                excg_id_dvsn_cd, dataframe1, dataframe2, depth + 1, max_depth
-            )
+def iter_inquire_daily_ccld(
+        env_dv: str,  # [필수] 실전모의구분 (real:실전, demo:모의)
+        pd_dv: str,  # [필수] 3개월이전이내구분 (before:이전, inner:이내)
+        cano: str,  # [필수] 종합계좌번호
+        acnt_prdt_cd: str,  # [필수] 계좌상품코드
+        inqr_strt_dt: str,  # [필수] 조회시작일자
+        inqr_end_dt: str,  # [필수] 조회종료일자
+        sll_buy_dvsn_cd: str,  # [필수] 매도매수구분코드 (00 : 전체 / 01 : 매도 / 02 : 매수)
+        ccld_dvsn: str,  # [필수] 체결구분 (00 전체 / 01 체결 / 02 미체결)
+        inqr_dvsn: str,  # [필수] 조회구분 (00 역순 / 01 정순)
+        inqr_dvsn_3: str,  # [필수] 조회구분3 (00 전체 / 01 현금 / 02 신용 / 03 담보 / 04 대주 / 05 대여 / 06 자기융자신규/상환 / 07 유통융자신규/상환)
+        pdno: str = "",  # 상품번호
+        ord_gno_brno: str = "",  # 주문채번지점번호
+        odno: str = "",  # 주문번호 (주문시 한국투자증권 시스템에서 채번된 주문번호)
+        inqr_dvsn_1: str = "",  # 조회구분1 (없음: 전체 / 1: ELW / 2: 프리보드)
+        FK100: str = "",  # 연속조회검색조건100 (공란: 최초 조회 / 이전 조회 Output 사용)
+        NK100: str = "",  # 연속조회키100 (공란: 최초 조회 / 이전 조회 Output 사용)
+        excg_id_dvsn_cd: Optional[str] = "KRX",  # 거래소ID구분코드 (KRX / NXT / SOR / ALL)
+        records: bool = False,  # True: output1 레코드(dict) 단위로 반환
+) -> Iterator:
+    """
+    주식일별주문체결조회 (페이지 단위 generator)
+    inquire_daily_ccld 와 같은 조회를 연속조회 페이지가 도착할 때마다 바로 돌려줍니다.
+    전체 결과를 메모리에 모으지 않으므로 장기간 체결내역을 파일로 쓰거나 집계할 때 사용합니다.
+
+    Args:
+        inquire_daily_ccld 와 동일 (tr_cont 제외)
+        records (bool): True 면 output1 레코드(dict)를 한 건씩 반환
+
+    Yields:
+        Tuple[pd.DataFrame, pd.DataFrame]: 페이지별 (output1, output2), records=True 면 output1 레코드(dict)
+
+    Raises:
+        ka.KISAPIError: API 오류 응답
+
+    Example:
+        >>> for df1, df2 in iter_inquire_daily_ccld(
+        ...     env_dv="real", pd_dv="inner", cano=trenv.my_acct, acnt_prdt_cd=trenv.my_prod,
+        ...     inqr_strt_dt="20240101", inqr_end_dt="20241231",
+        ...     sll_buy_dvsn_cd="00", ccld_dvsn="00", inqr_dvsn="00", inqr_dvsn_3="00"
+        ... ):
+        ...     df1.to_csv("ccld.csv", mode="a", header=False)
+    """
+    api_url = "/uapi/domestic-stock/v1/trading/inquire-daily-ccld"
+
+    tr_id, params = _inquire_daily_ccld_request(
+        env_dv, pd_dv, cano, acnt_prdt_cd, inqr_strt_dt, inqr_end_dt, sll_buy_dvsn_cd, ccld_dvsn,
+        inqr_dvsn, inqr_dvsn_3, pdno, ord_gno_brno, odno, inqr_dvsn_1, FK100, NK100, excg_id_dvsn_cd
+    )
+
+    for page in ka._streamPages(
+            api_url, tr_id, "", params, ("output1", "output2"),
+            cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"},
+    ):
+        if records:
+            for row in page["output1"]:
+                yield row
         else:
-            logging.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        res.printError(url=api_url)
-        return pd.DataFrame(), pd.DataFrame()
+            yield ka._toFrame(page["output1"], tr_id, "output1"), ka._toFrame(page["output2"], tr_id, "output2")
 
 
 ##############################################################################################
@@ -4318,11 +3331,7 @@ def inquire_daily_indexchartprice(
         fid_input_date_2: str,  # 조회 종료일자
         fid_period_div_code: str,  # 기간분류코드
         env_dv: str = "real",  # [추가] 실전모의구분 (real:실전, demo:모의)
-        dataframe1: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output1)
-        dataframe2: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output2)
         tr_cont: str = "",
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     [국내주식] 업종/기타 
@@ -4336,11 +3345,7 @@ def inquire_daily_indexchartprice(
         fid_input_date_2 (str): 조회 종료일자 (ex. 20220530)
         fid_period_div_code (str): D:일봉 W:주봉, M:월봉, Y:년봉
         env_dv (str): [추가] 실전모의구분 (real:실전, demo:모의, 기본값: 'real')
-        dataframe1 (Optional[pd.DataFrame]): 누적 데이터프레임 (output1)
-        dataframe2 (Optional[pd.DataFrame]): 누적 데이터프레임 (output2)
         tr_cont (str): 연속 거래 여부
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 국내주식업종기간별시세(일_주_월_년) 데이터
@@ -4392,11 +3397,6 @@ def inquire_daily_indexchartprice(
         logger.error("env_dv must be 'real' or 'demo'")
         raise ValueError("env_dv must be 'real' or 'demo'")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     # API 호출 URL 설정
 
     # TR ID 설정 (모의투자 지원 로직)
@@ -4414,52 +3414,11 @@ def inquire_daily_indexchartprice(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                current_data1 = pd.DataFrame(output_data if isinstance(output_data, list) else [output_data])
-                dataframe1 = pd.concat([dataframe1, current_data1],
-                                       ignore_index=True) if dataframe1 is not None else current_data1
-            else:
-                dataframe1 = dataframe1 if dataframe1 is not None else pd.DataFrame()
-        else:
-            dataframe1 = dataframe1 if dataframe1 is not None else pd.DataFrame()
-
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                current_data2 = pd.DataFrame(output_data if isinstance(output_data, list) else [output_data])
-                dataframe2 = pd.concat([dataframe2, current_data2],
-                                       ignore_index=True) if dataframe2 is not None else current_data2
-            else:
-                dataframe2 = dataframe2 if dataframe2 is not None else pd.DataFrame()
-        else:
-            dataframe2 = dataframe2 if dataframe2 is not None else pd.DataFrame()
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return inquire_daily_indexchartprice(
-                fid_cond_mrkt_div_code,
-                fid_input_iscd,
-                fid_input_date_1,
-                fid_input_date_2,
-                fid_period_div_code,
-                env_dv,  # env_dv 파라미터 추가
-                dataframe1,
-                dataframe2,
-                "N", depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1", "output2"))
+
+    if res.isOK():
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1"), ka._toFrame(pages["output2"], tr_id, "output2")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -4545,10 +3504,10 @@ def inquire_daily_itemchartprice(
 
     if res.isOK():
         # output1 처리 (object 타입이므로 DataFrame)
-        output1_data = pd.DataFrame([res.getBody().output1])
+        output1_data = ka._toFrame(res.getBody().output1, tr_id, "output1")
 
         # output2 처리 (array 타입이므로 DataFrame)
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output2_data = ka._toFrame(res.getBody().output2, tr_id, "output2")
 
         return (output1_data, output2_data)
     else:
@@ -4610,10 +3569,10 @@ def inquire_daily_overtimeprice(
 
     if res.isOK():
         # output1 (object) -> DataFrame
-        output1_data = pd.DataFrame(res.getBody().output1, index=[0])
+        output1_data = ka._toFrame(res.getBody().output1, tr_id, "output1")
 
         # output2 (array) -> DataFrame  
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output2_data = ka._toFrame(res.getBody().output2, tr_id, "output2")
 
         return output1_data, output2_data
     else:
@@ -4691,7 +3650,7 @@ def inquire_daily_price(
 
     if res.isOK():
         # output은 array 자료형이므로 DataFrame으로 변환
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -4753,10 +3712,10 @@ def inquire_daily_trade_volume(
 
     if res.isOK():
         # output1 (object) - 단일 레코드
-        output1_data = pd.DataFrame([res.getBody().output1])
+        output1_data = ka._toFrame(res.getBody().output1, tr_id, "output1")
 
         # output2 (array) - 배열 데이터
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output2_data = ka._toFrame(res.getBody().output2, tr_id, "output2")
 
         return output1_data, output2_data
     else:
@@ -4773,9 +3732,6 @@ def inquire_elw_price(
         fid_input_iscd: str,  # FID 입력 종목코드
         env_dv: str = "real",  # 실전모의구분 (real:실전, demo:모의)
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] ELW시세 
@@ -4787,9 +3743,6 @@ def inquire_elw_price(
         fid_input_iscd (str): FID 입력 종목코드 (예: '000660')
         env_dv (str): [추가] 실전모의구분 (real:실전, demo:모의, 기본값: 'real')
         tr_cont (str): 연속 거래 여부 (기본값: '')
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임 (기본값: None)
-        depth (int): 현재 재귀 깊이 (기본값: 0)
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: ELW 현재가 시세 데이터
@@ -4817,11 +3770,6 @@ def inquire_elw_price(
         logger.error("env_dv must be 'real' or 'demo'")
         raise ValueError("env_dv must be 'real' or 'demo'")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API 호출 URL 설정
 
     # TR ID 설정 (모의투자 지원 로직)
@@ -4838,39 +3786,11 @@ def inquire_elw_price(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
-    # API 응답 처리
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return inquire_elw_price(
-                fid_cond_mrkt_div_code,
-                fid_input_iscd,
-                env_dv,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -4887,11 +3807,7 @@ def inquire_index_category_price(
         fid_cond_scr_div_code: str,  # FID 조건 화면 분류 코드
         fid_mrkt_cls_code: str,  # FID 시장 구분 코드
         fid_blng_cls_code: str,  # FID 소속 구분 코드
-        dataframe1: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output1)
-        dataframe2: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output2)
         tr_cont: str = "",
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     [국내주식] 업종/기타 
@@ -4904,11 +3820,7 @@ def inquire_index_category_price(
         fid_cond_scr_div_code (str): Unique key( 20214 )
         fid_mrkt_cls_code (str): 시장구분코드(K:거래소, Q:코스닥, K2:코스피200)
         fid_blng_cls_code (str): 시장구분코드에 따라 아래와 같이 입력 시장구분코드(K:거래소) 0:전업종, 1:기타구분, 2:자본금구분 3:상업별구분 시장구분코드(Q:코스닥) 0:전업종, 1:기타구분, 2:벤처구분 3:일반구분 시장구분코드(K2:코스닥) 0:전업종
-        dataframe1 (Optional[pd.DataFrame]): 누적 데이터프레임 (output1)
-        dataframe2 (Optional[pd.DataFrame]): 누적 데이터프레임 (output2)
         tr_cont (str): 연속 거래 여부
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 국내업종 구분별전체시세 데이터
@@ -4949,11 +3861,6 @@ def inquire_index_category_price(
         logger.error("fid_blng_cls_code is required. (e.g. '0')")
         raise ValueError("fid_blng_cls_code is required. (e.g. '0')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "FHPUP02140000"
 
     params = {
@@ -4965,45 +3872,11 @@ def inquire_index_category_price(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                current_data1 = pd.DataFrame(output_data if isinstance(output_data, list) else [output_data])
-                dataframe1 = pd.concat([dataframe1, current_data1],
-                                       ignore_index=True) if dataframe1 is not None else current_data1
-            else:
-                dataframe1 = dataframe1 if dataframe1 is not None else pd.DataFrame()
-
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                current_data2 = pd.DataFrame(output_data if isinstance(output_data, list) else [output_data])
-                dataframe2 = pd.concat([dataframe2, current_data2],
-                                       ignore_index=True) if dataframe2 is not None else current_data2
-            else:
-                dataframe2 = dataframe2 if dataframe2 is not None else pd.DataFrame()
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return inquire_index_category_price(
-                fid_cond_mrkt_div_code,
-                fid_input_iscd,
-                fid_cond_scr_div_code,
-                fid_mrkt_cls_code,
-                fid_blng_cls_code,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1", "output2"))
+
+    if res.isOK():
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1"), ka._toFrame(pages["output2"], tr_id, "output2")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -5019,11 +3892,7 @@ def inquire_index_daily_price(
         fid_cond_mrkt_div_code: str,  # FID 조건 시장 분류 코드
         fid_input_iscd: str,  # FID 입력 종목코드
         fid_input_date_1: str,  # FID 입력 날짜1
-        dataframe1: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output1)
-        dataframe2: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output2)
         tr_cont: str = "",
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     [국내주식] 업종/기타 
@@ -5035,11 +3904,7 @@ def inquire_index_daily_price(
         fid_cond_mrkt_div_code (str): 시장구분코드 (업종 U)
         fid_input_iscd (str): 코스피(0001), 코스닥(1001), 코스피200(2001) ... 포탈 (FAQ : 종목정보 다운로드(국내) - 업종코드 참조)
         fid_input_date_1 (str): 입력 날짜(ex. 20240223)
-        dataframe1 (Optional[pd.DataFrame]): 누적 데이터프레임 (output1)
-        dataframe2 (Optional[pd.DataFrame]): 누적 데이터프레임 (output2)
         tr_cont (str): 연속 거래 여부
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 국내업종 일자별지수 데이터
@@ -5067,11 +3932,6 @@ def inquire_index_daily_price(
         logger.error("fid_input_date_1 is required. (e.g. '20240223')")
         raise ValueError("fid_input_date_1 is required. (e.g. '20240223')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "FHPUP02120000"
 
     params = {
@@ -5081,44 +3941,11 @@ def inquire_index_daily_price(
         "FID_INPUT_DATE_1": fid_input_date_1,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                current_data1 = pd.DataFrame(output_data if isinstance(output_data, list) else [output_data])
-                dataframe1 = pd.concat([dataframe1, current_data1],
-                                       ignore_index=True) if dataframe1 is not None else current_data1
-            else:
-                dataframe1 = pd.DataFrame() if dataframe1 is None else dataframe1
-
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                current_data2 = pd.DataFrame(output_data if isinstance(output_data, list) else [output_data])
-                dataframe2 = pd.concat([dataframe2, current_data2],
-                                       ignore_index=True) if dataframe2 is not None else current_data2
-            else:
-                dataframe2 = pd.DataFrame() if dataframe2 is None else dataframe2
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return inquire_index_daily_price(
-                fid_period_div_code,
-                fid_cond_mrkt_div_code,
-                fid_input_iscd,
-                fid_input_date_1,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1", "output2"))
+
+    if res.isOK():
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1"), ka._toFrame(pages["output2"], tr_id, "output2")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -5133,9 +3960,6 @@ def inquire_index_price(
         fid_cond_mrkt_div_code: str,  # FID 조건 시장 분류 코드
         fid_input_iscd: str,  # FID 입력 종목코드
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 업종/기타 
@@ -5146,9 +3970,6 @@ def inquire_index_price(
         fid_cond_mrkt_div_code (str): 업종(U)
         fid_input_iscd (str): 코스피(0001), 코스닥(1001), 코스피200(2001) ... 포탈 (FAQ : 종목정보 다운로드(국내) - 업종코드 참조)
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내업종 현재지수 데이터
@@ -5170,11 +3991,6 @@ def inquire_index_price(
         logger.error("fid_input_iscd is required. (e.g. '0001')")
         raise ValueError("fid_input_iscd is required. (e.g. '0001')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API 호출 URL 및 거래 ID 설정
     tr_id = "FHPUP02100000"
 
@@ -5185,37 +4001,11 @@ def inquire_index_price(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
-    # API 호출 성공 시 데이터 처리
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 기존 데이터프레임과 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return inquire_index_price(
-                fid_cond_mrkt_div_code,
-                fid_input_iscd,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         # API 호출 실패 시 에러 로그 출력
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
@@ -5231,9 +4021,6 @@ def inquire_index_tickprice(
         fid_input_iscd: str,  # 입력 종목코드
         fid_cond_mrkt_div_code: str,  # 시장 분류 코드
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 업종/기타 
@@ -5244,9 +4031,6 @@ def inquire_index_tickprice(
         fid_input_iscd (str): 0001:거래소, 1001:코스닥, 2001:코스피200, 3003:KSQ150
         fid_cond_mrkt_div_code (str): 시장구분코드 (업종 U)
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내업종 시간별지수(초) 데이터
@@ -5265,11 +4049,6 @@ def inquire_index_tickprice(
         logger.error("fid_cond_mrkt_div_code is required. (e.g. 'U')")
         raise ValueError("fid_cond_mrkt_div_code is required. (e.g. 'U')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPUP02110100"
 
     params = {
@@ -5278,38 +4057,11 @@ def inquire_index_tickprice(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return inquire_index_tickprice(
-                fid_input_iscd,
-                fid_cond_mrkt_div_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         # API 에러 처리
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
@@ -5326,9 +4078,6 @@ def inquire_index_timeprice(
         fid_input_iscd: str,  # 입력 종목코드
         fid_cond_mrkt_div_code: str,  # 조건 시장 분류 코드
         tr_cont: str = "",
-        dataframe: Optional[pd.DataFrame] = None,
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 업종/기타 
@@ -5340,9 +4089,6 @@ def inquire_index_timeprice(
         fid_input_iscd (str): 0001:거래소, 1001:코스닥, 2001:코스피200, 3003:KSQ150
         fid_cond_mrkt_div_code (str): 시장구분코드 (업종 U)
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내업종 시간별지수(분) 데이터
@@ -5365,11 +4111,6 @@ def inquire_index_timeprice(
         logger.error("fid_cond_mrkt_div_code is required. (e.g. 'U')")
         raise ValueError("fid_cond_mrkt_div_code is required. (e.g. 'U')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPUP02110200"
 
     params = {
@@ -5379,36 +4120,11 @@ def inquire_index_timeprice(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return inquire_index_timeprice(
-                fid_input_hour_1,
-                fid_input_iscd,
-                fid_cond_mrkt_div_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -5471,7 +4187,7 @@ def inquire_investor(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        return pd.DataFrame(res.getBody().output)
+        return ka._toFrame(res.getBody().output, tr_id, "output")
     else:
         res.printError(url=api_url)
         return pd.DataFrame()
@@ -5544,7 +4260,7 @@ def inquire_investor_daily_by_market(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -5592,7 +4308,7 @@ def inquire_investor_time_by_market(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -5651,7 +4367,7 @@ def inquire_member(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame([res.getBody().output])
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -5726,7 +4442,7 @@ def inquire_member_daily(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -5775,7 +4491,7 @@ def inquire_overtime_asking_price(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame([res.getBody().output])
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -5824,7 +4540,7 @@ def inquire_overtime_price(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output, index=[0])
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -5848,10 +4564,6 @@ def inquire_period_profit(
         NK100: str = "",  # 연속조회키100
         FK100: str = "",  # 연속조회검색조건100
         tr_cont: str = "",  # 연속거래여부
-        dataframe1: Optional[pd.DataFrame] = None,  # 누적 데이터프레임1
-        dataframe2: Optional[pd.DataFrame] = None,  # 누적 데이터프레임2
-        depth: int = 0,  # 내부 재귀깊이 (자동관리)
-        max_depth: int = 10  # 최대 재귀 횟수 제한
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     기간별손익일별합산조회 API입니다.
@@ -5869,10 +4581,6 @@ def inquire_period_profit(
         NK100 (str): 연속조회키100
         FK100 (str): 연속조회검색조건100
         tr_cont (str): 연속거래여부
-        dataframe1 (Optional[pd.DataFrame]): 누적 데이터프레임1
-        dataframe2 (Optional[pd.DataFrame]): 누적 데이터프레임2
-        depth (int): 내부 재귀깊이 (자동관리)
-        max_depth (int): 최대 재귀 횟수 제한
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 기간별손익일별합산조회 데이터 (output1, output2)
@@ -5906,14 +4614,6 @@ def inquire_period_profit(
     if cblc_dvsn == "":
         raise ValueError("cblc_dvsn is required (e.g. '00')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe1 is None:
-            dataframe1 = pd.DataFrame()
-        if dataframe2 is None:
-            dataframe2 = pd.DataFrame()
-        return dataframe1, dataframe2
-
     tr_id = "TTTC8708R"
 
     params = {
@@ -5929,37 +4629,14 @@ def inquire_period_profit(
         "CTX_AREA_NK100": NK100
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(
+        api_url, tr_id, tr_cont, params, ("output1", "output2"),
+        cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"},
+    )
 
     if res.isOK():
-        # output1 처리 (array)
-        current_data1 = pd.DataFrame(res.getBody().output1)
-        if dataframe1 is not None:
-            dataframe1 = pd.concat([dataframe1, current_data1], ignore_index=True)
-        else:
-            dataframe1 = current_data1
-
-        # output2 처리 (object)
-        current_data2 = pd.DataFrame(res.getBody().output2, index=[0])
-        if dataframe2 is not None:
-            dataframe2 = pd.concat([dataframe2, current_data2], ignore_index=True)
-        else:
-            dataframe2 = current_data2
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return inquire_period_profit(
-                cano, acnt_prdt_cd, inqr_strt_dt, inqr_end_dt, sort_dvsn, inqr_dvsn, cblc_dvsn,
-                pdno, NK100, FK100, "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe1, dataframe2
+        logging.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1"), ka._toFrame(pages["output2"], tr_id, "output2")
     else:
         res.printError(url=api_url)
         return pd.DataFrame(), pd.DataFrame()
@@ -5980,10 +4657,6 @@ def inquire_period_trade_profit(
         NK100: str = "",  # 연속조회키100
         FK100: str = "",  # 연속조회검색조건100
         tr_cont: str = "",  # 연속거래여부
-        dataframe1: Optional[pd.DataFrame] = None,  # 누적 데이터프레임1
-        dataframe2: Optional[pd.DataFrame] = None,  # 누적 데이터프레임2
-        depth: int = 0,  # 내부 재귀깊이 (자동관리)
-        max_depth: int = 10  # 최대 재귀 횟수 제한
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     기간별매매손익현황조회 API입니다.
@@ -6000,10 +4673,6 @@ def inquire_period_trade_profit(
         NK100 (str): 연속조회키100
         FK100 (str): 연속조회검색조건100
         tr_cont (str): 연속거래여부
-        dataframe1 (Optional[pd.DataFrame]): 누적 데이터프레임1
-        dataframe2 (Optional[pd.DataFrame]): 누적 데이터프레임2
-        depth (int): 내부 재귀깊이 (자동관리)
-        max_depth (int): 최대 재귀 횟수 제한
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 기간별매매손익현황 데이터 (output1, output2)
@@ -6015,6 +4684,27 @@ def inquire_period_trade_profit(
     """
     api_url = "/uapi/domestic-stock/v1/trading/inquire-period-trade-profit"
 
+    tr_id, params = _inquire_period_trade_profit_request(
+        cano, acnt_prdt_cd, sort_dvsn, inqr_strt_dt, inqr_end_dt, cblc_dvsn, pdno, NK100, FK100
+    )
+
+    res, pages = ka._paginate(
+        api_url, tr_id, tr_cont, params, ("output1", "output2"),
+        cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"},
+    )
+
+    if res.isOK():
+        logging.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1"), ka._toFrame(pages["output2"], tr_id, "output2")
+    else:
+        res.printError(url=api_url)
+        return pd.DataFrame(), pd.DataFrame()
+
+
+def _inquire_period_trade_profit_request(
+        cano, acnt_prdt_cd, sort_dvsn, inqr_strt_dt, inqr_end_dt, cblc_dvsn, pdno, NK100, FK100
+) -> Tuple[str, dict]:
+    """inquire_period_trade_profit / iter_inquire_period_trade_profit 공통: 파라미터 검증 후 (tr_id, params) 반환"""
     if cano == "":
         raise ValueError("cano is required")
 
@@ -6033,14 +4723,6 @@ def inquire_period_trade_profit(
     if cblc_dvsn == "":
         raise ValueError("cblc_dvsn is required (e.g. '00')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe1 is None:
-            dataframe1 = pd.DataFrame()
-        if dataframe2 is None:
-            dataframe2 = pd.DataFrame()
-        return dataframe1, dataframe2
-
     tr_id = "TTTC8715R"  # 기간별매매손익현황조회
 
     params = {
@@ -6055,39 +4737,58 @@ def inquire_period_trade_profit(
         "CTX_AREA_NK100": NK100  # 연속조회키100
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    return tr_id, params
 
-    if res.isOK():
-        current_data1 = pd.DataFrame(res.getBody().output1)
-        current_data2 = pd.DataFrame(res.getBody().output2, index=[0])
 
-        if dataframe1 is not None:
-            dataframe1 = pd.concat([dataframe1, current_data1], ignore_index=True)
-        else:
-            dataframe1 = current_data1
+def iter_inquire_period_trade_profit(
+        cano: str,  # 종합계좌번호
+        acnt_prdt_cd: str,  # 계좌상품코드
+        sort_dvsn: str,  # 정렬구분 (00: 최근, 01:과거, 02:최근)
+        inqr_strt_dt: str,  # 조회시작일자
+        inqr_end_dt: str,  # 조회종료일자
+        cblc_dvsn: str,  # 잔고구분 (00: 전체)
+        pdno: str = "",  # 상품번호
+        NK100: str = "",  # 연속조회키100
+        FK100: str = "",  # 연속조회검색조건100
+        records: bool = False,  # True: output1 레코드(dict) 단위로 반환
+) -> Iterator:
+    """
+    기간별매매손익현황조회 (페이지 단위 generator)
+    inquire_period_trade_profit 와 같은 조회를 연속조회 페이지가 도착할 때마다 바로 돌려줍니다.
 
-        if dataframe2 is not None:
-            dataframe2 = pd.concat([dataframe2, current_data2], ignore_index=True)
-        else:
-            dataframe2 = current_data2
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return inquire_period_trade_profit(
-                cano, acnt_prdt_cd, sort_dvsn, inqr_strt_dt, inqr_end_dt, cblc_dvsn,
-                pdno, NK100, FK100, "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
+    Args:
+        inquire_period_trade_profit 와 동일 (tr_cont 제외)
+        records (bool): True 면 output1 레코드(dict)를 한 건씩 반환
+
+    Yields:
+        Tuple[pd.DataFrame, pd.DataFrame]: 페이지별 (output1, output2), records=True 면 output1 레코드(dict)
+
+    Raises:
+        ka.KISAPIError: API 오류 응답
+
+    Example:
+        >>> total = 0
+        >>> for row in iter_inquire_period_trade_profit(
+        ...     cano=trenv.my_acct, acnt_prdt_cd=trenv.my_prod, sort_dvsn="02",
+        ...     inqr_strt_dt="20230216", inqr_end_dt="20240301", cblc_dvsn="00", records=True
+        ... ):
+        ...     total += int(row["rlzt_pfls"])
+    """
+    api_url = "/uapi/domestic-stock/v1/trading/inquire-period-trade-profit"
+
+    tr_id, params = _inquire_period_trade_profit_request(
+        cano, acnt_prdt_cd, sort_dvsn, inqr_strt_dt, inqr_end_dt, cblc_dvsn, pdno, NK100, FK100
+    )
+
+    for page in ka._streamPages(
+            api_url, tr_id, "", params, ("output1", "output2"),
+            cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"},
+    ):
+        if records:
+            for row in page["output1"]:
+                yield row
         else:
-            logging.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        res.printError(url=api_url)
-        return pd.DataFrame(), pd.DataFrame()
+            yield ka._toFrame(page["output1"], tr_id, "output1"), ka._toFrame(page["output2"], tr_id, "output2")
 
 
 ##############################################################################################
@@ -6145,7 +4846,7 @@ def inquire_price(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output, index=[0])
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -6193,7 +4894,7 @@ def inquire_price_2(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        return pd.DataFrame(res.getBody().output, index=[0])
+        return ka._toFrame(res.getBody().output, tr_id, "output")
     else:
         res.printError(url=api_url)
         return pd.DataFrame()
@@ -6295,7 +4996,7 @@ def inquire_psbl_order(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        return pd.DataFrame(res.getBody().output, index=[0])
+        return ka._toFrame(res.getBody().output, tr_id, "output")
     else:
         res.printError(url=api_url)
         return pd.DataFrame()
@@ -6313,9 +5014,6 @@ def inquire_psbl_rvsecncl(
         FK100: str = "",  # 연속조회검색조건100
         NK100: str = "",  # 연속조회키100
         tr_cont: str = "",  # 연속거래여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 내부 재귀깊이 (자동관리)
-        max_depth: int = 10  # 최대 재귀 횟수 제한
 ) -> pd.DataFrame:
     """
     주식정정취소가능주문조회 API입니다. 한 번의 호출에 최대 50건까지 확인 가능하며, 이후의 값은 연속조회를 통해 확인하실 수 있습니다.
@@ -6330,9 +5028,6 @@ def inquire_psbl_rvsecncl(
         FK100 (str): 연속조회검색조건100
         NK100 (str): 연속조회키100
         tr_cont (str): 연속거래여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 내부 재귀깊이 (자동관리)
-        max_depth (int): 최대 재귀 횟수 제한
 
     Returns:
         pd.DataFrame: 주식정정취소가능주문조회 데이터
@@ -6355,13 +5050,6 @@ def inquire_psbl_rvsecncl(
     if inqr_dvsn_2 == "":
         raise ValueError("inqr_dvsn_2 is required (e.g. '0: 전체, 1: 매도, 2: 매수')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe is None:
-            return pd.DataFrame()
-        else:
-            return dataframe
-
     tr_id = "TTTC0084R"  # 주식정정취소가능주문조회
 
     params = {
@@ -6373,29 +5061,14 @@ def inquire_psbl_rvsecncl(
         "CTX_AREA_NK100": NK100  # 연속조회키100
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
+    res, pages = ka._paginate(
+        api_url, tr_id, tr_cont, params, ("output",),
+        cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"},
+    )
 
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return inquire_psbl_rvsecncl(
-                cano, acnt_prdt_cd, inqr_dvsn_1, inqr_dvsn_2, FK100, NK100, "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe
+    if res.isOK():
+        logging.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         res.printError(url=api_url)
         return pd.DataFrame()
@@ -6410,9 +5083,6 @@ def inquire_psbl_sell(
         acnt_prdt_cd: str,  # 계좌상품코드
         pdno: str,  # 종목번호
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 주문/계좌 
@@ -6424,9 +5094,6 @@ def inquire_psbl_sell(
         acnt_prdt_cd (str): 계좌상품코드
         pdno (str): 보유종목 코드 ex)000660
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 매도가능수량조회 데이터
@@ -6449,11 +5116,6 @@ def inquire_psbl_sell(
         logger.error("pdno is required. (e.g. '000660')")
         raise ValueError("pdno is required. (e.g. '000660')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "TTTC8408R"
 
     params = {
@@ -6463,36 +5125,11 @@ def inquire_psbl_sell(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return inquire_psbl_sell(
-                cano,
-                acnt_prdt_cd,
-                pdno,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -6565,10 +5202,10 @@ def inquire_time_dailychartprice(
 
     if res.isOK():
         # output1 (object) -> DataFrame
-        output1 = pd.DataFrame([res.getBody().output1])
+        output1 = ka._toFrame(res.getBody().output1, tr_id, "output1")
 
         # output2 (array) -> DataFrame  
-        output2 = pd.DataFrame(res.getBody().output2)
+        output2 = ka._toFrame(res.getBody().output2, tr_id, "output2")
 
         return output1, output2
     else:
@@ -6586,11 +5223,7 @@ def inquire_time_indexchartprice(
         fid_input_iscd: str,  # FID 입력 종목코드
         fid_input_hour_1: str,  # FID 입력 시간1
         fid_pw_data_incu_yn: str,  # FID 과거 데이터 포함 여부
-        dataframe1: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output1)
-        dataframe2: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output2)
         tr_cont: str = "",
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     [국내주식] 업종/기타 
@@ -6603,11 +5236,7 @@ def inquire_time_indexchartprice(
         fid_input_iscd (str): FID 입력 종목코드 (예: '0001' 종합, '0002' 대형주)
         fid_input_hour_1 (str): FID 입력 시간1 (예: '30', '60', '600', '3600')
         fid_pw_data_incu_yn (str): FID 과거 데이터 포함 여부 (예: 'Y' 과거, 'N' 당일)
-        dataframe1 (Optional[pd.DataFrame]): 누적 데이터프레임 (output1)
-        dataframe2 (Optional[pd.DataFrame]): 누적 데이터프레임 (output2)
         tr_cont (str): 연속 거래 여부
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 업종 분봉조회 데이터
@@ -6648,11 +5277,6 @@ def inquire_time_indexchartprice(
         logger.error("fid_pw_data_incu_yn is required. (e.g. 'Y')")
         raise ValueError("fid_pw_data_incu_yn is required. (e.g. 'Y')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "FHKUP03500200"
 
     params = {
@@ -6663,67 +5287,11 @@ def inquire_time_indexchartprice(
         "FID_PW_DATA_INCU_YN": fid_pw_data_incu_yn,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1", "output2"))
 
     if res.isOK():
-        # Output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                # output1은 단일 객체, output2는 배열일 수 있음
-                if isinstance(output_data, list):
-                    current_data1 = pd.DataFrame(output_data)
-                else:
-                    # 단일 객체인 경우 리스트로 감싸서 DataFrame 생성
-                    current_data1 = pd.DataFrame([output_data])
-
-                if dataframe1 is not None:
-                    dataframe1 = pd.concat([dataframe1, current_data1], ignore_index=True)
-                else:
-                    dataframe1 = current_data1
-            else:
-                if dataframe1 is None:
-                    dataframe1 = pd.DataFrame()
-        else:
-            if dataframe1 is None:
-                dataframe1 = pd.DataFrame()
-        # Output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                # output1은 단일 객체, output2는 배열일 수 있음
-                if isinstance(output_data, list):
-                    current_data2 = pd.DataFrame(output_data)
-                else:
-                    # 단일 객체인 경우 리스트로 감싸서 DataFrame 생성
-                    current_data2 = pd.DataFrame([output_data])
-
-                if dataframe2 is not None:
-                    dataframe2 = pd.concat([dataframe2, current_data2], ignore_index=True)
-                else:
-                    dataframe2 = current_data2
-            else:
-                if dataframe2 is None:
-                    dataframe2 = pd.DataFrame()
-        else:
-            if dataframe2 is None:
-                dataframe2 = pd.DataFrame()
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return inquire_time_indexchartprice(
-                fid_cond_mrkt_div_code,
-                fid_etc_cls_code,
-                fid_input_iscd,
-                fid_input_hour_1,
-                fid_pw_data_incu_yn,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1"), ka._toFrame(pages["output2"], tr_id, "output2")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -6806,10 +5374,10 @@ def inquire_time_itemchartprice(
 
     if res.isOK():
         # output1 (object) -> DataFrame (1행)
-        output1_data = pd.DataFrame(res.getBody().output1, index=[0])
+        output1_data = ka._toFrame(res.getBody().output1, tr_id, "output1")
 
         # output2 (array) -> DataFrame (여러행)
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output2_data = ka._toFrame(res.getBody().output2, tr_id, "output2")
 
         return output1_data, output2_data
     else:
@@ -6877,10 +5445,10 @@ def inquire_time_itemconclusion(
 
     if res.isOK():
         # output1 처리 (object -> DataFrame)
-        output1_data = pd.DataFrame([res.getBody().output1])
+        output1_data = ka._toFrame(res.getBody().output1, tr_id, "output1")
 
         # output2 처리 (object -> DataFrame)  
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output2_data = ka._toFrame(res.getBody().output2, tr_id, "output2")
 
         return output1_data, output2_data
     else:
@@ -6948,10 +5516,10 @@ def inquire_time_overtimeconclusion(
 
     if res.isOK():
         # output1 (object) -> DataFrame
-        output1_data = pd.DataFrame(res.getBody().output1, index=[0])
+        output1_data = ka._toFrame(res.getBody().output1, tr_id, "output1")
 
         # output2 (array) -> DataFrame  
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output2_data = ka._toFrame(res.getBody().output2, tr_id, "output2")
 
         return output1_data, output2_data
     else:
@@ -6973,9 +5541,6 @@ def inquire_vi_status(
         fid_trgt_cls_code: str,  # FID 대상 구분 코드
         fid_trgt_exls_cls_code: str,  # FID 대상 제외 구분 코드
         tr_cont: str = "",
-        dataframe: Optional[pd.DataFrame] = None,
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 업종/기타 
@@ -6992,9 +5557,6 @@ def inquire_vi_status(
         fid_trgt_cls_code (str): 대상 구분 코드
         fid_trgt_exls_cls_code (str): 대상 제외 구분 코드
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 변동성완화장치(VI) 현황 데이터
@@ -7037,11 +5599,6 @@ def inquire_vi_status(
         logger.error("fid_div_cls_code is required. (e.g. '0')")
         raise ValueError("fid_div_cls_code is required. (e.g. '0')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPST01390000"
 
     params = {
@@ -7056,41 +5613,11 @@ def inquire_vi_status(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return inquire_vi_status(
-                fid_div_cls_code,
-                fid_cond_scr_div_code,
-                fid_mrkt_cls_code,
-                fid_input_iscd,
-                fid_rank_sort_cls_code,
-                fid_input_date_1,
-                fid_trgt_cls_code,
-                fid_trgt_exls_cls_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -7159,7 +5686,7 @@ def intgr_margin(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame([res.getBody().output])
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -7218,7 +5745,7 @@ def intstock_grouplist(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output2)
+        current_data = ka._toFrame(res.getBody().output2, tr_id, "output2")
         return current_data
     else:
         res.printError(url=api_url)
@@ -7509,7 +6036,7 @@ def intstock_multprice(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -7517,6 +6044,80 @@ def intstock_multprice(
         return pd.DataFrame()
 
 
+# 관심종목(멀티종목) 시세조회 1회 최대 종목 수
+MULTPRICE_BATCH_SIZE = 30
+MULTPRICE_TR_ID = "FHKST11300006"
+
+
+def _multprice_batches(codes, fid_cond_mrkt_div_code: str = "J") -> list:
+    """종목코드 목록을 intstock_multprice 호출 인자(최대 30종목)로 분할 (중복 제거, 순서 유지)"""
+    codes = list(dict.fromkeys(codes))
+    batches = []
+    for i in range(0, len(codes), MULTPRICE_BATCH_SIZE):
+        kwargs = {}
+        for n, code in enumerate(codes[i:i + MULTPRICE_BATCH_SIZE], start=1):
+            kwargs[f"fid_cond_mrkt_div_code_{n}"] = fid_cond_mrkt_div_code
+            kwargs[f"fid_input_iscd_{n}"] = code
+        batches.append(kwargs)
+    return batches
+
+
+def _quotes_frame(codes, frames) -> pd.DataFrame:
+    """배치별 시세 DataFrame 을 합쳐 종목코드 인덱스로 정리 (요청 순서, 조회 실패 종목은 제외)"""
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return pd.DataFrame()
+    df = pd.concat(frames, ignore_index=True).drop_duplicates(subset="inter_shrn_iscd")
+    # get_quotes 는 TYPED_OUTPUT 설정과 관계없이 항상 숫자 컬럼으로 반환 (이미 변환된 컬럼은 그대로)
+    df = kis_schema.decode(df, MULTPRICE_TR_ID, "output").set_index("inter_shrn_iscd")
+    codes = list(dict.fromkeys(codes))
+    missing = [c for c in codes if c not in df.index]
+    if missing:
+        logger.warning(f"시세 조회 누락 종목: {missing}")
+    return df.loc[[c for c in codes if c in df.index]]
+
+
+def _quote_batch(kwargs) -> pd.DataFrame:
+    """intstock_multprice 배치 1회 (전송 오류도 오류 응답처럼 로그만 남기고 해당 배치 종목은 누락 처리)"""
+    try:
+        return intstock_multprice(**kwargs)
+    except Exception as e:
+        logger.error(f"멀티종목 시세 조회 실패: {e}")
+        return pd.DataFrame()
+
+
+def get_quotes(
+        codes,  # 종목코드 목록 (ex. ["005930", "000660"])
+        fid_cond_mrkt_div_code: str = "J",  # 조건 시장 분류 코드 (J:KRX, NX:NXT)
+        max_workers: int = 4,  # 동시 호출 배치 수
+) -> pd.DataFrame:
+    """
+    여러 종목 현재가 일괄 조회
+    종목코드를 30개씩 나눠 관심종목(멀티종목) 시세조회(intstock_multprice)를 동시에 호출합니다.
+    종목마다 inquire_price 를 호출하는 대신 300종목을 10회 호출로 조회하며, 호출 속도는 _url_fetch 의 속도 제한을 따릅니다.
+
+    Args:
+        codes: 종목코드 목록
+        fid_cond_mrkt_div_code (str): 조건 시장 분류 코드 (J:KRX, NX:NXT)
+        max_workers (int): 동시에 호출할 배치 수
+
+    Returns:
+        pd.DataFrame: 종목코드(inter_shrn_iscd) 인덱스의 시세 데이터 (숫자 컬럼 타입 변환됨), 조회 실패 종목은 제외
+
+    Example:
+        >>> df = get_quotes(["005930", "000660", "035720"])
+        >>> df.loc["005930", "inter2_prpr"]
+    """
+    batches = _multprice_batches(codes, fid_cond_mrkt_div_code)
+    if not batches:
+        return pd.DataFrame()
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as pool:
+        frames = list(pool.map(_quote_batch, batches))
+
+    return _quotes_frame(codes, frames)
+
+
 ##############################################################################################
 # [국내주식] 시세분석 > 관심종목 그룹별 종목조회 [국내주식-203]
 ##############################################################################################
@@ -7591,10 +6192,10 @@ def intstock_stocklist_by_group(
 
     if res.isOK():
         # output1 데이터프레임 생성
-        output1_data = pd.DataFrame([res.getBody().output1])
+        output1_data = ka._toFrame(res.getBody().output1, tr_id, "output1")
 
         # output2 데이터프레임 생성
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output2_data = ka._toFrame(res.getBody().output2, tr_id, "output2")
 
         logging.info("Data fetch complete.")
         return output1_data, output2_data
@@ -7615,9 +6216,6 @@ def invest_opbysec(
         fid_input_date_1: str,  # 입력날짜1
         fid_input_date_2: str,  # 입력날짜2
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -7632,9 +6230,6 @@ def invest_opbysec(
         fid_input_date_1 (str): 이후 ~
         fid_input_date_2 (str): ~ 이전
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 증권사별 투자의견 데이터
@@ -7679,11 +6274,6 @@ def invest_opbysec(
         logger.error("fid_input_date_2 is required. (e.g. '20231231')")
         raise ValueError("fid_input_date_2 is required. (e.g. '20231231')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API 호출 URL 및 거래 ID 설정
 
     tr_id = "FHKST663400C0"
@@ -7699,40 +6289,11 @@ def invest_opbysec(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
-    # API 응답 처리
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return invest_opbysec(
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_input_date_1,
-                fid_input_date_2,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -7750,9 +6311,6 @@ def invest_opinion(
         fid_input_date_1: str,  # 입력날짜1
         fid_input_date_2: str,  # 입력날짜2
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -7766,9 +6324,6 @@ def invest_opinion(
         fid_input_date_1 (str): 이후 ~(ex) 0020231113)
         fid_input_date_2 (str): ~ 이전(ex) 0020240513)
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 종목투자의견 데이터
@@ -7808,11 +6363,6 @@ def invest_opinion(
         logger.error("fid_input_date_2 is required. (e.g. '20240513')")
         raise ValueError("fid_input_date_2 is required. (e.g. '20240513')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API 호출 URL 및 거래 ID 설정
 
     tr_id = "FHKST663300C0"
@@ -7827,40 +6377,11 @@ def invest_opinion(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
-    # API 응답 처리
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return invest_opinion(
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_input_date_1,
-                fid_input_date_2,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -7902,7 +6423,7 @@ def investor_program_trade_today(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output1)
+        current_data = ka._toFrame(res.getBody().output1, tr_id, "output1")
         return current_data
     else:
         res.printError(url=api_url)
@@ -7919,11 +6440,7 @@ def investor_trade_by_stock_daily(
         fid_input_date_1: str,  # 입력 날짜1
         fid_org_adj_prc: str,  # 수정주가 원주가 가격
         fid_etc_cls_code: str,  # 기타 구분 코드
-        dataframe1: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output1)
-        dataframe2: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output2)
         tr_cont: str = "",
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     [국내주식] 시세분석 
@@ -7936,11 +6453,7 @@ def investor_trade_by_stock_daily(
         fid_input_date_1 (str): 입력 날짜(20250812)
         fid_org_adj_prc (str): 공란 입력
         fid_etc_cls_code (str): 공란 입력
-        dataframe1 (Optional[pd.DataFrame]): 누적 데이터프레임 (output1)
-        dataframe2 (Optional[pd.DataFrame]): 누적 데이터프레임 (output2)
         tr_cont (str): 연속 거래 여부
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 종목별 투자자매매동향(일별) 데이터
@@ -7968,11 +6481,6 @@ def investor_trade_by_stock_daily(
         logger.error("fid_input_date_1 is required. (e.g. '20250812')")
         raise ValueError("fid_input_date_1 is required. (e.g. '20250812')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "FHPTJ04160001"
 
     params = {
@@ -7983,65 +6491,11 @@ def investor_trade_by_stock_daily(
         "FID_ETC_CLS_CODE": fid_etc_cls_code,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1", "output2"))
 
     if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                if isinstance(output_data, list):
-                    current_data1 = pd.DataFrame(output_data)
-                else:
-                    current_data1 = pd.DataFrame([output_data])
-
-                if dataframe1 is not None:
-                    dataframe1 = pd.concat([dataframe1, current_data1], ignore_index=True)
-                else:
-                    dataframe1 = current_data1
-            else:
-                if dataframe1 is None:
-                    dataframe1 = pd.DataFrame()
-        else:
-            if dataframe1 is None:
-                dataframe1 = pd.DataFrame()
-
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                if isinstance(output_data, list):
-                    current_data2 = pd.DataFrame(output_data)
-                else:
-                    current_data2 = pd.DataFrame([output_data])
-
-                if dataframe2 is not None:
-                    dataframe2 = pd.concat([dataframe2, current_data2], ignore_index=True)
-                else:
-                    dataframe2 = current_data2
-            else:
-                if dataframe2 is None:
-                    dataframe2 = pd.DataFrame()
-        else:
-            if dataframe2 is None:
-                dataframe2 = pd.DataFrame()
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return investor_trade_by_stock_daily(
-                fid_cond_mrkt_div_code,
-                fid_input_iscd,
-                fid_input_date_1,
-                fid_org_adj_prc,
-                fid_etc_cls_code,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1"), ka._toFrame(pages["output2"], tr_id, "output2")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -8087,7 +6541,7 @@ def investor_trend_estimate(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output2)
+        current_data = ka._toFrame(res.getBody().output2, tr_id, "output2")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -8105,9 +6559,6 @@ def ksdinfo_bonus_issue(
         t_dt: str,  # 조회일자To
         sht_cd: str,  # 종목코드
         tr_cont: str = "",
-        dataframe: Optional[pd.DataFrame] = None,
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -8120,9 +6571,6 @@ def ksdinfo_bonus_issue(
         t_dt (str): ~ 일자
         sht_cd (str): 공백: 전체, 특정종목 조회시 : 종목코드
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 예탁원정보(무상증자일정) 데이터
@@ -8144,11 +6592,6 @@ def ksdinfo_bonus_issue(
         logger.error("t_dt is required. (e.g. '20231231')")
         raise ValueError("t_dt is required. (e.g. '20231231')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB669101C0"
 
     params = {
@@ -8159,37 +6602,11 @@ def ksdinfo_bonus_issue(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1",))
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_bonus_issue(
-                cts,
-                f_dt,
-                t_dt,
-                sht_cd,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -8206,9 +6623,6 @@ def ksdinfo_cap_dcrs(
         t_dt: str,  # 조회일자To
         sht_cd: str,  # 종목코드
         tr_cont: str = "",
-        dataframe: Optional[pd.DataFrame] = None,
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -8221,9 +6635,6 @@ def ksdinfo_cap_dcrs(
         t_dt (str): ~ 일자
         sht_cd (str): 공백: 전체,  특정종목 조회시 : 종목코드
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 예탁원정보(자본감소일정) 데이터
@@ -8245,11 +6656,6 @@ def ksdinfo_cap_dcrs(
         logger.error("t_dt is required. (e.g. '20231231')")
         raise ValueError("t_dt is required. (e.g. '20231231')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB669106C0"
 
     params = {
@@ -8260,37 +6666,11 @@ def ksdinfo_cap_dcrs(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1",))
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_cap_dcrs(
-                cts,
-                f_dt,
-                t_dt,
-                sht_cd,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -8309,9 +6689,6 @@ def ksdinfo_dividend(
         sht_cd: str,  # 종목코드
         high_gb: str,  # 고배당여부
         tr_cont: str = "",
-        dataframe: Optional[pd.DataFrame] = None,
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -8326,9 +6703,6 @@ def ksdinfo_dividend(
         sht_cd (str): 공백: 전체,  특정종목 조회시 : 종목코드
         high_gb (str): 공백
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 예탁원정보(배당일정) 데이터
@@ -8354,11 +6728,6 @@ def ksdinfo_dividend(
         logger.error("t_dt is required. (e.g. '20231231')")
         raise ValueError("t_dt is required. (e.g. '20231231')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB669102C0"
 
     params = {
@@ -8371,41 +6740,11 @@ def ksdinfo_dividend(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1",))
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_dividend(
-                cts,
-                gb1,
-                f_dt,
-                t_dt,
-                sht_cd,
-                high_gb,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -8422,9 +6761,6 @@ def ksdinfo_forfeit(
         f_dt: str,  # 조회일자From
         cts: str,  # CTS
         tr_cont: str = "",
-        dataframe: Optional[pd.DataFrame] = None,
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -8437,9 +6773,6 @@ def ksdinfo_forfeit(
         f_dt (str): 일자 ~
         cts (str): 공백
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 예탁원정보(실권주일정) 데이터
@@ -8461,11 +6794,6 @@ def ksdinfo_forfeit(
         logger.error("f_dt is required. (e.g. '20240314')")
         raise ValueError("f_dt is required. (e.g. '20240314')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB669109C0"
 
     params = {
@@ -8476,37 +6804,11 @@ def ksdinfo_forfeit(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1",))
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_forfeit(
-                sht_cd,
-                t_dt,
-                f_dt,
-                cts,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -8523,9 +6825,6 @@ def ksdinfo_list_info(
         f_dt: str,  # 조회일자From
         cts: str,  # CTS
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -8538,9 +6837,6 @@ def ksdinfo_list_info(
         f_dt (str): 일자 ~
         cts (str): 공백
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 예탁원정보(상장정보일정) 데이터
@@ -8561,11 +6857,6 @@ def ksdinfo_list_info(
         logger.error("f_dt is required. (e.g. '20231001')")
         raise ValueError("f_dt is required. (e.g. '20231001')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API 호출 URL 및 ID 설정
 
     tr_id = "HHKDB669107C0"
@@ -8579,39 +6870,11 @@ def ksdinfo_list_info(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1",))
 
-    # API 응답 처리
     if res.isOK():
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_list_info(
-                sht_cd,
-                t_dt,
-                f_dt,
-                cts,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -8628,9 +6891,6 @@ def ksdinfo_mand_deposit(
         f_dt: str,  # 조회일자From
         cts: str,  # CTS
         tr_cont: str = "",
-        dataframe: Optional[pd.DataFrame] = None,
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -8643,9 +6903,6 @@ def ksdinfo_mand_deposit(
         f_dt (str): 조회 시작 일자 (예: '20230101')
         cts (str): CTS (공백)
         tr_cont (str): 연속 거래 여부 (기본값: "")
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 예탁원정보(의무예치일정) 데이터
@@ -8667,11 +6924,6 @@ def ksdinfo_mand_deposit(
         logger.error("f_dt is required. (e.g. '20230101')")
         raise ValueError("f_dt is required. (e.g. '20230101')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API 호출 URL 및 거래 ID 설정
 
     tr_id = "HHKDB669110C0"
@@ -8685,41 +6937,11 @@ def ksdinfo_mand_deposit(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1",))
 
-    # API 호출 성공 시 데이터 처리
     if res.isOK():
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 기존 데이터프레임과 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        # 다음 페이지 호출
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_mand_deposit(
-                t_dt,
-                sht_cd,
-                f_dt,
-                cts,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1")
     else:
         # API 호출 실패 시 에러 로그 출력
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
@@ -8737,9 +6959,6 @@ def ksdinfo_merger_split(
         t_dt: str,  # 조회일자To
         sht_cd: str,  # 종목코드
         tr_cont: str = "",
-        dataframe: Optional[pd.DataFrame] = None,
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -8752,9 +6971,6 @@ def ksdinfo_merger_split(
         t_dt (str): ~ 일자
         sht_cd (str): 공백: 전체, 특정종목 조회시 : 종목코드
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 예탁원정보(합병_분할일정) 데이터
@@ -8776,11 +6992,6 @@ def ksdinfo_merger_split(
         logger.error("t_dt is required. (e.g. '20231231')")
         raise ValueError("t_dt is required. (e.g. '20231231')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB669104C0"
 
     params = {
@@ -8791,37 +7002,11 @@ def ksdinfo_merger_split(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1",))
 
     if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output1'):
-            current_data = pd.DataFrame(res.getBody().output1)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_merger_split(
-                cts,
-                f_dt,
-                t_dt,
-                sht_cd,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1")
     else:
         # API 호출 실패 시 에러 로그
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
@@ -8840,9 +7025,6 @@ def ksdinfo_paidin_capin(
         t_dt: str,  # 조회일자To
         sht_cd: str,  # 종목코드
         tr_cont: str = "",
-        dataframe: Optional[pd.DataFrame] = None,
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -8856,9 +7038,6 @@ def ksdinfo_paidin_capin(
         t_dt (str): ~ 일자
         sht_cd (str): 공백(전체),  특정종목 조회시(종목코드)
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 예탁원정보(유상증자일정) 데이터
@@ -8884,11 +7063,6 @@ def ksdinfo_paidin_capin(
         logger.error("t_dt is required. (e.g. '20231231')")
         raise ValueError("t_dt is required. (e.g. '20231231')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB669100C0"
 
     params = {
@@ -8900,35 +7074,11 @@ def ksdinfo_paidin_capin(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1",))
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output1'):
-            current_data = pd.DataFrame(res.getBody().output1)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_paidin_capin(
-                cts,
-                gb1,
-                f_dt,
-                t_dt,
-                sht_cd,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -8945,9 +7095,6 @@ def ksdinfo_pub_offer(
         f_dt: str,  # 조회일자From
         t_dt: str,  # 조회일자To
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -8960,9 +7107,6 @@ def ksdinfo_pub_offer(
         f_dt (str): 일자 ~
         t_dt (str): ~ 일자
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 예탁원정보(공모주청약일정) 데이터
@@ -8981,11 +7125,6 @@ def ksdinfo_pub_offer(
         logger.error("t_dt is required. (e.g. '20231231')")
         raise ValueError("t_dt is required. (e.g. '20231231')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB669108C0"
 
     params = {
@@ -8996,37 +7135,11 @@ def ksdinfo_pub_offer(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1",))
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_pub_offer(
-                sht_cd,
-                cts,
-                f_dt,
-                t_dt,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -9043,9 +7156,6 @@ def ksdinfo_purreq(
         f_dt: str,  # 조회일자From
         cts: str,  # CTS
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -9058,9 +7168,6 @@ def ksdinfo_purreq(
         f_dt (str): 일자 ~
         cts (str): 공백
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 예탁원정보(주식매수청구일정) 데이터
@@ -9081,11 +7188,6 @@ def ksdinfo_purreq(
         logger.error("f_dt is required. (e.g. '20231001')")
         raise ValueError("f_dt is required. (e.g. '20231001')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB669103C0"
 
     params = {
@@ -9096,39 +7198,11 @@ def ksdinfo_purreq(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1",))
 
     if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_purreq(
-                sht_cd,
-                t_dt,
-                f_dt,
-                cts,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1")
     else:
         # API 에러 처리
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
@@ -9147,9 +7221,6 @@ def ksdinfo_rev_split(
         t_dt: str,  # 조회일자To
         market_gb: str,  # 시장구분
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -9163,9 +7234,6 @@ def ksdinfo_rev_split(
         t_dt (str): ~ 일자
         market_gb (str): 0:전체, 1:코스피, 2:코스닥
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 예탁원정보(액면교체일정) 데이터
@@ -9191,11 +7259,6 @@ def ksdinfo_rev_split(
         logger.error("market_gb must be one of ['0', '1', '2'].")
         raise ValueError("market_gb must be one of ['0', '1', '2'].")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB669105C0"
 
     params = {
@@ -9207,38 +7270,11 @@ def ksdinfo_rev_split(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1",))
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_rev_split(
-                sht_cd,
-                cts,
-                f_dt,
-                t_dt,
-                market_gb,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -9255,9 +7291,6 @@ def ksdinfo_sharehld_meet(
         t_dt: str,  # 조회일자To
         sht_cd: str,  # 종목코드
         tr_cont: str = "",
-        dataframe: Optional[pd.DataFrame] = None,
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -9270,9 +7303,6 @@ def ksdinfo_sharehld_meet(
         t_dt (str): ~ 일자
         sht_cd (str): 공백: 전체,  특정종목 조회시 : 종목코드
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 예탁원정보(주주총회일정) 데이터
@@ -9294,11 +7324,6 @@ def ksdinfo_sharehld_meet(
         logger.error("t_dt is required. (e.g. '20231231')")
         raise ValueError("t_dt is required. (e.g. '20231231')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "HHKDB669111C0"
 
     params = {
@@ -9309,34 +7334,11 @@ def ksdinfo_sharehld_meet(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1",))
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output1'):
-            current_data = pd.DataFrame(res.getBody().output1)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return ksdinfo_sharehld_meet(
-                cts,
-                f_dt,
-                t_dt,
-                sht_cd,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -9354,11 +7356,7 @@ def lendable_by_company(
         inqr_dvsn_1: str,  # 조회구분1
         ctx_area_fk200: str,  # 연속조회검색조건200
         ctx_area_nk100: str,  # 연속조회키100
-        dataframe1: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output1)
-        dataframe2: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output2)
         tr_cont: str = "",
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -9372,11 +7370,7 @@ def lendable_by_company(
         inqr_dvsn_1 (str): 0 : 전체조회, 1: 종목코드순 정렬
         ctx_area_fk200 (str): 미입력 (다음조회 불가)
         ctx_area_nk100 (str): 미입력 (다음조회 불가)
-        dataframe1 (Optional[pd.DataFrame]): 누적 데이터프레임 (output1)
-        dataframe2 (Optional[pd.DataFrame]): 누적 데이터프레임 (output2)
         tr_cont (str): 연속 거래 여부
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 당사 대주가능 종목 데이터
@@ -9403,11 +7397,6 @@ def lendable_by_company(
         logger.error("inqr_dvsn_1 is required. (e.g. '0')")
         raise ValueError("inqr_dvsn_1 is required. (e.g. '0')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "CTSC2702R"
 
     params = {
@@ -9419,68 +7408,11 @@ def lendable_by_company(
         "CTX_AREA_NK100": ctx_area_nk100,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1", "output2"))
 
     if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                # output1은 단일 객체, output2는 배열일 수 있음
-                if isinstance(output_data, list):
-                    current_data1 = pd.DataFrame(output_data)
-                else:
-                    # 단일 객체인 경우 리스트로 감싸서 DataFrame 생성
-                    current_data1 = pd.DataFrame([output_data])
-
-                if dataframe1 is not None:
-                    dataframe1 = pd.concat([dataframe1, current_data1], ignore_index=True)
-                else:
-                    dataframe1 = current_data1
-            else:
-                if dataframe1 is None:
-                    dataframe1 = pd.DataFrame()
-        else:
-            if dataframe1 is None:
-                dataframe1 = pd.DataFrame()
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                # output1은 단일 객체, output2는 배열일 수 있음
-                if isinstance(output_data, list):
-                    current_data2 = pd.DataFrame(output_data)
-                else:
-                    # 단일 객체인 경우 리스트로 감싸서 DataFrame 생성
-                    current_data2 = pd.DataFrame([output_data])
-
-                if dataframe2 is not None:
-                    dataframe2 = pd.concat([dataframe2, current_data2], ignore_index=True)
-                else:
-                    dataframe2 = current_data2
-            else:
-                if dataframe2 is None:
-                    dataframe2 = pd.DataFrame()
-        else:
-            if dataframe2 is None:
-                dataframe2 = pd.DataFrame()
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return lendable_by_company(
-                excg_dvsn_cd,
-                pdno,
-                thco_stln_psbl_yn,
-                inqr_dvsn_1,
-                ctx_area_fk200,
-                ctx_area_nk100,
-                dataframe1, dataframe2, "N", depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1"), ka._toFrame(pages["output2"], tr_id, "output2")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -9502,7 +7434,6 @@ def market_cap(
         fid_input_price_1: str,  # 입력 가격1
         fid_vol_cnt: str,  # 거래량 수
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None  # 누적 데이터프레임
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 순위분석 
@@ -9520,7 +7451,6 @@ def market_cap(
         fid_input_price_1 (str): 입력값 없을때 전체 (가격 ~)
         fid_vol_cnt (str): 입력값 없을때 전체 (거래량 ~)
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 시가총액 상위 데이터
@@ -9569,35 +7499,11 @@ def market_cap(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # 응답 데이터 처리
-        current_data = pd.DataFrame(res.getBody().output) if hasattr(res.getBody(), 'output') else pd.DataFrame()
-
-        # 기존 데이터프레임과 병합
-        dataframe = pd.concat([dataframe, current_data], ignore_index=True) if dataframe is not None else current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-        if tr_cont == "M":
-            print("Call Next")
-            ka.smart_sleep()
-            return market_cap(
-                fid_input_price_2,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_div_cls_code,
-                fid_input_iscd,
-                fid_trgt_cls_code,
-                fid_trgt_exls_cls_code,
-                fid_input_price_1,
-                fid_vol_cnt,
-                "N", dataframe
-            )
-        else:
-            print("The End")
-            return dataframe
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
+
+    if res.isOK():
+        print("The End")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         # 오류 출력
         res.printError(api_url)
@@ -9629,7 +7535,7 @@ def market_time() -> pd.DataFrame:
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        result = pd.DataFrame([res.getBody().output1])
+        result = ka._toFrame(res.getBody().output1, tr_id, "output1")
         return result
     else:
         res.printError(url=api_url)
@@ -9655,7 +7561,6 @@ def market_value(
         fid_blng_cls_code: str,  # 소속 구분 코드
         fid_trgt_exls_cls_code: str,  # 대상 제외 구분 코드
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None  # 누적 데이터프레임
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 순위분석 
@@ -9677,7 +7582,6 @@ def market_value(
         fid_blng_cls_code (str): 0 : 전체
         fid_trgt_exls_cls_code (str): 0 : 전체
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 시장가치 순위 데이터
@@ -9740,46 +7644,11 @@ def market_value(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            print("Call Next")
-            ka.smart_sleep()
-            return market_value(
-                fid_trgt_cls_code,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_input_price_1,
-                fid_input_price_2,
-                fid_vol_cnt,
-                fid_input_option_1,
-                fid_input_option_2,
-                fid_rank_sort_cls_code,
-                fid_blng_cls_code,
-                fid_trgt_exls_cls_code,
-                "N", dataframe
-            )
-        else:
-            print("The End")
-            return dataframe
+        print("The End")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         # 오류 처리
         res.printError(api_url)
@@ -9821,7 +7690,7 @@ def mktfunds(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -9847,7 +7716,6 @@ def near_new_highlow(
         fid_aply_rang_prc_1: str,  # 적용 범위 가격1
         fid_aply_rang_prc_2: str,  # 적용 범위 가격2
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None  # 누적 데이터프레임
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 순위분석 
@@ -9868,7 +7736,6 @@ def near_new_highlow(
         fid_aply_rang_prc_1 (str): 가격 ~
         fid_aply_rang_prc_2 (str): ~ 가격
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 신고_신저근접종목 상위 데이터
@@ -9927,45 +7794,11 @@ def near_new_highlow(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        # 기존 데이터프레임과 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            print("Call Next")
-            ka.smart_sleep()
-            return near_new_highlow(
-                fid_aply_rang_vol,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_div_cls_code,
-                fid_input_cnt_1,
-                fid_input_cnt_2,
-                fid_prc_cls_code,
-                fid_input_iscd,
-                fid_trgt_cls_code,
-                fid_trgt_exls_cls_code,
-                fid_aply_rang_prc_1,
-                fid_aply_rang_prc_2,
-                "N", dataframe
-            )
-        else:
-            print("The End")
-            return dataframe
+        print("The End")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         # 오류 발생 시 처리
         res.printError(api_url)
@@ -9986,9 +7819,6 @@ def news_title(
         fid_rank_sort_cls_code: str,  # 순위 정렬 구분 코드
         fid_input_srno: str,  # 입력 일련번호
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 업종/기타 
@@ -10005,9 +7835,6 @@ def news_title(
         fid_rank_sort_cls_code (str): 순위 정렬 구분 코드
         fid_input_srno (str): 입력 일련번호
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 종합 시황_공시(제목) 데이터
@@ -10026,11 +7853,6 @@ def news_title(
         >>> print(df)
     """
     api_url = "/uapi/domestic-stock/v1/quotations/news-title"
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API URL 및 거래 ID 설정
     tr_id = "FHKST01011800"
 
@@ -10047,43 +7869,11 @@ def news_title(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
-    # API 응답 처리
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return news_title(
-                fid_news_ofer_entp_code,
-                fid_cond_mrkt_cls_code,
-                fid_input_iscd,
-                fid_titl_cntt,
-                fid_input_date_1,
-                fid_input_hour_1,
-                fid_rank_sort_cls_code,
-                fid_input_srno,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -10206,7 +7996,7 @@ def order_cash(
     res = ka._url_fetch(api_url, tr_id, "", params, postFlag=True)
 
     if res.isOK():
-        current_data = pd.DataFrame([res.getBody().output])
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -10372,7 +8162,7 @@ def order_credit(
     res = ka._url_fetch(api_url, tr_id, "", params, postFlag=True)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output, index=[0])
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -10501,7 +8291,7 @@ def order_resv(
     res = ka._url_fetch(api_url, tr_id, "", params, postFlag=True)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output, index=[0])
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -10526,9 +8316,6 @@ def order_resv_ccnl(
         FK200: str = "",  # 연속조회검색조건200
         NK200: str = "",  # 연속조회키200
         tr_cont: str = "",  # 연속거래여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 내부 재귀깊이 (자동관리)
-        max_depth: int = 10  # 최대 재귀 횟수 제한
 ) -> pd.DataFrame:
     """
     국내예약주문 처리내역 조회 API 입니다.
@@ -10548,9 +8335,6 @@ def order_resv_ccnl(
         FK200 (str): 연속조회검색조건200
         NK200 (str): 연속조회키200
         tr_cont (str): 연속거래여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 내부 재귀깊이 (자동관리)
-        max_depth (int): 최대 재귀 횟수 제한
 
     Returns:
         pd.DataFrame: 주식예약주문조회 데이터
@@ -10590,13 +8374,6 @@ def order_resv_ccnl(
     if cncl_yn == "":
         raise ValueError("cncl_yn is required (e.g. 'Y')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe is None:
-            return pd.DataFrame()
-        else:
-            return dataframe
-
     tr_id = "CTSC0004R"  # 주식예약주문조회
 
     params = {
@@ -10614,31 +8391,14 @@ def order_resv_ccnl(
         "CTX_AREA_NK200": NK200  # 연속조회키200
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(
+        api_url, tr_id, tr_cont, params, ("output",),
+        cursor={"CTX_AREA_FK200": "ctx_area_fk200", "CTX_AREA_NK200": "ctx_area_nk200"},
+    )
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-        FK200 = res.getBody().ctx_area_fk200
-        NK200 = res.getBody().ctx_area_nk200
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return order_resv_ccnl(
-                rsvn_ord_ord_dt, rsvn_ord_end_dt, tmnl_mdia_kind_cd, cano, acnt_prdt_cd,
-                prcs_dvsn_cd, cncl_yn, rsvn_ord_seq, pdno, sll_buy_dvsn_cd,
-                FK200, NK200, "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe
+        logging.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         res.printError(url=api_url)
         return pd.DataFrame()
@@ -10757,7 +8517,7 @@ def order_resv_rvsecncl(
     res = ka._url_fetch(api_url, tr_id, "", params, postFlag=True)
 
     if res.isOK():
-        current_data = pd.DataFrame([res.getBody().output])
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -10877,7 +8637,7 @@ def order_rvsecncl(
     res = ka._url_fetch(api_url, tr_id, "", params, postFlag=True)
 
     if res.isOK():
-        return pd.DataFrame([res.getBody().output])
+        return ka._toFrame(res.getBody().output, tr_id, "output")
     else:
         res.printError(url=api_url)
         return pd.DataFrame()
@@ -10951,7 +8711,7 @@ def overtime_exp_trans_fluct(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -10974,11 +8734,7 @@ def overtime_fluctuation(
         fid_vol_cnt: str,  # 거래량 수
         fid_trgt_cls_code: str,  # 대상 구분 코드
         fid_trgt_exls_cls_code: str,  # 대상 제외 구분 코드
-        dataframe1: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output1)
-        dataframe2: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output2)
         tr_cont: str = "",
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     [국내주식] 순위분석 
@@ -10996,11 +8752,7 @@ def overtime_fluctuation(
         fid_vol_cnt (str): 입력값 없을때 전체 (거래량 ~)
         fid_trgt_cls_code (str): 공백 입력
         fid_trgt_exls_cls_code (str): 공백 입력
-        dataframe1 (Optional[pd.DataFrame]): 누적 데이터프레임 (output1)
-        dataframe2 (Optional[pd.DataFrame]): 누적 데이터프레임 (output2)
         tr_cont (str): 연속 거래 여부
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 국내주식 시간외등락율순위 데이터
@@ -11036,11 +8788,6 @@ def overtime_fluctuation(
         logger.error("fid_div_cls_code is required. (e.g. '1')")
         raise ValueError("fid_div_cls_code is required. (e.g. '1')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "FHPST02340000"
 
     params = {
@@ -11056,54 +8803,11 @@ def overtime_fluctuation(
         "FID_TRGT_EXLS_CLS_CODE": fid_trgt_exls_cls_code,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1", "output2"))
 
     if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                current_data1 = pd.DataFrame(output_data if isinstance(output_data, list) else [output_data])
-                dataframe1 = pd.concat([dataframe1, current_data1],
-                                       ignore_index=True) if dataframe1 is not None else current_data1
-            else:
-                dataframe1 = dataframe1 if dataframe1 is not None else pd.DataFrame()
-        else:
-            dataframe1 = dataframe1 if dataframe1 is not None else pd.DataFrame()
-
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                current_data2 = pd.DataFrame(output_data if isinstance(output_data, list) else [output_data])
-                dataframe2 = pd.concat([dataframe2, current_data2],
-                                       ignore_index=True) if dataframe2 is not None else current_data2
-            else:
-                dataframe2 = dataframe2 if dataframe2 is not None else pd.DataFrame()
-        else:
-            dataframe2 = dataframe2 if dataframe2 is not None else pd.DataFrame()
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return overtime_fluctuation(
-                fid_cond_mrkt_div_code,
-                fid_mrkt_cls_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_input_price_1,
-                fid_input_price_2,
-                fid_vol_cnt,
-                fid_trgt_cls_code,
-                fid_trgt_exls_cls_code,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1"), ka._toFrame(pages["output2"], tr_id, "output2")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -11124,11 +8828,7 @@ def overtime_volume(
         fid_vol_cnt: str,  # 거래량 수
         fid_trgt_cls_code: str,  # 대상 구분 코드
         fid_trgt_exls_cls_code: str,  # 대상 제외 구분 코드
-        dataframe1: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output1)
-        dataframe2: Optional[pd.DataFrame] = None,  # 누적 데이터프레임 (output2)
         tr_cont: str = "",
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     [국내주식] 순위분석 
@@ -11145,11 +8845,7 @@ def overtime_volume(
         fid_vol_cnt (str): 거래량 ~
         fid_trgt_cls_code (str): 공백
         fid_trgt_exls_cls_code (str): 공백
-        dataframe1 (Optional[pd.DataFrame]): 누적 데이터프레임 (output1)
-        dataframe2 (Optional[pd.DataFrame]): 누적 데이터프레임 (output2)
         tr_cont (str): 연속 거래 여부
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 국내주식 시간외거래량순위 데이터
@@ -11187,11 +8883,6 @@ def overtime_volume(
         logger.error("fid_rank_sort_cls_code is required. (e.g. '2')")
         raise ValueError("fid_rank_sort_cls_code is required. (e.g. '2')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe1 if dataframe1 is not None else pd.DataFrame(), dataframe2 if dataframe2 is not None else pd.DataFrame()
-
     tr_id = "FHPST02350000"
 
     params = {
@@ -11206,53 +8897,11 @@ def overtime_volume(
         "FID_TRGT_EXLS_CLS_CODE": fid_trgt_exls_cls_code,
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1", "output2"))
 
     if res.isOK():
-        # output1 처리
-        if hasattr(res.getBody(), 'output1'):
-            output_data = res.getBody().output1
-            if output_data:
-                current_data1 = pd.DataFrame(output_data if isinstance(output_data, list) else [output_data])
-                dataframe1 = pd.concat([dataframe1, current_data1],
-                                       ignore_index=True) if dataframe1 is not None else current_data1
-            else:
-                dataframe1 = dataframe1 if dataframe1 is not None else pd.DataFrame()
-        else:
-            dataframe1 = dataframe1 if dataframe1 is not None else pd.DataFrame()
-
-        # output2 처리
-        if hasattr(res.getBody(), 'output2'):
-            output_data = res.getBody().output2
-            if output_data:
-                current_data2 = pd.DataFrame(output_data if isinstance(output_data, list) else [output_data])
-                dataframe2 = pd.concat([dataframe2, current_data2],
-                                       ignore_index=True) if dataframe2 is not None else current_data2
-            else:
-                dataframe2 = dataframe2 if dataframe2 is not None else pd.DataFrame()
-        else:
-            dataframe2 = dataframe2 if dataframe2 is not None else pd.DataFrame()
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont in ["M", "F"]:
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return overtime_volume(
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_rank_sort_cls_code,
-                fid_input_price_1,
-                fid_input_price_2,
-                fid_vol_cnt,
-                fid_trgt_cls_code,
-                fid_trgt_exls_cls_code,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe1, dataframe2
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1"), ka._toFrame(pages["output2"], tr_id, "output2")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -11312,10 +8961,10 @@ def pbar_tratio(
 
     if res.isOK():
         # output1 (object) - 단일 객체를 DataFrame으로 변환
-        output1_data = pd.DataFrame([res.getBody().output1])
+        output1_data = ka._toFrame(res.getBody().output1, tr_id, "output1")
 
         # output2 (array) - 배열을 DataFrame으로 변환
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output2_data = ka._toFrame(res.getBody().output2, tr_id, "output2")
 
         return output1_data, output2_data
     else:
@@ -11335,10 +8984,6 @@ def pension_inquire_balance(
         FK100: str = "",  # 연속조회검색조건100
         NK100: str = "",  # 연속조회키100
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe1: Optional[pd.DataFrame] = None,  # 누적 데이터프레임1
-        dataframe2: Optional[pd.DataFrame] = None,  # 누적 데이터프레임2
-        depth: int = 0,  # 내부 재귀깊이 (자동관리)
-        max_depth: int = 10  # 최대 재귀 횟수 제한
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     주식, ETF, ETN만 조회 가능하며 펀드는 조회 불가합니다.
@@ -11354,10 +8999,6 @@ def pension_inquire_balance(
         FK100 (str): 연속조회검색조건100
         NK100 (str): 연속조회키100
         tr_cont (str): 연속 거래 여부
-        dataframe1 (Optional[pd.DataFrame]): 누적 데이터프레임1
-        dataframe2 (Optional[pd.DataFrame]): 누적 데이터프레임2
-        depth (int): 내부 재귀깊이 (자동관리)
-        max_depth (int): 최대 재귀 횟수 제한
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 퇴직연금 잔고 데이터
@@ -11381,14 +9022,6 @@ def pension_inquire_balance(
     if inqr_dvsn == "" or inqr_dvsn is None:
         raise ValueError("inqr_dvsn is required (e.g. '00')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe1 is None:
-            dataframe1 = pd.DataFrame()
-        if dataframe2 is None:
-            dataframe2 = pd.DataFrame()
-        return dataframe1, dataframe2
-
     tr_id = "TTTC2208R"  # 퇴직연금 잔고조회
 
     params = {
@@ -11400,37 +9033,14 @@ def pension_inquire_balance(
         "CTX_AREA_NK100": NK100  # 연속조회키100
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(
+        api_url, tr_id, tr_cont, params, ("output1", "output2"),
+        cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"},
+    )
 
     if res.isOK():
-        # output1 처리 (array)
-        current_data1 = pd.DataFrame(res.getBody().output1)
-        if dataframe1 is not None:
-            dataframe1 = pd.concat([dataframe1, current_data1], ignore_index=True)
-        else:
-            dataframe1 = current_data1
-
-        # output2 처리 (object)
-        current_data2 = pd.DataFrame(res.getBody().output2, index=[0])
-        if dataframe2 is not None:
-            dataframe2 = pd.concat([dataframe2, current_data2], ignore_index=True)
-        else:
-            dataframe2 = current_data2
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return pension_inquire_balance(
-                cano, acnt_prdt_cd, acca_dvsn_cd, inqr_dvsn, FK100, NK100, "N", dataframe1, dataframe2, depth + 1,
-                max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe1, dataframe2
+        logging.info("Data fetch complete.")
+        return ka._toFrame(pages["output1"], tr_id, "output1"), ka._toFrame(pages["output2"], tr_id, "output2")
     else:
         res.printError(url=api_url)
         return pd.DataFrame(), pd.DataFrame()
@@ -11450,9 +9060,6 @@ def pension_inquire_daily_ccld(
         FK100: str = "",  # 연속조회검색조건100
         NK100: str = "",  # 연속조회키100
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 내부 재귀 깊이 (자동 관리)
-        max_depth: int = 10  # 최대 재귀 횟수 제한
 ) -> pd.DataFrame:
     """
     [국내주식] 주문/계좌 > 퇴직연금 미체결내역[v1_국내주식-033]
@@ -11469,9 +9076,6 @@ def pension_inquire_daily_ccld(
         FK100 (str): 연속조회검색조건100
         NK100 (str): 연속조회키100
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 내부 재귀깊이 (자동관리)
-        max_depth (int): 최대 재귀 횟수 제한
 
     Returns:
         pd.DataFrame: 퇴직연금 미체결내역 데이터
@@ -11500,13 +9104,6 @@ def pension_inquire_daily_ccld(
     if inqr_dvsn_3 == "":
         raise ValueError("inqr_dvsn_3 is required (e.g. '00: 전체')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe is None:
-            return pd.DataFrame()
-        else:
-            return dataframe
-
     tr_id = "TTTC2201R"  # 퇴직연금 미체결내역
 
     params = {
@@ -11520,30 +9117,14 @@ def pension_inquire_daily_ccld(
         "CTX_AREA_NK100": NK100
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(
+        api_url, tr_id, tr_cont, params, ("output",),
+        cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"},
+    )
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return pension_inquire_daily_ccld(
-                cano, acnt_prdt_cd, user_dvsn_cd, sll_buy_dvsn_cd, ccld_nccs_dvsn, inqr_dvsn_3, FK100, NK100, "N",
-                dataframe, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe
+        logging.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         res.printError(url=api_url)
         return pd.DataFrame()
@@ -11596,7 +9177,7 @@ def pension_inquire_deposit(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame([res.getBody().output])
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -11661,10 +9242,10 @@ def pension_inquire_present_balance(
 
     if res.isOK():
         # output1 (array) - 보유종목 정보
-        output1_data = pd.DataFrame(res.getBody().output1)
+        output1_data = ka._toFrame(res.getBody().output1, tr_id, "output1")
 
         # output2 (array) - 계좌 요약 정보
-        output2_data = pd.DataFrame(res.getBody().output2)
+        output2_data = ka._toFrame(res.getBody().output2, tr_id, "output2")
 
         return output1_data, output2_data
     else:
@@ -11753,7 +9334,7 @@ def pension_inquire_psbl_order(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output, index=[0])
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -11778,9 +9359,6 @@ def period_rights(
         NK100: str = "",  # 연속조회키100
         FK100: str = "",  # 연속조회검색조건100
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 내부 재귀깊이 (자동관리)
-        max_depth: int = 10  # 최대 재귀 횟수 제한
 ) -> pd.DataFrame:
     """
     기간별계좌권리현황조회 API입니다.
@@ -11800,9 +9378,6 @@ def period_rights(
         NK100 (str): 연속조회키100
         FK100 (str): 연속조회검색조건100
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 내부 재귀깊이 (자동관리)
-        max_depth (int): 최대 재귀 횟수 제한
 
     Returns:
         pd.DataFrame: 기간별계좌권리현황 데이터
@@ -11828,13 +9403,6 @@ def period_rights(
     if inqr_end_dt == "":
         raise ValueError("inqr_end_dt is required (e.g. '20250103')")
 
-    if depth > max_depth:
-        logging.warning("Max recursive depth reached.")
-        if dataframe is None:
-            return pd.DataFrame()
-        else:
-            return dataframe
-
     tr_id = "CTRGA011R"  # 기간별계좌권리현황조회
 
     params = {
@@ -11852,31 +9420,14 @@ def period_rights(
         "CTX_AREA_FK100": FK100
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(
+        api_url, tr_id, tr_cont, params, ("output",),
+        cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"},
+    )
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return period_rights(
-                inqr_dvsn, cano, acnt_prdt_cd, inqr_strt_dt, inqr_end_dt,
-                cust_rncno25, hmid, rght_type_cd, pdno, prdt_type_cd,
-                NK100, FK100, "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe
+        logging.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         res.printError(url=api_url)
         return pd.DataFrame()
@@ -11897,9 +9448,6 @@ def prefer_disparate_ratio(
         fid_input_price_1: str,  # 입력 가격1
         fid_input_price_2: str,  # 입력 가격2
         tr_cont: str = "",
-        dataframe: Optional[pd.DataFrame] = None,
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 순위분석 
@@ -11917,9 +9465,6 @@ def prefer_disparate_ratio(
         fid_input_price_1 (str): 입력값 없을때 전체 (가격 ~)
         fid_input_price_2 (str): 입력값 없을때 전체 (~ 가격)
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 우선주_괴리율 상위 데이터
@@ -11959,11 +9504,6 @@ def prefer_disparate_ratio(
         logger.error("fid_trgt_exls_cls_code is required. (e.g. '0')")
         raise ValueError("fid_trgt_exls_cls_code is required. (e.g. '0')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPST01770000"
 
     params = {
@@ -11979,40 +9519,11 @@ def prefer_disparate_ratio(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return prefer_disparate_ratio(
-                fid_vol_cnt,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_div_cls_code,
-                fid_input_iscd,
-                fid_trgt_cls_code,
-                fid_trgt_exls_cls_code,
-                fid_input_price_1,
-                fid_input_price_2,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         # API 에러 처리
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
@@ -12039,7 +9550,6 @@ def profit_asset_index(
         fid_blng_cls_code: str,  # 소속 구분 코드
         fid_trgt_exls_cls_code: str,  # 대상 제외 구분 코드
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None  # 누적 데이터프레임
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 순위분석 
@@ -12061,7 +9571,6 @@ def profit_asset_index(
         fid_blng_cls_code (str): 소속 구분 코드 (필수)
         fid_trgt_exls_cls_code (str): 대상 제외 구분 코드 (필수)
         tr_cont (str): 연속 거래 여부 (옵션)
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임 (옵션)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 수익자산지표 순위 데이터
@@ -12126,46 +9635,11 @@ def profit_asset_index(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            print("Call Next")
-            ka.smart_sleep()
-            return profit_asset_index(
-                fid_cond_mrkt_div_code,
-                fid_trgt_cls_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_input_price_1,
-                fid_input_price_2,
-                fid_vol_cnt,
-                fid_input_option_1,
-                fid_input_option_2,
-                fid_rank_sort_cls_code,
-                fid_blng_cls_code,
-                fid_trgt_exls_cls_code,
-                "N", dataframe
-            )
-        else:
-            print("The End")
-            return dataframe
+        print("The End")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         # 오류 처리
         res.printError(api_url)
@@ -12214,7 +9688,7 @@ def program_trade_by_stock(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -12266,7 +9740,7 @@ def program_trade_by_stock_daily(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -12325,7 +9799,7 @@ def psearch_result(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output2)
+        current_data = ka._toFrame(res.getBody().output2, tr_id, "output2")
         return current_data
     else:
         res.printError(url=api_url)
@@ -12375,7 +9849,7 @@ def psearch_title(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output2)
+        current_data = ka._toFrame(res.getBody().output2, tr_id, "output2")
         logging.info("Data fetch complete.")
         return current_data
     else:
@@ -12399,7 +9873,6 @@ def quote_balance(
         fid_input_price_1: str,  # 입력 가격1
         fid_input_price_2: str,  # 입력 가격2
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None  # 누적 데이터프레임
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 순위분석 
@@ -12418,7 +9891,6 @@ def quote_balance(
         fid_input_price_1 (str): 입력값 없을때 전체 (가격 ~)
         fid_input_price_2 (str): 입력값 없을때 전체 (~ 가격)
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 호가잔량 순위 데이터
@@ -12471,43 +9943,11 @@ def quote_balance(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            print("Call Next")
-            ka.smart_sleep()
-            return quote_balance(
-                fid_vol_cnt,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_rank_sort_cls_code,
-                fid_div_cls_code,
-                fid_trgt_cls_code,
-                fid_trgt_exls_cls_code,
-                fid_input_price_1,
-                fid_input_price_2,
-                "N", dataframe
-            )
-        else:
-            print("The End")
-            return dataframe
+        print("The End")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         # 오류 출력
         res.printError(api_url)
@@ -12522,9 +9962,6 @@ def search_info(
         pdno: str,  # 상품번호
         prdt_type_cd: str,  # 상품유형코드
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -12535,9 +9972,6 @@ def search_info(
         pdno (str): 상품번호 (예: '000660', 'KR4101SC0009', 'AAPL')
         prdt_type_cd (str): 상품유형코드 (예: '300', '301', '512')
         tr_cont (str): 연속 거래 여부 (기본값: 공백)
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 상품기본조회 데이터
@@ -12559,11 +9993,6 @@ def search_info(
         logger.error("prdt_type_cd is required. (e.g. '300')")
         raise ValueError("prdt_type_cd is required. (e.g. '300')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     # API 호출 URL 및 거래 ID 설정
 
     tr_id = "CTPF1604R"
@@ -12575,38 +10004,11 @@ def search_info(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
-    # API 응답 처리
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return search_info(
-                pdno,
-                prdt_type_cd,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -12621,9 +10023,6 @@ def search_stock_info(
         prdt_type_cd: str,  # 상품유형코드
         pdno: str,  # 상품번호
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 종목정보 
@@ -12634,9 +10033,6 @@ def search_stock_info(
         prdt_type_cd (str): 300: 주식, ETF, ETN, ELW  301 : 선물옵션  302 : 채권  306 : ELS'
         pdno (str): 종목번호 (6자리) ETN의 경우, Q로 시작 (EX. Q500001)
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 주식기본조회 데이터
@@ -12658,11 +10054,6 @@ def search_stock_info(
         logger.error("pdno is required. (e.g. '000660')")
         raise ValueError("pdno is required. (e.g. '000660')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "CTPF1002R"
 
     params = {
@@ -12671,37 +10062,11 @@ def search_stock_info(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            output_data = res.getBody().output
-            if not isinstance(output_data, list):
-                output_data = [output_data]
-            current_data = pd.DataFrame(output_data)
-        else:
-            current_data = pd.DataFrame()
-
-        # 데이터프레임 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return search_stock_info(
-                prdt_type_cd,
-                pdno,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -12724,9 +10089,6 @@ def short_sale(
         fid_aply_rang_prc_1: str,  # FID 적용 범위 가격1
         fid_aply_rang_prc_2: str,  # FID 적용 범위 가격2
         tr_cont: str = "",
-        dataframe: Optional[pd.DataFrame] = None,
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 순위분석 
@@ -12745,9 +10107,6 @@ def short_sale(
         fid_aply_rang_prc_1 (str): FID 적용 범위 가격1
         fid_aply_rang_prc_2 (str): FID 적용 범위 가격2
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 공매도 상위종목 데이터
@@ -12785,11 +10144,6 @@ def short_sale(
         logger.error("fid_input_cnt_1 is required. (e.g. '0')")
         return None
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPST04820000"
 
     params = {
@@ -12806,40 +10160,11 @@ def short_sale(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return short_sale(
-                fid_aply_rang_vol,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_period_div_code,
-                fid_input_cnt_1,
-                fid_trgt_exls_cls_code,
-                fid_trgt_cls_code,
-                fid_aply_rang_prc_1,
-                fid_aply_rang_prc_2,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -12863,9 +10188,6 @@ def top_interest_stock(
         fid_div_cls_code: str,  # 분류 구분 코드
         fid_input_cnt_1: str,  # 입력 수1
         tr_cont: str = "",
-        dataframe: Optional[pd.DataFrame] = None,
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 순위분석 
@@ -12885,9 +10207,6 @@ def top_interest_stock(
         fid_div_cls_code (str): 0: 전체 1: 관리종목 2: 투자주의 3: 투자경고 4: 투자위험예고 5: 투자위험 6: 보통주 7: 우선주
         fid_input_cnt_1 (str): 순위검색 입력값(1: 1위부터, 10:10위부터)
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 관심종목등록 상위 데이터
@@ -12926,11 +10245,6 @@ def top_interest_stock(
         logger.error("fid_div_cls_code is required. (e.g. '0', '1', '2', '3', '4', '5', '6', '7')")
         raise ValueError("fid_div_cls_code is required. (e.g. '0', '1', '2', '3', '4', '5', '6', '7')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPST01800000"
 
     params = {
@@ -12948,41 +10262,11 @@ def top_interest_stock(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return top_interest_stock(
-                fid_input_iscd_2,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_trgt_cls_code,
-                fid_trgt_exls_cls_code,
-                fid_input_price_1,
-                fid_input_price_2,
-                fid_vol_cnt,
-                fid_div_cls_code,
-                fid_input_cnt_1,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
         res.printError(api_url)
@@ -13007,9 +10291,6 @@ def traded_by_company(
         fid_aply_rang_prc_2: str,  # 적용 범위 가격2
         fid_aply_rang_prc_1: str,  # 적용 범위 가격1
         tr_cont: str = "",  # 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None,  # 누적 데이터프레임
-        depth: int = 0,  # 현재 재귀 깊이
-        max_depth: int = 10  # 최대 재귀 깊이
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 순위분석 
@@ -13030,9 +10311,6 @@ def traded_by_company(
         fid_aply_rang_prc_2 (str): ~ 가격
         fid_aply_rang_prc_1 (str): 가격 ~
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 당사매매종목 상위 데이터
@@ -13087,11 +10365,6 @@ def traded_by_company(
         logger.error("fid_aply_rang_vol is required. (e.g. '0', '100')")
         return None
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPST01860000"
 
     params = {
@@ -13110,43 +10383,11 @@ def traded_by_company(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return traded_by_company(
-                fid_trgt_exls_cls_code,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_div_cls_code,
-                fid_rank_sort_cls_code,
-                fid_input_date_1,
-                fid_input_date_2,
-                fid_input_iscd,
-                fid_trgt_cls_code,
-                fid_aply_rang_vol,
-                fid_aply_rang_prc_2,
-                fid_aply_rang_prc_1,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         # API 에러 처리
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
@@ -13201,7 +10442,7 @@ def tradprt_byamt(
     res = ka._url_fetch(api_url, tr_id, "", params)
 
     if res.isOK():
-        current_data = pd.DataFrame(res.getBody().output)
+        current_data = ka._toFrame(res.getBody().output, tr_id, "output")
         return current_data
     else:
         res.printError(url=api_url)
@@ -13223,9 +10464,6 @@ def volume_power(
         fid_vol_cnt: str,  # 거래량 수
         fid_trgt_cls_code: str,  # 대상 구분 코드
         tr_cont: str = "",
-        dataframe: Optional[pd.DataFrame] = None,
-        depth: int = 0,
-        max_depth: int = 10
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 순위분석 
@@ -13243,9 +10481,6 @@ def volume_power(
         fid_vol_cnt (str): 입력값 없을때 전체 (거래량 ~)
         fid_trgt_cls_code (str): 0 : 전체
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
-        depth (int): 현재 재귀 깊이
-        max_depth (int): 최대 재귀 깊이 (기본값: 10)
         
     Returns:
         Optional[pd.DataFrame]: 국내주식 체결강도 상위 데이터
@@ -13285,11 +10520,6 @@ def volume_power(
         logger.error("fid_trgt_cls_code is required. (e.g. '0')")
         raise ValueError("fid_trgt_cls_code is required. (e.g. '0')")
 
-    # 최대 재귀 깊이 체크
-    if depth >= max_depth:
-        logger.warning("Maximum recursion depth (%d) reached. Stopping further requests.", max_depth)
-        return dataframe if dataframe is not None else pd.DataFrame()
-
     tr_id = "FHPST01680000"
 
     params = {
@@ -13305,40 +10535,11 @@ def volume_power(
     }
 
     # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        # 응답 데이터 처리
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return volume_power(
-                fid_trgt_exls_cls_code,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_input_iscd,
-                fid_div_cls_code,
-                fid_input_price_1,
-                fid_input_price_2,
-                fid_vol_cnt,
-                fid_trgt_cls_code,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
+        logger.info("Data fetch complete.")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         # API 에러 처리
         logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
@@ -13363,7 +10564,6 @@ def volume_rank(
         fid_vol_cnt: str,  # 필수, 거래량 수
         fid_input_date_1: str,  # 필수, 입력 날짜1
         tr_cont: str = "",  # 선택, 연속 거래 여부
-        dataframe: Optional[pd.DataFrame] = None  # 선택, 누적 데이터프레임
 ) -> Optional[pd.DataFrame]:
     """
     [국내주식] 순위분석
@@ -13383,7 +10583,6 @@ def volume_rank(
         fid_vol_cnt (str): 거래량 수 (거래량 ~, 전체 거래량 대상 조회 시 공란)
         fid_input_date_1 (str): 입력 날짜1 (공란)
         tr_cont (str): 연속 거래 여부
-        dataframe (Optional[pd.DataFrame]): 누적 데이터프레임
         
     Returns:
         pd.DataFrame: 순위분석 데이터
@@ -13431,33 +10630,11 @@ def volume_rank(
         "FID_INPUT_DATE_1": fid_input_date_1
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    res, pages = ka._paginate(api_url, tr_id, tr_cont, params)
 
     if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
-
-        tr_cont = res.getHeader().tr_cont
-
-        if tr_cont == "M":  # 다음 페이지 존재
-            print("Call Next")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return volume_rank(
-                fid_cond_mrkt_div_code, fid_cond_scr_div_code, fid_input_iscd,
-                fid_div_cls_code, fid_blng_cls_code, fid_trgt_cls_code,
-                fid_trgt_exls_cls_code, fid_input_price_1, fid_input_price_2,
-                fid_vol_cnt, fid_input_date_1, "N", dataframe
-            )
-        else:
-            print("The End")
-            return dataframe
+        print("The End")
+        return ka._toFrame(pages["output"], tr_id, "output")
     else:
         res.printError(api_url)
         return pd.DataFrame()
@@ -0,0 +1,147 @@
+"""
+국내주식 REST API 함수 (asyncio 버전)
+
+domestic_stock_functions.py 의 함수들을 import 시점에 같은 이름의 async 함수로 변환합니다.
+원본 소스를 그대로 컴파일하되 아래 호출만 await 로 바꾸므로 파라미터 검증, 연속조회,
+DataFrame 변환 로직은 원본과 항상 동일합니다.
+  - ka._url_fetch(...)   → await ka._url_fetch_async(...)
+  - ka._paginate(...)    → await ka._paginate_async(...)  (연속조회)
+  - for ... in ka._streamPages(...) → async for ... in ka._streamPagesAsync(...)
+  - 모듈 내 다른 API 함수 호출 → await
+iter_* generator 함수는 async generator 가 되므로 async for 로 사용합니다.
+
+Example:
+    >>> from domestic_stock import domestic_stock_functions_async as dsa
+    >>> df = await dsa.inquire_price("real", "J", "005930")
+    >>> dfs = await asyncio.gather(*(dsa.inquire_price("real", "J", c) for c in codes))
+    >>> quotes = await dsa.get_quotes(codes)  # 30종목씩 일괄 조회
+    >>> async for df1, df2 in dsa.iter_daily_short_sale("J", "005930", "20200101", "20241231"):
+    ...     print(len(df2))
+"""
+import ast
+import asyncio
+import inspect
+import sys
+
+import pandas as pd
+
+sys.path.extend(['..', '.'])
+from domestic_stock import domestic_stock_functions as _sync
+
+# 동기 함수 → 비동기 함수 매핑 (kis_auth)
+_ASYNC_KA_CALLS = {
+    "_url_fetch": "_url_fetch_async",
+    "_paginate": "_paginate_async",
+}
+
+# 동기 generator → async generator 매핑 (kis_auth), for 문을 async for 로 변환
+_ASYNC_KA_ITERS = {
+    "_streamPages": "_streamPagesAsync",
+}
+
+
+def _is_ka_call(node: ast.AST, names: dict = _ASYNC_KA_CALLS) -> bool:
+    if not isinstance(node, ast.Call):
+        return False
+    f = node.func
+    return (
+        isinstance(f, ast.Attribute)
+        and isinstance(f.value, ast.Name)
+        and f.value.id == "ka"
+        and f.attr in names
+    )
+
+
+def _called_names(func: ast.FunctionDef) -> set:
+    return {
+        n.func.id
+        for n in ast.walk(func)
+        if isinstance(n, ast.Call) and isinstance(n.func, ast.Name)
+    }
+
+
+class _AsyncTransformer(ast.NodeTransformer):
+    """API 호출을 await 로 감싸는 변환기"""
+
+    def __init__(self, async_names: set):
+        self.async_names = async_names
+
+    def visit_Call(self, node: ast.Call):
+        self.generic_visit(node)
+        if _is_ka_call(node):
+            node.func.attr = _ASYNC_KA_CALLS[node.func.attr]
+            return ast.Await(value=node)
+        if isinstance(node.func, ast.Name) and node.func.id in self.async_names:
+            return ast.Await(value=node)
+        return node
+
+    def visit_For(self, node: ast.For):
+        self.generic_visit(node)
+        if _is_ka_call(node.iter, _ASYNC_KA_ITERS):
+            node.iter.func.attr = _ASYNC_KA_ITERS[node.iter.func.attr]
+            return ast.AsyncFor(**{k: getattr(node, k) for k in node._fields})
+        return node
+
+
+def _build() -> dict:
+    tree = ast.parse(inspect.getsource(_sync))
+    funcs = {n.name: n for n in tree.body if isinstance(n, ast.FunctionDef)}
+
+    # kis_auth API 를 직접 호출하거나, 그런 함수를 호출하는 함수만 async 로 변환
+    async_names = {
+        name for name, f in funcs.items()
+        if any(_is_ka_call(n) or _is_ka_call(n, _ASYNC_KA_ITERS) for n in ast.walk(f))
+    }
+    changed = True
+    while changed:
+        changed = False
+        for name, f in funcs.items():
+            if name not in async_names and _called_names(f) & async_names:
+                async_names.add(name)
+                changed = True
+
+    transformer = _AsyncTransformer(async_names)
+    body = []
+    for name in sorted(async_names):
+        f = transformer.visit(funcs[name])
+        body.append(ast.AsyncFunctionDef(**{k: getattr(f, k) for k in f._fields}))
+
+    module = ast.fix_missing_locations(ast.Module(body=body, type_ignores=[]))
+    namespace = dict(vars(_sync))
+    exec(compile(module, _sync.__file__, "exec"), namespace)
+
+    result = {}
+    for name in async_names:
+        fn = namespace[name]
+        fn.__module__ = __name__
+        result[name] = fn
+    return result
+
+
+_async_functions = _build()
+globals().update(_async_functions)
+
+
+async def get_quotes(codes, fid_cond_mrkt_div_code: str = "J", max_workers: int = 4):
+    """
+    여러 종목 현재가 일괄 조회 (get_quotes 의 asyncio 버전)
+    30종목 배치를 max_workers 개씩 asyncio.gather 로 동시에 호출합니다.
+    """
+    batches = _sync._multprice_batches(codes, fid_cond_mrkt_div_code)
+    sem = asyncio.Semaphore(max(1, max_workers))
+
+    async def fetch(kwargs):
+        async with sem:
+            try:
+                return await intstock_multprice(**kwargs)
+            except Exception as e:
+                _sync.logger.error(f"멀티종목 시세 조회 실패: {e}")
+                return pd.DataFrame()
+
+    frames = await asyncio.gather(*(fetch(kwargs) for kwargs in batches))
+    return _sync._quotes_frame(codes, frames)
+
+
+_async_functions["get_quotes"] = get_quotes
+
+__all__ = sorted(_async_functions)
@@ -3,25 +3,53 @@
 # ====|  API 호출 공통 함수 포함                                  |=====================
 
 import asyncio
-import copy
+import hashlib
 import json
 import logging
+import math
 import os
+import random
+import threading
 import time
+import weakref
 from base64 import b64decode
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from io import StringIO
+from types import MappingProxyType
 
 import pandas as pd
 
 # pip install requests (패키지설치)
 import requests
+from requests.adapters import HTTPAdapter
 
 # 웹 소켓 모듈을 선언한다.
 import websockets
 
+# 프로세스간 호출 예산 공유용 파일 잠금 (POSIX 전용, 없으면 프로세스 내부에서만 제한)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# pip install aiohttp (선택, 없으면 _url_fetch_async 는 스레드에서 동기 호출)
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# pip install orjson (선택, 없으면 표준 json 으로 응답 본문 디코딩)
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 # pip install PyYAML (패키지설치)
 import yaml
 from Crypto.Cipher import AES
@@ -29,6 +57,9 @@ from Crypto.Cipher import AES
 # pip install pycryptodome
 from Crypto.Util.Padding import unpad
 
+# KIS 응답 필드 타입 스키마
+import kis_schema
+
 # Pydantic Settings로 환경 변수 관리
 from settings import settings
 
@@ -86,7 +117,6 @@ _last_auth_time = datetime.now()
 _autoReAuth = False
 _DEBUG = False
 _isPaper = False
-_smartSleep = 0.1
 
 # 기본 헤더값 정의
 _base_headers = {
@@ -96,46 +126,424 @@ _base_headers = {
     "User-Agent": _cfg["my_agent"],
 }
 
+# 환경별('prod'/'vps') 기본 헤더 템플릿 (읽기 전용)
+# auth() 시점에 토큰/앱키를 포함해 한 번 만들고, 토큰 갱신시 새 템플릿으로 통째로 교체
+# API 호출마다 deepcopy 하지 않고 템플릿에 tr_id / tr_cont / custtype 만 합쳐서 사용
+_header_templates = {}
+_default_header_template = MappingProxyType(dict(_base_headers))
+_auth_deadlines = {}  # 환경별 토큰 선제 갱신 시각 (time.monotonic 기준)
+_ws_auth_deadline = time.monotonic() + 86400  # 웹소켓 접속키 재발급 확인 시각 (_autoReAuth 사용시, 유효시간 1일)
+
+
+# 속도 제한기 공통 기능: 예약한 만큼 대기 + AIMD 속도 조절
+# 호출 제한 초과(EGW00201) 응답이 오면 속도를 절반으로 줄이고, 정상 응답마다 설정 속도까지 조금씩 복구
+class _RateLimiterBase:
+    aimd_decrease = 0.5  # 제한 초과시 곱할 비율
+    aimd_increase = 0.02  # 정상 응답마다 더할 속도 (설정 속도 대비 비율)
+    aimd_min_ratio = 0.1  # 설정 속도 대비 최저 속도
+
+    def _reserve(self):
+        raise NotImplementedError
+
+    def acquire(self):
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_throttle(self):
+        with self._lock:
+            self.rate = max(self.max_rate * self.aimd_min_ratio, self.rate * self.aimd_decrease)
+
+    def on_success(self):
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * self.aimd_increase)
+
+
+# API 호출 속도 제한 (토큰 버킷), 스레드 / asyncio task 공용
+# 요청 시점에 토큰을 예약하고 부족한 만큼만 대기하므로 동시에 호출해도 합계 속도가 rate 를 넘지 않음
+class TokenBucket(_RateLimiterBase):
+    def __init__(self, rate, burst=1):
+        self._lock = threading.Lock()
+        self.set_rate(rate, burst)
+
+    def set_rate(self, rate, burst=None):
+        with self._lock:
+            self.rate = self.max_rate = float(rate)
+            if burst is not None:
+                self.burst = float(burst)
+            self._tokens = self.burst
+            self._stamp = time.monotonic()
+
+    # 토큰 1개 예약, 대기해야 할 시간(초) 반환
+    def _reserve(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+# 같은 호스트의 여러 프로세스(uvicorn 서버, 스캐너, 백테스트)가 앱키별 호출 예산을 공유하는 속도 제한
+# 앱키별 상태 파일에 다음 호출 가능 시각(GCRA 의 TAT)을 기록하고 파일 잠금 안에서 예약/갱신
+class SharedRateLimiter(_RateLimiterBase):
+    def __init__(self, key, rate, burst=1, path=None):
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        self.path = path or os.path.join(config_root, f"ratelimit_{digest}")
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._lock = threading.Lock()  # 같은 프로세스 내 스레드간 파일 offset 경합 방지
+        self.set_rate(rate, burst)
+
+    def set_rate(self, rate, burst=None):
+        with self._lock:
+            self.rate = self.max_rate = float(rate)
+            if burst is not None:
+                self.burst = float(burst)
+
+    # 호출 1건 예약, 대기해야 할 시간(초) 반환
+    def _reserve(self):
+        interval = 1.0 / self.rate
+        tolerance = (self.burst - 1) * interval
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                raw = os.pread(self._fd, 64, 0)
+                now = time.time()
+                tat = max(float(raw) if raw else 0.0, now)
+                if tat - now > 60:  # 시계 변경 등으로 비정상적으로 먼 예약은 초기화
+                    tat = now
+                data = repr(tat + interval).encode()
+                os.pwrite(self._fd, data.ljust(64), 0)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return max(0.0, tat - tolerance - now)
+
+
+# 환경별 초당 호출 제한 (실전: prod, 모의: vps)
+_rate_limits = {"prod": settings.rate_limit_prod, "vps": settings.rate_limit_vps}
+_rate_limiters: dict = {}
+
+
+# 환경별 속도 제한기 생성, 가능하면 앱키 단위로 프로세스간 공유
+def _getRateLimiterFor(svr):
+    if svr not in _rate_limiters:
+        app_key = _cfg["my_app" if svr == "prod" else "paper_app"]
+        if settings.rate_limit_shared and fcntl is not None and app_key:
+            _rate_limiters[svr] = SharedRateLimiter(app_key, _rate_limits[svr])
+        else:
+            _rate_limiters[svr] = TokenBucket(_rate_limits[svr])
+    return _rate_limiters[svr]
+
+
+_rate_limiter = _getRateLimiterFor("prod")
+
+
+def getRateLimiter():
+    return _rate_limiter
+
+
+# 웹소켓 구독/해지 메시지 전송 속도 제한 (REST 호출 예산 / AIMD 와 분리)
+_ws_rate_limiter = TokenBucket(settings.rate_limit_ws)
+
+
+def getWsRateLimiter():
+    return _ws_rate_limiter
+
+
+# 응답 오류 분류 (msg_cd 기준)
+_RATE_EXCEEDED_CODES = {"EGW00201"}  # 초당 거래건수 초과
+_AUTH_EXPIRED_CODES = {"EGW00121", "EGW00123"}  # 유효하지 않은 token, 기간이 만료된 token
+
+ERR_RATE = "rate"  # 호출 제한 초과 → 속도 낮추고 재시도
+ERR_AUTH = "auth"  # 토큰 만료 → 재인증 후 재시도
+ERR_TRANSIENT = "transient"  # 5xx, 네트워크 오류 → 재시도
+ERR_HARD = "hard"  # 그 외 (파라미터 오류 등) → 재시도 없음
+
+
+def _classifyError(status_code, text):
+    msg_cd = ""
+    try:
+        msg_cd = json.loads(text).get("msg_cd", "")
+    except (ValueError, AttributeError):
+        pass
+    if msg_cd in _RATE_EXCEEDED_CODES or status_code == 429:
+        return ERR_RATE
+    if msg_cd in _AUTH_EXPIRED_CODES:
+        return ERR_AUTH
+    if status_code >= 500:
+        return ERR_TRANSIENT
+    return ERR_HARD
+
+
+# 재시도 정책: 지수 백오프 + full jitter
+class RetryPolicy:
+    def __init__(self, max_retries, base_delay, max_delay):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt):
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+_retry_policies = {
+    ERR_RATE: RetryPolicy(max_retries=8, base_delay=0.25, max_delay=5.0),
+    ERR_AUTH: RetryPolicy(max_retries=1, base_delay=0.0, max_delay=0.0),
+    ERR_TRANSIENT: RetryPolicy(max_retries=3, base_delay=0.5, max_delay=10.0),
+}
+
+
+# 연속 실패시 일정 시간 호출을 차단하는 회로 차단기
+# closed(정상) → 연속 failure_threshold 회 실패 → open(차단) → reset_timeout 후 half-open(1건 시험) → 성공시 closed
+class CircuitBreaker:
+    TRIAL = "trial"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+
+    @property
+    def state(self):
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    # 호출 허용 여부, half-open 상태에서 시험 호출로 허용된 경우 TRIAL 반환 (호출 1건당 한 번만 확인)
+    def allow(self):
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._trial:
+                self._trial = True
+                return self.TRIAL
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+    # 성공/실패를 기록하지 못하고 끝난 시험 호출(예외, 취소 등)은 실패로 보고 다시 차단
+    def end_trial(self):
+        with self._lock:
+            if self._trial:
+                self._trial = False
+                self._opened_at = time.monotonic()
+
+
+_circuit = CircuitBreaker()
+
+
+def getCircuitBreaker():
+    return _circuit
+
+
+# REST 호출 공용 HTTP 커넥션 풀 (keep-alive 유지, 모든 API 호출이 공유)
+_http_pool_size = settings.http_pool_size
+_http_timeout = (settings.http_connect_timeout, settings.http_read_timeout)  # (연결, 응답) 초
+_http_session = None
+_http_lock = threading.Lock()
+
+
+# 공용 세션 반환, 최초 호출시 커넥션 풀 생성
+# 풀이 가득 차면 새 연결을 만들지 않고 반납될 때까지 대기 (pool_block)
+def _getSession():
+    global _http_session
+    if _http_session is None:
+        with _http_lock:
+            if _http_session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=4, pool_maxsize=_http_pool_size, pool_block=True
+                )
+                s = requests.Session()
+                s.mount("https://", adapter)
+                s.mount("http://", adapter)
+                _http_session = s
+    return _http_session
+
+
+# 커넥션 풀 크기 / 타임아웃 변경, 기존 풀은 닫고 다음 호출시 새로 생성
+def set_http_pool(pool_size=None, timeout=None):
+    global _http_pool_size, _http_timeout
+    with _http_lock:
+        if pool_size is not None:
+            _http_pool_size = pool_size
+        if timeout is not None:
+            _http_timeout = timeout
+    close_http_pool()
+
+
+def close_http_pool():
+    global _http_session
+    with _http_lock:
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
+
 
 # 토큰 발급 받아 저장 (토큰값, 토큰 유효시간,1일, 6시간 이내 발급신청시는 기존 토큰값과 동일, 발급시 알림톡 발송)
-def save_token(my_token, my_expired):
+def save_token(my_token, my_expired, path=None):
     # print(type(my_expired), my_expired)
     valid_date = datetime.strptime(my_expired, "%Y-%m-%d %H:%M:%S")
     # print('Save token date: ', valid_date)
-    with open(token_tmp, "w", encoding="utf-8") as f:
+    with open(path or token_tmp, "w", encoding="utf-8") as f:
         f.write(f"token: {my_token}\n")
         f.write(f"valid-date: {valid_date}\n")
 
 
-# 토큰 확인 (토큰값, 토큰 유효시간_1일, 6시간 이내 발급신청시는 기존 토큰값과 동일, 발급시 알림톡 발송)
-def read_token():
+# 저장된 토큰 파일 읽기, (토큰값, 만료일시) 또는 None
+def _readTokenFile(path=None):
     try:
         # 토큰이 저장된 파일 읽기
-        with open(token_tmp, encoding="UTF-8") as f:
+        with open(path or token_tmp, encoding="UTF-8") as f:
             tkg_tmp = yaml.load(f, Loader=yaml.FullLoader)
-
-        # 토큰 만료 일,시간
-        exp_dt = datetime.strftime(tkg_tmp["valid-date"], "%Y-%m-%d %H:%M:%S")
-        # 현재일자,시간
-        now_dt = datetime.today().strftime("%Y-%m-%d %H:%M:%S")
-
-        # print('expire dt: ', exp_dt, ' vs now dt:', now_dt)
-        # 저장된 토큰 만료일자 체크 (만료일시 > 현재일시 인경우 보관 토큰 리턴)
-        if exp_dt > now_dt:
-            return tkg_tmp["token"]
-        else:
-            # print('Need new token: ', tkg_tmp['valid-date'])
-            return None
+        if isinstance(tkg_tmp["valid-date"], datetime):
+            return tkg_tmp["token"], tkg_tmp["valid-date"]
+        return tkg_tmp["token"], datetime.strptime(str(tkg_tmp["valid-date"]), "%Y-%m-%d %H:%M:%S")
     except Exception:
         # print('read token error: ', e)
         return None
 
 
-# 토큰 유효시간 체크해서 만료된 토큰이면 재발급처리
+# 토큰 확인 (토큰값, 토큰 유효시간_1일, 6시간 이내 발급신청시는 기존 토큰값과 동일, 발급시 알림톡 발송)
+def read_token(path=None):
+    saved = _readTokenFile(path)
+    # 저장된 토큰 만료일자 체크 (만료일시 > 현재일시 인경우 보관 토큰 리턴)
+    if saved is not None and saved[1] > datetime.now():
+        return saved[0]
+    return None
+
+
+# 앱키별 토큰 파일, 기본 앱키는 기존 파일(token_tmp) 그대로 사용
+def _tokenPath(appkey):
+    if appkey == _cfg["my_app"]:
+        return token_tmp
+    return f"{token_tmp}_{hashlib.sha256(appkey.encode()).hexdigest()[:12]}"
+
+
+# 접근 토큰 관리 (앱키별 메모리 캐시)
+# - 같은 앱키의 토큰은 프로세스 안에서 한 번만 파일에서 읽거나 발급받고 이후에는 메모리 값 사용
+# - 만료 refresh_margin 초 전부터는 새 토큰을 미리 발급 (6시간 이내 재발급은 같은 토큰이 오므로 만료 직전에만 갱신)
+# - 실전/모의 등 여러 앱키를 동시에 보관하므로 환경을 바꿔도 다시 인증하지 않음
+# - 앱키별 잠금으로 여러 스레드가 동시에 요청해도 발급은 한 번만
+class TokenManager:
+    def __init__(self, refresh_margin=600.0):
+        self.refresh_margin = refresh_margin
+        self._tokens = {}  # 앱키 -> (토큰, 만료일시)
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def _appLock(self, appkey):
+        with self._lock:
+            return self._locks.setdefault(appkey, threading.Lock())
+
+    def _fresh(self, item):
+        return item is not None and (item[1] - datetime.now()).total_seconds() > self.refresh_margin
+
+    # 토큰 발급 API 호출, (토큰값, 만료일시) 또는 None
+    def _issue(self, svr, appkey, appsecret):
+        p = {
+            "grant_type": "client_credentials",
+            "appkey": appkey,
+            "appsecret": appsecret,
+        }
+        url = f"{_cfg[svr]}/oauth2/tokenP"
+        res = _getSession().post(
+            url, data=json.dumps(p), headers=dict(_default_header_template), timeout=_http_timeout
+        )  # 토큰 발급
+        if res.status_code != 200:
+            return None
+        body = res.json()
+        my_expired = body["access_token_token_expired"]  # 토큰값 만료일시 가져오기
+        save_token(body["access_token"], my_expired, _tokenPath(appkey))  # 새로 발급 받은 토큰 저장
+        return body["access_token"], datetime.strptime(my_expired, "%Y-%m-%d %H:%M:%S")
+
+    # svr('prod'/'vps') 앱키의 유효한 토큰, force=True 면 캐시/파일 무시하고 재발급
+    def get(self, svr="prod", force=False):
+        appkey, appsecret = _appKeys(svr)
+        with self._appLock(appkey):
+            item = self._tokens.get(appkey)
+            if not force and not self._fresh(item):
+                item = _readTokenFile(_tokenPath(appkey))  # 다른 프로세스가 발급한 토큰 확인
+            if force or not self._fresh(item):
+                item = self._issue(svr, appkey, appsecret)
+                if item is None:
+                    return None
+            self._tokens[appkey] = item
+            return item[0]
+
+    # 메모리에 보관중인 토큰 (없으면 None, 발급하지 않음)
+    def peek(self, svr="prod"):
+        item = self._tokens.get(_appKeys(svr)[0])
+        return item[0] if item is not None else None
+
+    def expires(self, svr="prod"):
+        item = self._tokens.get(_appKeys(svr)[0])
+        return item[1] if item is not None else None
+
+    # 다음 선제 갱신까지 남은 시간 (초)
+    def refresh_in(self, svr="prod"):
+        exp = self.expires(svr)
+        if exp is None:
+            return 0.0
+        return max(0.0, (exp - datetime.now()).total_seconds() - self.refresh_margin)
+
+    def invalidate(self, svr=None):
+        with self._lock:
+            if svr is None:
+                self._tokens.clear()
+            else:
+                self._tokens.pop(_appKeys(svr)[0], None)
+
+
+def _appKeys(svr):
+    if svr == "prod":  # 실전투자
+        return _cfg["my_app"], _cfg["my_sec"]
+    return _cfg["paper_app"], _cfg["paper_sec"]  # 모의투자
+
+
+_token_manager = TokenManager(settings.token_refresh_margin)
+
+
+def getTokenManager():
+    return _token_manager
+
+
+def _setHeaderTemplate(svr, **fields):
+    _header_templates[svr] = MappingProxyType({**_base_headers, **fields})
+
+
+# 현재 환경의 헤더 템플릿, 토큰 만료가 임박했으면 재발급 후 새 템플릿 사용
+def _headerTemplate():
+    svr = "vps" if _isPaper else "prod"
+    if time.monotonic() >= _auth_deadlines.get(svr, float("inf")):
+        reAuth(svr, _TRENV.my_prod)
+    return _header_templates.get(svr, _default_header_template)
+
+
 def _getBaseHeader():
-    if _autoReAuth:
-        reAuth()
-    return copy.deepcopy(_base_headers)
+    return dict(_headerTemplate())
 
 
 # 가져오기 : 앱키, 앱시크리트, 종합계좌번호(계좌번호 중 숫자8자리), 계좌상품코드(계좌번호 중 숫자2자리), 토큰, 도메인
@@ -170,17 +578,17 @@ def isPaperTrading():  # 모의투자 매매
 def changeTREnv(token_key, svr="prod", product=_cfg["my_prod"]):
     cfg = dict()
 
-    global _isPaper
+    global _isPaper, _rate_limiter
     if svr == "prod":  # 실전투자
         ak1 = "my_app"  # 실전투자용 앱키
         ak2 = "my_sec"  # 실전투자용 앱시크리트
         _isPaper = False
-        _smartSleep = 0.05
     elif svr == "vps":  # 모의투자
         ak1 = "paper_app"  # 모의투자용 앱키
         ak2 = "paper_sec"  # 모의투자용 앱시크리트
         _isPaper = True
-        _smartSleep = 0.5
+
+    _rate_limiter = _getRateLimiterFor(svr)  # 환경별 초당 호출 제한 적용
 
     cfg["my_app"] = _cfg[ak1]
     cfg["my_sec"] = _cfg[ak2]
@@ -204,11 +612,8 @@ def changeTREnv(token_key, svr="prod", product=_cfg["my_prod"]):
     cfg["my_htsid"] = _cfg["my_htsid"]
     cfg["my_url"] = _cfg[svr]
 
-    try:
-        my_token = _TRENV.my_token
-    except AttributeError:
-        my_token = ""
-    cfg["my_token"] = my_token if token_key else token_key
+    # 토큰을 지정하지 않으면 해당 환경 앱키로 발급받은 토큰 사용 (환경 변경시 재인증 불필요)
+    cfg["my_token"] = token_key or _token_manager.peek(svr) or ""
     cfg["my_url_ws"] = _cfg["ops" if svr == "prod" else "vops"]
 
     # print(cfg)
@@ -216,60 +621,32 @@ def changeTREnv(token_key, svr="prod", product=_cfg["my_prod"]):
 
 
 def _getResultObject(json_data):
-    _tc_ = namedtuple("res", json_data.keys())
-
-    return _tc_(**json_data)
+    return _Fields(json_data)
 
 
 # Token 발급, 유효기간 1일, 6시간 이내 발급시 기존 token값 유지, 발급시 알림톡 무조건 발송
 # 모의투자인 경우  svr='vps', 투자계좌(01)이 아닌경우 product='XX' 변경하세요 (계좌번호 뒤 2자리)
-def auth(svr="prod", product=_cfg["my_prod"], url=None):
-    p = {
-        "grant_type": "client_credentials",
-    }
-    # 개인 환경파일 "kis_devlp.yaml" 파일을 참조하여 앱키, 앱시크리트 정보 가져오기
-    # 개인 환경파일명과 위치는 고객님만 아는 위치로 설정 바랍니다.
-    if svr == "prod":  # 실전투자
-        ak1 = "my_app"  # 앱키 (실전투자용)
-        ak2 = "my_sec"  # 앱시크리트 (실전투자용)
-    elif svr == "vps":  # 모의투자
-        ak1 = "paper_app"  # 앱키 (모의투자용)
-        ak2 = "paper_sec"  # 앱시크리트 (모의투자용)
-
-    # 앱키, 앱시크리트 가져오기
-    p["appkey"] = _cfg[ak1]
-    p["appsecret"] = _cfg[ak2]
-
-    # 기존 발급된 토큰이 있는지 확인
-    saved_token = read_token()  # 기존 발급 토큰 확인
-    # print("saved_token: ", saved_token)
-    if saved_token is None:  # 기존 발급 토큰 확인이 안되면 발급처리
-        url = f"{_cfg[svr]}/oauth2/tokenP"
-        res = requests.post(
-            url, data=json.dumps(p), headers=_getBaseHeader()
-        )  # 토큰 발급
-        rescode = res.status_code
-        if rescode == 200:  # 토큰 정상 발급
-            my_token = _getResultObject(res.json()).access_token  # 토큰값 가져오기
-            my_expired = _getResultObject(
-                res.json()
-            ).access_token_token_expired  # 토큰값 만료일시 가져오기
-            save_token(my_token, my_expired)  # 새로 발급 받은 토큰 저장
-        else:
-            print("Get Authentification token fail!\nYou have to restart your app!!!")
-            return
-    else:
-        my_token = saved_token  # 기존 발급 토큰 확인되어 기존 토큰 사용
+def auth(svr="prod", product=_cfg["my_prod"], url=None, force=False):
+    # 메모리에 보관중인 토큰 -> 저장된 토큰 파일 -> 신규 발급 순서로 확인 (force: 무조건 재발급)
+    my_token = _token_manager.get(svr, force=force)
+    if my_token is None:
+        print("Get Authentification token fail!\nYou have to restart your app!!!")
+        return
 
     # 발급토큰 정보 포함해서 헤더값 저장 관리, API 호출시 필요
     changeTREnv(my_token, svr, product)
 
-    _base_headers["authorization"] = f"Bearer {my_token}"
-    _base_headers["appkey"] = _TRENV.my_app
-    _base_headers["appsecret"] = _TRENV.my_sec
+    _setHeaderTemplate(
+        svr,
+        authorization=f"Bearer {my_token}",
+        appkey=_TRENV.my_app,
+        appsecret=_TRENV.my_sec,
+    )
 
     global _last_auth_time
     _last_auth_time = datetime.now()
+    # 토큰 만료 refresh_margin 초 전에 다음 API 호출에서 선제 갱신
+    _auth_deadlines[svr] = time.monotonic() + _token_manager.refresh_in(svr)
 
     if _DEBUG:
         print(f"[{_last_auth_time}] => get AUTH Key completed!")
@@ -278,20 +655,23 @@ def auth(svr="prod", product=_cfg["my_prod"], url=None):
 # end of initialize, 토큰 재발급, 토큰 발급시 유효시간 1일
 # 프로그램 실행시 _last_auth_time에 저장하여 유효시간 체크, 유효시간 만료시 토큰 발급 처리
 def reAuth(svr="prod", product=_cfg["my_prod"]):
-    n2 = datetime.now()
-    if (n2 - _last_auth_time).seconds >= 86400:  # 유효시간 1일
+    if time.monotonic() >= _auth_deadlines.get(svr, 0.0):  # 토큰 만료 임박
         auth(svr, product)
 
 
+# 토큰 만료 응답을 받은 경우 현재 환경으로 토큰 재발급
+def _reAuthNow():
+    auth("vps" if _isPaper else "prod", _TRENV.my_prod, force=True)
+
+
 def getEnv():
     return _cfg
 
 
+# 호출 속도는 _url_fetch 에서 _rate_limiter 로 자동 관리되므로 별도 대기하지 않음 (기존 코드 호환용)
 def smart_sleep():
     if _DEBUG:
-        print(f"[RateLimit] Sleeping {_smartSleep}s ")
-
-    time.sleep(_smartSleep)
+        print(f"[RateLimit] {_rate_limiter.rate}/s (_url_fetch 에서 자동 대기)")
 
 
 def getTREnv():
@@ -305,7 +685,7 @@ def getTREnv():
 def set_order_hash_key(h, p):
     url = f"{getTREnv().my_url}/uapi/hashkey"  # hashkey 발급 API URL
 
-    res = requests.post(url, data=json.dumps(p), headers=h)
+    res = _getSession().post(url, data=json.dumps(p), headers=h, timeout=_http_timeout)
     rescode = res.status_code
     if rescode == 200:
         h["hashkey"] = _getResultObject(res.json()).HASH
@@ -314,49 +694,85 @@ def set_order_hash_key(h, p):
 
 
 # API 호출 응답에 필요한 처리 공통 함수
+# 응답 header / body 필드를 속성으로 읽는 뷰 (namedtuple 대체)
+# 응답마다 클래스를 만들지 않고 디코딩된 dict 를 그대로 감싸므로 값 복사가 없다.
+class _Fields:
+    __slots__ = ("_data",)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getattr__(self, name):
+        try:
+            return self._data[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    @property
+    def _fields(self):
+        return tuple(self._data)
+
+    def _asdict(self):
+        return dict(self._data)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._data!r})"
+
+
+def _decodeBody(resp):
+    # requests.Response 는 원본 bytes 를 한 번만 디코딩 (orjson 사용 가능시 orjson)
+    content = getattr(resp, "content", None)
+    if isinstance(content, (bytes, bytearray, str)):
+        return _json_loads(content)
+    return resp.json()
+
+
 class APIResp:
+    """REST 응답. 본문은 생성시 한 번만 디코딩하고 header / body 뷰는 처음 접근할 때 만든다."""
+
+    __slots__ = ("_rescode", "_resp", "_data", "_header", "_body", "_err_code", "_err_message")
+
     def __init__(self, resp):
         self._rescode = resp.status_code
         self._resp = resp
-        self._header = self._setHeader()
-        self._body = self._setBody()
-        self._err_code = self._body.msg_cd
-        self._err_message = self._body.msg1
+        self._data = _decodeBody(resp)
+        self._header = None
+        self._body = None
+        self._err_code = self._data.get("msg_cd")
+        self._err_message = self._data.get("msg1")
 
     def getResCode(self):
         return self._rescode
 
     def _setHeader(self):
-        fld = dict()
-        for x in self._resp.headers.keys():
-            if x.islower():
-                fld[x] = self._resp.headers.get(x)
-        _th_ = namedtuple("header", fld.keys())
-
-        return _th_(**fld)
+        headers = self._resp.headers
+        return _Fields({x: headers.get(x) for x in headers.keys() if x.islower()})
 
     def _setBody(self):
-        _tb_ = namedtuple("body", self._resp.json().keys())
-
-        return _tb_(**self._resp.json())
+        return _Fields(self._data)
 
     def getHeader(self):
+        if self._header is None:
+            self._header = self._setHeader()
         return self._header
 
     def getBody(self):
+        if self._body is None:
+            self._body = self._setBody()
         return self._body
 
+    # 디코딩된 본문 dict (output / output1 / output2 리스트를 복사 없이 그대로 사용)
+    def getData(self):
+        return self._data
+
+    def getOutput(self, name="output", default=None):
+        return self._data.get(name, default)
+
     def getResponse(self):
         return self._resp
 
     def isOK(self):
-        try:
-            if self.getBody().rt_cd == "0":
-                return True
-            else:
-                return False
-        except:
-            return False
+        return self._data.get("rt_cd") == "0"
 
     def getErrorCode(self):
         return self._err_code
@@ -381,7 +797,7 @@ class APIResp:
         )
         print(
             "rt_cd : ",
-            self.getBody().rt_cd,
+            self._data.get("rt_cd"),
             "/ msg_cd : ",
             self.getErrorCode(),
             "/ msg1 : ",
@@ -393,6 +809,8 @@ class APIResp:
 
 
 class APIRespError(APIResp):
+    __slots__ = ("status_code", "error_text", "_error_code", "_error_message")
+
     def __init__(self, status_code, error_text):
         # 부모 생성자 호출하지 않고 직접 초기화
         self.status_code = status_code
@@ -403,6 +821,15 @@ class APIRespError(APIResp):
     def isOK(self):
         return False
 
+    def getResCode(self):
+        return self.status_code
+
+    def getData(self):
+        return {}
+
+    def getOutput(self, name="output", default=None):
+        return default
+
     def getErrorCode(self):
         return self._error_code
 
@@ -439,30 +866,231 @@ class APIRespError(APIResp):
             print(f"URL: {url}")
 
 
+# API 응답 캐시 (조회성 GET 요청만), (환경, api_url, tr_id, tr_cont, params) 기준 LRU + 분류별 TTL
+# 같은 시세/잔고/순위 조회가 몇 초 안에 반복될 때 API 호출 없이 이전 응답을 재사용
+class ResponseCache:
+    def __init__(self, maxsize=2048):
+        self.maxsize = maxsize
+        self._data = OrderedDict()  # key -> (만료시각, 분류, 응답)
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def _count(self, cls, field):
+        self._stats.setdefault(cls, {"hits": 0, "misses": 0})[field] += 1
+
+    def get(self, key):
+        cls = key[0]
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and item[0] > time.monotonic():
+                self._data.move_to_end(key)
+                self._count(cls, "hits")
+                return item[2]
+            if item is not None:
+                del self._data[key]
+            self._count(cls, "misses")
+            return None
+
+    def put(self, key, resp, ttl):
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, key[0], resp)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    # cls 지정시 해당 분류만, 아니면 전체 삭제
+    def clear(self, cls=None):
+        with self._lock:
+            if cls is None:
+                self._data.clear()
+            else:
+                for key in [k for k, v in self._data.items() if v[1] == cls]:
+                    del self._data[key]
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {}
+
+    def stats(self):
+        with self._lock:
+            result = {}
+            for cls, st in self._stats.items():
+                total = st["hits"] + st["misses"]
+                result[cls] = {**st, "hit_rate": st["hits"] / total if total else 0.0}
+            return result
+
+
+# 캐시 분류별 TTL(초), api_url 에 포함된 문자열로 분류 (위에서부터 먼저 일치하는 분류 적용)
+# 어느 분류에도 속하지 않는 API(주문, 주문가능조회 등)는 캐시하지 않음
+_cache_classes = [
+    ("info", ("/finance/", "/ksdinfo/", "/quotations/search-stock-info", "/quotations/search-info"), 86400.0),
+    ("ranking", ("/ranking/", "/quotations/volume-rank"), 30.0),
+    ("balance", ("/trading/inquire-balance",), 1.0),
+    ("quote", ("/quotations/",), 1.0),
+]
+
+_response_cache = ResponseCache(settings.response_cache_size)
+
+
+def _cacheClass(api_url):
+    for cls, patterns, ttl in _cache_classes:
+        if any(p in api_url for p in patterns):
+            return cls, ttl
+    return None, 0.0
+
+
+# 동일 요청 판별 키 (환경, api_url, tr_id, tr_cont, params), 조회성 GET 요청이 아니면 None
+# 연속조회(tr_cont 지정) 요청은 연속조회키 없이 tr_cont="N" 만으로 다음 페이지를 받는 API 가 많아
+# 요청이 같아도 응답이 매번 다르므로 캐시 / 중복 호출 병합 대상에서 제외
+def _requestKey(api_url, ptr_id, tr_cont, params, appendHeaders, postFlag):
+    if postFlag or appendHeaders or tr_cont:
+        return None
+    frozen = tuple(sorted((k, str(v)) for k, v in params.items()))
+    return (getTREnv().my_url, api_url, ptr_id, tr_cont, frozen)
+
+
+# 캐시 키와 TTL 반환, 캐시 대상이 아니면 (None, 0)
+def _cacheKey(request_key, api_url):
+    if request_key is None:
+        return None, 0.0
+    cls, ttl = _cacheClass(api_url)
+    if cls is None or ttl <= 0:
+        return None, 0.0
+    return (cls,) + request_key, ttl
+
+
+# 정상 응답은 캐시에 저장, 주문(POST) 후에는 잔고 캐시 무효화
+def _afterFetch(api_url, key, ttl, res, postFlag):
+    if key is not None and res.isOK():
+        _response_cache.put(key, res, ttl)
+    if postFlag and "/trading/" in api_url:
+        _response_cache.clear("balance")
+
+
+def set_cache_ttl(cls, ttl):
+    for i, (name, patterns, _) in enumerate(_cache_classes):
+        if name == cls:
+            _cache_classes[i] = (name, patterns, ttl)
+            return
+    raise ValueError(f"unknown cache class: {cls}")
+
+
+def getCacheStats():
+    return _response_cache.stats()
+
+
+def resetCacheStats():
+    _response_cache.reset_stats()
+
+
+def clearCache(cls=None):
+    _response_cache.clear(cls)
+
+
+# 동일 요청 합치기 (single-flight): 같은 요청이 동시에 여러 개 들어오면 한 번만 호출하고 결과를 공유
+# 스레드는 do(), asyncio task 는 do_async() 사용 (이벤트 루프별로 따로 관리)
+class SingleFlight:
+    class _Call:
+        def __init__(self):
+            self.event = threading.Event()
+            self.result = None
+            self.error = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._async_calls = weakref.WeakKeyDictionary()  # loop -> {key: Future}
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = self._Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    async def do_async(self, key, fn):
+        loop = asyncio.get_running_loop()
+        calls = self._async_calls.setdefault(loop, {})
+        task = calls.get(key)
+        if task is None:
+            # 공유 호출은 별도 task 로 실행해서 한 호출자가 취소되어도 다른 대기자에게 전파되지 않음
+            task = calls[key] = loop.create_task(fn())
+            task.add_done_callback(lambda t: self._finishAsync(calls, key, t))
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _finishAsync(calls, key, task):
+        if calls.get(key) is task:
+            del calls[key]
+        if not task.cancelled():
+            task.exception()  # 대기자가 모두 취소되어도 경고가 남지 않도록 조회 처리
+
+    def inflight(self):
+        with self._lock:
+            return len(self._calls) + sum(len(c) for c in self._async_calls.values())
+
+
+_inflight = SingleFlight()
+
+
+# 재시도 후에도 실패한 API 호출 (빈 결과와 실패를 구분해야 하는 호출자용)
+# partial: 연속조회 중간에 실패한 경우 그 전까지 받은 {output 이름: 레코드 리스트}
+class KISAPIError(Exception):
+    def __init__(self, resp, url="", partial=None):
+        self.resp = resp
+        self.url = url
+        self.partial = partial
+        super().__init__(self._message())
+
+    def _message(self):
+        return f"{self.resp.getErrorCode()} | {self.resp.getErrorMessage()} ({self.url})"
+
+
+# 연속조회가 진행되지 않음 (연속조회키가 그대로이거나 직전 페이지와 같은 응답이 반복)
+class KISPagingError(KISAPIError):
+    def _message(self):
+        return f"Paging did not advance ({self.url})"
+
+
 ########### API call wrapping : API 호출 공통
 
 
-def _url_fetch(
-        api_url, ptr_id, tr_cont, params, appendHeaders=None, postFlag=False, hashFlag=True
-):
+# API 호출 URL / Header 구성 (동기, 비동기 호출 공통)
+def _prepareRequest(api_url, ptr_id, tr_cont, params, appendHeaders=None):
     url = f"{getTREnv().my_url}{api_url}"
 
-    headers = _getBaseHeader()  # 기본 header 값 정리
-
-    # 추가 Header 설정
     tr_id = ptr_id
     if ptr_id[0] in ("T", "J", "C"):  # 실전투자용 TR id 체크
         if isPaperTrading():  # 모의투자용 TR id 식별
             tr_id = "V" + ptr_id[1:]
 
-    headers["tr_id"] = tr_id  # 트랜젝션 TR id
-    headers["custtype"] = "P"  # 일반(개인고객,법인고객) "P", 제휴사 "B"
-    headers["tr_cont"] = tr_cont  # 트랜젝션 TR id
+    # 기본 header 템플릿 + 호출별 Header
+    headers = {
+        **_headerTemplate(),
+        "tr_id": tr_id,  # 트랜젝션 TR id
+        "custtype": "P",  # 일반(개인고객,법인고객) "P", 제휴사 "B"
+        "tr_cont": tr_cont,  # 연속 거래 여부
+    }
 
-    if appendHeaders is not None:
-        if len(appendHeaders) > 0:
-            for x in appendHeaders.keys():
-                headers[x] = appendHeaders.get(x)
+    if appendHeaders:  # 추가 Header 설정
+        headers.update(appendHeaders)
 
     if _DEBUG:
         print("< Sending Info >")
@@ -470,12 +1098,11 @@ def _url_fetch(
         print(f"<header>\n{headers}")
         print(f"<body>\n{params}")
 
-    if postFlag:
-        # if (hashFlag): set_order_hash_key(headers, params)
-        res = requests.post(url, headers=headers, data=json.dumps(params))
-    else:
-        res = requests.get(url, headers=headers, params=params)
+    return url, headers
+
 
+# HTTP 응답을 APIResp / APIRespError 로 변환
+def _makeResp(res):
     if res.status_code == 200:
         ar = APIResp(res)
         if _DEBUG:
@@ -486,6 +1113,473 @@ def _url_fetch(
         return APIRespError(res.status_code, res.text)
 
 
+# 호출 결과를 속도 제한기 / 회로 차단기에 반영하고, 재시도할 경우 대기 시간(초) 반환
+# kind: None(정상) 또는 _classifyError 결과, POST(주문 등)는 중복 실행 위험이 있어 5xx/네트워크 오류는 재시도하지 않음
+def _retryDelay(kind, attempt, postFlag=False):
+    if kind is None or kind == ERR_HARD:
+        _rate_limiter.on_success()
+        _circuit.record_success()
+        return None
+
+    if kind == ERR_RATE:
+        _rate_limiter.on_throttle()
+
+    policy = _retry_policies[kind]
+    max_retries = 0 if postFlag and kind == ERR_TRANSIENT else policy.max_retries
+    if attempt >= max_retries:
+        if kind != ERR_AUTH:
+            _circuit.record_failure()
+        return None
+
+    delay = policy.delay(attempt)
+    logging.warning("[Retry] %s error, retry %d/%d after %.2fs", kind, attempt + 1, max_retries, delay)
+    return delay
+
+
+def _circuitOpenError(api_url):
+    return APIRespError(503, f"Circuit open: API 호출 일시 차단 중 ({api_url})")
+
+
+# 재시도 / 회로 차단기를 적용한 실제 API 호출
+def _fetchWithRetry(api_url, ptr_id, tr_cont, params, appendHeaders, postFlag, hashFlag):
+    allowed = _circuit.allow()
+    if not allowed:
+        return _circuitOpenError(api_url)
+
+    try:
+        attempt = 0
+        while True:
+            url, headers = _prepareRequest(api_url, ptr_id, tr_cont, params, appendHeaders)
+
+            _rate_limiter.acquire()
+
+            res, error = None, None
+            try:
+                if postFlag:
+                    # if (hashFlag): set_order_hash_key(headers, params)
+                    res = _getSession().post(
+                        url, headers=headers, data=json.dumps(params), timeout=_http_timeout
+                    )
+                else:
+                    res = _getSession().get(url, headers=headers, params=params, timeout=_http_timeout)
+            except requests.RequestException as e:
+                error = e
+
+            if error is not None:
+                kind = ERR_TRANSIENT
+            else:
+                kind = None if res.status_code == 200 else _classifyError(res.status_code, res.text)
+
+            delay = _retryDelay(kind, attempt, postFlag)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return _makeResp(res)
+
+            if kind == ERR_AUTH:
+                _reAuthNow()
+            time.sleep(delay)
+            attempt += 1
+    finally:
+        if allowed == CircuitBreaker.TRIAL:
+            _circuit.end_trial()
+
+
+def _url_fetch(
+        api_url, ptr_id, tr_cont, params, appendHeaders=None, postFlag=False, hashFlag=True
+):
+    request_key = _requestKey(api_url, ptr_id, tr_cont, params, appendHeaders, postFlag)
+    key, ttl = _cacheKey(request_key, api_url)
+    if key is not None:
+        cached = _response_cache.get(key)
+        if cached is not None:
+            return cached
+
+    def fetch():
+        res = _fetchWithRetry(api_url, ptr_id, tr_cont, params, appendHeaders, postFlag, hashFlag)
+        _afterFetch(api_url, key, ttl, res, postFlag)
+        return res
+
+    # 동시에 들어온 같은 조회 요청은 한 번만 호출
+    if request_key is None:
+        return fetch()
+    return _inflight.do(request_key, fetch)
+
+
+########### API call wrapping (asyncio) : 이벤트 루프를 막지 않는 API 호출
+
+# 이벤트 루프별 aiohttp 세션 (세션은 생성된 루프에서만 사용 가능)
+_aio_sessions = weakref.WeakKeyDictionary()
+
+
+class _AsyncHTTPResp:
+    """aiohttp 응답을 requests.Response 와 같은 모양으로 감싼 객체 (APIResp 입력용)"""
+
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return _json_loads(self.content)
+
+
+def _getAioSession():
+    loop = asyncio.get_running_loop()
+    s = _aio_sessions.get(loop)
+    if s is None or s.closed:
+        connector = aiohttp.TCPConnector(limit=_http_pool_size, keepalive_timeout=60)
+        timeout = aiohttp.ClientTimeout(
+            sock_connect=_http_timeout[0], sock_read=_http_timeout[1]
+        )
+        s = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        _aio_sessions[loop] = s
+    return s
+
+
+async def close_http_pool_async():
+    s = _aio_sessions.pop(asyncio.get_running_loop(), None)
+    if s is not None:
+        await s.close()
+
+
+async def _fetchWithRetryAsync(api_url, ptr_id, tr_cont, params, appendHeaders, postFlag, hashFlag):
+    # aiohttp 미설치 환경에서는 공용 커넥션 풀을 쓰는 스레드에서 동기 호출
+    if aiohttp is None:
+        return await asyncio.to_thread(
+            _fetchWithRetry, api_url, ptr_id, tr_cont, params, appendHeaders, postFlag, hashFlag
+        )
+
+    allowed = _circuit.allow()
+    if not allowed:
+        return _circuitOpenError(api_url)
+
+    try:
+        attempt = 0
+        while True:
+            url, headers = _prepareRequest(api_url, ptr_id, tr_cont, params, appendHeaders)
+
+            await _rate_limiter.acquire_async()
+
+            session = _getAioSession()
+            if postFlag:
+                req = session.post(url, headers=headers, data=json.dumps(params))
+            else:
+                req = session.get(url, headers=headers, params=params)
+
+            res, error = None, None
+            try:
+                async with req as r:
+                    res = _AsyncHTTPResp(r.status, dict(r.headers), await r.read())
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = e
+
+            if error is not None:
+                kind = ERR_TRANSIENT
+            else:
+                kind = None if res.status_code == 200 else _classifyError(res.status_code, res.text)
+
+            delay = _retryDelay(kind, attempt, postFlag)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return _makeResp(res)
+
+            if kind == ERR_AUTH:
+                await asyncio.to_thread(_reAuthNow)
+            await asyncio.sleep(delay)
+            attempt += 1
+    finally:
+        if allowed == CircuitBreaker.TRIAL:
+            _circuit.end_trial()
+
+
+async def _url_fetch_async(
+        api_url, ptr_id, tr_cont, params, appendHeaders=None, postFlag=False, hashFlag=True
+):
+    request_key = _requestKey(api_url, ptr_id, tr_cont, params, appendHeaders, postFlag)
+    key, ttl = _cacheKey(request_key, api_url)
+    if key is not None:
+        cached = _response_cache.get(key)
+        if cached is not None:
+            return cached
+
+    async def fetch():
+        res = await _fetchWithRetryAsync(
+            api_url, ptr_id, tr_cont, params, appendHeaders, postFlag, hashFlag
+        )
+        _afterFetch(api_url, key, ttl, res, postFlag)
+        return res
+
+    # 동시에 들어온 같은 조회 요청은 한 번만 호출
+    if request_key is None:
+        return await fetch()
+    return await _inflight.do_async(request_key, fetch)
+
+
+
+########### 연속조회 (페이지네이션)
+
+# 응답 header tr_cont 가 F / M 이면 다음 데이터 있음, D / E 면 마지막 데이터
+_MORE_PAGES = ("F", "M")
+
+
+# 다음 페이지 요청을 위해 params 의 연속조회키를 응답 값으로 갱신, 마지막 페이지면 None
+# cursor: {요청 파라미터명: 응답 body 필드명}, 예) {"CTX_AREA_FK100": "ctx_area_fk100"}
+def _nextPage(res, params, cursor):
+    if not res.isOK() or getattr(res.getHeader(), "tr_cont", "") not in _MORE_PAGES:
+        return None
+    if cursor:
+        body = res.getData()
+        for key, field in cursor.items():
+            params[key] = body.get(field, "")
+    logging.info("Call Next page...")
+    return "N"
+
+
+# 연속조회가 진행되지 않으면 KISPagingError (같은 요청 / 같은 응답 무한 반복 방지)
+# 직전 페이지와 같은 응답이거나, 다음 페이지가 있다면서 방금 보낸 연속조회키를 그대로 돌려준 경우
+def _checkAdvance(res, params, cursor, prev_data, api_url):
+    if not res.isOK():
+        return
+    data = res.getData()
+    stalled = data == prev_data
+    if cursor and not stalled and getattr(res.getHeader(), "tr_cont", "") in _MORE_PAGES:
+        sent = [params.get(key, "") for key in cursor]
+        stalled = any(sent) and sent == [data.get(field, "") for field in cursor.values()]
+    if stalled:
+        raise KISPagingError(res, api_url)
+
+
+# 페이지별 응답을 차례로 돌려주는 generator (마지막 페이지 또는 오류 응답에서 종료)
+def _iterPages(api_url, ptr_id, tr_cont, params, cursor=None, appendHeaders=None):
+    params = dict(params)
+    prev_data = None
+    while tr_cont is not None:
+        res = _url_fetch(api_url, ptr_id, tr_cont, params, appendHeaders)
+        _checkAdvance(res, params, cursor, prev_data, api_url)
+        prev_data = res.getData()
+        yield res
+        tr_cont = _nextPage(res, params, cursor)
+
+
+async def _iterPagesAsync(api_url, ptr_id, tr_cont, params, cursor=None, appendHeaders=None):
+    params = dict(params)
+    prev_data = None
+    while tr_cont is not None:
+        res = await _url_fetch_async(api_url, ptr_id, tr_cont, params, appendHeaders)
+        _checkAdvance(res, params, cursor, prev_data, api_url)
+        prev_data = res.getData()
+        yield res
+        tr_cont = _nextPage(res, params, cursor)
+
+
+def _addRecords(pages, res, outputs):
+    body = res.getData()
+    for name in outputs:
+        data = body.get(name)
+        if isinstance(data, list):
+            pages[name].extend(data)
+        elif data:  # 단건(dict) 응답은 1행으로
+            pages[name].append(data)
+
+
+# output 레코드(list / dict / None) -> DataFrame, TR 스키마로 숫자/날짜/코드 컬럼 타입 변환 (kis_schema)
+def _toFrame(data, tr_id=None, output="output"):
+    if data is None:
+        data = []
+    elif isinstance(data, dict):  # 단건 응답은 1행
+        data = [data]
+    df = pd.DataFrame(data)
+    return kis_schema.decode(df, tr_id, output) if _typed_output else df
+
+
+# 응답 DataFrame 타입 변환 사용 여부 (기본 False: 기존처럼 모든 값 문자열, TYPED_OUTPUT=true 로 사용)
+_typed_output = settings.typed_output
+
+
+def set_typed_output(flag):
+    global _typed_output
+    _typed_output = flag
+
+
+# 연속조회 전체 페이지를 반복 호출해서 output 별 레코드(dict) 리스트로 모음 (재귀/깊이 제한 없음)
+# 반환: (마지막 응답, {output 이름: 레코드 리스트}), 첫 페이지가 오류면 오류 응답과 빈 레코드
+# 두 번째 페이지부터 오류가 나거나 연속조회가 진행되지 않으면 KISAPIError (e.partial: 그 전까지 받은 레코드)
+# 예) res, pages = ka._paginate(api_url, tr_id, tr_cont, params, ("output1", "output2"), cursor)
+#     df1 = pd.DataFrame(pages["output1"])
+def _paginate(api_url, ptr_id, tr_cont, params, outputs=("output",), cursor=None, appendHeaders=None):
+    pages = {name: [] for name in outputs}
+    res = None
+    try:
+        for n, res in enumerate(_iterPages(api_url, ptr_id, tr_cont, params, cursor, appendHeaders)):
+            if res.isOK():
+                _addRecords(pages, res, outputs)
+            elif n > 0:
+                raise KISAPIError(res, api_url)
+    except KISAPIError as e:
+        e.partial = pages
+        raise
+    return res, pages
+
+
+async def _paginate_async(
+        api_url, ptr_id, tr_cont, params, outputs=("output",), cursor=None, appendHeaders=None
+):
+    pages = {name: [] for name in outputs}
+    res = None
+    n = 0
+    try:
+        async for res in _iterPagesAsync(api_url, ptr_id, tr_cont, params, cursor, appendHeaders):
+            if res.isOK():
+                _addRecords(pages, res, outputs)
+            elif n > 0:
+                raise KISAPIError(res, api_url)
+            n += 1
+    except KISAPIError as e:
+        e.partial = pages
+        raise
+    return res, pages
+
+
+# 페이지마다 {output 이름: 레코드 리스트} 를 바로 돌려주는 generator (전체 페이지를 메모리에 모으지 않음)
+# 오류 응답을 받으면 KISAPIError
+def _streamPages(api_url, ptr_id, tr_cont, params, outputs=("output",), cursor=None, appendHeaders=None):
+    for res in _iterPages(api_url, ptr_id, tr_cont, params, cursor, appendHeaders):
+        if not res.isOK():
+            raise KISAPIError(res, api_url)
+        page = {name: [] for name in outputs}
+        _addRecords(page, res, outputs)
+        yield page
+
+
+async def _streamPagesAsync(
+        api_url, ptr_id, tr_cont, params, outputs=("output",), cursor=None, appendHeaders=None
+):
+    async for res in _iterPagesAsync(api_url, ptr_id, tr_cont, params, cursor, appendHeaders):
+        if not res.isOK():
+            raise KISAPIError(res, api_url)
+        page = {name: [] for name in outputs}
+        _addRecords(page, res, outputs)
+        yield page
+
+
+# 종목별 호출 결과 모음 (fan_out / fan_out_async 반환값)
+# results: {키: 반환값}, errors: {키: 예외}, 둘 다 입력 순서
+class FanOutResult:
+    __slots__ = ("results", "errors")
+
+    def __init__(self, results, errors):
+        self.results = results
+        self.errors = errors
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def __repr__(self):
+        return f"FanOutResult(results={len(self.results)}, errors={len(self.errors)})"
+
+
+# fan_out 입력 정리: dict 면 {키: 인자}, 그 외에는 각 항목이 키이자 인자 (dict 항목은 순번이 키)
+# 인자가 dict 면 fn(**인자), tuple 이면 fn(*인자), 그 외에는 fn(인자)
+def _fanOutJobs(params):
+    if isinstance(params, dict):
+        return list(params.items())
+    return [(i if isinstance(p, dict) else p, p) for i, p in enumerate(params)]
+
+
+def _fanOutCall(fn, args):
+    if isinstance(args, dict):
+        return fn(**args)
+    if isinstance(args, tuple):
+        return fn(*args)
+    return fn(args)
+
+
+# fan_out 작업 스레드 표시 (fan_out 안에서 다시 fan_out 하면 바깥 호출이 이미 호출 예산을 쓰고 있으므로 순차 실행)
+_fan_out_local = threading.local()
+
+
+def _fanOutWorker(fn, args):
+    _fan_out_local.nested = True
+    return _fanOutCall(fn, args)
+
+
+# 동시 호출 수 기본값: 초당 호출 한도만큼 (응답 지연 동안에도 호출 예산을 다 쓰도록)
+def _fanOutWorkers(max_workers):
+    if max_workers is None:
+        max_workers = math.ceil(_rate_limiter.max_rate)
+    return max(1, int(max_workers))
+
+
+def _fanOutDone(jobs, results, errors):
+    order = [key for key, _ in jobs]
+    return FanOutResult(
+        {k: results[k] for k in order if k in results},
+        {k: errors[k] for k in order if k in errors},
+    )
+
+
+# 종목별 REST 호출을 제한된 동시성으로 실행 (domestic_stock_functions 함수, load_stock_data 등)
+# 호출 속도는 _url_fetch 의 속도 제한기가 관리하므로, 전체 소요 시간은 응답 지연이 아니라 호출 한도로 결정됨
+# 한 종목의 예외는 errors 에 모으고 나머지는 계속 진행, on_progress(완료 수, 전체 수, 키, 결과, 예외) 는 호출한 스레드에서 실행
+def fan_out(fn, params, max_workers=None, on_progress=None):
+    """
+    Example:
+        >>> r = fan_out(lambda code: finance_ratio("0", "J", code), ["005930", "000660"])
+        >>> r.results["005930"], r.errors
+    """
+    jobs = _fanOutJobs(params)
+    results, errors = {}, {}
+    if not jobs:
+        return FanOutResult(results, errors)
+
+    workers = 1 if getattr(_fan_out_local, "nested", False) else _fanOutWorkers(max_workers)
+    pool = ThreadPoolExecutor(max_workers=min(workers, len(jobs)))
+    try:
+        futures = {pool.submit(_fanOutWorker, fn, args): key for key, args in jobs}
+        for done, fut in enumerate(as_completed(futures), start=1):
+            key = futures[fut]
+            error = fut.exception()
+            if error is None:
+                results[key] = fut.result()
+            else:
+                errors[key] = error
+            if on_progress is not None:
+                on_progress(done, len(jobs), key, results.get(key), error)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)  # Ctrl+C 등으로 중단되면 남은 호출 취소
+
+    return _fanOutDone(jobs, results, errors)
+
+
+# fan_out 의 asyncio 버전 (fn 은 async 함수, 예: domestic_stock_functions_async)
+async def fan_out_async(fn, params, max_workers=None, on_progress=None):
+    jobs = _fanOutJobs(params)
+    results, errors = {}, {}
+    sem = asyncio.Semaphore(_fanOutWorkers(max_workers))
+    done = 0
+
+    async def run(key, args):
+        nonlocal done
+        async with sem:
+            try:
+                results[key] = await _fanOutCall(fn, args)
+            except Exception as e:
+                errors[key] = e
+        done += 1
+        if on_progress is not None:
+            on_progress(done, len(jobs), key, results.get(key), errors.get(key))
+
+    await asyncio.gather(*(run(key, args) for key, args in jobs))
+    return _fanOutDone(jobs, results, errors)
+
+
 # auth()
 # print("Pass through the end of the line")
 
@@ -496,12 +1590,19 @@ _base_headers_ws = {
     "content-type": "utf-8",
 }
 
+# 환경별 웹소켓 헤더 템플릿 (auth_ws() 시점에 접속키 포함해 만들고 통째로 교체)
+_ws_header_templates = {}
+_default_ws_header_template = MappingProxyType(dict(_base_headers_ws))
 
-def _getBaseHeader_ws():
-    if _autoReAuth:
-        reAuth_ws()
 
-    return copy.deepcopy(_base_headers_ws)
+def _headerTemplate_ws():
+    if _autoReAuth and time.monotonic() >= _ws_auth_deadline:
+        reAuth_ws("vps" if _isPaper else "prod", _TRENV.my_prod)
+    return _ws_header_templates.get("vps" if _isPaper else "prod", _default_ws_header_template)
+
+
+def _getBaseHeader_ws():
+    return dict(_headerTemplate_ws())
 
 
 def auth_ws(svr="prod", product=_cfg["my_prod"]):
@@ -517,7 +1618,9 @@ def auth_ws(svr="prod", product=_cfg["my_prod"]):
     p["secretkey"] = _cfg[ak2]
 
     url = f"{_cfg[svr]}/oauth2/Approval"
-    res = requests.post(url, data=json.dumps(p), headers=_getBaseHeader())  # 토큰 발급
+    res = _getSession().post(
+        url, data=json.dumps(p), headers=_getBaseHeader(), timeout=_http_timeout
+    )  # 토큰 발급
     rescode = res.status_code
     if rescode == 200:  # 토큰 정상 발급
         approval_key = _getResultObject(res.json()).approval_key
@@ -527,31 +1630,26 @@ def auth_ws(svr="prod", product=_cfg["my_prod"]):
 
     changeTREnv(None, svr, product)
 
-    _base_headers_ws["approval_key"] = approval_key
+    _ws_header_templates[svr] = MappingProxyType({**_base_headers_ws, "approval_key": approval_key})
 
-    global _last_auth_time
+    global _last_auth_time, _ws_auth_deadline
     _last_auth_time = datetime.now()
+    _ws_auth_deadline = time.monotonic() + 86400
 
     if _DEBUG:
         print(f"[{_last_auth_time}] => get AUTH Key completed!")
 
 
 def reAuth_ws(svr="prod", product=_cfg["my_prod"]):
-    n2 = datetime.now()
-    if (n2 - _last_auth_time).seconds >= 86400:
+    if time.monotonic() >= _ws_auth_deadline:  # 유효시간 1일
         auth_ws(svr, product)
 
 
 def data_fetch(tr_id, tr_type, params, appendHeaders=None) -> dict:
-    headers = _getBaseHeader_ws()  # 기본 header 값 정리
-
-    headers["tr_type"] = tr_type
-    headers["custtype"] = "P"
+    headers = {**_headerTemplate_ws(), "tr_type": tr_type, "custtype": "P"}  # 기본 header 값 정리
 
-    if appendHeaders is not None:
-        if len(appendHeaders) > 0:
-            for x in appendHeaders.keys():
-                headers[x] = appendHeaders.get(x)
+    if appendHeaders:
+        headers.update(appendHeaders)
 
     if _DEBUG:
         print("< Sending Info >")
@@ -716,6 +1814,8 @@ class KISWebSocket:
                 df = pd.read_csv(
                     StringIO(d), header=None, sep="^", names=dm["columns"], dtype=object
                 )
+                if _typed_output:
+                    df = kis_schema.decode(df, tr_id)
 
                 show_result = True
 
@@ -780,7 +1880,7 @@ class KISWebSocket:
         logging.info("send message >> %s" % json.dumps(msg))
 
         await ws.send(json.dumps(msg))
-        smart_sleep()
+        await _ws_rate_limiter.acquire_async()
 
     async def send_multiple(
             self,
@@ -0,0 +1,187 @@
+"""
+KIS API 응답 필드 타입 스키마
+
+KIS REST / 웹소켓 응답은 모든 값이 문자열로 오므로, TR / output 별로 필드 타입을 등록해 두고
+DataFrame 을 만들 때 한 번에 변환합니다.
+  - INT: 가격, 수량, 금액 (int64, 빈 값이나 소수가 있으면 float64)
+  - FLOAT: 비율, 등락률 (float64)
+  - DATE: 일자 YYYYMMDD (datetime64)
+  - CATEGORY: 구분 코드, 부호, 여부 (category)
+  - STR: 종목코드, 주문번호 등 앞자리 0 이 의미있는 값 (문자열 그대로)
+TR 스키마에 없는 필드는 KIS 필드명 규칙(접미사)으로 타입을 정하고, 규칙에도 없으면 문자열 그대로 둡니다.
+
+Example:
+    >>> import kis_schema
+    >>> kis_schema.register("FHKST01010100", "output", {"stck_prpr": kis_schema.INT})
+    >>> df = kis_schema.decode(pd.DataFrame(records), "FHKST01010100", "output")
+"""
+import re
+from functools import lru_cache
+from typing import Dict, Optional
+
+import pandas as pd
+
+INT = "int64"
+FLOAT = "float64"
+DATE = "datetime64[ns]"
+CATEGORY = "category"
+STR = "object"
+
+# 필드명 규칙 (소문자 기준, 위에서부터 먼저 맞는 규칙 적용)
+_FIELD_RULES = [
+    # 종목코드 / 주문번호 / 시각(HHMMSS) 은 문자열 유지
+    (re.compile(r"(_iscd|_shrn_iscd|^pdno|^odno|_odno|_brno|_hour|_tmd|_time)$"), STR),
+    (re.compile(r"(_date(_\d)?|_dt|_ymd)$"), DATE),
+    (re.compile(r"(_ctrt|_rate|_rt|_tnrt|_ehrt|^per|^pbr|^eps|^bps|^roe_\w+)$"), FLOAT),
+    (re.compile(
+        r"(_prpr|_oprc|_hgpr|_lwpr|_clpr|_sdpr|_mxpr|_llam|_vrss|_pric|_prc|_unpr|_amt|_pbmn|"
+        r"_vol|_qty|_cnt|_avls|_stcn|_rsqn\d*|_icdc|_askp\d*|_bidp\d*|_fcam|_pfls|^prpr)$"
+    ), INT),
+    (re.compile(r"(_cls_code|_dvsn|_dvsn_cd|_sign|_yn)$"), CATEGORY),
+]
+
+# (tr_id, output) -> {필드명: 타입}, 규칙과 다른 필드만 등록해도 됨
+_SCHEMAS: Dict[tuple, Dict[str, str]] = {}
+
+
+def register(tr_id: str, output: str, fields: Dict[str, str]) -> None:
+    """TR / output 의 필드 타입 등록 (기존 등록 필드는 덮어씀)"""
+    _SCHEMAS.setdefault((tr_id, output), {}).update({k.lower(): v for k, v in fields.items()})
+    _schema.cache_clear()
+
+
+def _rule(field: str) -> Optional[str]:
+    for pattern, dtype in _FIELD_RULES:
+        if pattern.search(field):
+            return dtype
+    return None
+
+
+def _registered(tr_id: Optional[str], output: str) -> Dict[str, str]:
+    if not tr_id:
+        return {}
+    fields = _SCHEMAS.get((tr_id, output))
+    if fields is None and tr_id[0] == "V":  # 모의투자 TR (VTTC...) 은 실전 TR 스키마 사용
+        fields = _SCHEMAS.get(("T" + tr_id[1:], output))
+    return fields or {}
+
+
+@lru_cache(maxsize=1024)
+def _schema(tr_id: Optional[str], output: str, columns: tuple) -> Dict[str, str]:
+    registered = _registered(tr_id, output)
+    result = {}
+    for col in columns:
+        name = str(col).lower()
+        dtype = registered.get(name) or _rule(name)
+        if dtype is not None and dtype != STR:
+            result[col] = dtype
+    return result
+
+
+def schema(tr_id: Optional[str], output: str, columns) -> Dict[str, str]:
+    """컬럼별 변환 타입 (문자열로 둘 컬럼은 제외)"""
+    return dict(_schema(tr_id, output, tuple(columns)))
+
+
+def _convert(s: pd.Series, dtype: str) -> pd.Series:
+    if dtype == INT:
+        v = pd.to_numeric(s, errors="coerce")
+        if v.dtype.kind == "f" and v.notna().all() and (v % 1 == 0).all():
+            v = v.astype("int64")
+        return v
+    if dtype == FLOAT:
+        return pd.to_numeric(s, errors="coerce").astype("float64")
+    if dtype == DATE:
+        return pd.to_datetime(s, format="%Y%m%d", errors="coerce")
+    if dtype == CATEGORY:
+        return s.astype("category")
+    return s.astype(dtype)
+
+
+def _is_text(s: pd.Series) -> bool:
+    # pandas 2 는 object, pandas 3 은 str dtype 으로 추론
+    return s.dtype == object or pd.api.types.is_string_dtype(s.dtype)
+
+
+def decode(df: pd.DataFrame, tr_id: Optional[str] = None, output: str = "output") -> pd.DataFrame:
+    """
+    문자열 컬럼을 스키마 타입으로 변환 (컬럼 단위 벡터 연산, df 를 직접 수정해서 반환)
+
+    Args:
+        df: KIS 응답 레코드로 만든 DataFrame
+        tr_id: 거래 ID (없으면 필드명 규칙만 적용)
+        output: 응답 output 이름 (output, output1, output2 ...)
+    """
+    if df.empty:
+        return df
+    for col, dtype in _schema(tr_id, output, tuple(df.columns)).items():
+        if _is_text(df[col]):
+            df[col] = _convert(df[col], dtype)
+    return df
+
+
+# 주요 TR 스키마 (필드명 규칙과 다르거나 규칙에 없는 필드)
+register("FHKST01010100", "output", {  # 주식현재가 시세
+    "stck_shrn_iscd": STR,
+    "bstp_kor_isnm": STR,
+    "hts_avls": INT,  # 시가총액 (억원)
+    "cpfn": INT,  # 자본금
+    "lstn_stcn": INT,  # 상장주수
+    "w52_hgpr_vrss_prpr_ctrt": FLOAT,
+    "w52_lwpr_vrss_prpr_ctrt": FLOAT,
+    "stck_dryy_hgpr": INT,
+    "stck_dryy_lwpr": INT,
+    "hts_frgn_ehrt": FLOAT,  # 외국인 소진율
+    "vol_tnrt": FLOAT,  # 거래량 회전율
+})
+register("FHKST03010100", "output1", {  # 국내주식기간별시세 (종목 정보)
+    "stck_shrn_iscd": STR,
+    "hts_avls": INT,
+    "vol_tnrt": FLOAT,
+})
+register("FHKST03010100", "output2", {  # 국내주식기간별시세 (봉 데이터)
+    "stck_bsop_date": DATE,
+    "stck_oprc": INT,
+    "stck_hgpr": INT,
+    "stck_lwpr": INT,
+    "stck_clpr": INT,
+    "acml_vol": INT,
+    "acml_tr_pbmn": INT,
+    "flng_cls_code": CATEGORY,  # 락 구분 코드
+    "prtt_rate": FLOAT,  # 분할 비율
+    "mod_yn": CATEGORY,
+    "revl_issu_reas": CATEGORY,  # 재평가사유코드
+})
+register("TTTC8434R", "output1", {  # 주식잔고조회 (보유종목)
+    "pdno": STR,
+    "prdt_name": STR,
+    "hldg_qty": INT,
+    "ord_psbl_qty": INT,
+    "pchs_avg_pric": FLOAT,  # 매입평균가격 (소수)
+    "pchs_amt": INT,
+    "prpr": INT,
+    "evlu_amt": INT,
+    "evlu_pfls_amt": INT,
+    "evlu_pfls_rt": FLOAT,
+    "evlu_erng_rt": FLOAT,
+    "fltt_rt": FLOAT,  # 등락율
+    "bfdy_cprs_icdc": INT,
+})
+register("TTTC8434R", "output2", {  # 주식잔고조회 (계좌 합계)
+    "asst_icdc_erng_rt": FLOAT,
+})
+for _tr_id in ("TTTC0081R", "CTSC9215R", "VTSC9215R"):  # 주식일별주문체결조회 (3개월 이내 / 이전)
+    register(_tr_id, "output1", {
+        "odno": STR,
+        "orgn_odno": STR,
+        "ord_tmd": STR,
+        "avg_prvs": FLOAT,  # 체결평균가
+    })
+register("FHKST11300006", "output", {  # 관심종목(멀티종목) 시세조회
+    "inter_shrn_iscd": STR,
+    "inter_kor_isnm": STR,
+    "inter2_hgpr": INT,  # 고가
+    "oprc_vrss_hgpr_rate": FLOAT,
+    "intr_antc_cntg_vrss": INT,
+    "intr_antc_cntg_prdy_ctrt": FLOAT,
+})
@@ -5,13 +5,14 @@ import os
 import pandas as pd
 import kis_auth as ka
 from backtesting import Backtest
-from domestic_stock.domestic_stock_functions import (
+from domestic_stock.domestic_stock_functions_async import (
     inquire_price,
+    get_quotes,
     inquire_balance,
     order_cash,
     inquire_psbl_order
 )
-from data_loader import load_stock_data
+from data_loader import load_snapshot, result_cache
 from strategies.balloon_theory_strategy import BalloonTheoryStrategy
 
 app = FastAPI(title="매매 자동매매 API", version="1.0.0")
@@ -41,6 +42,9 @@ class BacktestRequest(BaseModel):
     cash: int = 10_000_000  # 초기 자본금
     commission: float = 0.0015  # 수수료 0.15%
     svr: str = "prod"  # prod: 실전투자, vps: 모의투자
+    snapshot_id: str | None = None  # 데이터셋 스냅샷 고정 (이전 결과의 snapshot_id)
+    refresh: bool = False  # 같은 조건의 스냅샷이 있어도 데이터를 다시 로드해서 새 스냅샷 저장
+    use_cache: bool = True  # 같은 (전략, 파라미터, 스냅샷) 결과가 있으면 다시 계산하지 않음
 
 class BacktestCsvRequest(BaseModel):
     """CSV 파일 기반 백테스팅 요청 모델"""
@@ -74,7 +78,7 @@ async def root():
 async def get_stock_price(stock_code: str):
     """주식 현재가 조회"""
     try:
-        result = inquire_price(
+        result = await inquire_price(
             env_dv="real",
             fid_cond_mrkt_div_code="J",
             fid_input_iscd=stock_code
@@ -97,11 +101,43 @@ async def get_stock_price(stock_code: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/stock/prices")
+async def get_stock_prices(codes: str):
+    """여러 종목 현재가 일괄 조회 (codes: 콤마로 구분한 종목코드, 30종목당 API 1회 호출)"""
+    stock_codes = [c.strip() for c in codes.split(",") if c.strip()]
+    if not stock_codes:
+        raise HTTPException(status_code=400, detail="종목코드를 입력하세요")
+
+    try:
+        quotes = await get_quotes(stock_codes)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    # 거래정지 등으로 빈 필드는 NaN 으로 변환되므로 단건 조회(get_stock_price)처럼 0 으로
+    fields = ["inter2_prpr", "inter2_prdy_vrss", "prdy_ctrt", "acml_vol", "inter2_hgpr", "inter2_lwpr"]
+    quotes = quotes.reindex(columns=fields).fillna(0)
+
+    return {
+        "prices": [
+            {
+                "stock_code": code,
+                "current_price": int(row["inter2_prpr"]),
+                "change": int(row["inter2_prdy_vrss"]),
+                "change_rate": float(row["prdy_ctrt"]),
+                "volume": int(row["acml_vol"]),
+                "high": int(row["inter2_hgpr"]),
+                "low": int(row["inter2_lwpr"]),
+            }
+            for code, row in quotes.iterrows()
+        ]
+    }
+
+
 @app.get("/api/account/balance")
 async def get_balance():
     """계좌 잔고 조회"""
     try:
-        result = inquire_balance()
+        result = await inquire_balance()
 
         if result.empty:
             return {"holdings": [], "total_value": 0}
@@ -128,13 +164,13 @@ async def buy_stock(order: OrderRequest):
     """매수 주문"""
     try:
         # 매수 가능 금액 확인
-        psbl = inquire_psbl_order(
+        psbl = await inquire_psbl_order(
             fid_cond_mrkt_div_code="J",
             fid_input_iscd=order.stock_code,
             ord_dv="buy"
         )
 
-        result = order_cash(
+        result = await order_cash(
             fid_cond_mrkt_div_code="J",
             fid_input_iscd=order.stock_code,
             fid_ord_qty=str(order.quantity),
@@ -160,7 +196,7 @@ async def buy_stock(order: OrderRequest):
 async def sell_stock(order: OrderRequest):
     """매도 주문"""
     try:
-        result = order_cash(
+        result = await order_cash(
             fid_cond_mrkt_div_code="J",
             fid_input_iscd=order.stock_code,
             fid_ord_qty=str(order.quantity),
@@ -201,27 +237,48 @@ def run_backtest(
     end_date: str,
     cash: int = 10_000_000,
     commission: float = 0.0015,
-    svr: str = "prod"
+    svr: str = "prod",
+    snapshot_id: str | None = None,
+    use_cache: bool = True,
+    refresh: bool = False
 ) -> dict:
     """
     백테스팅 실행 함수
+
+    데이터는 데이터셋 스냅샷으로 로드하므로 같은 조건이면 API 조회 없이 같은 데이터를 쓰고,
+    (전략, 파라미터, 스냅샷) 이 같은 결과가 캐시에 있으면 다시 계산하지 않습니다.
+    종료일이 오늘 이후이거나 refresh=True 면 데이터를 다시 로드합니다.
     
     Returns:
-        dict: 백테스팅 결과 통계
+        dict: 백테스팅 결과 통계 (snapshot_id 포함)
     """
     # 1. KIS API 인증
     ka.auth(svr=svr)
     
-    # 2. 과거 데이터 로드
-    df = load_stock_data(
-        stock_code=stock_code,
-        start_date=start_date,
-        end_date=end_date,
-        adjusted=True  # 수정주가 사용
+    # 2. 과거 데이터 로드 (수정주가, 스냅샷 ID 를 주면 그 데이터 그대로)
+    snapshot_id, panel = load_snapshot(
+        [stock_code], start_date, end_date, adjusted=True, snapshot_id=snapshot_id, refresh=refresh
     )
+    df = panel.symbol(stock_code)
     
     if df.empty:
         raise ValueError(f"데이터를 불러올 수 없습니다: {stock_code}")
+
+    strategy_params = {
+        "ema_period": BalloonTheoryStrategy.ema_period,
+        "volume_multiplier": BalloonTheoryStrategy.volume_multiplier,
+        "min_price": BalloonTheoryStrategy.min_price
+    }
+    backtest_params = {
+        "initial_cash": cash,
+        "commission": commission
+    }
+    cache = result_cache() if snapshot_id is not None else None
+    cache_params = {"stock_code": stock_code, **strategy_params, **backtest_params}
+    if cache is not None and use_cache:
+        cached = cache.get(BalloonTheoryStrategy.__name__, cache_params, snapshot_id)
+        if cached is not None:
+            return cached
     
     # 3. 백테스팅 설정
     bt = Backtest(
@@ -245,16 +302,10 @@ def run_backtest(
         "end_date": end_date,
         "period": f"{df.index[0]} ~ {df.index[-1]}",
         "data_count": len(df),
+        "snapshot_id": snapshot_id,
         "strategy": "풍선이론 (Volume Breakout)",
-        "strategy_params": {
-            "ema_period": BalloonTheoryStrategy.ema_period,
-            "volume_multiplier": BalloonTheoryStrategy.volume_multiplier,
-            "min_price": BalloonTheoryStrategy.min_price
-        },
-        "backtest_params": {
-            "initial_cash": cash,
-            "commission": commission
-        },
+        "strategy_params": strategy_params,
+        "backtest_params": backtest_params,
         "results": {
             "initial_equity": initial_equity,
             "final_equity": safe_float(stats.get('Equity Final [$]', 0)),
@@ -266,7 +317,9 @@ def run_backtest(
             "sharpe_ratio": safe_float(stats.get('Sharpe Ratio', 0))
         }
     }
-    
+
+    if cache is not None:
+        cache.put(BalloonTheoryStrategy.__name__, cache_params, snapshot_id, result)
     return result
 
 
@@ -294,7 +347,10 @@ async def backtest_endpoint(request: BacktestRequest):
             end_date=request.end_date,
             cash=request.cash,
             commission=request.commission,
-            svr=request.svr
+            svr=request.svr,
+            snapshot_id=request.snapshot_id,
+            use_cache=request.use_cache,
+            refresh=request.refresh
         )
         return {
             "success": True,
@@ -315,7 +371,10 @@ async def backtest_get_endpoint(
     end_date: str = "20231231",
     cash: int = 10_000_000,
     commission: float = 0.0015,
-    svr: str = "prod"
+    svr: str = "prod",
+    snapshot_id: str | None = None,
+    use_cache: bool = True,
+    refresh: bool = False
 ):
     """
     백테스팅 실행 엔드포인트 (GET 방식)
@@ -327,6 +386,9 @@ async def backtest_get_endpoint(
     - cash: 초기 자본금 (기본값: 10000000)
     - commission: 수수료 (기본값: 0.0015)
     - svr: 서버 (prod 또는 vps, 기본값: prod)
+    - snapshot_id: 데이터셋 스냅샷 고정 (기본값: 같은 조건의 최근 스냅샷)
+    - use_cache: 캐시된 결과 사용 여부 (기본값: true)
+    - refresh: 같은 조건의 스냅샷이 있어도 데이터 다시 로드 (기본값: false)
     """
     try:
         result = run_backtest(
@@ -335,7 +397,10 @@ async def backtest_get_endpoint(
             end_date=end_date,
             cash=cash,
             commission=commission,
-            svr=svr
+            svr=svr,
+            snapshot_id=snapshot_id,
+            use_cache=use_cache,
+            refresh=refresh
         )
         return {
             "success": True,
@@ -0,0 +1,24 @@
+"""
+시장 데이터 로컬 저장소
+
+KIS API 에서 받은 시세 데이터를 디스크에 보관해서 같은 구간을 다시 조회하지 않도록 합니다.
+"""
+
+from .ohlcv_store import OHLCVStore, get_store, set_store
+from .panel import Panel, build_panel
+from .universe import Universe, get_universe, set_universe
+from .trading_calendar import TradingCalendar, get_calendar, set_calendar
+from .resample import resample
+from .checkpoint import BackfillCheckpoint
+from .snapshot import ResultCache, SnapshotStore
+from .adjustments import ActionStore, adjust, adjust_panel, events_from_ksdinfo
+
+__all__ = [
+    'OHLCVStore', 'get_store', 'set_store',
+    'Panel', 'build_panel',
+    'Universe', 'get_universe', 'set_universe',
+    'TradingCalendar', 'get_calendar', 'set_calendar',
+    'resample', 'BackfillCheckpoint',
+    'SnapshotStore', 'ResultCache',
+    'ActionStore', 'adjust', 'adjust_panel', 'events_from_ksdinfo',
+]
@@ -0,0 +1,249 @@
+"""
+기업 행사(권리락, 액면분할, 무상/유상증자, 배당, 분할) 수정주가 계산
+
+원주가 봉은 한 번만 저장하고, 예탁원 기업 행사 정보(ksdinfo_*)로 만든 이벤트 목록에서
+날짜별 수정 계수를 계산해 필요할 때 곱합니다 (가격 × 계수, 거래량 ÷ 계수).
+새 기업 행사가 생기면 계수 열만 다시 계산하면 되고 과거 봉을 다시 받을 필요가 없습니다.
+
+이벤트 (DataFrame 한 행):
+  - code: 종목코드
+  - ex_date: 권리락/배당락/변경상장일 (이 날짜 전 봉에 계수 적용)
+  - kind: split, bonus, rights, stock_dividend, cash_dividend, spinoff
+  - ratio: split 은 변경후/변경전 액면가, bonus/rights/stock_dividend 는 1주당 배정 주식수, spinoff 는 존속 비율
+  - price: rights 는 발행가, cash_dividend 는 주당 배당금
+
+Example:
+    >>> events = events_from_ksdinfo("split", ksdinfo_rev_split("005930", "", "20180101", "20181231", "0"))
+    >>> adjusted = adjust(raw_df, events)
+"""
+import json
+import os
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .panel import Panel
+from .trading_calendar import get_calendar
+
+EVENT_COLUMNS = ["code", "ex_date", "kind", "ratio", "price"]
+
+# 종가 기준 계수가 필요한 이벤트 (권리락 전일 종가 사용)
+_PRICE_DEPENDENT = ("rights", "cash_dividend")
+
+
+def empty_events() -> pd.DataFrame:
+    return pd.DataFrame({
+        "code": pd.Series(dtype=object),
+        "ex_date": pd.Series(dtype="datetime64[ns]"),
+        "kind": pd.Series(dtype=object),
+        "ratio": pd.Series(dtype="f8"),
+        "price": pd.Series(dtype="f8"),
+    })
+
+
+def _to_date(s: pd.Series) -> pd.Series:
+    """YYYYMMDD / YYYY/MM/DD / datetime 값을 datetime 으로 (기간 문자열은 시작일)"""
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s
+    digits = s.astype(str).str.replace(r"\D", "", regex=True).str[:8]
+    return pd.to_datetime(digits, format="%Y%m%d", errors="coerce")
+
+
+def _to_number(s: pd.Series) -> pd.Series:
+    if pd.api.types.is_numeric_dtype(s):
+        return s.astype("f8")
+    return pd.to_numeric(s.astype(str).str.replace(",", "").str.strip(), errors="coerce")
+
+
+def _share_ratio(s: pd.Series) -> pd.Series:
+    """1주당 배정 주식수 (예탁원 배정율이 % 로 오는 경우 5 초과 값은 % 로 보고 환산)"""
+    r = _to_number(s)
+    return r.where(r <= 5, r / 100)
+
+
+def _previous_business_day(s: pd.Series) -> pd.Series:
+    return pd.Series(get_calendar().offset(s, -1), index=s.index)
+
+
+def events_from_ksdinfo(kind: str, df: pd.DataFrame) -> pd.DataFrame:
+    """
+    ksdinfo_* 조회 결과를 이벤트 목록으로 변환
+
+    Args:
+        kind: 조회 API 종류
+            - "split": ksdinfo_rev_split (액면교체)
+            - "bonus": ksdinfo_bonus_issue (무상증자)
+            - "rights": ksdinfo_paidin_capin (유상증자, 권리락이 있는 주주배정만)
+            - "merger": ksdinfo_merger_split (합병/분할, 분할 존속회사만 조정)
+            - "dividend": ksdinfo_dividend (주식배당 + 현금배당)
+        df: 조회 결과 DataFrame
+
+    Returns:
+        pd.DataFrame: EVENT_COLUMNS 이벤트 (계수 계산이 불가능한 행은 제외)
+    """
+    if df is None or df.empty:
+        return empty_events()
+
+    code = df["sht_cd"].astype(str).str.strip()
+    nan = pd.Series(np.nan, index=df.index)
+
+    if kind == "split":
+        ex_date = _to_date(df["list_dt"]).fillna(_to_date(df["record_date"]))
+        ratio = _to_number(df["inter_af_face_amt"]) / _to_number(df["inter_bf_face_amt"])
+        frames = [("split", ex_date, ratio, nan)]
+    elif kind == "bonus":
+        frames = [("bonus", _to_date(df["right_dt"]), _share_ratio(df["fix_rate"]), nan)]
+    elif kind == "rights":
+        frames = [("rights", _to_date(df["right_dt"]), _share_ratio(df["fix_rate"]), _to_number(df["fix_price"]))]
+    elif kind == "merger":
+        # 합병 존속회사는 주당 가치가 그대로라 조정하지 않고, 분할 존속회사만 분할 비율로 조정
+        spinoff = df["merge_type"].astype(str).str.contains("분할")
+        ratio = _to_number(df["merge_rate"]).where(spinoff)
+        ex_date = _to_date(df["list_dt"]).fillna(_to_date(df["record_date"]))
+        frames = [("spinoff", ex_date, ratio, nan)]
+    elif kind == "dividend":
+        # 배당락일 = 기준일 전 거래일
+        ex_date = _previous_business_day(_to_date(df["record_date"]))
+        frames = [
+            ("stock_dividend", ex_date, _to_number(df["stk_divi_rate"]) / 100, nan),
+            ("cash_dividend", ex_date, nan, _to_number(df["per_sto_divi_amt"])),
+        ]
+    else:
+        raise ValueError(f"unknown ksdinfo kind: {kind}")
+
+    events = pd.concat([
+        pd.DataFrame({"code": code, "ex_date": ex_date, "kind": k, "ratio": ratio, "price": price})
+        for k, ex_date, ratio, price in frames
+    ], ignore_index=True)
+
+    valid = events["ex_date"].notna() & events["code"].ne("")
+    valid &= np.where(events["kind"] == "cash_dividend", events["price"] > 0, events["ratio"] > 0)
+    valid &= ~((events["kind"] == "spinoff") & (events["ratio"] >= 1))
+    valid &= ~((events["kind"] == "split") & (events["ratio"] == 1))
+    return events[valid].drop_duplicates(subset=["code", "ex_date", "kind"]).reset_index(drop=True)
+
+
+def _event_factor(kind: str, ratio: float, price: float, prev_close: float) -> float:
+    """이벤트 하나의 수정 계수 (이벤트 전 가격에 곱함)"""
+    if kind == "split":
+        return ratio
+    if kind in ("bonus", "stock_dividend"):
+        return 1.0 / (1.0 + ratio)
+    if kind == "spinoff":
+        return ratio
+    if not prev_close > 0:
+        return 1.0
+    if kind == "rights":
+        # 이론 권리락 가격 = (전일 종가 + 배정율 × 발행가) / (1 + 배정율), 발행가가 더 높으면 조정 없음
+        return min(1.0, (prev_close + ratio * price) / ((1.0 + ratio) * prev_close))
+    if kind == "cash_dividend":
+        return max(0.0, 1.0 - price / prev_close)
+    return 1.0
+
+
+def factors(dates: pd.DatetimeIndex, closes: np.ndarray, events: pd.DataFrame,
+            include_cash_dividends: bool = False) -> np.ndarray:
+    """
+    날짜별 누적 수정 계수 (해당 날짜 이후의 모든 이벤트 계수의 곱)
+
+    Args:
+        dates: 봉 날짜 (오름차순)
+        closes: 같은 길이의 원주가 종가 (권리락 전일 종가가 필요한 이벤트용)
+        events: 한 종목의 이벤트
+        include_cash_dividends: True 면 현금배당도 조정 (총수익 기준)
+
+    Returns:
+        np.ndarray: float64 계수, 가격 × 계수 / 거래량 ÷ 계수
+    """
+    n = len(dates)
+    step = np.ones(n + 1)
+    if n == 0 or events is None or events.empty:
+        return step[1:]
+
+    if not include_cash_dividends:
+        events = events[events["kind"] != "cash_dividend"]
+    ex = pd.DatetimeIndex(events["ex_date"]).values
+    pos = np.searchsorted(np.asarray(dates.values), ex, side="left")  # ex_date 이상인 첫 봉
+
+    for p, kind, ratio, price in zip(pos, events["kind"], events["ratio"], events["price"]):
+        if p == 0 or p > n:
+            continue  # 데이터 구간 밖 이벤트 (첫 봉 이전에 적용할 봉이 없음)
+        if p == n and kind in _PRICE_DEPENDENT:
+            continue  # 권리락 이후 봉이 아직 없음
+        step[p] *= _event_factor(kind, ratio, price, closes[p - 1])
+
+    # factor[t] = t 보다 뒤(ex_date 이 t 이후)에 있는 이벤트 계수의 곱
+    return np.cumprod(step[::-1])[::-1][1:]
+
+
+def adjust(df: pd.DataFrame, events: pd.DataFrame, include_cash_dividends: bool = False) -> pd.DataFrame:
+    """원주가 OHLCV DataFrame → 수정주가 DataFrame (벡터 곱)"""
+    f = factors(df.index, df["Close"].to_numpy(dtype="f8"), events, include_cash_dividends)
+    result = df.copy()
+    for col in ("Open", "High", "Low", "Close"):
+        result[col] = df[col].to_numpy(dtype="f8") * f
+    result["Volume"] = df["Volume"].to_numpy(dtype="f8") / f
+    return result
+
+
+def adjust_panel(panel: Panel, events: pd.DataFrame, include_cash_dividends: bool = False) -> Panel:
+    """
+    원주가 Panel → 수정주가 Panel
+
+    종목별 계수 열을 (날짜, 종목) 행렬로 만든 뒤 가격 필드에 곱하고 거래량 필드를 나눕니다.
+    """
+    closes = panel.field("Close")
+    by_code: Dict[str, pd.DataFrame] = dict(tuple(events.groupby("code"))) if not events.empty else {}
+    f = np.ones((len(panel.dates), len(panel.symbols)))
+    for j, code in enumerate(panel.symbols):
+        if code in by_code:
+            present = panel.mask[:, j]
+            f[present, j] = factors(panel.dates[present], closes[present, j], by_code[code], include_cash_dividends)
+
+    values = panel.values.copy()
+    for name in ("Open", "High", "Low", "Close"):
+        if name in panel.fields:
+            values[panel.fields.index(name)] *= f
+    if "Volume" in panel.fields:
+        values[panel.fields.index("Volume")] /= f
+    return Panel(panel.fields, panel.dates, panel.symbols, values, panel.mask)
+
+
+class ActionStore:
+    """
+    전 종목 기업 행사 이벤트 파일
+
+    {root}/events.csv 에 이벤트를, coverage.json 에 조회해 둔 기준일 구간을 기록합니다.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def read(self) -> Tuple[pd.DataFrame, Optional[Tuple[date, date]]]:
+        """
+        Returns:
+            (이벤트, (시작일, 종료일)), 저장된 데이터가 없으면 (빈 이벤트, None)
+        """
+        try:
+            with open(os.path.join(self.root, "coverage.json"), encoding="utf-8") as f:
+                meta = json.load(f)
+            events = pd.read_csv(os.path.join(self.root, "events.csv"), dtype={"code": str, "kind": str},
+                                 parse_dates=["ex_date"])
+        except (OSError, ValueError):
+            return empty_events(), None
+        return events[EVENT_COLUMNS], (date.fromisoformat(meta["start"]), date.fromisoformat(meta["end"]))
+
+    def write(self, events: pd.DataFrame, coverage: Tuple[date, date]) -> None:
+        """이벤트와 조회 구간 저장 (임시 파일 + rename)"""
+        os.makedirs(self.root, exist_ok=True)
+        suffix = f".{os.getpid()}.tmp"
+        path = os.path.join(self.root, "events.csv")
+        events[EVENT_COLUMNS].to_csv(path + suffix, index=False)
+        os.replace(path + suffix, path)
+
+        path = os.path.join(self.root, "coverage.json")
+        with open(path + suffix, "w", encoding="utf-8") as f:
+            json.dump({"start": coverage[0].isoformat(), "end": coverage[1].isoformat()}, f)
+        os.replace(path + suffix, path)
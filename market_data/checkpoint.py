@@ -0,0 +1,54 @@
+"""
+백필 체크포인트 (종목, 날짜 단위)
+
+여러 날짜를 나눠 받는 백필 작업이 중간에 끊겨도 이미 받은 날짜를 다시 조회하지 않도록,
+하루치 봉을 받을 때마다 {root}/{종목코드}/{YYYYMMDD}.npy 로 저장해 둡니다 (임시 파일 + rename).
+파일이 있으면 그 날짜는 완료된 것이고, 종목 전체를 저장소에 합친 뒤 clear 로 지웁니다.
+"""
+import os
+import shutil
+import threading
+from datetime import date
+from typing import List
+
+import numpy as np
+
+
+class BackfillCheckpoint:
+    """종목/날짜별 백필 완료 기록 + 받은 봉 임시 보관"""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, code: str, day: date) -> str:
+        return os.path.join(self.root, code, day.strftime("%Y%m%d") + ".npy")
+
+    def done(self, code: str, day: date) -> bool:
+        return os.path.exists(self._path(code, day))
+
+    def days(self, code: str) -> List[date]:
+        """완료된 날짜 (오름차순)"""
+        try:
+            names = os.listdir(os.path.join(self.root, code))
+        except FileNotFoundError:
+            return []
+        return sorted(
+            date(int(n[:4]), int(n[4:6]), int(n[6:8]))
+            for n in names if n.endswith(".npy") and len(n) == 12 and n[:8].isdigit()
+        )
+
+    def save(self, code: str, day: date, bars: np.ndarray) -> None:
+        """하루치 봉 저장 (봉이 없는 날도 빈 배열로 기록해서 완료 처리)"""
+        path = self._path(code, day)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, bars)
+        os.replace(tmp, path)
+
+    def load(self, code: str, day: date) -> np.ndarray:
+        return np.load(self._path(code, day))
+
+    def clear(self, code: str) -> None:
+        """종목의 체크포인트 삭제 (저장소에 합친 뒤)"""
+        shutil.rmtree(os.path.join(self.root, code), ignore_errors=True)
@@ -0,0 +1,147 @@
+"""
+로컬 OHLCV 저장소
+
+(종목코드, 봉 주기, 수정주가 여부) 별로 봉 데이터를 NumPy 구조화 배열(.npy) 파일 하나에 날짜순으로 저장합니다.
+읽을 때는 memory-map 으로 열어서 필요한 구간만 잘라 DataFrame 으로 만듭니다.
+파일마다 API 로 받아 둔 날짜 구간(coverage)을 함께 기록해서, 휴장일처럼 봉이 없는 구간도 다시 조회하지 않습니다.
+
+저장 위치: {root}/{period}/{adj|raw}/{종목코드}.npy, .json
+1분봉(period "1")은 시각(분) 단위 레코드로 저장하고, 구간은 똑같이 날짜 단위로 관리합니다.
+"""
+import json
+import os
+import threading
+from datetime import date
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+
+# 봉 1개 레코드 (날짜 + OHLCV)
+BAR_DTYPE = np.dtype([("Date", "M8[D]")] + [(c, "f8") for c in COLUMNS])
+
+# 1분봉 레코드 (시각 + OHLCV)
+MINUTE_BAR_DTYPE = np.dtype([("Date", "M8[m]")] + [(c, "f8") for c in COLUMNS])
+
+
+def bar_dtype(period: str) -> np.dtype:
+    """봉 주기별 레코드 타입 (분봉은 시각 단위)"""
+    return MINUTE_BAR_DTYPE if period.isdigit() else BAR_DTYPE
+
+
+def to_bars(df: pd.DataFrame, dtype: np.dtype = BAR_DTYPE) -> np.ndarray:
+    """backtesting.py 형식 DataFrame (Date 인덱스, OHLCV 컬럼) → 구조화 배열 (날짜순)"""
+    bars = np.empty(len(df), dtype=dtype)
+    bars["Date"] = df.index.values.astype(dtype["Date"])
+    for col in COLUMNS:
+        bars[col] = df[col].to_numpy(dtype="f8")
+    return np.sort(bars, order="Date", kind="stable")
+
+
+def to_frame(bars: np.ndarray) -> pd.DataFrame:
+    """구조화 배열 → backtesting.py 형식 DataFrame (memory-map 에서 복사)"""
+    df = pd.DataFrame({col: np.array(bars[col]) for col in COLUMNS})
+    df.index = pd.DatetimeIndex(bars["Date"].astype("M8[ns]"), name="Date")
+    return df
+
+
+def _day_bounds(bars: np.ndarray, start: date, end: date) -> tuple:
+    """start 일 0시, end 다음날 0시 (분봉도 end 일의 봉까지 포함되도록)"""
+    unit = bars.dtype["Date"]
+    return np.datetime64(start, "D").astype(unit), (np.datetime64(end, "D") + np.timedelta64(1, "D")).astype(unit)
+
+
+def merge_bars(bars: np.ndarray, new: np.ndarray, start: date, end: date) -> np.ndarray:
+    """start ~ end 구간을 새로 받은 봉으로 교체 (구간 밖의 기존 봉은 유지)"""
+    d = bars["Date"]
+    lo, hi = _day_bounds(bars, start, end)
+    keep = bars[(d < lo) | (d >= hi)]
+    return np.sort(np.concatenate([keep, new.astype(bars.dtype)]), order="Date", kind="stable")
+
+
+def slice_bars(bars: np.ndarray, start: date, end: date) -> np.ndarray:
+    """날짜순 배열에서 start ~ end 구간 (이진 탐색)"""
+    d = bars["Date"]
+    lo, hi = _day_bounds(bars, start, end)
+    return bars[np.searchsorted(d, lo, side="left"):np.searchsorted(d, hi, side="left")]
+
+
+class OHLCVStore:
+    """종목별 봉 데이터 파일 저장소 (프로세스 내 종목별 잠금, 파일은 임시 파일 + rename 으로 원자적 교체)"""
+
+    def __init__(self, root: str):
+        self.root = root
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+
+    def _base(self, code: str, period: str, adjusted: bool) -> str:
+        return os.path.join(self.root, period, "adj" if adjusted else "raw", code)
+
+    def lock(self, code: str, period: str, adjusted: bool) -> threading.Lock:
+        """같은 종목 동시 동기화 방지용 잠금"""
+        key = (code, period, adjusted)
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def read(self, code: str, period: str, adjusted: bool) -> Tuple[Optional[np.ndarray], Optional[Tuple[date, date]]]:
+        """
+        저장된 봉 배열(memory-map)과 받아 둔 날짜 구간
+
+        Returns:
+            (bars, (start, end)), 저장된 데이터가 없으면 (None, None)
+        """
+        base = self._base(code, period, adjusted)
+        try:
+            with open(base + ".json", encoding="utf-8") as f:
+                meta = json.load(f)
+            bars = np.load(base + ".npy", mmap_mode="r")
+        except (OSError, ValueError):
+            return None, None
+        if bars.dtype != bar_dtype(period):
+            return None, None
+        return bars, (date.fromisoformat(meta["start"]), date.fromisoformat(meta["end"]))
+
+    def write(self, code: str, period: str, adjusted: bool, bars: np.ndarray, coverage: Tuple[date, date]) -> None:
+        """봉 배열과 받아 둔 날짜 구간 저장 (배열 → 구간 순서로 교체해서 구간이 배열보다 앞서지 않게)"""
+        base = self._base(code, period, adjusted)
+        os.makedirs(os.path.dirname(base), exist_ok=True)
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+
+        with open(base + ".npy" + suffix, "wb") as f:
+            np.save(f, np.ascontiguousarray(bars, dtype=bar_dtype(period)))
+        os.replace(base + ".npy" + suffix, base + ".npy")
+
+        with open(base + ".json" + suffix, "w", encoding="utf-8") as f:
+            json.dump({"start": coverage[0].isoformat(), "end": coverage[1].isoformat()}, f)
+        os.replace(base + ".json" + suffix, base + ".json")
+
+    def delete(self, code: str, period: str, adjusted: bool) -> None:
+        base = self._base(code, period, adjusted)
+        for ext in (".json", ".npy"):
+            try:
+                os.remove(base + ext)
+            except FileNotFoundError:
+                pass
+
+
+# 기본 저장소 (처음 사용할 때 settings 로 생성, OHLCV_STORE=false 면 None → 저장소 없이 항상 API 조회)
+_UNSET = object()
+_store = _UNSET
+
+
+def get_store() -> Optional[OHLCVStore]:
+    global _store
+    if _store is _UNSET:
+        # settings 는 환경 변수 검증을 하므로 패널 등 저장소를 쓰지 않는 import 에서는 읽지 않음
+        from settings import settings
+        root = settings.ohlcv_store_dir or os.path.join(os.path.expanduser("~"), "KIS", "ohlcv")
+        _store = OHLCVStore(root) if settings.ohlcv_store else None
+    return _store
+
+
+def set_store(store: Optional[OHLCVStore]) -> None:
+    """기본 저장소 교체 (None 이면 저장소 사용 안 함)"""
+    global _store
+    _store = store
@@ -0,0 +1,120 @@
+"""
+여러 종목 시세 패널 (필드 × 날짜 × 종목)
+
+종목별 OHLCV DataFrame 을 하나의 날짜 인덱스에 맞춘 연속된 NumPy 3차원 배열로 묶습니다.
+봉이 없는 자리는 NaN 으로 채우고 mask 로 표시하므로, 전략/스캐너/백테스트에서
+종목마다 날짜를 다시 맞출 필요가 없습니다.
+
+Example:
+    >>> panel = build_panel({"233740": df1, "251340": df2})
+    >>> closes = panel.field("Close")      # (날짜, 종목) 2차원 배열
+    >>> common = panel.common()            # 모든 종목에 봉이 있는 날짜만
+    >>> common.frame("Close")              # 날짜 × 종목 DataFrame
+"""
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .ohlcv_store import COLUMNS
+
+
+class Panel:
+    """
+    날짜 정렬된 여러 종목 시세
+
+    Attributes:
+        fields: 필드 이름 (Open, High, Low, Close, Volume ...)
+        dates: 공통 날짜 인덱스 (오름차순)
+        symbols: 종목 코드
+        values: (필드, 날짜, 종목) float64 C-연속 배열, 봉이 없으면 NaN
+        mask: (날짜, 종목) bool 배열, 봉이 있으면 True
+    """
+
+    __slots__ = ("fields", "dates", "symbols", "values", "mask", "_field_pos", "_symbol_pos")
+
+    def __init__(self, fields, dates, symbols, values, mask):
+        self.fields = tuple(fields)
+        self.dates = pd.DatetimeIndex(dates, name="Date")
+        self.symbols = tuple(symbols)
+        self.values = np.ascontiguousarray(values, dtype="f8")
+        self.mask = np.ascontiguousarray(mask, dtype=bool)
+        self._field_pos = {f: i for i, f in enumerate(self.fields)}
+        self._symbol_pos = {s: i for i, s in enumerate(self.symbols)}
+
+        expected = (len(self.fields), len(self.dates), len(self.symbols))
+        if self.values.shape != expected or self.mask.shape != expected[1:]:
+            raise ValueError(f"panel shape mismatch: values {self.values.shape}, mask {self.mask.shape}, expected {expected}")
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def __len__(self):
+        return len(self.dates)
+
+    def __repr__(self):
+        return f"Panel(fields={len(self.fields)}, dates={len(self.dates)}, symbols={len(self.symbols)})"
+
+    def field(self, name: str) -> np.ndarray:
+        """필드 하나의 (날짜, 종목) 배열 (복사 없는 view)"""
+        return self.values[self._field_pos[name]]
+
+    def frame(self, name: str) -> pd.DataFrame:
+        """필드 하나의 날짜 × 종목 DataFrame"""
+        return pd.DataFrame(self.field(name), index=self.dates, columns=list(self.symbols), copy=False)
+
+    def symbol(self, code: str, dropna: bool = True) -> pd.DataFrame:
+        """종목 하나의 backtesting.py 형식 DataFrame (dropna=True 면 봉이 있는 날짜만)"""
+        j = self._symbol_pos[code]
+        df = pd.DataFrame(self.values[:, :, j].T, index=self.dates, columns=list(self.fields))
+        return df[self.mask[:, j]] if dropna else df
+
+    def take(self, rows) -> "Panel":
+        """날짜 위치(bool 배열 또는 정수 배열)로 고른 패널"""
+        return Panel(self.fields, self.dates[rows], self.symbols, self.values[:, rows], self.mask[rows])
+
+    def common(self) -> "Panel":
+        """모든 종목에 봉이 있는 날짜만 남긴 패널"""
+        return self.take(self.mask.all(axis=1))
+
+    def between(self, start, end) -> "Panel":
+        """start ~ end 날짜 구간 패널"""
+        lo, hi = self.dates.searchsorted(pd.Timestamp(start), "left"), self.dates.searchsorted(pd.Timestamp(end), "right")
+        return self.take(slice(lo, hi))
+
+
+def build_panel(
+    frames: Dict[str, pd.DataFrame],
+    fields: Optional[Sequence[str]] = None,
+    how: str = "outer"
+) -> Panel:
+    """
+    종목별 DataFrame 을 패널로 묶기
+
+    Args:
+        frames: {종목코드: 날짜 인덱스 DataFrame}
+        fields: 담을 컬럼 (기본: Open, High, Low, Close, Volume)
+        how: "outer" 면 날짜 합집합 (없는 봉은 NaN + mask False), "inner" 면 모든 종목에 있는 날짜만
+
+    Returns:
+        Panel
+    """
+    fields = tuple(fields or COLUMNS)
+    symbols = list(frames)
+    indexes = [pd.DatetimeIndex(df.index).values for df in frames.values()]
+    dates = np.unique(np.concatenate(indexes)) if indexes else np.array([], dtype="M8[ns]")
+
+    values = np.full((len(fields), len(dates), len(symbols)), np.nan)
+    mask = np.zeros((len(dates), len(symbols)), dtype=bool)
+    for j, (df, index) in enumerate(zip(frames.values(), indexes)):
+        rows = np.searchsorted(dates, index)
+        mask[rows, j] = True
+        values[:, rows, j] = df[list(fields)].to_numpy(dtype="f8").T
+
+    panel = Panel(fields, dates, symbols, values, mask)
+    if how == "inner":
+        return panel.common()
+    if how != "outer":
+        raise ValueError(f"how must be 'outer' or 'inner': {how}")
+    return panel
@@ -0,0 +1,68 @@
+"""
+1분봉 → N분봉 리샘플링
+
+같은 날 장 시작 시각부터 N분 단위로 구간을 나눠 OHLCV 를 합칩니다 (벡터 연산, 정렬된 1분봉 기준).
+  - 구간은 날짜를 넘지 않고 매일 장 시작(09:00)에 맞춰 다시 시작 (KRX 정규장은 점심 휴장이 없어 이어지는 구간)
+  - 장 마감 동시호가 체결(15:30 봉)은 마감 전 마지막 구간에 포함
+  - 장 시작 전 / 마감 후 시간외 봉은 제외
+  - 봉 시각은 구간 시작 시각 (09:00, 09:05, ...)
+
+Example:
+    >>> df_5 = resample(minute_df, 5)
+    >>> df_60 = resample(minute_df, 60)  # 09:00, 10:00, ..., 15:00 (15:00 ~ 15:30)
+"""
+from datetime import time
+
+import numpy as np
+import pandas as pd
+
+from .ohlcv_store import COLUMNS
+from .trading_calendar import DEFAULT_CLOSE, DEFAULT_OPEN
+
+
+def _minutes(t: time) -> int:
+    return t.hour * 60 + t.minute
+
+
+def resample(df: pd.DataFrame, minutes: int, open_time: time = DEFAULT_OPEN,
+             close_time: time = DEFAULT_CLOSE) -> pd.DataFrame:
+    """
+    1분봉 DataFrame → minutes 분봉 DataFrame
+
+    Args:
+        df: backtesting.py 형식 1분봉 (시각 인덱스 오름차순, OHLCV 컬럼)
+        minutes: 봉 주기 (분)
+        open_time, close_time: 정규장 시작 / 마감 시각
+
+    Returns:
+        pd.DataFrame: 같은 형식의 N분봉 (봉이 하나도 없는 구간은 만들지 않음)
+    """
+    if minutes < 1:
+        raise ValueError(f"minutes must be positive: {minutes}")
+
+    ts = df.index.values.astype("M8[m]")
+    day = ts.astype("M8[D]")
+    minute = (ts - day).astype("i8")
+    start, end = _minutes(open_time), _minutes(close_time)
+
+    inside = (minute >= start) & (minute <= end)
+    last_bucket = (end - start - 1) // minutes * minutes  # 마감 직전 구간 (마감 봉 포함)
+    bucket = np.minimum((minute - start) // minutes * minutes, last_bucket)
+    key = (day.astype("M8[m]") + (start + bucket).astype("m8[m]"))[inside]
+
+    if len(key) == 0:
+        return pd.DataFrame({col: pd.Series(dtype="f8") for col in COLUMNS},
+                            index=pd.DatetimeIndex([], name=df.index.name))
+
+    # 정렬된 구간 키가 바뀌는 위치로 묶어서 reduceat
+    starts = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+    ends = np.r_[starts[1:], len(key)] - 1
+    values = {col: df[col].to_numpy(dtype="f8")[inside] for col in COLUMNS}
+    result = pd.DataFrame({
+        "Open": values["Open"][starts],
+        "High": np.maximum.reduceat(values["High"], starts),
+        "Low": np.minimum.reduceat(values["Low"], starts),
+        "Close": values["Close"][ends],
+        "Volume": np.add.reduceat(values["Volume"], starts),
+    }, index=pd.DatetimeIndex(key[starts].astype("M8[ns]"), name=df.index.name))
+    return result
@@ -0,0 +1,209 @@
+"""
+데이터셋 스냅샷 + 백테스트 결과 캐시
+
+백테스트에 쓴 시세 패널을 내용 해시(ID)로 저장해 두고 다시 바꾸지 않습니다.
+  - 스냅샷 ID: 조건(종목, 구간, 봉 주기, 수정주가 여부)과 패널 데이터 전체의 SHA-256 앞 16자리
+    → 같은 조건이라도 데이터가 다르면(수정주가 재계산 등) 다른 ID
+  - 조건별 최신 스냅샷을 refs 에 기록해서, 같은 조건으로 다시 실행하면 API 조회 없이 같은 데이터 사용
+  - 결과 캐시 키: (전략, 파라미터, 스냅샷 ID) → 같은 키면 다시 계산하지 않고, 전략/파라미터별 결과 비교
+
+저장 위치:
+  {root}/data/{스냅샷 ID}/meta.json, panel.npz
+  {root}/refs/{조건 해시}
+  {root}/results/{결과 키}.json
+
+Example:
+    >>> snapshots = SnapshotStore(root)
+    >>> sid = snapshots.save(panel, {"symbols": codes, "start": "20200101", "end": "20241231",
+    ...                              "period": "D", "adjusted": True})
+    >>> panel = snapshots.load(sid)
+    >>> cache = ResultCache(root)
+    >>> cache.get("BalloonTheoryStrategy", params, sid) or cache.put("BalloonTheoryStrategy", params, sid, result)
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .panel import Panel
+
+ID_LENGTH = 16
+
+_ID_PATTERN = re.compile(f"[0-9a-f]{{{ID_LENGTH}}}")
+
+
+def is_snapshot_id(value: Any) -> bool:
+    """스냅샷 ID 형식 (소문자 16진수 ID_LENGTH 자리) 인지"""
+    return isinstance(value, str) and _ID_PATTERN.fullmatch(value) is not None
+
+
+def _canonical(value: Any) -> bytes:
+    """키 순서와 관계없이 같은 값이면 같은 JSON 바이트"""
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def spec_key(spec: Dict[str, Any]) -> str:
+    """스냅샷 조건 해시"""
+    return hashlib.sha256(_canonical(spec)).hexdigest()[:ID_LENGTH]
+
+
+def panel_digest(panel: Panel, spec: Dict[str, Any]) -> str:
+    """조건 + 패널 내용 해시 (스냅샷 ID)"""
+    h = hashlib.sha256(_canonical(spec))
+    h.update(_canonical([list(panel.fields), list(panel.symbols)]))
+    h.update(np.ascontiguousarray(panel.dates.values.astype("M8[ns]")).tobytes())
+    h.update(panel.values.tobytes())
+    h.update(panel.mask.tobytes())
+    return h.hexdigest()[:ID_LENGTH]
+
+
+def _write_json(path: str, value: Any) -> None:
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(value, f, ensure_ascii=False, default=str)
+    os.replace(tmp, path)
+
+
+class SnapshotStore:
+    """내용 주소 기반 패널 스냅샷 저장소 (저장한 스냅샷은 바뀌지 않음)"""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _dir(self, snapshot_id: str) -> str:
+        # 외부(API 요청)에서 받은 ID 가 저장소 밖 경로를 가리키지 않도록 형식 검사
+        if not is_snapshot_id(snapshot_id):
+            raise ValueError(f"invalid snapshot id: {snapshot_id!r}")
+        return os.path.join(self.root, "data", snapshot_id)
+
+    def exists(self, snapshot_id: str) -> bool:
+        return os.path.exists(os.path.join(self._dir(snapshot_id), "meta.json"))
+
+    def save(self, panel: Panel, spec: Dict[str, Any]) -> str:
+        """
+        패널 저장 후 스냅샷 ID 반환 (같은 내용이 이미 있으면 그대로 사용), 조건별 최신 스냅샷 갱신
+
+        Args:
+            panel: 저장할 패널
+            spec: 조건 (symbols, start, end, period, adjusted)
+        """
+        snapshot_id = panel_digest(panel, spec)
+        target = self._dir(snapshot_id)
+        if not self.exists(snapshot_id):
+            # 임시 폴더에 다 쓴 뒤 rename 해서 읽는 쪽이 쓰는 중인 스냅샷을 보지 않도록
+            tmp = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+            os.makedirs(tmp, exist_ok=True)
+            np.savez(
+                os.path.join(tmp, "panel.npz"),
+                fields=np.array(panel.fields),
+                symbols=np.array(panel.symbols),
+                dates=panel.dates.values.astype("M8[ns]"),
+                values=panel.values,
+                mask=panel.mask,
+            )
+            _write_json(os.path.join(tmp, "meta.json"), {
+                "id": snapshot_id,
+                "spec": spec,
+                "shape": list(panel.shape),
+                "created": datetime.now().isoformat(timespec="seconds"),
+            })
+            try:
+                os.rename(tmp, target)
+            except OSError:  # 다른 프로세스가 같은 스냅샷을 먼저 저장
+                shutil.rmtree(tmp, ignore_errors=True)
+
+        refs = os.path.join(self.root, "refs")
+        os.makedirs(refs, exist_ok=True)
+        _write_json(os.path.join(refs, spec_key(spec)), snapshot_id)
+        return snapshot_id
+
+    def load(self, snapshot_id: str) -> Panel:
+        """
+        Raises:
+            KeyError: 없는 스냅샷 ID
+            ValueError: 스냅샷 ID 형식이 아님 (소문자 16진수 16자리)
+        """
+        if not self.exists(snapshot_id):
+            raise KeyError(f"snapshot not found: {snapshot_id}")
+        with np.load(os.path.join(self._dir(snapshot_id), "panel.npz")) as data:
+            return Panel(
+                [str(f) for f in data["fields"]], data["dates"], [str(s) for s in data["symbols"]],
+                data["values"], data["mask"],
+            )
+
+    def meta(self, snapshot_id: str) -> Dict[str, Any]:
+        with open(os.path.join(self._dir(snapshot_id), "meta.json"), encoding="utf-8") as f:
+            return json.load(f)
+
+    def latest(self, spec: Dict[str, Any]) -> Optional[str]:
+        """조건으로 마지막에 저장한 스냅샷 ID (없으면 None)"""
+        try:
+            with open(os.path.join(self.root, "refs", spec_key(spec)), encoding="utf-8") as f:
+                snapshot_id = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return snapshot_id if is_snapshot_id(snapshot_id) and self.exists(snapshot_id) else None
+
+
+class ResultCache:
+    """(전략, 파라미터, 스냅샷 ID) → 백테스트 결과 (JSON)"""
+
+    def __init__(self, root: str):
+        self.root = os.path.join(root, "results")
+
+    @staticmethod
+    def key(strategy: str, params: Dict[str, Any], snapshot_id: str) -> str:
+        return hashlib.sha256(_canonical([strategy, params, snapshot_id])).hexdigest()[:ID_LENGTH]
+
+    def get(self, strategy: str, params: Dict[str, Any], snapshot_id: str) -> Optional[Any]:
+        """캐시된 결과 (없으면 None)"""
+        try:
+            with open(os.path.join(self.root, self.key(strategy, params, snapshot_id) + ".json"), encoding="utf-8") as f:
+                return json.load(f)["result"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, strategy: str, params: Dict[str, Any], snapshot_id: str, result: Any) -> Any:
+        """결과 저장 후 그대로 반환"""
+        os.makedirs(self.root, exist_ok=True)
+        _write_json(os.path.join(self.root, self.key(strategy, params, snapshot_id) + ".json"), {
+            "strategy": strategy,
+            "params": params,
+            "snapshot_id": snapshot_id,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "result": result,
+        })
+        return result
+
+    def entries(self, strategy: Optional[str] = None, snapshot_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        캐시된 결과 목록 (전략 / 스냅샷으로 거름), 파라미터별 결과 비교용
+
+        Returns:
+            [{"strategy", "params", "snapshot_id", "created", "result"}, ...] (저장 시각순)
+        """
+        try:
+            names = os.listdir(self.root)
+        except FileNotFoundError:
+            return []
+        entries = []
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.root, name), encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if strategy is not None and entry.get("strategy") != strategy:
+                continue
+            if snapshot_id is not None and entry.get("snapshot_id") != snapshot_id:
+                continue
+            entries.append(entry)
+        return sorted(entries, key=lambda e: e.get("created", ""))
@@ -0,0 +1,226 @@
+"""
+거래일 달력 (국내 주식시장 개장일 / 장 운영 시간)
+
+국내휴장일조회(chk_holiday) 결과 중 평일 휴장일만 저장해 두고 numpy 영업일 달력
+(np.busdaycalendar)으로 거래일 여부, 구간 거래일 수, 이전/다음 거래일을 계산합니다.
+  - is_trading_day / previous_session / next_session: O(log 휴장일 수)
+  - trading_days(A, B): 구간 길이만큼의 벡터 연산
+조회해 둔 구간(coverage) 밖의 날짜는 주말만 휴장일로 봅니다.
+
+저장 위치: {path} (JSON, start / end / holidays / open / close)
+
+Example:
+    >>> cal = get_calendar()
+    >>> cal.trading_days("2024-01-01", "2024-01-31")
+    >>> cal.previous_session(date.today())
+    >>> cal.is_open()
+"""
+import json
+import os
+import threading
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# 한국 표준시 (서버 시간대와 관계없이 장 운영 시간 판단)
+KST = timezone(timedelta(hours=9), "KST")
+
+# 정규장 기본 운영 시간 (market_time 조회 전)
+DEFAULT_OPEN = time(9, 0)
+DEFAULT_CLOSE = time(15, 30)
+
+
+def _day(value) -> np.datetime64:
+    return np.datetime64(pd.Timestamp(value).date(), "D")
+
+
+def _parse_time(value) -> Optional[time]:
+    """HHMM / HHMMSS 문자열 → time (형식이 다르면 None)"""
+    digits = "".join(ch for ch in str(value) if ch.isdigit())
+    if len(digits) not in (4, 6):
+        return None
+    try:
+        return time(int(digits[:2]), int(digits[2:4]))
+    except ValueError:
+        return None
+
+
+class TradingCalendar:
+    """
+    국내 주식시장 거래일 달력
+
+    Args:
+        path: 저장 파일 경로 (None 이면 메모리에만 보관)
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._holidays = np.array([], dtype="M8[D]")
+        self._coverage: Optional[Tuple[date, date]] = None
+        self.open_time = DEFAULT_OPEN
+        self.close_time = DEFAULT_CLOSE
+        self._load()
+        self._busdays = np.busdaycalendar(holidays=self._holidays)
+
+    def _load(self) -> None:
+        if not self.path:
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return
+        self._holidays = np.array(meta.get("holidays", []), dtype="M8[D]")
+        self._coverage = (date.fromisoformat(meta["start"]), date.fromisoformat(meta["end"]))
+        self.open_time = _parse_time(meta.get("open")) or DEFAULT_OPEN
+        self.close_time = _parse_time(meta.get("close")) or DEFAULT_CLOSE
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({
+                "start": self._coverage[0].isoformat(),
+                "end": self._coverage[1].isoformat(),
+                "holidays": [str(d) for d in self._holidays],
+                "open": self.open_time.strftime("%H%M"),
+                "close": self.close_time.strftime("%H%M"),
+            }, f)
+        os.replace(tmp, self.path)
+
+    @property
+    def coverage(self) -> Optional[Tuple[date, date]]:
+        """휴장일을 조회해 둔 구간 (없으면 None)"""
+        return self._coverage
+
+    @property
+    def holidays(self) -> pd.DatetimeIndex:
+        """평일 휴장일"""
+        return pd.DatetimeIndex(self._holidays)
+
+    def missing(self, start: date, end: date) -> list:
+        """start ~ end 중 조회해 둔 구간 밖 (이어지도록 조회 구간 뒤쪽은 종료일 다음날부터)"""
+        if self._coverage is None:
+            return [(start, end)] if start <= end else []
+        lo, hi = self._coverage
+        ranges = []
+        if start < lo:
+            ranges.append((start, lo - timedelta(days=1)))
+        if end > hi:
+            ranges.append((hi + timedelta(days=1), end))
+        return ranges
+
+    def update(self, days: Dict[date, bool], start: date, end: date) -> None:
+        """
+        start ~ end 의 개장 여부를 반영하고 저장
+
+        Args:
+            days: {날짜: 개장일 여부}, 없는 평일은 개장일로 봄
+            start, end: 조회한 구간 (기존 구간과 이어져야 함)
+        """
+        closed = np.array(
+            [_day(d) for d, is_open in days.items() if not is_open and start <= pd.Timestamp(d).date() <= end],
+            dtype="M8[D]",
+        )
+        with self._lock:
+            keep = self._holidays[(self._holidays < _day(start)) | (self._holidays > _day(end))]
+            holidays = np.union1d(keep, closed)
+            # busdaycalendar 는 주말 휴장일을 무시하므로 평일만 보관
+            self._holidays = holidays[np.is_busday(holidays)]
+            if self._coverage is None:
+                self._coverage = (start, end)
+            else:
+                self._coverage = (min(start, self._coverage[0]), max(end, self._coverage[1]))
+            self._busdays = np.busdaycalendar(holidays=self._holidays)
+            self._save()
+
+    def set_session(self, open_time, close_time) -> None:
+        """장 운영 시간 변경 (HHMM / HHMMSS, 형식이 다르면 그대로 둠)"""
+        with self._lock:
+            self.open_time = _parse_time(open_time) or self.open_time
+            self.close_time = _parse_time(close_time) or self.close_time
+            if self._coverage is not None:
+                self._save()
+
+    def is_trading_day(self, day) -> bool:
+        return bool(np.is_busday(_day(day), busdaycal=self._busdays))
+
+    def trading_days(self, start, end) -> pd.DatetimeIndex:
+        """start ~ end (양끝 포함) 거래일"""
+        lo, hi = _day(start), _day(end)
+        if lo > hi:
+            return pd.DatetimeIndex([])
+        days = np.arange(lo, hi + np.timedelta64(1, "D"))
+        return pd.DatetimeIndex(days[np.is_busday(days, busdaycal=self._busdays)])
+
+    def count(self, start, end) -> int:
+        """start ~ end (양끝 포함) 거래일 수"""
+        lo, hi = _day(start), _day(end)
+        if lo > hi:
+            return 0
+        return int(np.busday_count(lo, hi + np.timedelta64(1, "D"), busdaycal=self._busdays))
+
+    def offset(self, days, n: int):
+        """
+        n 거래일 뒤(음수면 앞) 날짜 (벡터 가능)
+
+        day 가 휴장일이면 n < 0 은 다음 거래일, n > 0 은 이전 거래일 기준으로 세므로
+        offset(day, -1) 은 항상 day 보다 앞선 가장 최근 거래일입니다.
+        """
+        roll = "forward" if n < 0 else "backward"
+        if np.ndim(days) == 0:
+            return np.busday_offset(_day(days), n, roll=roll, busdaycal=self._busdays).item()
+        values = pd.DatetimeIndex(days).values.astype("M8[D]")
+        shifted = np.busday_offset(values, n, roll=roll, busdaycal=self._busdays)
+        return pd.DatetimeIndex(shifted.astype("M8[ns]"))
+
+    def previous_session(self, day=None) -> date:
+        """day 이전 가장 최근 거래일 (기본: 오늘)"""
+        return self.offset(day or self.now().date(), -1)
+
+    def next_session(self, day=None) -> date:
+        """day 다음 첫 거래일 (기본: 오늘)"""
+        return self.offset(day or self.now().date(), 1)
+
+    @staticmethod
+    def now() -> datetime:
+        return datetime.now(KST)
+
+    def is_open(self, now: Optional[datetime] = None) -> bool:
+        """정규장 운영 중인지 (now 가 시간대 없는 값이면 한국 시간으로 봄)"""
+        now = now or self.now()
+        if now.tzinfo is not None:
+            now = now.astimezone(KST)
+        return self.is_trading_day(now.date()) and self.open_time <= now.time() < self.close_time
+
+    def is_closed(self, now: Optional[datetime] = None) -> bool:
+        """거래일 정규장이 마감됐는지 (휴장일이면 False, now 가 시간대 없는 값이면 한국 시간으로 봄)"""
+        now = now or self.now()
+        if now.tzinfo is not None:
+            now = now.astimezone(KST)
+        return self.is_trading_day(now.date()) and now.time() >= self.close_time
+
+
+# 기본 달력 (처음 사용할 때 settings 로 생성)
+_calendar = None
+
+
+def get_calendar() -> TradingCalendar:
+    global _calendar
+    if _calendar is None:
+        from settings import settings
+        _calendar = TradingCalendar(
+            settings.calendar_file or os.path.join(os.path.expanduser("~"), "KIS", "calendar.json")
+        )
+    return _calendar
+
+
+def set_calendar(calendar: Optional[TradingCalendar]) -> None:
+    """기본 달력 교체 (None 이면 다음 사용 때 settings 로 다시 생성)"""
+    global _calendar
+    _calendar = calendar
@@ -0,0 +1,269 @@
+"""
+전 종목 일봉 유니버스 (memory-map, append-only)
+
+상장 종목 전체의 일봉을 필드별 고정폭 배열 파일에 날짜 한 행씩 이어서 저장합니다.
+  - 행: 날짜 (오름차순, 하루치 추가 = 파일 끝에 한 행 추가)
+  - 열: 종목 (codes.json 의 순서로 고정된 종목코드 → 열 번호, 새 종목은 빈 열에 배정)
+  - 가격: float32 (봉이 없으면 NaN), 거래량: int64 (봉이 없으면 0)
+여러 프로세스가 np.memmap 으로 복사 없이 읽을 수 있고, 쓰기는 파일 잠금으로 한 프로세스씩 진행합니다.
+날짜 파일을 가장 마지막에 늘리므로 읽는 쪽은 날짜 수만큼의 행만 보게 되어 쓰는 중인 행을 읽지 않습니다.
+
+저장 위치: {root}/meta.json, dates.M8, open.f4, high.f4, low.f4, close.f4, volume.i8
+"""
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .panel import Panel
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스간 잠금 없이 스레드 잠금만 사용
+    fcntl = None
+
+# (필드, 파일 dtype)
+FIELDS = (
+    ("Open", np.dtype("f4")),
+    ("High", np.dtype("f4")),
+    ("Low", np.dtype("f4")),
+    ("Close", np.dtype("f4")),
+    ("Volume", np.dtype("i8")),
+)
+_FIELD_DTYPES = dict(FIELDS)
+_DATE_DTYPE = np.dtype("M8[D]")
+
+# 기본 종목 열 수 (KOSPI + KOSDAQ 상장 종목 약 2,500개 + 신규 상장 여유)
+DEFAULT_CAPACITY = 4096
+
+
+def _missing(dtype: np.dtype):
+    return np.nan if dtype.kind == "f" else 0
+
+
+class Universe:
+    """
+    전 종목 일봉 memory-map 파일
+
+    Example:
+        >>> u = Universe("/data/universe")
+        >>> closes = u.field("Close")           # (날짜, capacity) memmap, 복사 없음
+        >>> closes[:, u.index("005930")]
+        >>> u.append("2024-12-30", bars)        # bars: 종목코드 인덱스, OHLCV 컬럼 DataFrame
+    """
+
+    def __init__(self, root: str, capacity: int = DEFAULT_CAPACITY):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._lock = threading.Lock()
+        self._meta_mtime = None
+        self._codes = []
+        self._index = {}
+        self.capacity = capacity
+
+        meta = self._path("meta.json")
+        if os.path.exists(meta):
+            self._load_meta()
+        else:
+            with self._write_lock():
+                if not os.path.exists(meta):
+                    self._save_meta([])
+                self._load_meta()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.root, name)
+
+    def _file(self, field: str) -> str:
+        return self._path(f"{field.lower()}.{_FIELD_DTYPES[field].str[1:]}")
+
+    # ---- 메타데이터 (종목코드 → 열 번호)
+
+    def _load_meta(self):
+        path = self._path("meta.json")
+        mtime = os.stat(path).st_mtime_ns
+        if mtime == self._meta_mtime:
+            return
+        with open(path, encoding="utf-8") as f:
+            meta = json.load(f)
+        self.capacity = meta["capacity"]
+        self._codes = meta["codes"]
+        self._index = {code: i for i, code in enumerate(self._codes)}
+        self._meta_mtime = mtime
+
+    def _save_meta(self, codes):
+        tmp = self._path(f"meta.json.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"capacity": self.capacity, "codes": list(codes)}, f)
+        os.replace(tmp, self._path("meta.json"))
+
+    @contextmanager
+    def _write_lock(self):
+        """쓰기 잠금 (같은 프로세스는 스레드 잠금, 다른 프로세스는 파일 잠금)"""
+        with self._lock:
+            fd = os.open(self._path("lock"), os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                os.close(fd)  # 닫으면 flock 도 해제
+
+    @property
+    def codes(self) -> list:
+        """열 순서의 종목코드"""
+        self._load_meta()
+        return list(self._codes)
+
+    def index(self, code: str) -> int:
+        """종목코드의 열 번호 (KeyError: 없는 종목)"""
+        self._load_meta()
+        return self._index[code]
+
+    # ---- 읽기 (복사 없는 memory-map)
+
+    def __len__(self):
+        try:
+            return os.path.getsize(self._path("dates.M8")) // _DATE_DTYPE.itemsize
+        except FileNotFoundError:
+            return 0
+
+    @property
+    def dates(self) -> np.ndarray:
+        """날짜 (datetime64[D], 오름차순)"""
+        n = len(self)
+        if n == 0:
+            return np.empty(0, dtype=_DATE_DTYPE)
+        return np.memmap(self._path("dates.M8"), dtype=_DATE_DTYPE, mode="r", shape=(n,))
+
+    @property
+    def last_date(self) -> Optional[pd.Timestamp]:
+        dates = self.dates
+        return pd.Timestamp(dates[-1]) if len(dates) else None
+
+    def field(self, name: str) -> np.ndarray:
+        """필드 하나의 (날짜, capacity) 읽기 전용 memmap"""
+        dtype = _FIELD_DTYPES[name]
+        n = len(self)
+        if n == 0:
+            return np.empty((0, self.capacity), dtype=dtype)
+        return np.memmap(self._file(name), dtype=dtype, mode="r", shape=(n, self.capacity))
+
+    def _rows(self, start=None, end=None) -> slice:
+        dates = self.dates
+        lo = 0 if start is None else np.searchsorted(dates, np.datetime64(pd.Timestamp(start), "D"), "left")
+        hi = len(dates) if end is None else np.searchsorted(dates, np.datetime64(pd.Timestamp(end), "D"), "right")
+        return slice(lo, hi)
+
+    def frame(self, name: str, codes: Optional[Sequence[str]] = None, start=None, end=None) -> pd.DataFrame:
+        """필드 하나의 날짜 × 종목 DataFrame (선택한 구간/종목만 복사)"""
+        codes = self.codes if codes is None else list(codes)
+        rows = self._rows(start, end)
+        cols = [self.index(c) for c in codes]
+        index = pd.DatetimeIndex(np.asarray(self.dates[rows]).astype("M8[ns]"), name="Date")
+        return pd.DataFrame(self.field(name)[rows][:, cols], index=index, columns=codes)
+
+    def panel(self, codes: Optional[Sequence[str]] = None, start=None, end=None) -> Panel:
+        """선택한 구간/종목의 Panel (float64 로 복사, 봉이 없는 자리는 mask False)"""
+        codes = self.codes if codes is None else list(codes)
+        rows = self._rows(start, end)
+        cols = [self.index(c) for c in codes]
+        values = np.stack([self.field(name)[rows][:, cols].astype("f8") for name, _ in FIELDS])
+        mask = ~np.isnan(values[3])  # Close
+        values[4][~mask] = np.nan
+        return Panel([name for name, _ in FIELDS], np.asarray(self.dates[rows]).astype("M8[ns]"), codes, values, mask)
+
+    # ---- 쓰기 (append-only)
+
+    def _assign(self, codes) -> np.ndarray:
+        """종목코드 열 번호 (없는 종목은 빈 열에 새로 배정), 잠금 안에서 호출"""
+        self._load_meta()
+        new = [c for c in dict.fromkeys(codes) if c not in self._index]
+        if new:
+            if len(self._codes) + len(new) > self.capacity:
+                raise ValueError(f"universe capacity exceeded: {len(self._codes) + len(new)} > {self.capacity}")
+            self._save_meta(self._codes + new)
+            self._load_meta()
+        return np.array([self._index[c] for c in codes], dtype=np.intp)
+
+    def _append_rows(self, dates: np.ndarray, cols: np.ndarray, values: dict) -> None:
+        """dates 행들을 파일 끝에 추가 (values: {필드: (날짜, 종목) 배열}), 잠금 안에서 호출"""
+        n = len(self)
+        for name, dtype in FIELDS:
+            rows = np.full((len(dates), self.capacity), _missing(dtype), dtype=dtype)
+            rows[:, cols] = values[name]
+            with open(self._file(name), "ab") as f:
+                f.truncate(n * self.capacity * dtype.itemsize)  # 이전에 중단된 쓰기가 남긴 행 제거
+                f.write(rows.tobytes())
+        # 날짜를 마지막에 늘려서 읽는 쪽은 완성된 행만 보게 함
+        with open(self._path("dates.M8"), "ab") as f:
+            f.write(dates.astype(_DATE_DTYPE).tobytes())
+
+    def append(self, date, bars: pd.DataFrame) -> bool:
+        """
+        하루치 봉 추가 (마지막 날짜 이후만, 이미 있는 날짜면 추가하지 않음)
+
+        Args:
+            date: 날짜
+            bars: 종목코드 인덱스, Open/High/Low/Close/Volume 컬럼 DataFrame
+
+        Returns:
+            추가했으면 True
+        """
+        day = np.datetime64(pd.Timestamp(date), "D")
+        with self._write_lock():
+            last = self.dates[-1] if len(self) else None
+            if last is not None and day <= last:
+                return False
+            bars = bars[~bars.index.duplicated()]
+            cols = self._assign(list(bars.index))
+            values = {
+                name: bars[name].fillna(_missing(dtype)).to_numpy()[None, :].astype(dtype)
+                for name, dtype in FIELDS
+            }
+            self._append_rows(np.array([day]), cols, values)
+        return True
+
+    def append_panel(self, panel: Panel) -> int:
+        """
+        Panel 의 날짜 중 마지막 날짜 이후 행만 추가 (과거 데이터 일괄 적재용)
+
+        Returns:
+            추가한 날짜 수
+        """
+        with self._write_lock():
+            days = np.asarray(panel.dates.values).astype(_DATE_DTYPE)
+            if len(self):
+                keep = days > self.dates[-1]
+            else:
+                keep = np.ones(len(days), dtype=bool)
+            if not keep.any():
+                return 0
+            cols = self._assign(list(panel.symbols))
+            values = {}
+            for name, dtype in FIELDS:
+                v = panel.field(name)[keep]
+                values[name] = np.where(panel.mask[keep], v, _missing(dtype)).astype(dtype)
+            self._append_rows(days[keep], cols, values)
+            return int(keep.sum())
+
+
+# 기본 유니버스 (처음 사용할 때 settings 로 생성)
+_universe = None
+
+
+def get_universe() -> Universe:
+    global _universe
+    if _universe is None:
+        from settings import settings
+        _universe = Universe(settings.universe_dir or os.path.join(os.path.expanduser("~"), "KIS", "universe"))
+    return _universe
+
+
+def set_universe(universe: Optional[Universe]) -> None:
+    """기본 유니버스 교체 (None 이면 다음 사용 때 settings 로 다시 생성)"""
+    global _universe
+    _universe = universe
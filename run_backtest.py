@@ -298,13 +298,23 @@ def main():
     total_final = 0
     total_trades = 0
 
+    # 종목별 데이터 조회 + 백테스팅을 호출 한도 안에서 동시에 실행 (결과는 종목 순서대로 집계)
+    jobs = {
+        str(stock_code).zfill(6): (str(stock_code).zfill(6), stock_name, start_date, end_date, cash, commission)
+        for stock_code, stock_name in stock_dict.items()
+    }
+
+    def on_progress(done, total, code, result, error):
+        if done % 10 == 0 or done == total:
+            print(f"  ... {done}/{total} 종목 완료", flush=True)
+
+    backtests = ka.fan_out(run_backtest_single, jobs, on_progress=on_progress)
+
     trade_count = 0  # 거래 발생 종목 카운터
-    for i, (stock_code, stock_name) in enumerate(stock_dict.items(), 1):
-        stock_code_str = str(stock_code).zfill(6)
+    for stock_code_str, result in backtests.results.items():
+        stock_name = jobs[stock_code_str][1]
         display_name = f"{stock_name[:8]}" if stock_name else stock_code_str
 
-        result = run_backtest_single(stock_code_str, stock_name, start_date, end_date, cash, commission)
-
         if result and result.get("success"):
             results.append(result)
             total_initial += result["initial_equity"]
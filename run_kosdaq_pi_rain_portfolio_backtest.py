@@ -13,7 +13,7 @@ import pandas as pd
 import numpy as np
 import vectorbt as vbt
 import kis_auth as ka
-from data_loader import load_stock_data
+from data_loader import load_snapshot, result_cache
 from strategies.kosdaq_pi_rain_strategy import (
     check_kosdaq150_lev_buy_signal,
     check_kosdaq150_lev_sell_signal,
@@ -45,60 +45,42 @@ ETF_NAMES = {
 }
 
 
-def load_etf_data(start_date, end_date):
+def load_etf_data(start_date, end_date, snapshot_id=None):
     """
-    4개 ETF 데이터 로드
+    4개 ETF 데이터를 날짜 정렬된 패널로 로드 (종목별 동시 로드, 데이터셋 스냅샷)
+
+    Args:
+        snapshot_id: 고정할 스냅샷 ID (기본: 같은 조건으로 마지막에 만든 스냅샷, 없으면 새로 로드)
 
     Returns:
-        dict: {etf_name: DataFrame}
+        (스냅샷 ID, Panel): 필드 × 날짜 × 종목 (봉이 없는 날짜는 mask False)
     """
     print("\n[데이터 로드 중...]")
-    data = {}
-
-    for name, code in ETF_CODES.items():
-        print(f"  {ETF_NAMES[code]} ({code}) 로드 중...")
-        df = load_stock_data(
-            stock_code=code,
-            start_date=start_date,
-            end_date=end_date,
-            adjusted=True
-        )
-
-        if df.empty:
-            raise ValueError(f"{code} 데이터를 불러올 수 없습니다.")
+    snapshot_id, panel = load_snapshot(list(ETF_CODES.values()), start_date, end_date, snapshot_id=snapshot_id)
+    if snapshot_id is not None:
+        print(f"  데이터셋 스냅샷: {snapshot_id}")
 
-        data[name] = df
-        print(f"    ✓ {len(df)}일 데이터 로드 완료")
+    for code, count in zip(panel.symbols, panel.mask.sum(axis=0)):
+        if count == 0:
+            raise ValueError(f"{code} 데이터를 불러올 수 없습니다.")
+        print(f"  ✓ {ETF_NAMES[code]} ({code}): {count}일 데이터 로드 완료")
 
-    return data
+    return snapshot_id, panel
 
 
-def align_dataframes(data_dict):
+def align_dataframes(panel):
     """
-    모든 DataFrame의 인덱스(날짜)를 동일하게 맞춤
+    모든 ETF에 봉이 있는 날짜만 남겨서 ETF별 DataFrame으로 나눔
 
     Returns:
-        dict: 정렬된 데이터
+        dict: {etf_name: DataFrame} (모두 같은 날짜 인덱스)
     """
-    # 공통 날짜 찾기
-    common_dates = None
-    for df in data_dict.values():
-        if common_dates is None:
-            common_dates = set(df.index)
-        else:
-            common_dates = common_dates.intersection(set(df.index))
-
-    common_dates = sorted(list(common_dates))
+    common = panel.common()
 
     print(f"\n[데이터 정렬]")
-    print(f"  공통 날짜 수: {len(common_dates)}일")
+    print(f"  공통 날짜 수: {len(common)}일")
 
-    # 공통 날짜로 필터링
-    aligned_data = {}
-    for name, df in data_dict.items():
-        aligned_data[name] = df.loc[common_dates]
-
-    return aligned_data
+    return {name: common.symbol(code) for name, code in ETF_CODES.items()}
 
 
 def generate_signals(data):
@@ -377,9 +359,12 @@ def print_results(pf):
     print("\n" + "=" * 80)
 
 
-def main():
+def main(snapshot_id=None):
     """
     메인 함수
+
+    Args:
+        snapshot_id: 고정할 데이터셋 스냅샷 ID (이전 실행에서 출력된 ID, 같은 데이터로 재현)
     """
     print("=" * 80)
     print("코스닥피 레인 - 모멘텀 스코어 기반 포트폴리오 백테스팅")
@@ -402,7 +387,7 @@ def main():
     print(f"  수수료: {fees * 100}%")
 
     # 3. 데이터 로드
-    data = load_etf_data(start_date, end_date)
+    snapshot_id, data = load_etf_data(start_date, end_date, snapshot_id)
 
     # 4. 데이터 정렬
     print("\n[3/6] 데이터 정렬 중...")
@@ -423,6 +408,15 @@ def main():
     # 8. 결과 출력
     print_results(pf)
 
+    # 결과 기록 (전략, 파라미터, 스냅샷 별로 비교)
+    cache = result_cache() if snapshot_id is not None else None
+    if cache is not None:
+        stats = pf.stats()
+        cache.put("kosdaq_pi_rain_portfolio", {"init_cash": init_cash, "fees": fees}, snapshot_id, {
+            key: (float(value) if isinstance(value, (int, float, np.number)) else str(value))
+            for key, value in stats.items()
+        })
+
     # 9. 차트 저장
     print("\n[차트 저장]")
     try:
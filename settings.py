@@ -25,6 +25,33 @@ class Settings(BaseSettings):
     domain_prod: str = "https://openapi.koreainvestment.com:9443"
     domain_vps: str = "https://openapivts.koreainvestment.com:29443"
 
+    # API 호출 속도 제한 (선택)
+    rate_limit_prod: float = Field(default=20.0, description="실전투자 초당 API 호출 수")
+    rate_limit_vps: float = Field(default=2.0, description="모의투자 초당 API 호출 수")
+    rate_limit_shared: bool = Field(default=True, description="같은 호스트의 프로세스간 앱키별 호출 제한 공유")
+    rate_limit_ws: float = Field(default=10.0, description="웹소켓 구독 메시지 초당 전송 수 (REST 호출 제한과 별도)")
+
+    # 접근 토큰 (선택)
+    token_refresh_margin: float = Field(default=600.0, description="토큰 만료 몇 초 전에 미리 재발급할지")
+
+    # API 응답 타입 변환 (선택)
+    typed_output: bool = Field(default=False, description="응답 DataFrame 의 숫자/날짜/코드 컬럼을 타입 변환 (기본: 기존처럼 문자열)")
+
+    # 과거 시세 로컬 저장소 (선택)
+    ohlcv_store: bool = Field(default=True, description="load_stock_data 일/주/월/년봉을 로컬 저장소에 보관")
+    ohlcv_store_dir: str = Field(default="", description="로컬 저장소 폴더 (빈 값이면 ~/KIS/ohlcv)")
+    universe_dir: str = Field(default="", description="전 종목 일봉 유니버스 폴더 (빈 값이면 ~/KIS/universe)")
+    calendar_file: str = Field(default="", description="거래일 달력 파일 (빈 값이면 ~/KIS/calendar.json)")
+    local_adjustment: bool = Field(default=False, description="수정주가 일봉을 원주가 + 예탁원 기업 행사 정보로 직접 계산")
+
+    # API 응답 캐시 (선택)
+    response_cache_size: int = Field(default=2048, description="API 응답 캐시 최대 항목 수")
+
+    # HTTP 커넥션 풀 (선택)
+    http_pool_size: int = Field(default=20, description="REST 커넥션 풀 최대 연결 수")
+    http_connect_timeout: float = Field(default=5.0, description="연결 타임아웃 (초)")
+    http_read_timeout: float = Field(default=30.0, description="응답 타임아웃 (초)")
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -1,10 +1,18 @@
 """
 pytest 공통 설정 및 fixture 정의
 """
+import os
+
 import pytest
 from datetime import datetime
 from typing import List, Dict
 
+# kis_auth 는 import 시점에 settings 를 검증하므로 테스트용 더미 값 설정
+os.environ.setdefault("REAL_APP", "test-app")
+os.environ.setdefault("REAL_SEC", "test-sec")
+os.environ.setdefault("MY_REAL_STOCK", "12345678")
+os.environ.setdefault("MY_HTSID", "tester")
+
 
 # ============================================
 # Test Data Fixtures
@@ -105,6 +113,15 @@ def test_db():
 # Cleanup Fixtures
 # ============================================
 
+@pytest.fixture(autouse=True)
+def trading_calendar():
+    """기본 거래일 달력을 빈 메모리 달력으로 (사용자 ~/KIS/calendar.json 을 읽지 않도록)"""
+    from market_data import TradingCalendar, get_calendar, set_calendar
+    set_calendar(TradingCalendar())
+    yield get_calendar()
+    set_calendar(None)
+
+
 @pytest.fixture(autouse=True)
 def reset_state():
     """각 테스트 후 상태 초기화"""
@@ -0,0 +1,143 @@
+"""
+market_data.adjustments (기업 행사 수정주가 계산) 테스트
+"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_data import ActionStore, adjust, adjust_panel, build_panel, events_from_ksdinfo
+from market_data.adjustments import factors
+
+
+def bars(closes, start="2024-01-02"):
+    index = pd.bdate_range(start, periods=len(closes))
+    close = pd.Series(closes, index=index, dtype=float)
+    return pd.DataFrame({"Open": close, "High": close, "Low": close, "Close": close, "Volume": 1000.0})
+
+
+def event(kind, ex_date, ratio=np.nan, price=np.nan, code="005930"):
+    return pd.DataFrame([{"code": code, "ex_date": pd.Timestamp(ex_date), "kind": kind, "ratio": ratio, "price": price}])
+
+
+@pytest.mark.unit
+class TestEventsFromKsdinfo:
+    """예탁원 조회 결과 → 이벤트 변환"""
+
+    def test_split_ratio_from_face_value(self):
+        df = pd.DataFrame([{"sht_cd": "005930", "record_date": "20180416", "list_dt": "20180504",
+                            "inter_bf_face_amt": "5000", "inter_af_face_amt": "100"}])
+
+        events = events_from_ksdinfo("split", df)
+
+        assert events.loc[0, "ex_date"] == pd.Timestamp("2018-05-04")
+        assert events.loc[0, "ratio"] == pytest.approx(0.02)
+
+    def test_bonus_rate_in_percent(self):
+        """배정율이 % 로 오면 1주당 주식수로 환산"""
+        df = pd.DataFrame([{"sht_cd": "000660", "right_dt": "20240105", "fix_rate": "50"}])
+
+        assert events_from_ksdinfo("bonus", df).loc[0, "ratio"] == pytest.approx(0.5)
+
+    def test_dividend_ex_date_is_previous_business_day(self):
+        """배당락일 = 기준일 전 거래일, 현금배당 없는 행은 제외"""
+        df = pd.DataFrame([
+            {"sht_cd": "005930", "record_date": "20240102", "per_sto_divi_amt": "361", "stk_divi_rate": "0"},
+            {"sht_cd": "000660", "record_date": "20240102", "per_sto_divi_amt": "0", "stk_divi_rate": "0"},
+        ])
+
+        events = events_from_ksdinfo("dividend", df)
+
+        assert len(events) == 1
+        assert events.loc[0, "kind"] == "cash_dividend"
+        assert events.loc[0, "ex_date"] == pd.Timestamp("2024-01-01")
+
+    def test_merger_survivor_is_not_adjusted(self):
+        df = pd.DataFrame([
+            {"sht_cd": "111111", "merge_type": "흡수합병", "merge_rate": "0.5", "list_dt": "20240105", "record_date": "20240102"},
+            {"sht_cd": "222222", "merge_type": "인적분할", "merge_rate": "0.7", "list_dt": "20240105", "record_date": "20240102"},
+        ])
+
+        events = events_from_ksdinfo("merger", df)
+
+        assert list(events["code"]) == ["222222"]
+        assert events.loc[0, "kind"] == "spinoff"
+
+    def test_empty_result(self):
+        assert events_from_ksdinfo("split", pd.DataFrame()).empty
+
+
+@pytest.mark.unit
+class TestFactors:
+    """수정 계수 계산"""
+
+    def test_split_scales_bars_before_ex_date(self):
+        df = bars([50000, 51000, 1020, 1030])
+
+        result = adjust(df, event("split", df.index[2], ratio=0.02))
+
+        assert list(result["Close"]) == pytest.approx([1000, 1020, 1020, 1030])
+        assert result["Volume"].iloc[0] == pytest.approx(50000)
+        assert result["Volume"].iloc[-1] == 1000
+
+    def test_rights_uses_previous_close(self):
+        """이론 권리락가 = (전일 종가 + 배정율 × 발행가) / (1 + 배정율)"""
+        df = bars([1000, 1000, 850])
+
+        f = factors(df.index, df["Close"].to_numpy(), event("rights", df.index[2], ratio=0.5, price=700))
+
+        assert f == pytest.approx([0.9, 0.9, 1.0])
+
+    def test_events_compound(self):
+        df = bars([100, 100, 100, 100])
+        events = pd.concat([
+            event("bonus", df.index[1], ratio=1.0),
+            event("split", df.index[3], ratio=0.5),
+        ], ignore_index=True)
+
+        f = factors(df.index, df["Close"].to_numpy(), events)
+
+        assert f == pytest.approx([0.25, 0.5, 0.5, 1.0])
+
+    def test_cash_dividend_is_opt_in(self):
+        df = bars([100, 100, 98])
+        events = event("cash_dividend", df.index[2], price=2)
+
+        assert adjust(df, events)["Close"].iloc[0] == 100
+        assert adjust(df, events, include_cash_dividends=True)["Close"].iloc[0] == pytest.approx(98)
+
+    def test_events_outside_data_are_ignored(self):
+        df = bars([100, 100])
+        events = pd.concat([
+            event("split", "2023-06-01", ratio=0.1),
+            event("rights", "2030-01-02", ratio=0.5, price=10),
+        ], ignore_index=True)
+
+        assert factors(df.index, df["Close"].to_numpy(), events) == pytest.approx([1.0, 1.0])
+
+    def test_adjust_panel_per_symbol(self):
+        a, b = bars([100, 100, 50]), bars([10, 10, 10])
+        panel = build_panel({"005930": a, "000660": b})
+
+        result = adjust_panel(panel, event("split", a.index[2], ratio=0.5))
+
+        assert result.symbol("005930")["Close"].tolist() == pytest.approx([50, 50, 50])
+        assert result.symbol("000660")["Close"].tolist() == pytest.approx([10, 10, 10])
+
+
+@pytest.mark.unit
+class TestActionStore:
+    """기업 행사 이벤트 파일"""
+
+    def test_round_trip(self, tmp_path):
+        store = ActionStore(str(tmp_path))
+        assert store.read()[1] is None
+
+        events = event("split", "2024-01-05", ratio=0.02, code="000020")
+        store.write(events, (date(2024, 1, 1), date(2024, 3, 31)))
+        loaded, coverage = store.read()
+
+        assert coverage == (date(2024, 1, 1), date(2024, 3, 31))
+        assert loaded.loc[0, "code"] == "000020"  # 앞자리 0 유지
+        assert loaded.loc[0, "ex_date"] == pd.Timestamp("2024-01-05")
@@ -0,0 +1,548 @@
+"""
+data_loader (과거 데이터 로더) 테스트
+"""
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import kis_auth as ka
+from data_loader import (
+    backfill_minutes, build_universe, load_corporate_actions, load_minute_data, load_panel, load_snapshot,
+    load_stock_data, sync_calendar, sync_universe
+)
+from market_data import OHLCVStore, SnapshotStore, TradingCalendar, Universe, ohlcv_store
+from market_data.trading_calendar import KST
+from settings import settings
+from tests.test_kis_auth import FakeResponse, ok_body
+
+
+def chart_resp(dates):
+    rows = [
+        {"stck_bsop_date": d, "stck_oprc": "100", "stck_hgpr": "110",
+         "stck_lwpr": "90", "stck_clpr": "105", "acml_vol": "1000"}
+        for d in dates
+    ]
+    return ka.APIResp(FakeResponse(ok_body(output1={}, output2=rows)))
+
+
+def market(closes):
+    """{YYYYMMDD: 종가} 시장에서 요청 구간의 최근 봉 100건을 돌려주는 가짜 _url_fetch"""
+    def fetch(url, tr_id, tr_cont, params):
+        rows = [
+            {"stck_bsop_date": d, "stck_oprc": str(c), "stck_hgpr": str(c), "stck_lwpr": str(c),
+             "stck_clpr": str(c), "acml_vol": "1000"}
+            for d, c in sorted(closes.items(), reverse=True)
+            if params["FID_INPUT_DATE_1"] <= d <= params["FID_INPUT_DATE_2"]
+        ][:100]  # 최근 100건까지만 응답
+        return ka.APIResp(FakeResponse(ok_body(output1={}, output2=rows)))
+    return fetch
+
+
+def weekdays(start, end):
+    return [d.strftime("%Y%m%d") for d in pd.bdate_range(start, end)]
+
+
+@pytest.fixture(autouse=True)
+def trenv():
+    ka.changeTREnv("test-token", svr="prod", product="01")
+
+
+@pytest.fixture(autouse=True)
+def store(tmp_path):
+    saved = ohlcv_store.get_store()
+    ohlcv_store.set_store(OHLCVStore(str(tmp_path)))
+    yield ohlcv_store.get_store()
+    ohlcv_store.set_store(saved)
+
+
+@pytest.mark.unit
+class TestLoadStockData:
+    """load_stock_data 테스트"""
+
+    def test_converts_to_backtesting_format(self, mocker):
+        """OHLCV 숫자 컬럼 + 날짜 인덱스(오름차순)로 변환"""
+        mocker.patch.object(ka, "_url_fetch", return_value=chart_resp(["20240103", "20240102"]))
+
+        df = load_stock_data("005930", "20240101", "20240105")
+
+        assert list(df.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert df.index.is_monotonic_increasing
+        assert df["Close"].iloc[0] == 105
+
+    def test_failed_window_raises_instead_of_dropping_data(self, mocker):
+        """구간 조회 실패는 빈 구간으로 취급하지 않고 예외 발생"""
+        mocker.patch.object(ka, "_url_fetch", side_effect=[
+            chart_resp(["20240603"]),
+            ka.APIRespError(500, "Internal Server Error"),
+        ])
+
+        with pytest.raises(ka.KISAPIError):
+            load_stock_data("005930", "20240101", "20240605")
+
+    def test_windows_are_fetched_concurrently(self, mocker):
+        """구간을 미리 나눠 동시에 조회하고 한 번에 합침"""
+        closes = {d: 100 for d in weekdays("2020-01-01", "2024-12-31")}
+        fake = market(closes)
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def slow_fetch(*args):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return fake(*args)
+
+        mocker.patch.object(ka, "_url_fetch", side_effect=slow_fetch)
+
+        df = load_stock_data("005930", "20200101", "20241231", use_store=False)
+
+        assert peak[0] > 1
+        assert len(df) == len(closes)
+        assert df.index.is_monotonic_increasing and df.index.is_unique
+
+
+@pytest.mark.unit
+class TestWindowPlanning:
+    """조회 구간 계획 테스트"""
+
+    def test_daily_windows_are_100_trading_days(self, mocker):
+        """일봉 구간은 거래일 100일씩, 빈틈/겹침 없이 호출 수 최소화"""
+        days = weekdays("2020-01-01", "2024-12-31")
+        closes = {d: 100 for i, d in enumerate(days) if i % 20 != 7}  # 공휴일 흉내
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=market(closes))
+
+        df = load_stock_data("005930", "20200101", "20241231", use_store=False)
+
+        assert fetch.call_count == -(-len(days) // 100)
+        assert len(df) == len(closes)
+        windows = sorted((c.args[3]["FID_INPUT_DATE_1"], c.args[3]["FID_INPUT_DATE_2"]) for c in fetch.call_args_list)
+        assert windows[0][0] == "20200101" and windows[-1][1] == "20241231"
+        for (_, prev_end), (start, _) in zip(windows, windows[1:]):
+            assert pd.Timestamp(start) - pd.Timestamp(prev_end) == pd.Timedelta(days=1)
+
+    def test_truncated_response_continues_from_earliest_date(self, mocker):
+        """응답이 100건으로 잘리면 가장 이른 일자 전날부터 이어서 조회"""
+        closes = {d.strftime("%Y%m%d"): 100 for d in pd.date_range("2024-01-01", "2024-06-30")}  # 주말 거래
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=market(closes))
+
+        df = load_stock_data("005930", "20240101", "20240630", use_store=False)
+
+        assert len(df) == len(closes)
+        assert fetch.call_count > -(-len(weekdays("2024-01-01", "2024-06-30")) // 100)
+
+    def test_weekly_window_covers_100_weeks(self, mocker):
+        closes = {d: 100 for d in weekdays("2020-01-03", "2021-12-31")[::5]}
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=market(closes))
+
+        load_stock_data("005930", "20200101", "20211231", period="W", use_store=False)
+
+        assert fetch.call_count == 2
+
+
+@pytest.mark.unit
+class TestOHLCVStore:
+    """로컬 저장소 증분 동기화 테스트"""
+
+    def test_repeat_load_makes_no_api_calls(self, mocker):
+        """받아 둔 구간은 저장소에서 읽음"""
+        closes = {d: 100 + i for i, d in enumerate(weekdays("2023-01-02", "2023-12-29"))}
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=market(closes))
+
+        first = load_stock_data("005930", "20230101", "20231231")
+        calls = fetch.call_count
+        second = load_stock_data("005930", "20230301", "20230630")
+
+        assert fetch.call_count == calls
+        pd.testing.assert_frame_equal(second, first.loc["2023-03-01":"2023-06-30"])
+        assert len(first) == len(closes)
+
+    def test_fetches_only_missing_range(self, mocker):
+        """뒤쪽 모자란 구간만 (마지막 봉 하루 겹쳐서) 조회"""
+        closes = {d: 100 for d in weekdays("2023-01-02", "2023-03-31")}
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=market(closes))
+        load_stock_data("005930", "20230101", "20230228")
+        fetch.reset_mock()
+
+        df = load_stock_data("005930", "20230101", "20230331")
+
+        assert [(c.args[3]["FID_INPUT_DATE_1"], c.args[3]["FID_INPUT_DATE_2"]) for c in fetch.call_args_list] \
+            == [("20230228", "20230331")]
+        assert df.index[-1] == pd.Timestamp("2023-03-31")
+        assert df.index.is_unique
+
+    def test_adjusted_basis_change_refetches_everything(self, mocker):
+        """겹친 봉의 수정주가가 달라지면 (액면분할 등) 전체 구간 다시 조회"""
+        closes = {d: 1000 for d in weekdays("2023-01-02", "2023-03-31")}
+        mocker.patch.object(ka, "_url_fetch", side_effect=market(closes))
+        load_stock_data("005930", "20230101", "20230228")
+
+        split = {d: c // 10 for d, c in closes.items()}
+        mocker.patch.object(ka, "_url_fetch", side_effect=market(split))
+        df = load_stock_data("005930", "20230101", "20230331")
+
+        assert (df["Close"] == 100).all()
+
+    def test_today_is_refetched(self, mocker):
+        """오늘 봉은 장중에 바뀌므로 다음 조회 때 다시 받음"""
+        today = date.today()
+        closes = {d: 100 for d in weekdays(today - timedelta(days=14), today)}
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=market(closes))
+        end = today.strftime("%Y%m%d")
+        start = (today - timedelta(days=14)).strftime("%Y%m%d")
+        load_stock_data("005930", start, end)
+        fetch.reset_mock()
+
+        load_stock_data("005930", start, end)
+
+        assert fetch.call_count == 1
+
+    def test_use_store_false(self, mocker, store):
+        """use_store=False 는 저장소를 읽지도 쓰지도 않음"""
+        closes = {d: 100 for d in weekdays("2023-01-02", "2023-01-31")}
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=market(closes))
+
+        load_stock_data("005930", "20230101", "20230131", use_store=False)
+        load_stock_data("005930", "20230101", "20230131", use_store=False)
+
+        assert fetch.call_count == 2
+        assert store.read("005930", "D", True) == (None, None)
+
+
+@pytest.mark.unit
+class TestLoadPanel:
+    """load_panel 테스트"""
+
+    def test_panel_is_aligned_across_symbols(self, mocker):
+        """종목별 로드 결과를 하나의 날짜 인덱스로 정렬"""
+        days = weekdays("2024-01-01", "2024-01-31")
+        markets = {"000001": market({d: 100 for d in days}), "000002": market({d: 200 for d in days[5:]})}
+        mocker.patch.object(ka, "_url_fetch", side_effect=lambda url, tr_id, tr_cont, params:
+                            markets[params["FID_INPUT_ISCD"]](url, tr_id, tr_cont, params))
+
+        panel = load_panel(["000001", "000002"], "20240101", "20240131")
+
+        assert panel.symbols == ("000001", "000002")
+        assert len(panel) == len(days)
+        assert panel.mask.sum(axis=0).tolist() == [len(days), len(days) - 5]
+        assert len(load_panel(["000001", "000002"], "20240101", "20240131", how="inner")) == len(days) - 5
+
+    def test_failed_symbol_raises(self, mocker):
+        mocker.patch.object(ka, "_url_fetch", return_value=ka.APIRespError(500, "Internal Server Error"))
+
+        with pytest.raises(ka.KISAPIError):
+            load_panel(["000001"], "20240101", "20240131")
+
+
+@pytest.mark.unit
+class TestUniverseSync:
+    """유니버스 적재/동기화 테스트"""
+
+    def test_build_appends_only_new_dates(self, mocker, tmp_path):
+        """마지막 날짜 이후 구간만 원주가로 조회해서 추가"""
+        universe = Universe(str(tmp_path / "universe"), capacity=4)
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=market({d: 100 for d in weekdays("2024-01-01", "2024-02-29")}))
+
+        assert build_universe(["000001"], "20240101", "20240131", universe) == len(weekdays("2024-01-01", "2024-01-31"))
+        fetch.reset_mock()
+        build_universe(["000001"], "20240101", "20240229", universe)
+
+        assert min(c.args[3]["FID_INPUT_DATE_1"] for c in fetch.call_args_list) >= "20240131"  # 저장소와 한 봉 겹침
+        assert all(c.args[3]["FID_ORG_ADJ_PRC"] == "1" for c in fetch.call_args_list)
+        assert universe.last_date == pd.Timestamp("2024-02-29")
+
+    def test_build_skips_codes_without_bars(self, mocker, tmp_path, caplog):
+        """구간에 봉이 없는 종목(거래정지, 신규 상장 등)은 건너뛰고 나머지는 적재"""
+        universe = Universe(str(tmp_path / "universe"), capacity=4)
+        listed = market({d: 100 for d in weekdays("2024-01-01", "2024-01-31")})
+        mocker.patch.object(ka, "_url_fetch", side_effect=lambda url, tr_id, tr_cont, params: (
+            listed(url, tr_id, tr_cont, params) if params["FID_INPUT_ISCD"] == "000001" else chart_resp([])
+        ))
+
+        assert build_universe(["000001", "000002"], "20240101", "20240131", universe) > 0
+        assert universe.codes == ["000001"]
+        assert "000002" in caplog.text
+
+    def test_sync_adds_one_day_from_quotes(self, mocker, tmp_path, trading_calendar):
+        """장 마감 후 멀티종목 시세로 오늘 하루치 추가, 거래 없는 종목은 봉 없음"""
+        universe = Universe(str(tmp_path / "universe"), capacity=4)
+        quotes = pd.DataFrame({
+            "inter2_oprc": [100, 0], "inter2_hgpr": [110, 0], "inter2_lwpr": [90, 0],
+            "inter2_prpr": [105, 500], "acml_vol": [1000, 0],
+        }, index=pd.Index(["000001", "000002"], name="inter_shrn_iscd"))
+        get_quotes = mocker.patch("domestic_stock.domestic_stock_functions.get_quotes", return_value=quotes)
+
+        now = mocker.patch.object(TradingCalendar, "now", return_value=datetime(2024, 1, 5, 16, 0, tzinfo=KST))
+
+        assert sync_universe(["000001", "000002"], universe)
+        assert not sync_universe(["000001", "000002"], universe)  # 이미 추가한 날짜
+
+        assert get_quotes.call_count == 2
+        assert universe.dates[-1] == pd.Timestamp("2024-01-05")
+        assert universe.field("Close")[0, universe.index("000001")] == 105
+        assert universe.codes == ["000001"]
+
+    def test_sync_waits_for_session_close(self, mocker, tmp_path, trading_calendar):
+        """장중이나 휴장일에는 시세를 조회하지 않고 추가하지 않음 (장중 봉은 고칠 수 없음)"""
+        get_quotes = mocker.patch("domestic_stock.domestic_stock_functions.get_quotes")
+        universe = Universe(str(tmp_path / "universe"))
+
+        for now in (datetime(2024, 1, 5, 14, 0, tzinfo=KST), datetime(2024, 1, 6, 16, 0, tzinfo=KST)):
+            mocker.patch.object(TradingCalendar, "now", return_value=now)
+            assert not sync_universe(["000001"], universe)
+        get_quotes.assert_not_called()
+
+
+def ksdinfo(mocker, split_rows=(), failing=()):
+    """예탁원 조회 가짜 (액면교체만 split_rows, failing 종류는 실패 응답, 나머지는 빈 결과)"""
+    split_url = "/uapi/domestic-stock/v1/ksdinfo/rev-split"
+
+    def paginate(api_url, tr_id, tr_cont, params, outputs):
+        if api_url.rsplit("/", 1)[-1] in failing:
+            return ka.APIRespError(500, "Internal Server Error"), {"output1": []}
+        rows = list(split_rows) if api_url == split_url else []
+        return ka.APIResp(FakeResponse(ok_body(output1=rows))), {"output1": rows}
+
+    calls = mocker.patch.object(ka, "_paginate", side_effect=paginate)
+    return calls
+
+
+@pytest.mark.unit
+class TestLocalAdjustment:
+    """원주가 + 기업 행사 수정주가 테스트"""
+
+    SPLIT = {"sht_cd": "000001", "record_date": "20240110", "list_dt": "20240115",
+             "inter_bf_face_amt": "5000", "inter_af_face_amt": "1000"}
+
+    def test_adjusts_raw_bars_with_split(self, mocker):
+        """원주가만 조회하고 변경상장일 전 봉을 분할 비율로 조정"""
+        mocker.patch.object(settings, "local_adjustment", True)
+        closes = {d: (500 if d < "20240115" else 100) for d in weekdays("2024-01-02", "2024-01-19")}
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=market(closes))
+        ksdinfo(mocker, [self.SPLIT])
+
+        df = load_stock_data("000001", "20240102", "20240119")
+
+        assert all(c.args[3]["FID_ORG_ADJ_PRC"] == "1" for c in fetch.call_args_list)
+        assert df["Close"].tolist() == pytest.approx([100] * len(closes))
+        assert df["Volume"].iloc[0] == pytest.approx(5000)
+
+    def test_events_are_fetched_once(self, mocker):
+        """조회해 둔 기준일 구간은 다시 조회하지 않음"""
+        calls = ksdinfo(mocker, [self.SPLIT])
+
+        first = load_corporate_actions("20240101", "20240131")
+        second = load_corporate_actions("20240105", "20240120")
+
+        assert calls.call_count == 5  # 종류별 1회
+        pd.testing.assert_frame_equal(second, first, check_dtype=False)
+        assert load_corporate_actions("20240201", "20240229").empty
+
+    def test_failed_fetch_does_not_record_coverage(self, mocker):
+        """예탁원 조회가 하나라도 실패하면 예외를 발생시키고 조회 구간을 늘리지 않음 (다음 호출에서 다시 조회)"""
+        from data_loader import _action_store
+
+        ksdinfo(mocker, [self.SPLIT])
+        load_corporate_actions("20240101", "20240131")
+        before = _action_store().read()[1]
+
+        ksdinfo(mocker, failing=("dividend",))
+        with pytest.raises(ka.KISAPIError):
+            load_corporate_actions("20240101", "20240229")
+        assert _action_store().read()[1] == before
+
+        calls = ksdinfo(mocker, [self.SPLIT])
+        assert len(load_corporate_actions("20240101", "20240229")) == 1
+        assert calls.call_count == 5
+
+def holiday_api(closed, rows_per_call=10):
+    """기준일부터 rows_per_call 일치 개장 여부를 돌려주는 가짜 chk_holiday"""
+    def chk_holiday(bass_dt):
+        days = pd.date_range(bass_dt, periods=rows_per_call)
+        return pd.DataFrame({
+            "bass_dt": days,
+            "opnd_yn": ["N" if d.weekday() >= 5 or d.strftime("%Y%m%d") in closed else "Y" for d in days],
+        })
+    return chk_holiday
+
+
+@pytest.mark.unit
+class TestTradingCalendarSync:
+    """거래일 달력 동기화 / 사용 테스트"""
+
+    def test_sync_fetches_missing_range_once(self, mocker, trading_calendar):
+        chk = mocker.patch("domestic_stock.domestic_stock_functions.chk_holiday",
+                           side_effect=holiday_api({"20240209", "20240212"}))
+        mocker.patch("domestic_stock.domestic_stock_functions.market_time",
+                     return_value=pd.DataFrame([{"s_time": "090000", "e_time": "153000"}]))
+
+        sync_calendar("20240201", "20240229")
+        calls = chk.call_count
+        sync_calendar("20240201", "20240229")
+
+        assert calls == 3 and chk.call_count == calls
+        assert trading_calendar.coverage == (date(2024, 2, 1), date(2024, 2, 29))
+        assert list(trading_calendar.holidays.strftime("%Y%m%d")) == ["20240209", "20240212"]
+
+    def test_daily_windows_skip_holidays(self, mocker, trading_calendar):
+        """달력의 휴장일은 거래일 100일 구간 계산에서 제외"""
+        trading_calendar.update({date(2024, 1, 1): False}, date(2024, 1, 1), date(2024, 12, 31))
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=market({d: 100 for d in weekdays("2024-01-02", "2024-06-28")}))
+
+        load_stock_data("000001", "20240101", "20240628", use_store=False)
+
+        starts = sorted(c.args[3]["FID_INPUT_DATE_1"] for c in fetch.call_args_list)
+        assert starts[0] == "20240101"
+        assert trading_calendar.count(starts[-1], "2024-06-28") == 100  # 1/1 휴장일 제외하고 거래일 100일
+
+    def test_sync_universe_skips_holiday(self, mocker, tmp_path, trading_calendar):
+        trading_calendar.update({date(2024, 2, 9): False}, date(2024, 2, 1), date(2024, 2, 29))
+        get_quotes = mocker.patch("domestic_stock.domestic_stock_functions.get_quotes")
+
+        mocker.patch.object(TradingCalendar, "now", return_value=datetime(2024, 2, 9, 16, 0, tzinfo=KST))
+
+        assert not sync_universe(["000001"], Universe(str(tmp_path / "universe")))
+        get_quotes.assert_not_called()
+
+
+def minute_market(days, max_rows=120):
+    """days 의 09:00 ~ 15:30 1분봉 (종가 100)을 입력 시각부터 과거 방향으로 max_rows 건 돌려주는 가짜 _url_fetch"""
+    bars = [
+        (d, t.strftime("%H%M%S"))
+        for d in days
+        for t in pd.date_range(f"{d} 09:00", f"{d} 15:30", freq="min")
+    ]
+
+    def fetch(url, tr_id, tr_cont, params):
+        key = (params.get("FID_INPUT_DATE_1"), params["FID_INPUT_HOUR_1"])
+        rows = [
+            {"stck_bsop_date": d, "stck_cntg_hour": h, "stck_oprc": "100", "stck_hgpr": "100",
+             "stck_lwpr": "100", "stck_prpr": "100", "cntg_vol": "10"}
+            for d, h in sorted(bars, reverse=True)
+            if (d, h) <= key
+        ][:max_rows]
+        return ka.APIResp(FakeResponse(ok_body(output1={}, output2=rows)))
+    return fetch
+
+
+@pytest.mark.unit
+class TestMinuteStore:
+    """1분봉 저장소 + 리샘플링 테스트"""
+
+    def test_one_fetch_serves_all_timeframes(self, mocker):
+        """1분봉을 한 번 받으면 5/60분봉은 API 호출 없이 계산"""
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=minute_market(["20240102", "20240103"]))
+
+        one = load_minute_data("000001", "20240102", "20240103")
+        calls = fetch.call_count
+        five = load_stock_data("000001", "20240102", "20240103", period="5")
+        hour = load_stock_data("000001", "20240102", "20240103", period="60")
+
+        assert len(one) == 2 * 391
+        assert calls == 2 * 4  # 하루 391건 = 120건씩 4회
+        assert fetch.call_count == calls
+        assert len(five) == 2 * 78 and len(hour) == 2 * 7
+        assert hour["Volume"].iloc[-1] == 310  # 15:00 ~ 15:30 (마감 봉 포함)
+
+    def test_holidays_are_not_requested(self, mocker, trading_calendar):
+        trading_calendar.update({date(2024, 1, 1): False}, date(2024, 1, 1), date(2024, 1, 31))
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=minute_market(["20240102"]))
+
+        load_minute_data("000001", "20231230", "20240102")
+
+        assert {c.args[3]["FID_INPUT_DATE_1"] for c in fetch.call_args_list} == {"20240102"}
+
+
+@pytest.mark.unit
+class TestMinuteBackfill:
+    """1분봉 백필 (체크포인트 / 이어서 진행) 테스트"""
+
+    DAYS = ["20240102", "20240103", "20240104"]
+
+    def test_resumes_after_failure(self, mocker, store):
+        """실패한 날짜가 있는 종목은 체크포인트만 남기고, 다시 실행하면 남은 날짜만 조회"""
+        market = minute_market(self.DAYS)
+
+        def flaky(url, tr_id, tr_cont, params):
+            if params["FID_INPUT_ISCD"] == "000002" and params["FID_INPUT_DATE_1"] == "20240103":
+                return ka.APIRespError(500, "Internal Server Error")
+            return market(url, tr_id, tr_cont, params)
+
+        mocker.patch.object(ka, "_url_fetch", side_effect=flaky)
+        first = backfill_minutes(["000001", "000002"], "20240102", "20240104")
+
+        assert first.results == {"000001": 3 * 391}
+        assert list(first.errors) == ["000002"]
+        assert store.read("000002", "1", False) == (None, None)
+
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=market)
+        second = backfill_minutes(["000001", "000002"], "20240102", "20240104")
+
+        assert second.ok and second.results["000002"] == 3 * 391
+        assert {(c.args[3]["FID_INPUT_ISCD"], c.args[3]["FID_INPUT_DATE_1"]) for c in fetch.call_args_list} == {
+            ("000002", "20240103")
+        }
+        assert load_minute_data("000002", "20240102", "20240104", minutes=60).shape == (3 * 7, 5)
+        assert fetch.call_count == 4  # 저장소에서 읽음
+
+    def test_progress_per_page(self, mocker):
+        mocker.patch.object(ka, "_url_fetch", side_effect=minute_market(self.DAYS))
+        progress = []
+
+        backfill_minutes(["000001"], "20240102", "20240102", on_progress=lambda done, total, key, *_: progress.append((done, total, key)))
+
+        assert [p[:2] for p in progress] == [(1, 4), (2, 4), (3, 4), (4, 4)]
+        assert sorted(p[2][2] for p in progress) == ["093000", "113000", "133000", "153000"]
+
+
+@pytest.mark.unit
+class TestSnapshot:
+    """load_snapshot 테스트"""
+
+    def test_reuses_latest_snapshot(self, mocker):
+        """같은 조건으로 다시 로드하면 API 조회 없이 같은 스냅샷"""
+        days = weekdays("2024-01-01", "2024-01-31")
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=market({d: 100 for d in days}))
+
+        sid, panel = load_snapshot(["000001"], "20240101", "20240131")
+        calls = fetch.call_count
+        again, reloaded = load_snapshot(["000001"], "20240101", "20240131")
+
+        assert sid is not None and again == sid
+        assert fetch.call_count == calls
+        np.testing.assert_array_equal(reloaded.values, panel.values)
+
+    def test_open_ended_range_is_not_reused(self, mocker):
+        """종료일이 오늘 이후면 이전 스냅샷을 재사용하지 않고 다시 로드"""
+        today = date.today().strftime("%Y%m%d")
+        days = weekdays(pd.Timestamp.today() - pd.Timedelta(days=30), pd.Timestamp.today())
+        mocker.patch.object(ka, "_url_fetch", side_effect=market({d: 100 for d in days}))
+
+        load_snapshot(["000001"], days[0], today, adjusted=False)
+        latest = mocker.spy(SnapshotStore, "latest")
+        load_snapshot(["000001"], days[0], today, adjusted=False)
+
+        assert latest.call_count == 0
+
+    def test_pinned_id_and_refresh(self, mocker, store):
+        """ID 를 지정하면 그 데이터 그대로, refresh 는 다시 로드해서 데이터가 바뀌면 새 ID"""
+        days = weekdays("2024-01-01", "2024-01-31")
+        mocker.patch.object(ka, "_url_fetch", side_effect=market({d: 100 for d in days}))
+        sid, _ = load_snapshot(["000001"], "20240101", "20240131")
+
+        for adjusted in (True, False):  # 저장소 데이터가 바뀐 경우 (재조회, 수정주가 재계산 등)
+            store.delete("000001", "D", adjusted)
+        mocker.patch.object(ka, "_url_fetch", side_effect=market({d: 200 for d in days}))
+        assert load_snapshot(["000001"], "20240101", "20240131")[0] == sid
+        refreshed, panel = load_snapshot(["000001"], "20240101", "20240131", refresh=True)
+        pinned_id, pinned = load_snapshot([], "", "", snapshot_id=sid)
+
+        assert refreshed != sid
+        assert panel.symbol("000001")["Close"].iloc[-1] == 200
+        assert pinned_id == sid and pinned.symbol("000001")["Close"].iloc[-1] == 100
@@ -0,0 +1,183 @@
+"""
+domestic_stock_functions 연속조회 테스트
+"""
+import pandas as pd
+import pytest
+
+import kis_auth as ka
+from domestic_stock import domestic_stock_functions as dsf
+from tests.test_kis_auth import FakeResponse, ok_body
+
+
+def make_resp(tr_cont="", **body):
+    return ka.APIResp(FakeResponse(ok_body(**body), headers={"tr_cont": tr_cont}))
+
+
+@pytest.mark.unit
+class TestPaging:
+    """연속조회 함수 테스트"""
+
+    def test_volume_rank_reads_every_page(self, mocker):
+        """페이지 수 제한 없이 전체 페이지를 하나의 DataFrame 으로"""
+        pages = [make_resp("M", output=[{"mksc_shrn_iscd": f"{i:06d}"}]) for i in range(14)]
+        pages.append(make_resp("D", output=[{"mksc_shrn_iscd": "000014"}]))
+        mocker.patch.object(ka, "_url_fetch", side_effect=pages)
+
+        df = dsf.volume_rank("J", "20171", "0000", "0", "0", "111111111", "0000000000", "", "", "", "")
+
+        assert isinstance(df, pd.DataFrame)
+        assert df["mksc_shrn_iscd"].tolist() == [f"{i:06d}" for i in range(15)]
+        assert df.index.tolist() == list(range(15))
+
+    def test_inquire_balance_follows_cursor(self, mocker):
+        """잔고조회는 연속조회키를 넘기며 output1 / output2 를 각각 모음"""
+        pages = [
+            make_resp("M", output1=[{"pdno": "005930"}], output2=[{"tot_evlu_amt": "1"}],
+                      ctx_area_fk100="FK", ctx_area_nk100="NK"),
+            make_resp("D", output1=[{"pdno": "000660"}], output2=[{"tot_evlu_amt": "2"}],
+                      ctx_area_fk100="", ctx_area_nk100=""),
+        ]
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=pages)
+
+        df1, df2 = dsf.inquire_balance("real", "12345678", "01", "N", "02", "01", "N", "N", "00")
+
+        assert df1["pdno"].tolist() == ["005930", "000660"]
+        assert len(df2) == 2
+        second = fetch.call_args_list[1].args
+        assert second[2] == "N"
+        assert second[3]["CTX_AREA_FK100"] == "FK"
+        assert second[3]["CTX_AREA_NK100"] == "NK"
+
+    def test_error_returns_empty(self, mocker):
+        """오류 응답이면 빈 DataFrame"""
+        mocker.patch.object(ka, "_url_fetch", return_value=ka.APIRespError(500, "server error"))
+
+        df1, df2 = dsf.inquire_balance("real", "12345678", "01", "N", "02", "01", "N", "N", "00")
+
+        assert df1.empty and df2.empty
+
+
+CCLD_ARGS = ("real", "inner", "12345678", "01", "20240101", "20241231", "00", "00", "00", "00")
+
+
+@pytest.mark.unit
+class TestStreaming:
+    """페이지 단위 generator 테스트"""
+
+    def test_pages_are_yielded_as_they_arrive(self, mocker):
+        """다음 페이지는 앞 페이지를 소비한 뒤에 요청"""
+        pages = [
+            make_resp("M", output1=[{"odno": "1"}, {"odno": "2"}], output2={"tot_ord_qty": "2"},
+                      ctx_area_fk100="FK", ctx_area_nk100="NK"),
+            make_resp("D", output1=[{"odno": "3"}], output2={"tot_ord_qty": "1"}),
+        ]
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=pages)
+
+        it = dsf.iter_inquire_daily_ccld(*CCLD_ARGS)
+        df1, df2 = next(it)
+
+        assert fetch.call_count == 1
+        assert df1["odno"].tolist() == ["1", "2"]
+        assert len(df2) == 1
+
+        df1, _ = next(it)
+        assert df1["odno"].tolist() == ["3"]
+        assert fetch.call_args_list[1].args[3]["CTX_AREA_NK100"] == "NK"
+        assert next(it, None) is None
+
+    def test_records(self, mocker):
+        """records=True 면 output1 레코드 단위"""
+        pages = [
+            make_resp("F", output1=[{"pdno": "005930"}], output2={"rlzt_pfls": "10"}),
+            make_resp("E", output1=[{"pdno": "000660"}], output2={"rlzt_pfls": "5"}),
+        ]
+        mocker.patch.object(ka, "_url_fetch", side_effect=pages)
+
+        rows = list(dsf.iter_inquire_period_trade_profit(
+            "12345678", "01", "02", "20230101", "20231231", "00", records=True
+        ))
+
+        assert [r["pdno"] for r in rows] == ["005930", "000660"]
+
+    def test_error_raises(self, mocker):
+        """오류 응답은 KISAPIError"""
+        mocker.patch.object(ka, "_url_fetch", return_value=ka.APIRespError(500, "server error"))
+
+        with pytest.raises(ka.KISAPIError):
+            list(dsf.iter_inquire_daily_ccld(*CCLD_ARGS))
+
+    def test_validation_is_shared(self):
+        """목록 함수와 같은 파라미터 검증"""
+        with pytest.raises(ValueError):
+            next(dsf.iter_inquire_daily_ccld("real", "inner", "", "01", "20240101", "20241231", "00", "00", "00", "00"))
+
+    def test_daily_short_sale_walks_back_by_date(self, mocker):
+        """공매도 일별추이는 가장 이른 일자 전날을 다음 종료일자로"""
+        pages = [
+            make_resp(output1={"stck_prpr": "1"}, output2=[{"stck_bsop_date": "20240328"}, {"stck_bsop_date": "20240301"}]),
+            make_resp(output1={"stck_prpr": "1"}, output2=[{"stck_bsop_date": "20240229"}, {"stck_bsop_date": "20240201"}]),
+            make_resp(output1={"stck_prpr": "1"}, output2=[{"stck_bsop_date": "20240131"}, {"stck_bsop_date": "20231229"}]),
+        ]
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=pages)
+
+        rows = list(dsf.iter_daily_short_sale("J", "005930", "20240115", "20240328", records=True))
+
+        assert [r["stck_bsop_date"] for r in rows] == ["20240328", "20240301", "20240229", "20240201", "20240131"]
+        assert [c.args[3]["FID_INPUT_DATE_2"] for c in fetch.call_args_list] == ["20240328", "20240229", "20240131"]
+
+
+def multprice_resp(params):
+    """요청한 종목마다 시세 1행을 돌려주는 가짜 intstock_multprice 응답"""
+    codes = [v for k, v in params.items() if k.startswith("FID_INPUT_ISCD_")]
+    rows = [{"inter_shrn_iscd": c, "inter2_prpr": str(int(c) * 10), "prdy_ctrt": "1.5"} for c in codes]
+    return make_resp(output=rows)
+
+
+@pytest.mark.unit
+class TestQuotes:
+    """get_quotes (멀티종목 일괄 시세) 테스트"""
+
+    def test_batches_of_30_indexed_by_code(self, mocker):
+        """65종목은 30종목씩 3회 호출, 요청 순서의 종목코드 인덱스 + 타입 변환"""
+        fetch = mocker.patch.object(
+            ka, "_url_fetch", side_effect=lambda url, tr_id, tr_cont, params: multprice_resp(params))
+        codes = [f"{i:06d}" for i in range(65, 0, -1)]
+
+        df = dsf.get_quotes(codes + codes[:5])  # 중복은 한 번만 조회
+
+        assert fetch.call_count == 3
+        sizes = sorted(sum(k.startswith("FID_INPUT_ISCD_") for k in c.args[3]) for c in fetch.call_args_list)
+        assert sizes == [5, 30, 30]
+        assert df.index.tolist() == codes
+        assert df.loc["000012", "inter2_prpr"] == 120
+        assert df["prdy_ctrt"].dtype == "float64"
+
+    def test_failed_batch_is_dropped(self, mocker):
+        """실패한 배치의 종목만 빠지고 나머지는 반환"""
+        def fetch(url, tr_id, tr_cont, params):
+            if params["FID_INPUT_ISCD_1"] == "000000":
+                return ka.APIResp(FakeResponse({"rt_cd": "1", "msg_cd": "E", "msg1": "error"}))
+            return multprice_resp(params)
+        mocker.patch.object(ka, "_url_fetch", side_effect=fetch)
+
+        df = dsf.get_quotes([f"{i:06d}" for i in range(40)])
+
+        assert df.index.tolist() == [f"{i:06d}" for i in range(30, 40)]
+
+    def test_transport_error_drops_only_its_batch(self, mocker):
+        """전송 예외가 난 배치도 오류 응답처럼 그 배치 종목만 빠짐"""
+        def fetch(url, tr_id, tr_cont, params):
+            if params["FID_INPUT_ISCD_1"] == "000000":
+                raise ConnectionError("connection reset")
+            return multprice_resp(params)
+        mocker.patch.object(ka, "_url_fetch", side_effect=fetch)
+
+        df = dsf.get_quotes([f"{i:06d}" for i in range(40)])
+
+        assert df.index.tolist() == [f"{i:06d}" for i in range(30, 40)]
+
+    def test_empty(self, mocker):
+        fetch = mocker.patch.object(ka, "_url_fetch")
+
+        assert dsf.get_quotes([]).empty
+        fetch.assert_not_called()
@@ -0,0 +1,126 @@
+"""
+domestic_stock_functions_async (async 변환 함수) 테스트
+"""
+import asyncio
+import inspect
+
+import pandas as pd
+import pytest
+
+import kis_auth as ka
+from domestic_stock import domestic_stock_functions as dsf
+from domestic_stock import domestic_stock_functions_async as dsa
+from tests.test_kis_auth import FakeResponse, ok_body
+
+
+def make_resp(body, tr_cont=""):
+    return ka.APIResp(FakeResponse(body, headers={"tr_cont": tr_cont}))
+
+
+@pytest.mark.unit
+class TestAsyncFunctions:
+    """async 변환 함수 테스트"""
+
+    def test_every_rest_function_has_async_twin(self):
+        """_url_fetch / _paginate / _streamPages 를 호출하는 모든 함수에 async 버전 존재"""
+        sync_names = {
+            name for name, fn in inspect.getmembers(dsf, inspect.isfunction)
+            if fn.__module__ == dsf.__name__
+            and any(call in inspect.getsource(fn) for call in ("ka._url_fetch(", "ka._paginate(", "ka._streamPages("))
+        }
+
+        assert sync_names <= set(dsa.__all__)
+        assert all(
+            inspect.iscoroutinefunction(getattr(dsa, name)) or inspect.isasyncgenfunction(getattr(dsa, name))
+            for name in sync_names
+        )
+
+    async def test_streaming_generators_become_async_generators(self, mocker):
+        """iter_* 는 async for 로 페이지를 받음"""
+        pages = [
+            make_resp(ok_body(output1=[{"odno": "1"}], output2={"tot_ord_qty": "1"}), tr_cont="M"),
+            make_resp(ok_body(output1=[{"odno": "2"}], output2={"tot_ord_qty": "1"}), tr_cont="D"),
+        ]
+        mocker.patch.object(ka, "_url_fetch_async", mocker.AsyncMock(side_effect=pages))
+
+        assert inspect.isasyncgenfunction(dsa.iter_inquire_daily_ccld)
+        rows = [
+            row async for row in dsa.iter_inquire_daily_ccld(
+                "real", "inner", "12345678", "01", "20240101", "20241231", "00", "00", "00", "00",
+                records=True,
+            )
+        ]
+
+        assert [r["odno"] for r in rows] == ["1", "2"]
+
+    async def test_inquire_price(self, mocker):
+        """단건 조회는 원본과 같은 DataFrame 반환"""
+        fetch = mocker.patch.object(ka, "_url_fetch_async", mocker.AsyncMock(
+            return_value=make_resp(ok_body(output={"stck_prpr": "70000"}))))
+
+        df = await dsa.inquire_price("real", "J", "005930")
+
+        assert isinstance(df, pd.DataFrame)
+        assert df.iloc[0]["stck_prpr"] == "70000"
+        assert fetch.await_args.args[1] == "FHKST01010100"
+
+    async def test_validation_is_kept(self):
+        """필수 파라미터 검증 로직 유지"""
+        with pytest.raises(ValueError):
+            await dsa.inquire_price("", "J", "005930")
+
+    async def test_continuation_pages_are_awaited(self, mocker):
+        """연속조회(tr_cont=M)도 await 로 이어서 호출"""
+        pages = [
+            make_resp(ok_body(output=[{"mksc_shrn_iscd": "005930"}]), tr_cont="M"),
+            make_resp(ok_body(output=[{"mksc_shrn_iscd": "000660"}]), tr_cont="D"),
+        ]
+        mocker.patch.object(ka, "_url_fetch_async", mocker.AsyncMock(side_effect=pages))
+
+        df = await dsa.after_hour_balance("", "J", "20176", "1", "0", "0000", "0", "0", "", "")
+
+        assert df["mksc_shrn_iscd"].tolist() == ["005930", "000660"]
+
+    async def test_concurrent_calls(self, mocker):
+        """여러 요청을 한 이벤트 루프에서 동시에 실행"""
+        async def fake_fetch(api_url, tr_id, tr_cont, params, *args, **kwargs):
+            await asyncio.sleep(0.05)
+            return make_resp(ok_body(output={"stck_shrn_iscd": params["FID_INPUT_ISCD"]}))
+
+        mocker.patch.object(ka, "_url_fetch_async", fake_fetch)
+        codes = [f"{i:06d}" for i in range(50)]
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        dfs = await asyncio.gather(*(dsa.inquire_price("real", "J", c) for c in codes))
+
+        assert [df.iloc[0]["stck_shrn_iscd"] for df in dfs] == codes
+        assert loop.time() - started < 1.0
+
+    async def test_get_quotes(self, mocker):
+        """async get_quotes 도 30종목 배치로 동시 조회"""
+        from tests.test_domestic_stock_functions import multprice_resp
+
+        fetch = mocker.patch.object(ka, "_url_fetch_async", mocker.AsyncMock(
+            side_effect=lambda url, tr_id, tr_cont, params: multprice_resp(params)))
+        codes = [f"{i:06d}" for i in range(1, 61)]
+
+        df = await dsa.get_quotes(codes)
+
+        assert fetch.await_count == 2
+        assert df.index.tolist() == codes
+
+    async def test_get_quotes_transport_error_drops_batch(self, mocker):
+        """async get_quotes 도 전송 예외가 난 배치만 빠짐"""
+        from tests.test_domestic_stock_functions import multprice_resp
+
+        async def fetch(url, tr_id, tr_cont, params):
+            if params["FID_INPUT_ISCD_1"] == "000001":
+                raise ConnectionError("connection reset")
+            return multprice_resp(params)
+        mocker.patch.object(ka, "_url_fetch_async", fetch)
+        codes = [f"{i:06d}" for i in range(1, 61)]
+
+        df = await dsa.get_quotes(codes)
+
+        assert df.index.tolist() == codes[30:]
@@ -0,0 +1,1095 @@
+"""
+kis_auth REST 공통 모듈 테스트
+"""
+import asyncio
+import multiprocessing
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+import requests
+
+import kis_auth as ka
+
+
+class FakeResponse:
+    """requests.Response 대용 (status_code / headers / json / text)"""
+
+    def __init__(self, body, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers if headers is not None else {"tr_cont": ""}
+        self._body = body
+        self.text = str(body)
+
+    def json(self):
+        return dict(self._body)
+
+
+def ok_body(**kwargs):
+    body = {"rt_cd": "0", "msg_cd": "MCA00000", "msg1": "정상처리 되었습니다."}
+    body.update(kwargs)
+    return body
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """테스트간 응답 캐시 공유 방지"""
+    ka.clearCache()
+    ka.resetCacheStats()
+    yield
+    ka.clearCache()
+
+
+@pytest.fixture
+def trenv():
+    """실전 환경으로 TR 환경 설정"""
+    ka.changeTREnv("test-token", svr="prod", product="01")
+    yield ka.getTREnv()
+
+
+def raw_response(body: bytes, status_code=200, headers=None):
+    """본문 bytes 를 가진 실제 requests.Response"""
+    r = requests.Response()
+    r.status_code = status_code
+    r._content = body
+    r.headers.update(headers or {"tr_cont": "M", "Content-Type": "application/json"})
+    return r
+
+
+@pytest.fixture
+def http_pool():
+    """테스트마다 새 커넥션 풀 사용"""
+    ka.close_http_pool()
+    yield
+    ka.set_http_pool(pool_size=ka.settings.http_pool_size,
+                     timeout=(ka.settings.http_connect_timeout, ka.settings.http_read_timeout))
+
+
+@pytest.mark.unit
+class TestHttpPool:
+    """REST 커넥션 풀 테스트"""
+
+    def test_session_is_shared(self, http_pool):
+        """모든 호출이 같은 세션을 공유"""
+        assert ka._getSession() is ka._getSession()
+
+    def test_session_is_shared_across_threads(self, http_pool):
+        """여러 스레드에서 동시에 요청해도 세션은 하나만 생성"""
+        sessions = []
+
+        def worker():
+            sessions.append(ka._getSession())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(s) for s in sessions}) == 1
+
+    def test_set_http_pool_rebuilds_adapter(self, http_pool):
+        """풀 크기 변경시 새 세션에 반영"""
+        before = ka._getSession()
+        ka.set_http_pool(pool_size=5, timeout=(1.0, 2.0))
+        after = ka._getSession()
+
+        assert after is not before
+        assert after.get_adapter("https://example.com")._pool_maxsize == 5
+        assert ka._http_timeout == (1.0, 2.0)
+
+    def test_url_fetch_uses_pool_with_timeout(self, http_pool, trenv, mocker):
+        """_url_fetch 는 공용 세션으로 타임아웃을 지정해서 호출"""
+        get = mocker.patch.object(ka._getSession(), "get",
+                                  return_value=FakeResponse(ok_body(output={"stck_prpr": "70000"})))
+
+        res = ka._url_fetch("/uapi/domestic-stock/v1/quotations/inquire-price",
+                            "FHKST01010100", "", {"FID_INPUT_ISCD": "005930"})
+
+        assert res.isOK()
+        assert res.getBody().output["stck_prpr"] == "70000"
+        assert get.call_args.kwargs["timeout"] == ka._http_timeout
+        assert get.call_args.kwargs["headers"]["tr_id"] == "FHKST01010100"
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """API 호출 속도 제한 테스트"""
+
+    def test_first_call_does_not_wait(self):
+        """여유가 있으면 바로 통과"""
+        bucket = ka.TokenBucket(rate=10)
+
+        started = time.monotonic()
+        bucket.acquire()
+
+        assert time.monotonic() - started < 0.05
+
+    def test_calls_are_spaced_at_rate(self):
+        """연속 호출은 1/rate 간격으로 진행"""
+        bucket = ka.TokenBucket(rate=50)
+
+        started = time.monotonic()
+        for _ in range(11):
+            bucket.acquire()
+
+        assert time.monotonic() - started == pytest.approx(0.2, abs=0.05)
+
+    def test_threads_share_budget(self):
+        """여러 스레드가 동시에 호출해도 합계 속도 유지"""
+        bucket = ka.TokenBucket(rate=50)
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(11)]
+
+        started = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert time.monotonic() - started == pytest.approx(0.2, abs=0.05)
+
+    async def test_async_tasks_share_budget(self):
+        """asyncio task 들도 같은 버킷을 공유"""
+        bucket = ka.TokenBucket(rate=50)
+
+        started = time.monotonic()
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(11)))
+
+        assert time.monotonic() - started == pytest.approx(0.2, abs=0.05)
+
+    def test_change_env_applies_rate(self):
+        """환경 전환시 실전/모의 호출 제한 적용"""
+        ka.changeTREnv("test-token", svr="vps", product="01")
+        assert ka.getRateLimiter().rate == ka.settings.rate_limit_vps
+
+        ka.changeTREnv("test-token", svr="prod", product="01")
+        assert ka.getRateLimiter().rate == ka.settings.rate_limit_prod
+
+    async def test_websocket_sends_use_separate_budget(self, mocker):
+        """웹소켓 구독 메시지는 REST 호출 예산을 쓰지 않음"""
+        rest = mocker.patch.object(ka._rate_limiter, "acquire_async", mocker.AsyncMock())
+        ws_limit = mocker.patch.object(ka._ws_rate_limiter, "acquire_async", mocker.AsyncMock())
+        mocker.patch.object(ka, "add_data_map")
+        ws = mocker.Mock(send=mocker.AsyncMock())
+        request = lambda tr_type, data: ({"body": {"input": {"tr_id": "H0STCNT0", "tr_key": data}}}, [])
+
+        for code in ("005930", "000660", "035720"):
+            await ka.KISWebSocket.send(ws, request, "1", code)
+
+        assert ws_limit.await_count == 3
+        rest.assert_not_awaited()
+
+
+def _acquire_shared(path, count):
+    limiter = ka.SharedRateLimiter("app-key", rate=50, path=path)
+    for _ in range(count):
+        limiter.acquire()
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(ka.fcntl is None, reason="POSIX 파일 잠금 필요")
+class TestSharedRateLimiter:
+    """프로세스간 공유 호출 예산 테스트"""
+
+    def test_state_file_is_keyed_by_app_key(self):
+        """앱키별로 다른 상태 파일 사용 (앱키 원문은 파일명에 노출하지 않음)"""
+        a = ka.SharedRateLimiter("app-key-a", rate=10)
+        b = ka.SharedRateLimiter("app-key-b", rate=10)
+
+        assert a.path != b.path
+        assert "app-key" not in a.path
+
+    def test_limiters_on_same_file_share_budget(self, tmp_path):
+        """같은 상태 파일을 쓰는 제한기끼리 예산 공유"""
+        path = str(tmp_path / "ratelimit")
+        a = ka.SharedRateLimiter("app-key", rate=50, path=path)
+        b = ka.SharedRateLimiter("app-key", rate=50, path=path)
+
+        started = time.monotonic()
+        for _ in range(5):
+            a.acquire()
+            b.acquire()
+
+        assert time.monotonic() - started == pytest.approx(0.18, abs=0.05)
+
+    def test_processes_share_budget(self, tmp_path):
+        """여러 프로세스가 동시에 호출해도 합계 속도 유지"""
+        path = str(tmp_path / "ratelimit")
+        ctx = multiprocessing.get_context("fork")
+        procs = [ctx.Process(target=_acquire_shared, args=(path, 10)) for _ in range(2)]
+
+        started = time.monotonic()
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+
+        assert all(p.exitcode == 0 for p in procs)
+        assert time.monotonic() - started >= 19 / 50
+
+
+RATE_EXCEEDED = '{"rt_cd": "1", "msg_cd": "EGW00201", "msg1": "초당 거래건수를 초과하였습니다."}'
+TOKEN_EXPIRED = '{"rt_cd": "1", "msg_cd": "EGW00123", "msg1": "기간이 만료된 token 입니다."}'
+
+
+class ErrorResponse(FakeResponse):
+    def __init__(self, text, status_code=500):
+        super().__init__({}, status_code=status_code)
+        self.text = text
+
+
+@pytest.fixture
+def resilience(monkeypatch, mocker):
+    """테스트마다 새 회로 차단기 / 속도 제한기, 재시도 대기 없음"""
+    monkeypatch.setattr(ka, "_circuit", ka.CircuitBreaker(failure_threshold=3, reset_timeout=0.2))
+    monkeypatch.setattr(ka, "_rate_limiter", ka.TokenBucket(rate=1000))
+    mocker.patch.object(ka.RetryPolicy, "delay", return_value=0)
+
+
+@pytest.mark.unit
+class TestRetry:
+    """오류 분류 / 재시도 / AIMD / 회로 차단기 테스트"""
+
+    @pytest.mark.parametrize("status,text,expected", [
+        (500, RATE_EXCEEDED, ka.ERR_RATE),
+        (429, "", ka.ERR_RATE),
+        (500, TOKEN_EXPIRED, ka.ERR_AUTH),
+        (502, "Bad Gateway", ka.ERR_TRANSIENT),
+        (400, '{"msg_cd": "OPSQ0001"}', ka.ERR_HARD),
+    ])
+    def test_classify_error(self, status, text, expected):
+        """msg_cd / HTTP 상태로 오류 분류"""
+        assert ka._classifyError(status, text) == expected
+
+    def test_retry_delay_is_bounded_with_jitter(self):
+        """지수 백오프 + jitter, 최대 대기 시간 제한"""
+        policy = ka.RetryPolicy(max_retries=5, base_delay=0.5, max_delay=2.0)
+
+        delays = [policy.delay(10) for _ in range(100)]
+
+        assert all(0 <= d <= 2.0 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_rate_exceeded_is_retried_and_slows_down(self, http_pool, trenv, resilience, mocker):
+        """호출 제한 초과시 속도를 낮추고 재시도"""
+        mocker.patch.object(ka._getSession(), "get", side_effect=[
+            ErrorResponse(RATE_EXCEEDED),
+            ErrorResponse(RATE_EXCEEDED),
+            FakeResponse(ok_body(output={})),
+        ])
+
+        res = ka._url_fetch("/uapi/test", "FHKST01010100", "", {})
+
+        assert res.isOK()
+        assert ka._rate_limiter.rate < ka._rate_limiter.max_rate
+
+    def test_rate_recovers_additively(self):
+        """정상 응답이 이어지면 설정 속도까지 복구"""
+        bucket = ka.TokenBucket(rate=20)
+        bucket.on_throttle()
+        assert bucket.rate == 10
+
+        for _ in range(100):
+            bucket.on_success()
+
+        assert bucket.rate == 20
+
+    def test_token_expired_reauths_and_retries(self, http_pool, trenv, resilience, mocker):
+        """토큰 만료시 재인증 후 재시도"""
+        reauth = mocker.patch.object(ka, "_reAuthNow")
+        mocker.patch.object(ka._getSession(), "get", side_effect=[
+            ErrorResponse(TOKEN_EXPIRED),
+            FakeResponse(ok_body(output={})),
+        ])
+
+        res = ka._url_fetch("/uapi/test", "FHKST01010100", "", {})
+
+        assert res.isOK()
+        reauth.assert_called_once()
+
+    def test_hard_error_is_not_retried(self, http_pool, trenv, resilience, mocker):
+        """파라미터 오류 등은 재시도 없이 반환"""
+        get = mocker.patch.object(ka._getSession(), "get",
+                                  return_value=ErrorResponse('{"msg_cd": "OPSQ0001"}', status_code=400))
+
+        res = ka._url_fetch("/uapi/test", "FHKST01010100", "", {})
+
+        assert not res.isOK()
+        assert get.call_count == 1
+
+    def test_post_is_not_retried_on_server_error(self, http_pool, trenv, resilience, mocker):
+        """주문(POST)은 5xx 에서 중복 실행 위험이 있어 재시도하지 않음"""
+        post = mocker.patch.object(ka._getSession(), "post",
+                                   return_value=ErrorResponse("Bad Gateway", status_code=502))
+
+        res = ka._url_fetch("/uapi/test", "TTTC0802U", "", {}, postFlag=True)
+
+        assert not res.isOK()
+        assert post.call_count == 1
+
+    def test_network_error_is_raised_after_retries(self, http_pool, trenv, resilience, mocker):
+        """네트워크 오류는 재시도 후에도 실패하면 예외 발생"""
+        get = mocker.patch.object(ka._getSession(), "get",
+                                  side_effect=ka.requests.ConnectionError("reset"))
+
+        with pytest.raises(ka.requests.ConnectionError):
+            ka._url_fetch("/uapi/test", "FHKST01010100", "", {})
+
+        assert get.call_count == ka._retry_policies[ka.ERR_TRANSIENT].max_retries + 1
+
+    def test_circuit_opens_after_consecutive_failures(self, http_pool, trenv, resilience, mocker):
+        """연속 실패시 회로가 열려 호출 차단, 일정 시간 후 시험 호출로 복구"""
+        get = mocker.patch.object(ka._getSession(), "get",
+                                  return_value=ErrorResponse("Bad Gateway", status_code=502))
+        for _ in range(3):
+            ka._url_fetch("/uapi/test", "FHKST01010100", "", {})
+        calls = get.call_count
+
+        res = ka._url_fetch("/uapi/test", "FHKST01010100", "", {})
+
+        assert res.getErrorCode() == "503"
+        assert get.call_count == calls
+        assert ka._circuit.state == "open"
+
+        time.sleep(0.25)
+        get.return_value = FakeResponse(ok_body(output={}))
+        assert ka._url_fetch("/uapi/test", "FHKST01010100", "", {}).isOK()
+        assert ka._circuit.state == "closed"
+
+    def test_trial_call_is_retried_within_one_call(self, http_pool, trenv, resilience, mocker):
+        """half-open 시험 호출이 재시도 대상 오류를 받아도 같은 호출 안에서 재시도 후 회로 복구"""
+        breaker = ka._circuit
+        for _ in range(3):
+            breaker.record_failure()
+        time.sleep(0.25)
+        get = mocker.patch.object(ka._getSession(), "get", side_effect=[
+            ErrorResponse(RATE_EXCEEDED),
+            FakeResponse(ok_body(output={})),
+        ])
+
+        assert ka._url_fetch("/uapi/test", "FHKST01010100", "", {}).isOK()
+        assert get.call_count == 2
+        assert breaker.state == "closed"
+
+    def test_trial_ending_without_result_reopens(self, http_pool, trenv, resilience, mocker):
+        """시험 호출이 결과 기록 없이 끝나면(재인증 실패 등) 다시 차단되고 이후 새 시험 호출 허용"""
+        breaker = ka._circuit
+        for _ in range(3):
+            breaker.record_failure()
+        time.sleep(0.25)
+        mocker.patch.object(ka, "_reAuthNow", side_effect=RuntimeError("auth failed"))
+        get = mocker.patch.object(ka._getSession(), "get",
+                                  return_value=ErrorResponse(TOKEN_EXPIRED))
+
+        with pytest.raises(RuntimeError):
+            ka._url_fetch("/uapi/test", "FHKST01010100", "", {})
+        assert breaker.state == "open"
+
+        time.sleep(0.25)
+        get.return_value = FakeResponse(ok_body(output={}))
+        assert ka._url_fetch("/uapi/test", "FHKST01010100", "", {}).isOK()
+        assert breaker.state == "closed"
+
+
+PRICE_URL = "/uapi/domestic-stock/v1/quotations/inquire-price"
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    """API 응답 캐시 테스트"""
+
+    @pytest.mark.parametrize("api_url,expected", [
+        ("/uapi/domestic-stock/v1/quotations/inquire-price", "quote"),
+        ("/uapi/domestic-stock/v1/quotations/volume-rank", "ranking"),
+        ("/uapi/domestic-stock/v1/ranking/fluctuation", "ranking"),
+        ("/uapi/domestic-stock/v1/finance/financial-ratio", "info"),
+        ("/uapi/domestic-stock/v1/ksdinfo/dividend", "info"),
+        ("/uapi/domestic-stock/v1/trading/inquire-balance", "balance"),
+        ("/uapi/domestic-stock/v1/trading/order-cash", None),
+    ])
+    def test_endpoint_classes(self, api_url, expected):
+        """api_url 로 캐시 분류 결정"""
+        assert ka._cacheClass(api_url)[0] == expected
+
+    def test_repeated_quote_is_served_from_cache(self, http_pool, trenv, mocker):
+        """같은 요청은 TTL 동안 API 호출 없이 재사용, 파라미터가 다르면 별도 호출"""
+        get = mocker.patch.object(ka._getSession(), "get",
+                                  return_value=FakeResponse(ok_body(output={"stck_prpr": "70000"})))
+
+        first = ka._url_fetch(PRICE_URL, "FHKST01010100", "", {"FID_INPUT_ISCD": "005930"})
+        second = ka._url_fetch(PRICE_URL, "FHKST01010100", "", {"FID_INPUT_ISCD": "005930"})
+        ka._url_fetch(PRICE_URL, "FHKST01010100", "", {"FID_INPUT_ISCD": "000660"})
+
+        assert second is first
+        assert get.call_count == 2
+        assert ka.getCacheStats()["quote"] == {"hits": 1, "misses": 2, "hit_rate": pytest.approx(1 / 3)}
+
+    def test_entries_expire_after_ttl(self, http_pool, trenv, mocker, monkeypatch):
+        """TTL 이 지나면 다시 호출"""
+        get = mocker.patch.object(ka._getSession(), "get",
+                                  return_value=FakeResponse(ok_body(output={})))
+        ka.set_cache_ttl("quote", 0.05)
+        try:
+            ka._url_fetch(PRICE_URL, "FHKST01010100", "", {})
+            time.sleep(0.06)
+            ka._url_fetch(PRICE_URL, "FHKST01010100", "", {})
+        finally:
+            ka.set_cache_ttl("quote", 1.0)
+
+        assert get.call_count == 2
+
+    def test_errors_are_not_cached(self, http_pool, trenv, mocker):
+        """실패 응답은 캐시하지 않음"""
+        get = mocker.patch.object(ka._getSession(), "get",
+                                  return_value=FakeResponse({"rt_cd": "1", "msg_cd": "X", "msg1": "오류"}))
+
+        ka._url_fetch(PRICE_URL, "FHKST01010100", "", {})
+        ka._url_fetch(PRICE_URL, "FHKST01010100", "", {})
+
+        assert get.call_count == 2
+
+    def test_lru_size_bound(self):
+        """최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목 제거"""
+        cache = ka.ResponseCache(maxsize=2)
+        cache.put(("quote", 1), "a", 10)
+        cache.put(("quote", 2), "b", 10)
+        cache.get(("quote", 1))
+        cache.put(("quote", 3), "c", 10)
+
+        assert cache.get(("quote", 2)) is None
+        assert cache.get(("quote", 1)) == "a"
+
+    def test_order_invalidates_balance(self, http_pool, trenv, mocker):
+        """주문 후에는 잔고 캐시 무효화"""
+        mocker.patch.object(ka._getSession(), "post", return_value=FakeResponse(ok_body(output={})))
+        get = mocker.patch.object(ka._getSession(), "get", return_value=FakeResponse(ok_body(output1=[])))
+        balance_url = "/uapi/domestic-stock/v1/trading/inquire-balance"
+
+        ka._url_fetch(balance_url, "TTTC8434R", "", {"CANO": "12345678"})
+        ka._url_fetch("/uapi/domestic-stock/v1/trading/order-cash", "TTTC0802U", "", {}, postFlag=True)
+        ka._url_fetch(balance_url, "TTTC8434R", "", {"CANO": "12345678"})
+
+        assert get.call_count == 2
+
+
+class FakeIssuer:
+    """토큰 발급 API 대용, token 에 지정한 값을 발급하고 호출 횟수 기록"""
+
+    def __init__(self):
+        self.token = "token-1"
+        self.expires_in = timedelta(hours=24)
+        self.calls = []
+
+    def __call__(self, svr, appkey, appsecret):
+        self.calls.append(svr)
+        return self.token, datetime.now() + self.expires_in
+
+
+@pytest.fixture
+def tokens(mocker, tmp_path):
+    """테스트용 토큰 관리자 (토큰 파일은 임시 폴더, 발급은 FakeIssuer)"""
+    issuer = FakeIssuer()
+    manager = ka.TokenManager(refresh_margin=600)
+    mocker.patch.object(manager, "_issue", side_effect=issuer)
+    mocker.patch.object(ka, "_token_manager", manager)
+    mocker.patch.object(ka, "_tokenPath", lambda appkey: str(tmp_path / f"token_{appkey}"))
+    mocker.patch.object(ka, "_auth_deadlines", {})
+    mocker.patch.dict(ka._cfg, {"paper_app": "paper-app", "paper_sec": "paper-sec"})
+    yield issuer
+    mocker.stopall()
+    ka.changeTREnv("test-token", svr="prod", product="01")
+
+
+@pytest.fixture
+def header_templates(mocker, tokens):
+    """테스트용 빈 헤더 템플릿 (전역 템플릿 보존)"""
+    mocker.patch.object(ka, "_header_templates", {})
+    mocker.patch.object(ka, "_ws_header_templates", {})
+    yield tokens
+
+
+@pytest.mark.unit
+class TestHeaderTemplate:
+    """헤더 템플릿 테스트"""
+
+    def test_auth_builds_template(self, header_templates, mocker):
+        """auth() 시점에 토큰/앱키가 들어간 템플릿 생성"""
+        ka.auth("prod", "01")
+
+        url, headers = ka._prepareRequest("/uapi/test", "FHKST01010100", "N", {})
+
+        assert headers["authorization"] == "Bearer token-1"
+        assert headers["appkey"] == ka.getTREnv().my_app
+        assert headers["tr_id"] == "FHKST01010100"
+        assert headers["tr_cont"] == "N"
+        assert headers["custtype"] == "P"
+        assert headers["Content-Type"] == "application/json"
+
+    def test_template_is_not_modified_by_calls(self, header_templates, mocker):
+        """호출별 헤더 / 추가 헤더는 템플릿에 남지 않음"""
+        ka.auth("prod", "01")
+
+        _, h1 = ka._prepareRequest("/uapi/test", "TTTC0802U", "", {}, {"hashkey": "abc"})
+        h1["tr_id"] = "changed"
+        _, h2 = ka._prepareRequest("/uapi/test", "FHKST01010100", "", {})
+
+        assert "hashkey" not in h2
+        assert h2["tr_id"] == "FHKST01010100"
+        assert "tr_id" not in ka._headerTemplate()
+        with pytest.raises(TypeError):
+            ka._headerTemplate()["authorization"] = "x"
+
+    def test_token_rotation_swaps_template(self, header_templates, mocker):
+        """토큰 재발급시 템플릿 교체, 이전에 받은 템플릿은 그대로"""
+        ka.auth("prod", "01")
+        old = ka._headerTemplate()
+
+        header_templates.token = "token-2"
+        ka.auth("prod", "01", force=True)
+
+        assert old["authorization"] == "Bearer token-1"
+        assert ka._headerTemplate()["authorization"] == "Bearer token-2"
+
+    def test_templates_per_environment(self, header_templates, mocker):
+        """실전 / 모의 템플릿은 따로 관리"""
+        header_templates.token = "real-token"
+        ka.auth("prod", "01")
+        header_templates.token = "paper-token"
+        ka.auth("vps", "01")
+
+        _, paper = ka._prepareRequest("/uapi/test", "TTTC8434R", "", {})
+        ka.changeTREnv("real-token", svr="prod", product="01")
+        _, real = ka._prepareRequest("/uapi/test", "TTTC8434R", "", {})
+
+        assert paper["authorization"] == "Bearer paper-token"
+        assert paper["tr_id"] == "VTTC8434R"
+        assert real["authorization"] == "Bearer real-token"
+        assert real["tr_id"] == "TTTC8434R"
+
+    def test_websocket_template(self, header_templates, http_pool, mocker):
+        """웹소켓 헤더도 auth_ws() 시점의 템플릿 사용"""
+        mocker.patch.object(
+            ka._getSession(), "post", return_value=FakeResponse({"approval_key": "approval-1"})
+        )
+        ka.auth_ws("prod", "01")
+
+        msg = ka.data_fetch("H0STCNT0", "1", {"tr_key": "005930"})
+
+        assert msg["header"]["approval_key"] == "approval-1"
+        assert msg["header"]["tr_type"] == "1"
+        assert msg["body"]["input"] == {"tr_id": "H0STCNT0", "tr_key": "005930"}
+        assert "tr_type" not in ka._headerTemplate_ws()
+
+
+@pytest.mark.unit
+class TestTokenManager:
+    """토큰 관리자 테스트"""
+
+    def test_token_cached_in_memory(self, tokens, mocker):
+        """같은 앱키는 한 번만 발급하고 이후에는 파일도 읽지 않음"""
+        read = mocker.spy(ka, "_readTokenFile")
+
+        for _ in range(5):
+            ka.auth("prod", "01")
+
+        assert tokens.calls == ["prod"]
+        assert read.call_count == 1
+        assert ka.getTREnv().my_token == "token-1"
+
+    def test_reuses_token_file(self, tokens):
+        """다른 프로세스가 저장한 유효한 토큰 파일은 발급 없이 사용"""
+        ka.save_token(
+            "saved-token",
+            (datetime.now() + timedelta(hours=10)).strftime("%Y-%m-%d %H:%M:%S"),
+            ka._tokenPath(ka._cfg["my_app"]),
+        )
+
+        assert ka.getTokenManager().get("prod") == "saved-token"
+        assert tokens.calls == []
+
+    def test_proactive_refresh(self, tokens, mocker):
+        """만료 refresh_margin 이내면 API 호출 전에 새 토큰으로 교체"""
+        tokens.expires_in = timedelta(seconds=300)  # 이미 갱신 구간
+        mocker.patch.object(ka, "_header_templates", {})
+        ka.auth("prod", "01")
+        tokens.token = "token-2"
+        tokens.expires_in = timedelta(hours=24)
+
+        _, headers = ka._prepareRequest("/uapi/test", "FHKST01010100", "", {})
+
+        assert headers["authorization"] == "Bearer token-2"
+        assert tokens.calls == ["prod", "prod"]
+
+    def test_concurrent_callers_issue_once(self, tokens):
+        """여러 스레드가 동시에 요청해도 발급은 한 번"""
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(ka.getTokenManager().get("prod")))
+            for _ in range(10)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == ["token-1"] * 10
+        assert tokens.calls == ["prod"]
+
+    def test_accounts_side_by_side(self, tokens):
+        """실전 / 모의 토큰을 함께 보관, 환경 변경시 재인증 없음"""
+        tokens.token = "real-token"
+        ka.auth("prod", "01")
+        tokens.token = "paper-token"
+        ka.auth("vps", "01")
+
+        ka.changeTREnv(None, svr="prod", product="01")
+        assert ka.getTREnv().my_token == "real-token"
+        ka.auth("vps", "01")
+        assert ka.getTREnv().my_token == "paper-token"
+        assert tokens.calls == ["prod", "vps"]
+
+    def test_explicit_token_wins_over_cache(self, tokens):
+        """changeTREnv 에 토큰을 지정하면 캐시된 토큰보다 우선"""
+        ka.auth("prod", "01")
+
+        ka.changeTREnv("explicit-token", svr="prod", product="01")
+
+        assert ka.getTREnv().my_token == "explicit-token"
+
+    def test_ws_reauth_waits_for_deadline(self, mocker):
+        """웹소켓 접속키는 유효시간(1일)이 지나기 전에는 다시 발급하지 않음"""
+        auth_ws = mocker.patch.object(ka, "auth_ws")
+        mocker.patch.object(ka, "_autoReAuth", True)
+        mocker.patch.object(ka, "_ws_auth_deadline", time.monotonic() + 60)
+
+        ka._headerTemplate_ws()
+        auth_ws.assert_not_called()
+
+        mocker.patch.object(ka, "_ws_auth_deadline", time.monotonic() - 1)
+        ka._headerTemplate_ws()
+        auth_ws.assert_called_once()
+
+    def test_force_reissues(self, tokens):
+        """force=True 면 캐시 무시하고 재발급"""
+        manager = ka.getTokenManager()
+        manager.get("prod")
+        tokens.token = "token-2"
+
+        assert manager.get("prod") == "token-1"
+        assert manager.get("prod", force=True) == "token-2"
+
+
+@pytest.mark.unit
+class TestAPIResp:
+    """응답 객체 파싱 테스트"""
+
+    BODY = '{"rt_cd":"0","msg_cd":"MCA00000","msg1":"정상","output":[{"a":"1"},{"a":"2"}]}'.encode()
+
+    def test_decodes_body_once(self, mocker):
+        """본문은 한 번만 디코딩"""
+        loads = mocker.patch.object(ka, "_json_loads", wraps=ka._json_loads)
+        res = ka.APIResp(raw_response(self.BODY))
+
+        res.isOK()
+        res.getBody().output
+        res.getBody().msg1
+        res.getErrorCode()
+
+        assert loads.call_count == 1
+
+    def test_body_and_header_fields(self):
+        """body / header 속성 접근과 hasattr 동작은 기존과 동일"""
+        res = ka.APIResp(raw_response(self.BODY))
+
+        assert res.isOK()
+        assert res.getErrorCode() == "MCA00000"
+        assert res.getErrorMessage() == "정상"
+        assert res.getBody().output == [{"a": "1"}, {"a": "2"}]
+        assert hasattr(res.getBody(), "output")
+        assert not hasattr(res.getBody(), "output2")
+        assert res.getBody()._fields == ("rt_cd", "msg_cd", "msg1", "output")
+        assert res.getHeader().tr_cont == "M"
+        assert "Content-Type" not in res.getHeader()._fields
+
+    def test_output_is_not_copied(self):
+        """output 리스트는 디코딩 결과를 그대로 노출"""
+        res = ka.APIResp(raw_response(self.BODY))
+
+        assert res.getOutput() is res.getBody().output
+        assert res.getOutput() is res.getData()["output"]
+        assert res.getOutput("output2", []) == []
+
+    def test_no_class_per_response(self):
+        """응답마다 새 클래스를 만들지 않음"""
+        a = ka.APIResp(raw_response(self.BODY))
+        b = ka.APIResp(raw_response(self.BODY))
+
+        assert type(a.getBody()) is type(b.getBody())
+        assert type(a.getHeader()) is type(b.getBody())
+
+    def test_error_body(self):
+        """rt_cd 가 0 이 아니면 실패"""
+        res = ka.APIResp(raw_response('{"rt_cd":"1","msg_cd":"EGW00201","msg1":"초당 거래건수를 초과하였습니다."}'.encode()))
+
+        assert not res.isOK()
+        assert res.getErrorCode() == "EGW00201"
+
+    def test_error_response(self):
+        """APIRespError 는 빈 결과를 돌려줌"""
+        res = ka.APIRespError(500, "server error")
+
+        assert not res.isOK()
+        assert res.getResCode() == 500
+        assert res.getOutput() is None
+        assert res.getBody().output is None
+        assert res.getHeader().tr_cont == ""
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """동일 요청 합치기 테스트"""
+
+    def test_concurrent_identical_requests_share_one_call(self, http_pool, trenv, resilience, mocker):
+        """동시에 들어온 같은 요청은 한 번만 호출하고 같은 응답 공유"""
+        def slow_get(*args, **kwargs):
+            time.sleep(0.1)
+            return FakeResponse(ok_body(output={}))
+
+        get = mocker.patch.object(ka._getSession(), "get", side_effect=slow_get)
+        results = []
+
+        def worker():
+            results.append(ka._url_fetch("/uapi/test", "FHKST01010100", "", {"FID_INPUT_ISCD": "005930"}))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert get.call_count == 1
+        assert len({id(r) for r in results}) == 1
+        assert ka._inflight.inflight() == 0
+
+    def test_errors_are_shared_with_waiters(self):
+        """대표 호출의 예외는 기다리던 호출자에게도 전달"""
+        flight = ka.SingleFlight()
+        started = threading.Event()
+        errors = []
+
+        def failing():
+            started.set()
+            time.sleep(0.05)
+            raise RuntimeError("boom")
+
+        def worker(fn):
+            try:
+                flight.do("key", fn)
+            except RuntimeError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=worker, args=(failing,))
+        leader.start()
+        started.wait()
+        follower = threading.Thread(target=worker, args=(lambda: "never",))
+        follower.start()
+        leader.join()
+        follower.join()
+
+        assert len(errors) == 2
+
+    def test_different_requests_are_not_merged(self, http_pool, trenv, resilience, mocker):
+        """파라미터가 다르면 각각 호출"""
+        get = mocker.patch.object(ka._getSession(), "get", return_value=FakeResponse(ok_body(output={})))
+
+        ka._url_fetch("/uapi/test", "FHKST01010100", "", {"FID_INPUT_ISCD": "005930"})
+        ka._url_fetch("/uapi/test", "FHKST01010100", "", {"FID_INPUT_ISCD": "000660"})
+
+        assert get.call_count == 2
+
+    async def test_async_tasks_share_one_call(self, trenv, mocker):
+        """asyncio task 들도 같은 요청은 한 번만 호출"""
+        calls = []
+
+        async def slow_fetch(*args):
+            calls.append(args)
+            await asyncio.sleep(0.05)
+            return ka.APIResp(FakeResponse(ok_body(output={})))
+
+        mocker.patch.object(ka, "_fetchWithRetryAsync", slow_fetch)
+
+        results = await asyncio.gather(*(
+            ka._url_fetch_async("/uapi/test", "FHKST01010100", "", {"FID_INPUT_ISCD": "005930"})
+            for _ in range(10)
+        ))
+
+        assert len(calls) == 1
+        assert len({id(r) for r in results}) == 1
+
+    async def test_async_leader_cancel_does_not_cancel_followers(self):
+        """먼저 요청한 task 가 취소되어도 같은 요청을 기다리던 task 는 결과를 받음"""
+        flight = ka.SingleFlight()
+        calls = []
+
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "result"
+
+        leader = asyncio.create_task(flight.do_async("key", slow))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do_async("key", slow))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "result"
+        assert leader.cancelled()
+        assert len(calls) == 1
+        assert flight.inflight() == 0
+
+
+def page(output, tr_cont, **body):
+    return ka.APIResp(FakeResponse(ok_body(output=output, **body), headers={"tr_cont": tr_cont}))
+
+
+@pytest.mark.unit
+class TestPaginate:
+    """연속조회 테스트"""
+
+    def test_collects_all_pages_without_depth_limit(self, mocker):
+        """tr_cont 가 M/F 인 동안 깊이 제한 없이 반복"""
+        pages = [page([{"n": i}], "M" if i % 2 else "F") for i in range(24)] + [page([{"n": 24}], "D")]
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=pages)
+
+        res, records = ka._paginate("/uapi/test", "FHPST01760000", "", {"A": "1"})
+
+        assert res.isOK()
+        assert [r["n"] for r in records["output"]] == list(range(25))
+        assert fetch.call_count == 25
+        assert [c.args[2] for c in fetch.call_args_list] == [""] + ["N"] * 24
+
+    def test_cursor_is_passed_to_next_page(self, mocker):
+        """응답의 연속조회키를 다음 요청 파라미터로 전달"""
+        pages = [
+            page([{"n": 1}], "M", ctx_area_fk100="FK1", ctx_area_nk100="NK1"),
+            page([{"n": 2}], "D", ctx_area_fk100="FK2", ctx_area_nk100="NK2"),
+        ]
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=pages)
+        params = {"CTX_AREA_FK100": "", "CTX_AREA_NK100": ""}
+
+        ka._paginate(
+            "/uapi/test", "TTTC8434R", "", params, ("output",),
+            cursor={"CTX_AREA_FK100": "ctx_area_fk100", "CTX_AREA_NK100": "ctx_area_nk100"},
+        )
+
+        assert fetch.call_args_list[1].args[3] == {"CTX_AREA_FK100": "FK1", "CTX_AREA_NK100": "NK1"}
+        assert params == {"CTX_AREA_FK100": "", "CTX_AREA_NK100": ""}
+
+    def test_multiple_outputs(self, mocker):
+        """output 별로 모으고 단건(dict) 응답은 1행으로"""
+        bodies = [
+            ka.APIResp(FakeResponse(ok_body(output1=[{"a": 1}, {"a": 2}], output2={"s": 1}), headers={"tr_cont": "M"})),
+            ka.APIResp(FakeResponse(ok_body(output1=[{"a": 3}], output2={"s": 2}), headers={"tr_cont": "E"})),
+        ]
+        mocker.patch.object(ka, "_url_fetch", side_effect=bodies)
+
+        _, records = ka._paginate("/uapi/test", "TTTC8001R", "", {}, ("output1", "output2", "output3"))
+
+        assert records == {"output1": [{"a": 1}, {"a": 2}, {"a": 3}], "output2": [{"s": 1}, {"s": 2}], "output3": []}
+
+    def test_first_page_error_is_returned(self, mocker):
+        """첫 페이지 오류는 오류 응답을 그대로 돌려줌"""
+        mocker.patch.object(ka, "_url_fetch", return_value=ka.APIRespError(500, "server error"))
+
+        res, records = ka._paginate("/uapi/test", "FHPST01760000", "", {})
+
+        assert not res.isOK()
+        assert records == {"output": []}
+
+    def test_later_page_error_keeps_partial_result(self, mocker):
+        """중간 페이지 오류는 중단하고 그 전까지 받은 레코드를 예외에 담아 전달"""
+        pages = [page([{"n": 1}], "M"), ka.APIRespError(500, "server error"), page([{"n": 3}], "D")]
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=pages)
+
+        with pytest.raises(ka.KISAPIError) as exc:
+            ka._paginate("/uapi/test", "FHPST01760000", "", {})
+
+        assert exc.value.partial == {"output": [{"n": 1}]}
+        assert fetch.call_count == 2
+
+    def test_repeated_response_stops_paging(self, mocker):
+        """직전 페이지와 같은 응답이 다시 오면 무한 반복하지 않고 중단"""
+        mocker.patch.object(ka, "_url_fetch", side_effect=[page([{"n": 1}], "M"), page([{"n": 2}], "M"),
+                                                           page([{"n": 2}], "M"), page([{"n": 4}], "D")])
+
+        with pytest.raises(ka.KISPagingError) as exc:
+            ka._paginate("/uapi/test", "FHPST01760000", "", {})
+
+        assert exc.value.partial == {"output": [{"n": 1}, {"n": 2}]}
+
+    def test_unchanged_cursor_stops_paging(self, mocker):
+        """다음 페이지가 있다면서 방금 보낸 연속조회키를 그대로 돌려주면 중단"""
+        fetch = mocker.patch.object(ka, "_url_fetch", side_effect=[
+            page([{"n": 1}], "M", ctx_area_nk100="NK1"),
+            page([{"n": 2}], "M", ctx_area_nk100="NK1"),
+            page([{"n": 3}], "D", ctx_area_nk100="NK2"),
+        ])
+
+        with pytest.raises(ka.KISPagingError):
+            ka._paginate("/uapi/test", "TTTC8434R", "", {"CTX_AREA_NK100": ""}, ("output",),
+                         cursor={"CTX_AREA_NK100": "ctx_area_nk100"})
+
+        assert fetch.call_count == 2
+
+    def test_continuation_pages_bypass_cache(self, http_pool, trenv, mocker):
+        """연속조회키 없이 tr_cont 만으로 넘기는 페이지는 캐시된 응답을 재사용하지 않음"""
+        get = mocker.patch.object(ka._getSession(), "get", side_effect=[
+            FakeResponse(ok_body(output=[{"n": i}]), headers={"tr_cont": "M" if i < 3 else "D"})
+            for i in range(1, 4)
+        ])
+
+        res, records = ka._paginate(PRICE_URL, "FHKST01010100", "", {"FID_INPUT_ISCD": "005930"})
+
+        assert res.isOK()
+        assert records["output"] == [{"n": 1}, {"n": 2}, {"n": 3}]
+        assert get.call_count == 3
+
+    async def test_async(self, mocker):
+        """비동기 연속조회"""
+        pages = [page([{"n": 1}], "M"), page([{"n": 2}], "D")]
+        mocker.patch.object(ka, "_url_fetch_async", mocker.AsyncMock(side_effect=pages))
+
+        res, records = await ka._paginate_async("/uapi/test", "FHPST01760000", "", {})
+
+        assert res.isOK()
+        assert records["output"] == [{"n": 1}, {"n": 2}]
+
+
+@pytest.mark.unit
+class TestFanOut:
+    """종목별 동시 호출 테스트"""
+
+    def test_runs_concurrently_and_keeps_input_order(self):
+        """동시에 실행하고 결과는 입력 순서, 실패는 종목별로 errors 에"""
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def fetch(code):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            if code == "000002":
+                raise ValueError("bad")
+            return int(code)
+
+        codes = [f"{i:06d}" for i in range(8, 0, -1)]
+        progress = []
+        r = ka.fan_out(fetch, codes, max_workers=4, on_progress=lambda *a: progress.append(a))
+
+        assert list(r.results) == [c for c in codes if c != "000002"]
+        assert r.results["000008"] == 8
+        assert isinstance(r.errors["000002"], ValueError) and not r.ok
+        assert peak[0] == 4
+        assert sorted(p[0] for p in progress) == list(range(1, 9))
+        assert all(p[1] == 8 for p in progress)
+
+    def test_argument_forms(self):
+        """dict 입력은 {키: 인자}, 인자 tuple 은 위치 인자, dict 는 키워드 인자"""
+        def fn(a, b=0):
+            return a + b
+
+        assert ka.fan_out(fn, {"x": (1, 2), "y": {"a": 3, "b": 4}, "z": 5}).results == {"x": 3, "y": 7, "z": 5}
+        assert ka.fan_out(fn, [{"a": 1}, {"a": 2}]).results == {0: 1, 1: 2}
+        assert ka.fan_out(fn, []).results == {}
+
+    def test_nested_fan_out_runs_serially(self):
+        """fan_out 작업 안의 fan_out 은 바깥 동시 호출에 맡기고 순차 실행"""
+        threads = []
+
+        def inner(x):
+            threads.append(threading.get_ident())
+            return x
+
+        def outer(code):
+            return ka.fan_out(inner, [1, 2, 3, 4], max_workers=4).results
+
+        r = ka.fan_out(outer, ["a", "b"], max_workers=2)
+
+        assert r.results == {"a": {1: 1, 2: 2, 3: 3, 4: 4}, "b": {1: 1, 2: 2, 3: 3, 4: 4}}
+        assert len(set(threads)) <= 2
+
+    async def test_async(self):
+        """fan_out_async 는 세마포어로 동시 호출 수 제한"""
+        active, peak = [0], [0]
+
+        async def fetch(code):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+            if code == "b":
+                raise KeyError(code)
+            return code.upper()
+
+        r = await ka.fan_out_async(fetch, ["a", "b", "c", "d"], max_workers=2)
+
+        assert r.results == {"a": "A", "c": "C", "d": "D"}
+        assert list(r.errors) == ["b"]
+        assert peak[0] == 2
+
+
+@pytest.mark.unit
+class TestUrlFetchAsync:
+    """asyncio API 호출 테스트"""
+
+    async def test_fallback_to_thread_without_aiohttp(self, http_pool, trenv, mocker):
+        """aiohttp 가 없으면 공용 커넥션 풀로 동기 호출"""
+        mocker.patch.object(ka, "aiohttp", None)
+        get = mocker.patch.object(ka._getSession(), "get",
+                                  return_value=FakeResponse(ok_body(output={"stck_prpr": "70000"})))
+
+        res = await ka._url_fetch_async("/uapi/domestic-stock/v1/quotations/inquire-price",
+                                        "FHKST01010100", "", {"FID_INPUT_ISCD": "005930"})
+
+        assert isinstance(res, ka.APIResp)
+        assert res.getBody().output["stck_prpr"] == "70000"
+        get.assert_called_once()
+
+    async def test_aiohttp_transport(self, trenv, mocker):
+        """aiohttp 로 호출하고 응답 header / body 를 APIResp 로 변환"""
+        pytest.importorskip("aiohttp")
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        async def handler(request):
+            assert request.headers["tr_id"] == "FHKST01010100"
+            return web.json_response(ok_body(output={"stck_prpr": "70000"}),
+                                     headers={"tr_cont": "D"})
+
+        app = web.Application()
+        app.router.add_get("/uapi/domestic-stock/v1/quotations/inquire-price", handler)
+        async with TestServer(app) as server:
+            mocker.patch.object(ka, "_TRENV", trenv._replace(my_url=str(server.make_url("")).rstrip("/")))
+            res = await ka._url_fetch_async("/uapi/domestic-stock/v1/quotations/inquire-price",
+                                            "FHKST01010100", "", {"FID_INPUT_ISCD": "005930"})
+            await ka.close_http_pool_async()
+
+        assert res.isOK()
+        assert res.getHeader().tr_cont == "D"
+        assert res.getBody().output["stck_prpr"] == "70000"
+
+    async def test_error_status_returns_api_resp_error(self, http_pool, trenv, resilience, mocker):
+        """HTTP 오류는 동기 호출과 같은 APIRespError 로 반환"""
+        mocker.patch.object(ka, "aiohttp", None)
+        mocker.patch.object(ka._getSession(), "get",
+                            return_value=FakeResponse({}, status_code=500))
+
+        res = await ka._url_fetch_async("/uapi/domestic-stock/v1/quotations/inquire-price",
+                                        "FHKST01010100", "", {})
+
+        assert isinstance(res, ka.APIRespError)
+        assert res.getErrorCode() == "500"
@@ -0,0 +1,65 @@
+"""
+kis_schema (응답 필드 타입 변환) 테스트
+"""
+import pandas as pd
+import pytest
+
+import kis_auth as ka
+import kis_schema
+
+
+@pytest.fixture
+def schemas():
+    saved = {k: dict(v) for k, v in kis_schema._SCHEMAS.items()}
+    yield
+    kis_schema._SCHEMAS.clear()
+    kis_schema._SCHEMAS.update(saved)
+    kis_schema._schema.cache_clear()
+
+
+@pytest.mark.unit
+class TestDecode:
+    """decode 테스트"""
+
+    def test_field_name_rules(self):
+        """등록되지 않은 TR 은 필드명 접미사 규칙으로 변환"""
+        df = pd.DataFrame([{
+            "stck_shrn_iscd": "005930", "stck_prpr": "70000", "prdy_ctrt": "-1.25",
+            "stck_bsop_date": "20240102", "prdy_vrss_sign": "5", "hts_kor_isnm": "삼성전자",
+        }])
+
+        df = kis_schema.decode(df, "UNKNOWN")
+
+        assert df["stck_shrn_iscd"].iloc[0] == "005930"  # 앞자리 0 유지
+        assert df["stck_prpr"].dtype == "int64"
+        assert df["prdy_ctrt"].iloc[0] == -1.25
+        assert df["stck_bsop_date"].iloc[0] == pd.Timestamp("2024-01-02")
+        assert df["prdy_vrss_sign"].dtype == "category"
+        assert df["hts_kor_isnm"].iloc[0] == "삼성전자"
+
+    def test_blank_int_becomes_float_nan(self):
+        """빈 값이 섞인 정수 컬럼은 NaN 을 담을 수 있게 float64"""
+        df = kis_schema.decode(pd.DataFrame({"acml_vol": ["10", ""]}))
+
+        assert df["acml_vol"].dtype == "float64"
+        assert pd.isna(df["acml_vol"].iloc[1])
+
+    def test_registered_schema_overrides_rules(self, schemas):
+        """TR 등록 타입이 필드명 규칙보다 우선, 모의투자 TR 은 실전 TR 스키마 사용"""
+        kis_schema.register("TTTC9999R", "output1", {"stck_prpr": kis_schema.STR})
+        df = pd.DataFrame({"stck_prpr": ["070000"]})
+
+        assert kis_schema.decode(df.copy(), "TTTC9999R", "output1")["stck_prpr"].iloc[0] == "070000"
+        assert kis_schema.decode(df.copy(), "VTTC9999R", "output1")["stck_prpr"].iloc[0] == "070000"
+        assert kis_schema.decode(df.copy(), "TTTC9999R", "output2")["stck_prpr"].iloc[0] == 70000
+
+    def test_to_frame(self):
+        """_toFrame 은 단건 dict / None 도 DataFrame 으로 만들고, 기본은 문자열 그대로 (켜면 타입 변환)"""
+        assert ka._toFrame(None).empty
+        assert ka._toFrame([{"stck_prpr": "100"}])["stck_prpr"].iloc[0] == "100"
+
+        ka.set_typed_output(True)
+        try:
+            assert ka._toFrame({"stck_prpr": "100"}, "FHKST01010100")["stck_prpr"].iloc[0] == 100
+        finally:
+            ka.set_typed_output(False)
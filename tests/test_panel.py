@@ -0,0 +1,55 @@
+"""
+market_data.panel (여러 종목 시세 패널) 테스트
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_data import Panel, build_panel
+
+
+def ohlcv(dates, base):
+    idx = pd.DatetimeIndex(pd.to_datetime(dates), name="Date")
+    close = np.arange(len(idx), dtype=float) + base
+    return pd.DataFrame({"Open": close, "High": close + 1, "Low": close - 1, "Close": close,
+                         "Volume": close * 10}, index=idx)
+
+
+@pytest.fixture
+def frames():
+    return {
+        "A": ohlcv(["2024-01-02", "2024-01-03", "2024-01-04"], 100),
+        "B": ohlcv(["2024-01-03", "2024-01-04", "2024-01-05"], 200),
+    }
+
+
+@pytest.mark.unit
+class TestPanel:
+    """패널 생성/조회 테스트"""
+
+    def test_outer_alignment_with_mask(self, frames):
+        """날짜 합집합에 맞추고 봉이 없는 자리는 NaN + mask False"""
+        panel = build_panel(frames)
+
+        assert panel.shape == (5, 4, 2)
+        assert panel.values.flags["C_CONTIGUOUS"]
+        assert panel.dates.tolist() == list(pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"]))
+        assert panel.mask.tolist() == [[True, False], [True, True], [True, True], [False, True]]
+        closes = panel.field("Close")
+        assert np.isnan(closes[0, 1]) and closes[3, 1] == 202
+        assert np.shares_memory(closes, panel.values)
+
+    def test_common_and_frames(self, frames):
+        """common() 은 모든 종목에 봉이 있는 날짜만, symbol() 은 원래 DataFrame"""
+        panel = build_panel(frames)
+
+        common = panel.common()
+        assert len(common) == 2 and common.mask.all()
+        assert common.frame("Close").loc["2024-01-04"].tolist() == [102, 201]
+        pd.testing.assert_frame_equal(panel.symbol("A"), frames["A"], check_freq=False)
+        assert len(build_panel(frames, how="inner")) == 2
+        assert len(panel.between("2024-01-03", "2024-01-04")) == 2
+
+    def test_shape_validation(self):
+        with pytest.raises(ValueError):
+            Panel(["Close"], pd.DatetimeIndex([]), ["A"], np.zeros((1, 1, 1)), np.zeros((1, 1), bool))
@@ -267,4 +267,60 @@ class TestBacktestRun:
         # Peak: 1,200,000 (120원일 때)
         # Valley: 800,000 (80원일 때)
         # MDD = (1,200,000 - 800,000) / 1,200,000 * 100 = 33.33%
-        assert results['max_drawdown'] > 30  # 대략 33% MDD
\ No newline at end of file
+        assert results['max_drawdown'] > 30  # 대략 33% MDD
+
+    def test_run_with_panel(self):
+        """패널로 로드하면 봉이 있는 종목만 전략에 전달"""
+        # Given
+        from market_data import build_panel
+
+        bt = PortfolioBacktest(initial_cash=1_000_000, commission=0.0)
+        dates = pd.date_range('2024-01-01', periods=4, freq='D')
+        frames = {
+            'A': pd.DataFrame({'Open': 100.0, 'High': 100.0, 'Low': 100.0, 'Close': [100.0, 110, 120, 130],
+                               'Volume': 1000.0}, index=dates),
+            'B': pd.DataFrame({'Open': 50.0, 'High': 50.0, 'Low': 50.0, 'Close': [50.0, 55],
+                               'Volume': 1000.0}, index=dates[2:]),
+        }
+        bt.load_panel(build_panel(frames))
+        seen = []
+
+        # When
+        def strategy(backtest, date, current_data):
+            seen.append(sorted(current_data))
+            if date == dates[0]:
+                backtest.buy('A', quantity=100, price=current_data['A']['Close'], date=date)
+
+        results = bt.run(strategy)
+
+        # Then
+        assert seen == [['A'], ['A'], ['A', 'B'], ['A', 'B']]
+        assert results['final_equity'] == pytest.approx(1_003_000)
+        assert len(bt.data['B']) == 2
+
+    def test_run_keeps_extra_columns(self):
+        """전략에 종목별 추가 컬럼(지표 등)과 원래 dtype 이 그대로 전달됨"""
+        # Given
+        bt = PortfolioBacktest(initial_cash=1_000_000, commission=0.0)
+        dates = pd.date_range('2024-01-01', periods=3, freq='D')
+        a = pd.DataFrame({'Open': 100, 'High': 100, 'Low': 100, 'Close': [100, 110, 120],
+                          'Volume': 1000, 'SMA': [np.nan, 105.0, 115.0]}, index=dates)
+        b = pd.DataFrame({'Open': 50, 'High': 50, 'Low': 50, 'Close': [50, 55],
+                          'Volume': 1000, 'Signal': ['buy', 'hold']}, index=dates[1:])
+        bt.load_data('A', a)
+        bt.load_data('B', b)
+        rows = {}
+
+        # When
+        def strategy(backtest, date, current_data):
+            for symbol, row in current_data.items():
+                rows[(symbol, date)] = row
+
+        bt.run(strategy)
+
+        # Then
+        assert rows[('A', dates[1])]['SMA'] == 105.0
+        assert rows[('B', dates[1])]['Signal'] == 'buy'
+        assert 'SMA' not in rows[('B', dates[2])]
+        assert rows[('A', dates[2])]['Close'] == 120
+        assert rows[('B', dates[2])].name == dates[2]
@@ -0,0 +1,61 @@
+"""
+market_data.resample (1분봉 → N분봉 리샘플링) 테스트
+"""
+from datetime import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_data import resample
+
+
+def minute_bars(day="2024-01-02", start="09:00", end="15:30"):
+    """장 시작 ~ 마감 1분봉, 종가 = 분 순번"""
+    index = pd.date_range(f"{day} {start}", f"{day} {end}", freq="min", name="Date")
+    n = np.arange(len(index), dtype=float)
+    return pd.DataFrame({"Open": n, "High": n + 0.5, "Low": n - 0.5, "Close": n, "Volume": 10.0}, index=index)
+
+
+@pytest.mark.unit
+class TestResample:
+    """리샘플링 테스트"""
+
+    def test_five_minute_bars(self):
+        df = resample(minute_bars(), 5)
+
+        first = df.iloc[0]
+        assert df.index[0] == pd.Timestamp("2024-01-02 09:00")
+        assert (first["Open"], first["High"], first["Low"], first["Close"], first["Volume"]) == (0, 4.5, -0.5, 4, 50)
+        assert len(df) == 78  # 6시간 30분 / 5분
+
+    def test_closing_auction_joins_last_bucket(self):
+        """15:30 마감 동시호가 봉은 15:25 구간에 포함, 60분봉 마지막 구간은 15:00 ~ 15:30"""
+        five = resample(minute_bars(), 5)
+        hour = resample(minute_bars(), 60)
+
+        assert five.index[-1] == pd.Timestamp("2024-01-02 15:25")
+        assert five["Volume"].iloc[-1] == 60
+        assert list(hour.index.strftime("%H:%M")) == ["09:00", "10:00", "11:00", "12:00", "13:00", "14:00", "15:00"]
+        assert hour["Close"].iloc[-1] == 390
+
+    def test_buckets_do_not_cross_days(self):
+        """날짜마다 장 시작 시각에 다시 맞추고, 시간외 봉은 제외"""
+        df = pd.concat([minute_bars("2024-01-02", "08:30", "16:00"), minute_bars("2024-01-03")])
+
+        hour = resample(df, 60)
+
+        assert len(hour) == 14
+        assert hour.index[7] == pd.Timestamp("2024-01-03 09:00")
+        assert hour["Volume"].iloc[0] == 600  # 08:30 ~ 08:59 제외
+
+    def test_missing_minutes_and_custom_session(self):
+        """거래 없는 분은 건너뛰고, 장 시작이 늦은 날은 그 시각 기준"""
+        df = minute_bars(start="10:00", end="10:09").drop(pd.Timestamp("2024-01-02 10:03"))
+
+        result = resample(df, 5, open_time=time(10, 0), close_time=time(16, 30))
+
+        assert list(result["Volume"]) == [40, 50]
+
+    def test_empty(self):
+        assert resample(minute_bars().iloc[:0], 5).empty
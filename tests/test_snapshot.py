@@ -0,0 +1,90 @@
+"""
+market_data.snapshot (데이터셋 스냅샷 / 결과 캐시) 테스트
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_data import ResultCache, SnapshotStore, build_panel
+
+SPEC = {"symbols": ["A", "B"], "start": "20240101", "end": "20240131", "period": "D", "adjusted": True}
+
+
+def ohlcv(dates, base):
+    idx = pd.DatetimeIndex(pd.to_datetime(dates), name="Date")
+    close = np.arange(len(idx), dtype=float) + base
+    return pd.DataFrame({"Open": close, "High": close + 1, "Low": close - 1, "Close": close,
+                         "Volume": close * 10}, index=idx)
+
+
+@pytest.fixture
+def panel():
+    return build_panel({
+        "A": ohlcv(["2024-01-02", "2024-01-03", "2024-01-04"], 100),
+        "B": ohlcv(["2024-01-03", "2024-01-04", "2024-01-05"], 200),
+    })
+
+
+@pytest.mark.unit
+class TestSnapshotStore:
+    """스냅샷 저장/로드 테스트"""
+
+    def test_round_trip(self, tmp_path, panel):
+        snapshots = SnapshotStore(str(tmp_path))
+
+        loaded = snapshots.load(snapshots.save(panel, SPEC))
+
+        assert loaded.symbols == panel.symbols and loaded.fields == panel.fields
+        assert loaded.dates.equals(panel.dates)
+        np.testing.assert_array_equal(loaded.values, panel.values)
+        np.testing.assert_array_equal(loaded.mask, panel.mask)
+
+    def test_id_is_content_addressed(self, tmp_path, panel):
+        """같은 조건 + 같은 데이터면 같은 ID, 데이터가 하나라도 다르면 다른 ID"""
+        snapshots = SnapshotStore(str(tmp_path))
+        first = snapshots.save(panel, SPEC)
+
+        changed = panel.values.copy()
+        changed[0, 0, 0] += 1
+        other = snapshots.save(type(panel)(panel.fields, panel.dates, panel.symbols, changed, panel.mask), SPEC)
+
+        assert snapshots.save(panel, SPEC) == first
+        assert other != first
+        assert snapshots.load(first).values[0, 0, 0] == panel.values[0, 0, 0]  # 저장한 스냅샷은 그대로
+        assert snapshots.meta(first)["spec"] == SPEC
+
+    def test_latest_per_spec(self, tmp_path, panel):
+        snapshots = SnapshotStore(str(tmp_path))
+        assert snapshots.latest(SPEC) is None
+
+        sid = snapshots.save(panel, SPEC)
+
+        assert snapshots.latest(dict(reversed(list(SPEC.items())))) == sid  # 키 순서 무관
+        assert snapshots.latest({**SPEC, "adjusted": False}) is None
+        with pytest.raises(KeyError):
+            snapshots.load("0" * 16)
+
+    @pytest.mark.parametrize("snapshot_id", ["../../etc", "/tmp/x", "0" * 15, "ABCDEF0123456789", "0" * 16 + "/.."])
+    def test_rejects_malformed_id(self, tmp_path, snapshot_id):
+        """외부에서 받은 ID 로 저장소 밖 경로에 접근하지 않음"""
+        with pytest.raises(ValueError):
+            SnapshotStore(str(tmp_path)).load(snapshot_id)
+
+
+@pytest.mark.unit
+class TestResultCache:
+    """결과 캐시 테스트"""
+
+    def test_get_put_and_entries(self, tmp_path):
+        cache = ResultCache(str(tmp_path))
+        params = {"period": 20, "cash": 1_000_000}
+
+        assert cache.get("Strategy", params, "s1") is None
+        assert cache.put("Strategy", params, "s1", {"return": 1.5}) == {"return": 1.5}
+        cache.put("Strategy", {**params, "period": 10}, "s1", {"return": 2.0})
+        cache.put("Other", params, "s2", {"return": 0.0})
+
+        assert cache.get("Strategy", {"cash": 1_000_000, "period": 20}, "s1") == {"return": 1.5}
+        assert cache.get("Strategy", params, "s2") is None
+        assert sorted(e["params"]["period"] for e in cache.entries("Strategy", "s1")) == [10, 20]
+        assert len(cache.entries()) == 3
@@ -0,0 +1,70 @@
+"""
+market_data.trading_calendar (거래일 달력) 테스트
+"""
+from datetime import date, datetime, timezone
+
+import pandas as pd
+import pytest
+
+from market_data import TradingCalendar
+
+# 2024년 설 연휴 (2/9 ~ 2/12, 2/10 2/11 은 주말)
+LUNAR_NEW_YEAR = {date(2024, 2, 9): False, date(2024, 2, 12): False, date(2024, 2, 13): True}
+
+
+@pytest.fixture
+def calendar(tmp_path):
+    cal = TradingCalendar(str(tmp_path / "calendar.json"))
+    cal.update(LUNAR_NEW_YEAR, date(2024, 2, 1), date(2024, 2, 29))
+    return cal
+
+
+@pytest.mark.unit
+class TestTradingCalendar:
+    """거래일 달력 테스트"""
+
+    def test_trading_days_skip_holidays(self, calendar):
+        days = calendar.trading_days("2024-02-07", "2024-02-14")
+
+        assert [d.day for d in days] == [7, 8, 13, 14]
+        assert calendar.count("2024-02-07", "2024-02-14") == 4
+        assert not calendar.is_trading_day(date(2024, 2, 12))
+
+    def test_previous_and_next_session(self, calendar):
+        assert calendar.previous_session(date(2024, 2, 13)) == date(2024, 2, 8)
+        assert calendar.previous_session(date(2024, 2, 11)) == date(2024, 2, 8)  # 휴장일 기준
+        assert calendar.next_session(date(2024, 2, 8)) == date(2024, 2, 13)
+
+    def test_vector_offset(self, calendar):
+        shifted = calendar.offset(pd.Series(pd.to_datetime(["2024-02-13", "2024-02-15"])), -1)
+
+        assert list(shifted) == [pd.Timestamp("2024-02-08"), pd.Timestamp("2024-02-14")]
+
+    def test_outside_coverage_only_weekends(self, calendar):
+        assert calendar.coverage == (date(2024, 2, 1), date(2024, 2, 29))
+        assert calendar.is_trading_day(date(2024, 5, 6))  # 조회 전 구간은 평일이면 거래일
+        assert calendar.missing(date(2024, 1, 1), date(2024, 3, 31)) == [
+            (date(2024, 1, 1), date(2024, 1, 31)),
+            (date(2024, 3, 1), date(2024, 3, 31)),
+        ]
+
+    def test_is_open_in_kst(self, calendar):
+        assert calendar.is_open(datetime(2024, 2, 13, 9, 0))
+        assert not calendar.is_open(datetime(2024, 2, 13, 15, 30))
+        assert not calendar.is_open(datetime(2024, 2, 12, 10, 0))  # 휴장일
+        assert calendar.is_open(datetime(2024, 2, 13, 1, 0, tzinfo=timezone.utc))  # KST 10:00
+
+    def test_is_closed_after_session(self, calendar):
+        assert not calendar.is_closed(datetime(2024, 2, 13, 15, 0))
+        assert calendar.is_closed(datetime(2024, 2, 13, 15, 30))
+        assert not calendar.is_closed(datetime(2024, 2, 12, 16, 0))  # 휴장일
+        assert calendar.is_closed(datetime(2024, 2, 13, 7, 0, tzinfo=timezone.utc))  # KST 16:00
+
+    def test_persisted(self, calendar):
+        calendar.set_session("080000", "153000")
+
+        reloaded = TradingCalendar(calendar.path)
+
+        assert reloaded.coverage == calendar.coverage
+        assert list(reloaded.holidays) == [pd.Timestamp("2024-02-09"), pd.Timestamp("2024-02-12")]
+        assert reloaded.is_open(datetime(2024, 2, 13, 8, 30))
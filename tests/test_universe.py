@@ -0,0 +1,81 @@
+"""
+market_data.universe (전 종목 일봉 memory-map 유니버스) 테스트
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_data import Universe, build_panel
+
+
+def day_bars(prices):
+    """{종목코드: 종가} → 하루치 OHLCV DataFrame"""
+    close = pd.Series(prices, dtype=float)
+    return pd.DataFrame({"Open": close, "High": close, "Low": close, "Close": close, "Volume": close * 10})
+
+
+@pytest.mark.unit
+class TestUniverse:
+    """유니버스 파일 테스트"""
+
+    def test_append_and_read_zero_copy(self, tmp_path):
+        """하루치씩 추가하고 다른 인스턴스(프로세스)에서 memmap 으로 읽음"""
+        u = Universe(str(tmp_path), capacity=8)
+        assert u.append("2024-01-02", day_bars({"005930": 100, "000660": 200}))
+        assert u.append("2024-01-03", day_bars({"000660": 210, "035720": 50}))  # 신규 종목은 다음 열
+
+        reader = Universe(str(tmp_path))
+        closes = reader.field("Close")
+        assert isinstance(closes, np.memmap) and closes.dtype == np.float32
+        assert closes.shape == (2, 8)
+        assert reader.codes == ["005930", "000660", "035720"]
+        assert closes[1, reader.index("000660")] == 210
+        assert np.isnan(closes[1, reader.index("005930")])
+        assert reader.field("Volume")[1, reader.index("005930")] == 0
+        assert reader.last_date == pd.Timestamp("2024-01-03")
+
+    def test_append_is_idempotent(self, tmp_path):
+        """이미 있는 날짜나 과거 날짜는 추가하지 않음 (야간 동기화 재실행 안전)"""
+        u = Universe(str(tmp_path), capacity=4)
+        u.append("2024-01-03", day_bars({"A": 1}))
+
+        assert not u.append("2024-01-03", day_bars({"A": 2}))
+        assert not u.append("2024-01-02", day_bars({"A": 2}))
+        assert len(u) == 1
+
+    def test_append_panel_and_read_back(self, tmp_path):
+        """과거 데이터 일괄 적재 후 Panel / DataFrame 으로 조회"""
+        idx = pd.DatetimeIndex(pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04"]), name="Date")
+        frames = {
+            "A": pd.DataFrame({c: [1.0, 2.0, 3.0] for c in ("Open", "High", "Low", "Close", "Volume")}, index=idx),
+            "B": pd.DataFrame({c: [5.0, 6.0] for c in ("Open", "High", "Low", "Close", "Volume")}, index=idx[1:]),
+        }
+        u = Universe(str(tmp_path), capacity=4)
+
+        assert u.append_panel(build_panel(frames)) == 3
+        assert u.append_panel(build_panel(frames)) == 0  # 이미 적재한 날짜
+
+        panel = u.panel(["B", "A"], start="2024-01-03")
+        assert panel.symbols == ("B", "A")
+        assert panel.mask.all()
+        assert panel.field("Close")[:, 1].tolist() == [2.0, 3.0]
+        assert u.frame("Close", ["B"]).iloc[:, 0].isna().tolist() == [True, False, False]
+
+    def test_interrupted_write_is_invisible_and_repaired(self, tmp_path):
+        """날짜 파일보다 긴 필드 파일(중단된 쓰기)은 읽지 않고 다음 추가 때 잘라냄"""
+        u = Universe(str(tmp_path), capacity=2)
+        u.append("2024-01-02", day_bars({"A": 1}))
+        with open(os.path.join(str(tmp_path), "close.f4"), "ab") as f:
+            f.write(np.zeros(2, dtype="f4").tobytes())
+
+        assert u.field("Close").shape == (1, 2)
+        u.append("2024-01-03", day_bars({"A": 3}))
+        assert u.field("Close")[:, 0].tolist() == [1.0, 3.0]
+
+    def test_capacity_exceeded(self, tmp_path):
+        u = Universe(str(tmp_path), capacity=1)
+
+        with pytest.raises(ValueError, match="capacity"):
+            u.append("2024-01-02", day_bars({"A": 1, "B": 2}))